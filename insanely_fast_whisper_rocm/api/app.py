@@ -15,9 +15,11 @@ from fastapi import FastAPI
 from fastapi.routing import APIRoute
 
 from insanely_fast_whisper_rocm import __version__
+from insanely_fast_whisper_rocm.api.coalescing import get_request_coalescer
 from insanely_fast_whisper_rocm.api.middleware import add_middleware
 from insanely_fast_whisper_rocm.api.routes import router as api_router
 from insanely_fast_whisper_rocm.core.backend_cache import clear_cache
+from insanely_fast_whisper_rocm.core.result_writer import shutdown_result_writer
 from insanely_fast_whisper_rocm.utils.constants import (
     API_DESCRIPTION,
     API_TITLE,
@@ -26,6 +28,7 @@ from insanely_fast_whisper_rocm.utils.constants import (
     HF_TOKEN,
 )
 from insanely_fast_whisper_rocm.utils.download_hf_model import download_model_if_needed
+from insanely_fast_whisper_rocm.utils.temp_space import get_temp_manager
 
 logger = logging.getLogger(__name__)
 
@@ -72,11 +75,20 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Run startup sequence using FastAPI's lifespan support.
 
     This context manager handles both startup and shutdown of the application.
-    On shutdown, it clears the backend cache to release GPU memory and prevent
-    resource leaks.
+    On startup, it starts the temp-file janitor, which first sweeps orphans
+    left by earlier runs. On shutdown, it stops the janitor, flushes pending
+    background result writes and clears the backend cache to release GPU
+    memory and prevent resource leaks.
     """
     await run_startup_sequence(app)
+    temp_manager = get_temp_manager()
+    temp_manager.start()
     yield
+    temp_manager.stop()
+    logger.info("Temporary file usage: %s", temp_manager.stats())
+    logger.info("Request coalescing: %s", get_request_coalescer().stats())
+    logger.info("Shutting down API - flushing pending result writes")
+    await asyncio.to_thread(shutdown_result_writer)
     # Cleanup on shutdown: release all cached backends to free GPU memory
     logger.info("Shutting down API - clearing backend cache")
     clear_cache(force_close=True)
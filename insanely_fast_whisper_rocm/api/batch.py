@@ -0,0 +1,307 @@
+"""Multi-file batch processing for the API.
+
+A batch request uploads many files (or ZIP archives of audio files) at once.
+`collect_batch_items` saves every upload through the regular admission checks
+and expands archives; `iter_batch_outcomes` then processes the files on a
+small thread pool. As in the WebUI batch mode, audio preparation (WAV
+conversion) and post-processing of one file overlap with inference of
+another, while inference itself is serialized on the shared cached model.
+
+Every file succeeds or fails on its own: an unreadable upload or a failed
+transcription becomes an error entry for that file instead of failing the
+whole request.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import uuid
+import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from fastapi import HTTPException, UploadFile
+
+from insanely_fast_whisper_rocm.audio.conversion import ensure_wav
+from insanely_fast_whisper_rocm.utils import constants
+from insanely_fast_whisper_rocm.utils.file_utils import (
+    UPLOAD_CHUNK_BYTES,
+    FileHandler,
+    cleanup_temp_files,
+    save_stream,
+)
+from insanely_fast_whisper_rocm.utils.temp_space import temp_prefix, track_temp_path
+
+logger = logging.getLogger(__name__)
+
+# Called with the path of a prepared WAV file; returns the raw result.
+BatchJob = Callable[[str], dict[str, Any]]
+
+
+@dataclass
+class BatchItem:
+    """One file of a batch request."""
+
+    index: int
+    filename: str
+    path: str | None = None
+    error: str | None = None
+    status_code: int = 400
+
+
+@dataclass
+class BatchOutcome:
+    """Result or error of one `BatchItem`."""
+
+    item: BatchItem
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    status_code: int = 200
+
+    @property
+    def ok(self) -> bool:
+        """bool: Whether the file was processed successfully."""
+        return self.error is None
+
+
+def _unique_name(name: str, used: set[str]) -> str:
+    """Return ``name``, or a numbered variant if it is already taken.
+
+    Returns:
+        str: A name not in ``used``; it is added to ``used``.
+    """
+    candidate = name
+    stem, suffix = os.path.splitext(name)
+    counter = 2
+    while candidate in used:
+        candidate = f"{stem} ({counter}){suffix}"
+        counter += 1
+    used.add(candidate)
+    return candidate
+
+
+def _expand_archive(archive_path: str, archive_name: str) -> list[BatchItem]:
+    """Extract the audio members of a ZIP archive into a temp directory.
+
+    Members are written under generated names, never their archive paths, and
+    each one passes the same admission checks as a direct upload. At most
+    ``API_BATCH_MAX_FILES`` members are extracted.
+
+    Args:
+        archive_path: The saved archive.
+        archive_name: Client-side name of the archive, for reporting.
+
+    Returns:
+        list[BatchItem]: One item per audio member, not yet numbered.
+    """
+    try:
+        archive = zipfile.ZipFile(archive_path)
+    except (zipfile.BadZipFile, OSError) as exc:
+        return [
+            BatchItem(
+                -1, archive_name, error=f"Invalid archive: {exc}", status_code=415
+            )
+        ]
+
+    items: list[BatchItem] = []
+    limit = max(1, constants.API_BATCH_MAX_FILES)
+    target_dir: str | None = None
+    with archive:
+        for member in archive.infolist():
+            parts = Path(member.filename).parts
+            suffix = Path(member.filename).suffix.lower()
+            if (
+                member.is_dir()
+                or any(part.startswith((".", "__MACOSX")) for part in parts)
+                or suffix not in constants.SUPPORTED_AUDIO_FORMATS
+            ):
+                logger.debug("Skipping archive member %s", member.filename)
+                continue
+            if len(items) >= limit:
+                items.append(
+                    BatchItem(
+                        -1,
+                        archive_name,
+                        error=f"Archive has more than {limit} audio files",
+                        status_code=413,
+                    )
+                )
+                break
+            if target_dir is None:
+                target_dir = track_temp_path(
+                    tempfile.mkdtemp(prefix=temp_prefix("extracted_audio_"))
+                )
+            item = BatchItem(-1, f"{archive_name}/{member.filename}")
+            destination = os.path.join(target_dir, f"{len(items):04d}{suffix}")
+            try:
+                with archive.open(member) as source:
+                    save_stream(source, destination, member.file_size)
+                item.path = destination
+            except HTTPException as exc:
+                item.error, item.status_code = str(exc.detail), exc.status_code
+            except (OSError, zipfile.BadZipFile, RuntimeError) as exc:
+                item.error = f"Unreadable archive member: {exc}"
+            items.append(item)
+    if not items:
+        items.append(
+            BatchItem(
+                -1,
+                archive_name,
+                error="Archive contains no supported audio files",
+                status_code=415,
+            )
+        )
+    return items
+
+
+def _receive_archive(upload: UploadFile, file_handler: FileHandler) -> list[BatchItem]:
+    """Save an uploaded ZIP archive and expand it.
+
+    An archive may hold one file per allowed batch entry, so its size limit
+    is scaled by ``API_BATCH_MAX_FILES`` like the request limit.
+
+    Args:
+        upload: The uploaded archive.
+        file_handler: Handler whose upload directory receives the archive.
+
+    Returns:
+        list[BatchItem]: The archive's audio files, or a single error item.
+    """
+    name = upload.filename or "archive.zip"
+    files = max(1, constants.API_BATCH_MAX_FILES)
+    limit = files * constants.MAX_AUDIO_SIZE_MB * 1024 * 1024
+    archive_path = track_temp_path(
+        os.path.join(file_handler.upload_dir, f"{uuid.uuid4()}.zip")
+    )
+    try:
+        with open(archive_path, "wb") as handle:
+            while block := upload.file.read(UPLOAD_CHUNK_BYTES):
+                handle.write(block)
+                if limit and handle.tell() > limit:
+                    return [
+                        BatchItem(
+                            -1,
+                            name,
+                            error=(
+                                f"Archive exceeds the upload limit of {files} "
+                                f"files of {constants.MAX_AUDIO_SIZE_MB} MB"
+                            ),
+                            status_code=413,
+                        )
+                    ]
+        return _expand_archive(archive_path, name)
+    except OSError as exc:
+        return [
+            BatchItem(-1, name, error=f"Error saving archive: {exc}", status_code=500)
+        ]
+    finally:
+        file_handler.cleanup(archive_path)
+
+
+def collect_batch_items(
+    files: list[UploadFile], file_handler: FileHandler
+) -> list[BatchItem]:
+    """Save the uploads of a batch request and expand ZIP archives.
+
+    Args:
+        files: The uploaded files.
+        file_handler: Handler used to validate and save each upload.
+
+    Returns:
+        list[BatchItem]: One item per audio file, numbered in upload order.
+        Rejected uploads carry an error instead of a path.
+    """
+    items: list[BatchItem] = []
+    for upload in files:
+        if Path(upload.filename or "").suffix.lower() == ".zip":
+            items.extend(_receive_archive(upload, file_handler))
+            continue
+        item = BatchItem(-1, upload.filename or "upload")
+        try:
+            file_handler.validate_audio_file(upload)
+            item.path = file_handler.save_upload(upload)
+        except HTTPException as exc:
+            item.error, item.status_code = str(exc.detail), exc.status_code
+        items.append(item)
+
+    limit = max(1, constants.API_BATCH_MAX_FILES)
+    used_names: set[str] = set()
+    for index, item in enumerate(items):
+        item.index = index
+        item.filename = _unique_name(item.filename, used_names)
+        if index >= limit and item.path is not None:
+            cleanup_temp_files([item.path])
+            item.path = None
+            item.error = f"Batch exceeds the limit of {limit} files"
+            item.status_code = 413
+    return items
+
+
+def _process_item(item: BatchItem, job: BatchJob) -> BatchOutcome:
+    """Prepare one file and run ``job`` on it, capturing any failure.
+
+    Returns:
+        BatchOutcome: The result, or the error of this file only.
+    """
+    assert item.path is not None
+    converted: str | None = None
+    try:
+        # Conversion runs outside the inference lock so it overlaps with the
+        # inference of other files.
+        audio_path = ensure_wav(item.path)
+        if audio_path != item.path:
+            converted = audio_path
+        return BatchOutcome(item, result=job(audio_path))
+    except HTTPException as exc:
+        return BatchOutcome(item, error=str(exc.detail), status_code=exc.status_code)
+    except Exception as exc:  # noqa: BLE001 - isolate per-file failures
+        logger.error("Batch file %s failed: %s", item.filename, exc, exc_info=True)
+        return BatchOutcome(item, error=str(exc), status_code=500)
+    finally:
+        if converted is not None:
+            cleanup_temp_files([converted])
+
+
+def iter_batch_outcomes(
+    items: list[BatchItem], job: BatchJob, concurrency: int | None = None
+) -> Iterator[BatchOutcome]:
+    """Process a batch and yield each outcome as soon as it is known.
+
+    Items rejected during upload are yielded first, then processed files in
+    completion order. Saved uploads are removed once the generator finishes
+    or is closed (e.g. because the client disconnected).
+
+    Args:
+        items: Items from `collect_batch_items`.
+        job: Runs inference on a prepared file; it is responsible for
+            serializing access to the model (see `INFERENCE_LOCK`).
+        concurrency: Files processed at once. Defaults to
+            ``API_BATCH_CONCURRENCY``.
+
+    Yields:
+        BatchOutcome: One outcome per item.
+    """
+    if concurrency is None:
+        concurrency = constants.API_BATCH_CONCURRENCY
+    runnable = [item for item in items if item.path is not None]
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(concurrency, len(runnable) or 1)),
+        thread_name_prefix="api-batch",
+    )
+    try:
+        for item in items:
+            if item.path is None:
+                yield BatchOutcome(item, error=item.error, status_code=item.status_code)
+        futures: list[Future[BatchOutcome]] = [
+            executor.submit(_process_item, item, job) for item in runnable
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        cleanup_temp_files([item.path for item in runnable if item.path])
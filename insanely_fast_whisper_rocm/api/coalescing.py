@@ -0,0 +1,125 @@
+"""Single-flight coalescing of identical concurrent API requests.
+
+Clients that time out often retry with the same file, so several identical
+uploads can be in flight at once. `RequestCoalescer` runs one job per key and
+lets every concurrent duplicate await that job instead of starting its own
+inference. Routes key jobs by the upload's content hash plus every parameter
+that affects the raw result; the response format is applied per caller, so
+duplicates may each ask for a different ``response_format``.
+
+Only concurrent requests are coalesced: a key is forgotten as soon as its job
+finishes, so nothing is cached between requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_HASH_BLOCK_BYTES = 1024 * 1024
+
+
+@dataclass
+class CoalescingStats:
+    """Counters of a `RequestCoalescer`."""
+
+    # Jobs that actually ran
+    executed: int = 0
+    # Requests that attached to an already running job
+    coalesced: int = 0
+    failed: int = 0
+
+
+def content_hash(path: str) -> str:
+    """Return the SHA-256 hex digest of a file.
+
+    Args:
+        path: The file to hash.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        while block := handle.read(_HASH_BLOCK_BYTES):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class RequestCoalescer:
+    """Run at most one job per key at a time and share its outcome.
+
+    Must be used from a single event loop. Jobs are plain callables that run on
+    a worker thread; the event loop stays free while they execute.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty coalescer."""
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self._stats = CoalescingStats()
+
+    @property
+    def in_flight(self) -> int:
+        """int: Number of jobs currently running."""
+        return len(self._inflight)
+
+    def stats(self) -> dict[str, int]:
+        """Return the coalescing counters.
+
+        Returns:
+            dict[str, int]: A snapshot of `CoalescingStats` plus ``in_flight``.
+        """
+        return {**asdict(self._stats), "in_flight": self.in_flight}
+
+    async def run(self, key: str, job: Callable[[], T]) -> T:
+        """Run ``job`` unless an identical job is already running.
+
+        The job runs as its own task, so a caller that is cancelled while
+        waiting does not cancel the work for the others.
+
+        Args:
+            key: Identity of the job; equal keys must produce equal results.
+            job: Callable executed on a worker thread.
+
+        Returns:
+            T: The job's result, shared by every caller with the same key.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self._stats.coalesced += 1
+            logger.info("Coalesced duplicate request onto in-flight job %s", key[:16])
+        else:
+            task = asyncio.ensure_future(asyncio.to_thread(job))
+            self._inflight[key] = task
+            self._stats.executed += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Forget a finished job and record its outcome."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve the exception so an unawaited failure is not reported as
+        # "never retrieved"; the awaiting callers re-raise it themselves.
+        if not task.cancelled() and task.exception() is not None:
+            self._stats.failed += 1
+
+
+_COALESCER = RequestCoalescer()
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """Return the process-wide coalescer used by the API routes.
+
+    Returns:
+        RequestCoalescer: The shared coalescer.
+    """
+    return _COALESCER
@@ -9,10 +9,18 @@ import time
 from collections.abc import Awaitable, Callable
 
 from fastapi import FastAPI, Request
-from starlette.responses import Response
+from starlette.responses import JSONResponse, Response
+
+from insanely_fast_whisper_rocm.utils import constants
 
 logger = logging.getLogger(__name__)
 
+# Allowance for multipart boundaries and form fields on top of the file itself.
+UPLOAD_FORM_OVERHEAD_BYTES = 1024 * 1024
+
+# Routes accepting up to ``API_BATCH_MAX_FILES`` files in one request.
+BATCH_UPLOAD_PATHS = frozenset({"/v1/audio/batch"})
+
 
 async def log_request_timing(
     request: Request, call_next: Callable[[Request], Awaitable[Response]]
@@ -41,10 +49,57 @@ async def log_request_timing(
     return response
 
 
+async def reject_oversized_uploads(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Reject uploads whose declared size exceeds the limit before reading them.
+
+    The byte limit is also enforced while the file is copied (see
+    `FileHandler.save_upload`), which covers chunked requests without a
+    ``Content-Length`` header. Batch routes may carry one file per allowed
+    batch entry, so their request limit is scaled by ``API_BATCH_MAX_FILES``.
+
+    Args:
+        request: The incoming HTTP request
+        call_next: The next middleware or route handler
+
+    Returns:
+        Response: A 413 response, or the response of the route handler
+    """
+    limit = constants.MAX_AUDIO_SIZE_MB * 1024 * 1024
+    files = (
+        max(1, constants.API_BATCH_MAX_FILES)
+        if request.url.path in BATCH_UPLOAD_PATHS
+        else 1
+    )
+    declared = request.headers.get("content-length", "")
+    if (
+        limit
+        and declared.isdigit()
+        and int(declared) > files * (limit + UPLOAD_FORM_OVERHEAD_BYTES)
+        and request.headers.get("content-type", "").startswith("multipart/")
+    ):
+        logger.warning(
+            "Rejected %s %s: request body of %s bytes exceeds the upload limit",
+            request.method,
+            request.url.path,
+            declared,
+        )
+        detail = f"File exceeds the {constants.MAX_AUDIO_SIZE_MB} MB upload limit"
+        if files > 1:
+            detail = (
+                f"Batch exceeds the upload limit of {files} files of "
+                f"{constants.MAX_AUDIO_SIZE_MB} MB"
+            )
+        return JSONResponse(status_code=413, content={"detail": detail})
+    return await call_next(request)
+
+
 def add_middleware(app: FastAPI) -> None:
     """Add all middleware to the FastAPI application.
 
     Args:
         app: The FastAPI application instance
     """
+    app.middleware("http")(reject_oversized_uploads)
     app.middleware("http")(log_request_timing)
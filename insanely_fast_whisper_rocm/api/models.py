@@ -36,3 +36,25 @@ class TranscriptionResponse(BaseModel):
     runtime_seconds: float | None = Field(
         None, description="Processing time in seconds"
     )
+
+
+class TranscriptSearchHit(BaseModel):
+    """A timestamped segment matching a transcript archive search."""
+
+    result_id: int = Field(..., description="Archive id of the matching result")
+    file: str = Field(..., description="Original file name of the result")
+    model: str | None = Field(None, description="Model that produced the result")
+    task: str | None = Field(None, description="ASR task (transcribe or translate)")
+    created_at: str = Field(..., description="ISO 8601 time the result was saved")
+    start: float | None = Field(None, description="Segment start time in seconds")
+    end: float | None = Field(None, description="Segment end time in seconds")
+    text: str = Field(..., description="Matching segment text")
+
+
+class TranscriptSearchResponse(BaseModel):
+    """Response model for the transcript search endpoint."""
+
+    query: str = Field(..., description="The search query")
+    hits: list[TranscriptSearchHit] = Field(
+        default_factory=list, description="Matching segments"
+    )
@@ -1,11 +1,13 @@
 """Format API responses for various payload styles."""
 
+import json
 from collections.abc import Callable
 from typing import Any
 
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 
 from insanely_fast_whisper_rocm.core.formatters import FORMATTERS, BaseFormatter
+from insanely_fast_whisper_rocm.core.streaming import iter_encoded, should_stream
 from insanely_fast_whisper_rocm.utils import (
     RESPONSE_FORMAT_JSON,
     RESPONSE_FORMAT_SRT,
@@ -139,10 +141,68 @@ class ResponseFormatter:
             # Fallback for formatters that don't accept a payload argument
             return format_callable()
 
+    @staticmethod
+    def _subtitle_response(
+        formatter: FormatterLike, payload: dict[str, Any], media_type: str
+    ) -> PlainTextResponse | StreamingResponse:
+        """Render subtitles, streaming the body for long transcripts.
+
+        Args:
+            formatter: Formatter candidate retrieved via `_get_formatter`.
+            payload: Result dictionary passed to the formatter implementation.
+            media_type: MIME type of the response body.
+
+        Returns:
+            PlainTextResponse | StreamingResponse: A streamed response when the
+            result is large and the formatter supports fragments, otherwise
+            the fully rendered text.
+        """
+        if (
+            isinstance(formatter, type)
+            and issubclass(formatter, BaseFormatter)
+            and should_stream(payload)
+        ):
+            return StreamingResponse(
+                iter_encoded(formatter, payload), media_type=media_type
+            )
+        text_output = ResponseFormatter._call_formatter(formatter, payload)
+        return PlainTextResponse(text_output, media_type=media_type)
+
+    @staticmethod
+    def render_payload(
+        result: dict[str, Any], response_format: str = RESPONSE_FORMAT_JSON
+    ) -> dict[str, Any] | str:
+        """Render a result as the body of ``response_format``, unwrapped.
+
+        Used where several results share one response, such as batch
+        requests.
+
+        Args:
+            result: The transcription or translation result dictionary
+            response_format: Desired response format
+
+        Returns:
+            dict[str, Any] | str: The JSON body for "json"/"verbose_json",
+            otherwise the rendered text.
+
+        Raises:
+            ValueError: If ``response_format`` is not supported.
+        """
+        payload = result.get("transcription", result)
+        if response_format == RESPONSE_FORMAT_TEXT:
+            return payload.get("text", "")
+        if response_format in (RESPONSE_FORMAT_JSON, RESPONSE_FORMAT_VERBOSE_JSON):
+            response = ResponseFormatter.format_transcription(payload, response_format)
+            return json.loads(response.body)
+        if response_format in (RESPONSE_FORMAT_SRT, RESPONSE_FORMAT_VTT):
+            formatter = ResponseFormatter._get_formatter(response_format)
+            return ResponseFormatter._call_formatter(formatter, payload)
+        raise ValueError(f"Unsupported response_format: {response_format}")
+
     @staticmethod
     def format_transcription(
         result: dict[str, Any], response_format: str = RESPONSE_FORMAT_JSON
-    ) -> JSONResponse | PlainTextResponse:
+    ) -> JSONResponse | PlainTextResponse | StreamingResponse:
         """Format transcription result based on requested format.
 
         Args:
@@ -150,7 +210,8 @@ class ResponseFormatter:
             response_format: Desired response format ("json" or "text")
 
         Returns:
-            Union[JSONResponse, PlainTextResponse]: Formatted response
+            JSONResponse | PlainTextResponse | StreamingResponse: Formatted
+            response
         """
         # Plain text response
         if response_format == RESPONSE_FORMAT_TEXT:
@@ -203,13 +264,11 @@ class ResponseFormatter:
         if response_format in (RESPONSE_FORMAT_SRT, RESPONSE_FORMAT_VTT):
             if response_format == RESPONSE_FORMAT_SRT:
                 formatter = ResponseFormatter._get_formatter("srt")
-                text_output = ResponseFormatter._call_formatter(formatter, result)
                 mime = "text/srt"
             else:
                 formatter = ResponseFormatter._get_formatter("vtt")
-                text_output = ResponseFormatter._call_formatter(formatter, result)
                 mime = "text/vtt"
-            return PlainTextResponse(text_output, media_type=mime)
+            return ResponseFormatter._subtitle_response(formatter, result, mime)
 
         # Unsupported format – return 400 handled by caller or fallback
         return JSONResponse(
@@ -219,7 +278,7 @@ class ResponseFormatter:
     @staticmethod
     def format_translation(
         result: dict[str, Any], response_format: str = RESPONSE_FORMAT_JSON
-    ) -> JSONResponse | PlainTextResponse:
+    ) -> JSONResponse | PlainTextResponse | StreamingResponse:
         """Format translation result based on requested format.
 
         Args:
@@ -227,7 +286,8 @@ class ResponseFormatter:
             response_format: Desired response format ("json" or "text")
 
         Returns:
-            Union[JSONResponse, PlainTextResponse]: Formatted response
+            JSONResponse | PlainTextResponse | StreamingResponse: Formatted
+            response
         """
         # Plain text response
         if response_format == RESPONSE_FORMAT_TEXT:
@@ -276,17 +336,13 @@ class ResponseFormatter:
             transcription_output = result.get("transcription", result)
             if response_format == RESPONSE_FORMAT_SRT:
                 formatter = ResponseFormatter._get_formatter("srt")
-                text_output = ResponseFormatter._call_formatter(
-                    formatter, transcription_output
-                )
                 mime = "text/srt"
             else:
                 formatter = ResponseFormatter._get_formatter("vtt")
-                text_output = ResponseFormatter._call_formatter(
-                    formatter, transcription_output
-                )
                 mime = "text/vtt"
-            return PlainTextResponse(text_output, media_type=mime)
+            return ResponseFormatter._subtitle_response(
+                formatter, transcription_output, mime
+            )
 
         # Fallback unsupported
         return JSONResponse(
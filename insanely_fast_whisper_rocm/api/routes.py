@@ -4,20 +4,42 @@ This module contains clean, focused route definitions that use dependency
 injection for ASR pipeline instances and file handling.
 """
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import json
 import logging
-from typing import Literal
-
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
+
+from insanely_fast_whisper_rocm.api.batch import (
+    BatchOutcome,
+    collect_batch_items,
+    iter_batch_outcomes,
+)
+from insanely_fast_whisper_rocm.api.coalescing import (
+    content_hash,
+    get_request_coalescer,
+)
 from insanely_fast_whisper_rocm.api.dependencies import (
     get_asr_pipeline,
     get_file_handler,
 )
+from insanely_fast_whisper_rocm.api.models import TranscriptSearchResponse
 from insanely_fast_whisper_rocm.api.responses import ResponseFormatter
+from insanely_fast_whisper_rocm.core.backend_cache import INFERENCE_LOCK
 from insanely_fast_whisper_rocm.core.errors import OutOfMemoryError
 from insanely_fast_whisper_rocm.core.integrations.stable_ts import stabilize_timestamps
 from insanely_fast_whisper_rocm.core.orchestrator import create_orchestrator
 from insanely_fast_whisper_rocm.core.pipeline import WhisperPipeline
+from insanely_fast_whisper_rocm.core.storage import SQLiteStorage
 from insanely_fast_whisper_rocm.utils import (
     DEFAULT_DEMUCS,
     DEFAULT_STABILIZE,
@@ -27,6 +49,7 @@ from insanely_fast_whisper_rocm.utils import (
     RESPONSE_FORMAT_JSON,
     SUPPORTED_RESPONSE_FORMATS,
     FileHandler,
+    constants,
 )
 
 logger = logging.getLogger(__name__)
@@ -34,6 +57,150 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _run_asr_job(
+    audio_path: str,
+    backend_config: object,
+    *,
+    task: str,
+    language: str | None,
+    timestamp_type: str,
+    stabilize: bool,
+    demucs: bool,
+    vad: bool,
+    vad_threshold: float,
+) -> dict[str, Any]:
+    """Transcribe or translate a saved upload and optionally stabilize it.
+
+    Runs on a worker thread. Only decoding holds `INFERENCE_LOCK`, so
+    concurrent requests never share a single-model pipeline; conversion,
+    saving and stabilization overlap with the decoding of other requests.
+    Errors are mapped to the HTTP status the endpoints report.
+
+    Args:
+        audio_path: Path of the saved upload.
+        backend_config: Backend configuration of the injected pipeline.
+        task: "transcribe" or "translate".
+        language: Optional source language code.
+        timestamp_type: Type of timestamp to generate.
+        stabilize: Enable timestamp stabilization if True.
+        demucs: Enable Demucs noise reduction if True.
+        vad: Enable Voice Activity Detection if True.
+        vad_threshold: VAD sensitivity threshold (0.0 - 1.0).
+
+    Returns:
+        dict[str, Any]: The raw result.
+
+    Raises:
+        HTTPException: 507 on GPU out-of-memory, 500 on other failures.
+    """
+    label = "translation" if task == "translate" else "transcription"
+    logger.info("Starting %s process...", label)
+
+    # Use orchestrator for transcription with OOM recovery
+    orchestrator = create_orchestrator()
+    try:
+        result = orchestrator.run_transcription(
+            audio_path=audio_path,
+            backend_config=backend_config,
+            language=language,
+            task=task,
+            timestamp_type=timestamp_type,
+            inference_lock=INFERENCE_LOCK,
+        )
+    except OutOfMemoryError as oom:
+        raise HTTPException(
+            status_code=507,
+            detail=f"Insufficient GPU memory for {label}: {str(oom)}",
+        ) from oom
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    # Optional stabilization (post-process) applied here for API
+    if stabilize:
+        try:
+            result = stabilize_timestamps(
+                result, demucs=demucs, vad=vad, vad_threshold=vad_threshold
+            )
+        except Exception as stab_exc:  # noqa: BLE001
+            logger.error("Stabilization failed: %s", stab_exc, exc_info=True)
+    logger.info("%s completed successfully", label.capitalize())
+    return result
+
+
+def _admit_input(
+    file: UploadFile | None, path: str | None, file_handler: FileHandler
+) -> tuple[str, bool]:
+    """Save an upload or resolve a server-side path, whichever was given.
+
+    Args:
+        file: The uploaded file, if any.
+        path: Server-side path to read in place, if any.
+        file_handler: Injected file handler instance.
+
+    Returns:
+        tuple[str, bool]: The audio path and whether it is a saved upload that
+        must be cleaned up afterwards.
+
+    Raises:
+        HTTPException: If neither or both inputs are given, or admission fails.
+    """
+    if (file is None) == (path is None):
+        raise HTTPException(
+            status_code=400, detail="Provide exactly one of 'file' or 'path'"
+        )
+    if path is not None:
+        return file_handler.resolve_local_input(path), False
+    file_handler.validate_audio_file(file)
+    return file_handler.save_upload(file), True
+
+
+def _local_identity(audio_path: str) -> str:
+    """Identify a file read in place without hashing its contents.
+
+    Returns:
+        str: Path, size and modification time of the file.
+    """
+    stat = os.stat(audio_path)
+    return f"{audio_path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+async def _process_upload(
+    audio_path: str,
+    backend_config: object,
+    input_identity: str | None = None,
+    **params: object,
+) -> dict[str, Any]:
+    """Run `_run_asr_job` off the event loop, coalescing identical requests.
+
+    Concurrent requests for the same file content, backend configuration and
+    decode parameters share one job (see `RequestCoalescer`).
+
+    Args:
+        audio_path: Path of the saved upload.
+        backend_config: Backend configuration of the injected pipeline.
+        input_identity: Identity of the input file; the SHA-256 of its
+            contents is used when omitted.
+        **params: Keyword arguments of `_run_asr_job`.
+
+    Returns:
+        dict[str, Any]: The raw result.
+    """
+    job = functools.partial(_run_asr_job, audio_path, backend_config, **params)
+    if not constants.API_COALESCE_REQUESTS:
+        return await asyncio.to_thread(job)
+    if input_identity is None:
+        try:
+            input_identity = await asyncio.to_thread(content_hash, audio_path)
+        except OSError as exc:
+            logger.debug("Not coalescing %s: %s", audio_path, exc)
+            return await asyncio.to_thread(job)
+    identity = repr((input_identity, backend_config, sorted(params.items())))
+    key = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+    return await get_request_coalescer().run(key, job)
+
+
 @router.post(
     "/v1/audio/transcriptions",
     tags=["Transcription"],
@@ -50,13 +217,24 @@ router = APIRouter()
             },
         },
         400: {"description": "Invalid request parameters"},
+        413: {"description": "File exceeds the upload size or duration limit"},
+        415: {"description": "File content is not a supported audio format"},
         422: {"description": "Validation error (e.g., unsupported file format)"},
         500: {"description": "Internal server error"},
         503: {"description": "Model not loaded or unavailable"},
     },
 )
 async def create_transcription(
-    file: UploadFile = File(..., description="The audio file to transcribe"),  # noqa: B008
+    file: UploadFile | None = File(  # noqa: B008
+        None, description="The audio file to transcribe"
+    ),
+    path: str | None = Form(
+        None,
+        description=(
+            "Server-side file under API_LOCAL_INPUT_ROOT to read in place "
+            "instead of uploading"
+        ),
+    ),
     response_format: str = Form(
         RESPONSE_FORMAT_JSON,
         description="Response format (json, verbose_json, text, srt, vtt)",
@@ -88,6 +266,8 @@ async def create_transcription(
 
     Args:
         file: The audio file to transcribe (supported formats: mp3, wav, etc.)
+        path: Server-side file to read in place instead of ``file``; requires
+            ``API_LOCAL_INPUT_ROOT``
         response_format: Desired response format ("json", "verbose_json",
             "text", "srt", or "vtt").
         timestamp_type: Type of timestamp to generate ("chunk" or "word")
@@ -108,57 +288,32 @@ async def create_transcription(
     """
     logger.info("-" * 50)
     logger.info("Received transcription request:")
-    logger.info("  File: %s", file.filename)
+    logger.info("  File: %s", file.filename if file is not None else path)
     logger.debug("  Timestamp type: %s", timestamp_type)
     logger.debug("  Language: %s", language)
     logger.debug("  Task: %s", task)
 
-    # Validate and save file
-    file_handler.validate_audio_file(file)
-    temp_filepath = file_handler.save_upload(file)
+    # Saving and probing the upload block on disk I/O and ffprobe
+    temp_filepath, uploaded = await asyncio.to_thread(
+        _admit_input, file, path, file_handler
+    )
 
     try:
-        logger.info("Starting transcription process...")
-
-        # Use orchestrator for transcription with OOM recovery
-        orchestrator = create_orchestrator()
-
-        # We need to construct a backend config.
-        # Since we use dependency injection for asr_pipeline,
-        # we can get the config from it.
-        # However, the orchestrator handles pipeline acquisition
-        # via borrow_pipeline.
-        # We'll use the config from the injected pipeline as
-        # the starting point.
+        # The orchestrator handles pipeline acquisition via borrow_pipeline;
+        # the config of the injected pipeline is the starting point.
         base_config = asr_pipeline.asr_backend.config
-
-        try:
-            result = orchestrator.run_transcription(
-                audio_path=temp_filepath,
-                backend_config=base_config,
-                language=language,
-                task=task,
-                timestamp_type=timestamp_type,
-            )
-        except OutOfMemoryError as oom:
-            raise HTTPException(
-                status_code=507,
-                detail=f"Insufficient GPU memory for transcription: {str(oom)}",
-            ) from oom
-        except Exception as e:
-            if isinstance(e, HTTPException):
-                raise
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-        # Optional stabilization (post-process) applied here for API
-        if stabilize:
-            try:
-                result = stabilize_timestamps(
-                    result, demucs=demucs, vad=vad, vad_threshold=vad_threshold
-                )
-            except Exception as stab_exc:  # noqa: BLE001
-                logger.error("Stabilization failed: %s", stab_exc, exc_info=True)
-        logger.info("Transcription completed successfully")
+        result = await _process_upload(
+            temp_filepath,
+            base_config,
+            input_identity=None if uploaded else _local_identity(temp_filepath),
+            task=task,
+            language=language,
+            timestamp_type=timestamp_type,
+            stabilize=stabilize,
+            demucs=demucs,
+            vad=vad,
+            vad_threshold=vad_threshold,
+        )
 
         # Validate response_format
         if response_format not in SUPPORTED_RESPONSE_FORMATS:
@@ -169,7 +324,9 @@ async def create_transcription(
         return ResponseFormatter.format_transcription(result, response_format)
 
     finally:
-        file_handler.cleanup(temp_filepath)
+        # Files read in place belong to the caller and are never removed.
+        if uploaded:
+            file_handler.cleanup(temp_filepath)
 
 
 @router.post(
@@ -188,13 +345,24 @@ async def create_transcription(
             },
         },
         400: {"description": "Invalid request parameters"},
+        413: {"description": "File exceeds the upload size or duration limit"},
+        415: {"description": "File content is not a supported audio format"},
         422: {"description": "Validation error (e.g., unsupported file format)"},
         500: {"description": "Internal server error"},
         503: {"description": "Model not loaded or unavailable"},
     },
 )
 async def create_translation(
-    file: UploadFile = File(..., description="The audio file to translate"),  # noqa: B008
+    file: UploadFile | None = File(  # noqa: B008
+        None, description="The audio file to translate"
+    ),
+    path: str | None = Form(
+        None,
+        description=(
+            "Server-side file under API_LOCAL_INPUT_ROOT to read in place "
+            "instead of uploading"
+        ),
+    ),
     response_format: str = Form(
         RESPONSE_FORMAT_JSON,
         description="Response format (json, verbose_json, text, srt, vtt)",
@@ -225,6 +393,8 @@ async def create_translation(
 
     Args:
         file: The audio file to translate (supported formats: mp3, wav, etc.)
+        path: Server-side file to read in place instead of ``file``; requires
+            ``API_LOCAL_INPUT_ROOT``
         response_format: Desired response format ("json" or "text")
         timestamp_type: Type of timestamp to generate ("chunk" or "word")
         language: Optional source language code (auto-detect if None)
@@ -243,49 +413,30 @@ async def create_translation(
     """
     logger.info("-" * 50)
     logger.info("Received translation request:")
-    logger.info("  File: %s", file.filename)
+    logger.info("  File: %s", file.filename if file is not None else path)
     logger.debug("  Timestamp type: %s", timestamp_type)
     logger.debug("  Language: %s", language)
     logger.debug("  Response format: %s", response_format)
 
-    # Validate and save file
-    file_handler.validate_audio_file(file)
-    temp_filepath = file_handler.save_upload(file)
+    # Saving and probing the upload block on disk I/O and ffprobe
+    temp_filepath, uploaded = await asyncio.to_thread(
+        _admit_input, file, path, file_handler
+    )
 
     try:
-        logger.info("Starting translation process...")
-
-        # Use orchestrator for translation with OOM recovery
-        orchestrator = create_orchestrator()
         base_config = asr_pipeline.asr_backend.config
-
-        try:
-            result = orchestrator.run_transcription(
-                audio_path=temp_filepath,
-                backend_config=base_config,
-                language=language,
-                task="translate",
-                timestamp_type=timestamp_type,
-            )
-        except OutOfMemoryError as oom:
-            raise HTTPException(
-                status_code=507,
-                detail=f"Insufficient GPU memory for translation: {str(oom)}",
-            ) from oom
-        except Exception as e:
-            if isinstance(e, HTTPException):
-                raise
-            raise HTTPException(status_code=500, detail=str(e)) from e
-
-        # Optional stabilization (post-process) applied here for API
-        if stabilize:
-            try:
-                result = stabilize_timestamps(
-                    result, demucs=demucs, vad=vad, vad_threshold=vad_threshold
-                )
-            except Exception as stab_exc:  # noqa: BLE001
-                logger.error("Stabilization failed: %s", stab_exc, exc_info=True)
-        logger.info("Translation completed successfully")
+        result = await _process_upload(
+            temp_filepath,
+            base_config,
+            input_identity=None if uploaded else _local_identity(temp_filepath),
+            task="translate",
+            language=language,
+            timestamp_type=timestamp_type,
+            stabilize=stabilize,
+            demucs=demucs,
+            vad=vad,
+            vad_threshold=vad_threshold,
+        )
         logger.debug("Translation result: %s", result)
 
         # Validate response_format
@@ -296,4 +447,268 @@ async def create_translation(
         return ResponseFormatter.format_translation(result, response_format)
 
     finally:
-        file_handler.cleanup(temp_filepath)
+        # Files read in place belong to the caller and are never removed.
+        if uploaded:
+            file_handler.cleanup(temp_filepath)
+
+
+# Archive folder used for each response format in batch ZIP downloads
+_BATCH_ZIP_FORMATS = {
+    "json": "json",
+    "verbose_json": "json",
+    "text": "txt",
+    "srt": "srt",
+    "vtt": "vtt",
+}
+
+
+def _outcome_record(outcome: BatchOutcome, response_format: str) -> dict[str, Any]:
+    """Describe one batch outcome for the NDJSON stream.
+
+    Args:
+        outcome: The processed (or rejected) file.
+        response_format: Format of the rendered result.
+
+    Returns:
+        dict[str, Any]: The record written for the file.
+    """
+    record: dict[str, Any] = {
+        "index": outcome.item.index,
+        "filename": outcome.item.filename,
+        "status_code": outcome.status_code,
+    }
+    if outcome.ok and outcome.result is not None:
+        record["result"] = ResponseFormatter.render_payload(
+            outcome.result, response_format
+        )
+    else:
+        record["error"] = outcome.error
+    return record
+
+
+def _iter_batch_ndjson(
+    outcomes: Iterator[BatchOutcome], response_format: str
+) -> Iterator[bytes]:
+    """Encode batch outcomes as NDJSON lines, ending with a summary line.
+
+    Yields:
+        bytes: One JSON document per line.
+    """
+    succeeded = failed = 0
+    for outcome in outcomes:
+        succeeded += outcome.ok
+        failed += not outcome.ok
+        record = _outcome_record(outcome, response_format)
+        yield (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    summary = {"summary": {"succeeded": succeeded, "failed": failed}}
+    yield (json.dumps(summary) + "\n").encode("utf-8")
+
+
+def _build_batch_zip(outcomes: Iterator[BatchOutcome], response_format: str) -> str:
+    """Write batch results into a ZIP archive as they complete.
+
+    Args:
+        outcomes: Outcomes from `iter_batch_outcomes`.
+        response_format: Selects the rendered format inside the archive.
+
+    Returns:
+        str: Path of the finished archive.
+    """
+    # Imported lazily: the WebUI package pulls in Gradio.
+    from insanely_fast_whisper_rocm.webui.zip_creator import (
+        BatchZipBuilder,
+        ZipConfiguration,
+    )
+
+    formats = [_BATCH_ZIP_FORMATS[response_format]]
+    builder = BatchZipBuilder(ZipConfiguration(organize_by_format=True))
+    builder.create(filename=f"batch_{os.urandom(6).hex()}.zip")
+    errors: list[dict[str, Any]] = []
+    try:
+        for outcome in outcomes:
+            if outcome.ok and outcome.result is not None:
+                result = outcome.result.get("transcription", outcome.result)
+                builder.add_file_async(outcome.item.filename, result, formats)
+            else:
+                errors.append(_outcome_record(outcome, response_format))
+        if errors:
+            errors.sort(key=lambda record: record["index"])
+            builder.add_custom_file("errors.json", json.dumps(errors, indent=2))
+        zip_path, _ = builder.build()
+    except BaseException:
+        builder.discard()
+        raise
+    return zip_path
+
+
+def _remove_file(path: str) -> None:
+    """Delete a served download."""
+    with contextlib.suppress(OSError):
+        os.remove(path)
+
+
+@router.post(
+    "/v1/audio/batch",
+    tags=["Transcription"],
+    summary="Batch Transcribe Audio",
+    description=(
+        "Transcribe or translate many audio files (or ZIP archives of audio "
+        "files) in one request"
+    ),
+    response_model=None,
+    responses={
+        200: {
+            "description": (
+                "Per-file results as NDJSON lines in completion order, followed "
+                "by a summary line, or a ZIP archive when output=zip"
+            ),
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "application/zip": {"schema": {"type": "string", "format": "binary"}},
+            },
+        },
+        400: {"description": "Invalid request parameters"},
+        500: {"description": "Internal server error"},
+    },
+)
+async def create_batch_transcription(
+    files: list[UploadFile] = File(  # noqa: B008
+        ..., description="Audio files or ZIP archives of audio files"
+    ),
+    task: Literal["transcribe", "translate"] = Form(
+        "transcribe", description="ASR task type"
+    ),
+    response_format: str = Form(
+        RESPONSE_FORMAT_JSON,
+        description="Format of each result (json, verbose_json, text, srt, vtt)",
+    ),
+    output: Literal["ndjson", "zip"] = Form(
+        "ndjson", description="Stream NDJSON records or return a ZIP archive"
+    ),
+    timestamp_type: str = Form(
+        DEFAULT_TIMESTAMP_TYPE,
+        description="Type of timestamp to generate ('chunk' or 'word')",
+    ),
+    language: str | None = Form(
+        None, description="Source language code (auto-detect if None)"
+    ),
+    stabilize: bool = Form(
+        DEFAULT_STABILIZE, description="Enable timestamp stabilization"
+    ),
+    demucs: bool = Form(DEFAULT_DEMUCS, description="Enable Demucs noise reduction"),
+    vad: bool = Form(DEFAULT_VAD, description="Enable Voice Activity Detection"),
+    vad_threshold: float = Form(
+        DEFAULT_VAD_THRESHOLD, description="VAD threshold for speech detection"
+    ),
+    asr_pipeline: WhisperPipeline = Depends(get_asr_pipeline),  # noqa: B008
+    file_handler: FileHandler = Depends(get_file_handler),  # noqa: B008
+) -> StreamingResponse | FileResponse:
+    """Process many files in one request with per-file error isolation.
+
+    Files share the cached model: inference is serialized, while WAV
+    conversion and stabilization of other files overlap with it. A file that
+    is rejected or fails to process is reported on its own and does not
+    affect the rest of the batch.
+
+    Args:
+        files: Audio files, or ZIP archives whose audio members are processed.
+        task: "transcribe" or "translate".
+        response_format: Format of each rendered result.
+        output: "ndjson" streams one JSON record per file as it completes;
+            "zip" returns an archive with one file per input plus
+            ``errors.json`` for failed inputs.
+        timestamp_type: Type of timestamp to generate ("chunk" or "word")
+        language: Optional source language code (auto-detect if None)
+        stabilize: Enable timestamp stabilization if True.
+        demucs: Enable Demucs noise reduction if True.
+        vad: Enable Voice Activity Detection if True.
+        vad_threshold: VAD sensitivity threshold (0.0 - 1.0).
+        asr_pipeline: Injected ASR pipeline instance
+        file_handler: Injected file handler instance
+
+    Returns:
+        StreamingResponse | FileResponse: NDJSON stream or ZIP download.
+
+    Raises:
+        HTTPException: If ``response_format`` is not supported.
+    """
+    if response_format not in SUPPORTED_RESPONSE_FORMATS:
+        raise HTTPException(status_code=400, detail="Unsupported response_format")
+    logger.info("Received batch %s request with %d upload(s)", task, len(files))
+
+    # Uploads are saved before responding; FastAPI closes them afterwards.
+    items = await asyncio.to_thread(collect_batch_items, files, file_handler)
+    job = functools.partial(
+        _run_asr_job,
+        backend_config=asr_pipeline.asr_backend.config,
+        task=task,
+        language=language,
+        timestamp_type=timestamp_type,
+        stabilize=stabilize,
+        demucs=demucs,
+        vad=vad,
+        vad_threshold=vad_threshold,
+    )
+    outcomes = iter_batch_outcomes(items, job)
+
+    if output == "zip":
+        zip_path = await asyncio.to_thread(_build_batch_zip, outcomes, response_format)
+        return FileResponse(
+            zip_path,
+            media_type="application/zip",
+            filename=os.path.basename(zip_path),
+            background=BackgroundTask(_remove_file, zip_path),
+        )
+    return StreamingResponse(
+        _iter_batch_ndjson(outcomes, response_format),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/v1/transcripts/search",
+    tags=["Transcripts"],
+    summary="Search Transcripts",
+    description="Full-text search over the SQLite transcript archive",
+    response_model=TranscriptSearchResponse,
+    responses={
+        400: {"description": "Invalid search query"},
+        404: {"description": "Transcript archive not found"},
+    },
+)
+def search_transcripts(
+    q: str = Query(..., min_length=1, description="Full-text search query"),
+    limit: int = Query(20, ge=1, le=500, description="Maximum number of hits"),
+    file: str | None = Query(None, description="Filter on file name substring"),
+    model: str | None = Query(None, description="Filter on model name"),
+    task: Literal["transcribe", "translate"] | None = Query(
+        None, description="Filter on ASR task"
+    ),
+) -> TranscriptSearchResponse:
+    """Search archived transcript segments.
+
+    Results are archived when the server runs with ``STORAGE_BACKEND=sqlite``.
+
+    Args:
+        q: Full-text query (FTS5 syntax when available).
+        limit: Maximum number of hits to return.
+        file: Only return hits whose file name contains this value.
+        model: Only return hits produced by this model.
+        task: Only return hits for this task.
+
+    Returns:
+        TranscriptSearchResponse: The query and its timestamped hits.
+
+    Raises:
+        HTTPException: 404 if the archive does not exist, 400 for invalid queries.
+    """
+    db_path = Path(constants.STORAGE_SQLITE_PATH)
+    if not db_path.exists():
+        raise HTTPException(status_code=404, detail="Transcript archive not found")
+    try:
+        hits = SQLiteStorage(db_path).search(
+            q, limit=limit, file=file, model=model, task=task
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return TranscriptSearchResponse(query=q, hits=hits)
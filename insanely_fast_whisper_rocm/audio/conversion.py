@@ -15,6 +15,7 @@ try:  # pragma: no cover - optional dependency
 except ModuleNotFoundError:  # pragma: no cover - handled gracefully
     ffmpeg = None  # type: ignore
 
+from insanely_fast_whisper_rocm.utils.temp_space import temp_prefix, track_temp_path
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +54,9 @@ def ensure_wav(
     if original_path.suffix.lower() == ".wav":
         return str(original_path)
 
-    tmp_dir = Path(tempfile.mkdtemp(prefix="converted_audio_"))
+    tmp_dir = Path(
+        track_temp_path(tempfile.mkdtemp(prefix=temp_prefix("converted_audio_")))
+    )
     output_path = tmp_dir / f"{original_path.stem or 'audio'}.wav"
 
     if ffmpeg is None:
@@ -16,6 +16,7 @@ except ModuleNotFoundError:  # pragma: no cover - handled gracefully
     AudioSegment = None  # type: ignore
 
 from insanely_fast_whisper_rocm.utils.file_utils import cleanup_temp_files
+from insanely_fast_whisper_rocm.utils.temp_space import temp_prefix, track_temp_path
 
 
 def get_audio_duration(audio_path: str) -> float:
@@ -78,7 +79,9 @@ def extract_audio_from_video(
         if not os.path.isfile(video_path):
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
-        tmp_dir = tempfile.mkdtemp(prefix="extracted_audio_")
+        tmp_dir = track_temp_path(
+            tempfile.mkdtemp(prefix=temp_prefix("extracted_audio_"))
+        )
         output_path = os.path.join(
             tmp_dir,
             f"{os.path.splitext(os.path.basename(video_path))[0]}.{output_format}",
@@ -161,7 +164,9 @@ def split_audio(
             return [(audio_path, 0.0)]
 
         # Create a temporary directory for chunks
-        temp_dir = tempfile.mkdtemp(prefix="audio_chunks_")
+        temp_dir = track_temp_path(
+            tempfile.mkdtemp(prefix=temp_prefix("audio_chunks_"))
+        )
         chunk_paths: list[tuple[str, float]] = []
         start_ms = 0
         chunk_num = 1
@@ -20,10 +20,13 @@ def merge_chunk_results(chunk_results: list[tuple[dict, float]]) -> dict[str, An
     all_chunks = []
     full_text = []
     total_runtime = 0.0
+    guard_events = []
 
     for result, start_time in chunk_results:
         full_text.append(result.get("text", "").strip())
         total_runtime += result.get("runtime_seconds", 0.0)
+        for event in result.get("generation_guard") or []:
+            guard_events.append({**event, "chunk_start": start_time})
 
         if "chunks" in result and result["chunks"] is not None:
             for segment in result["chunks"]:
@@ -67,5 +70,7 @@ def merge_chunk_results(chunk_results: list[tuple[dict, float]]) -> dict[str, An
         "chunking_used": True,
         "num_chunks": len(chunk_results),
     }
+    if guard_events:
+        combined["generation_guard"] = guard_events
 
     return combined
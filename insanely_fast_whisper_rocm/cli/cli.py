@@ -11,7 +11,8 @@ import warnings
 import click
 from transformers import logging as transformers_logging
 
-from insanely_fast_whisper_rocm.cli.commands import transcribe, translate
+from insanely_fast_whisper_rocm.cli.commands import search, transcribe, translate
+from insanely_fast_whisper_rocm.core.result_writer import shutdown_result_writer
 from insanely_fast_whisper_rocm.utils import constants
 
 # Configure logging
@@ -30,18 +31,23 @@ os.environ["TOKENIZERS_PARALLELISM"] = "false"  # Suppress parallelism warning
 
 @click.group()
 @click.version_option(version=constants.API_VERSION, prog_name=constants.API_TITLE)
-def cli() -> None:
+@click.pass_context
+def cli(ctx: click.Context) -> None:
     """🎵 Insanely Fast Whisper API - CLI Tool.
 
     A high-performance CLI for audio transcription and translation.
 
     For a full list of options for each command, add `--help` after the command name.
     """
+    # Results may still be queued on the background writer when a command
+    # returns (or exits via sys.exit); make sure they reach disk.
+    ctx.call_on_close(shutdown_result_writer)
 
 
 # Add commands to the CLI group
 cli.add_command(transcribe)
 cli.add_command(translate)
+cli.add_command(search)
 
 
 def main() -> None:
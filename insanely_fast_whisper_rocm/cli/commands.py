@@ -8,6 +8,7 @@ receives shared CLI options via the ``audio_options`` decorator. See
 from __future__ import annotations
 
 import contextlib
+import json
 import logging
 import os
 import signal
@@ -32,9 +33,12 @@ from insanely_fast_whisper_rocm.core.errors import (
 )
 from insanely_fast_whisper_rocm.core.formatters import (
     FORMATTERS,
+    RenderPlan,
     build_quality_segments,
 )
 from insanely_fast_whisper_rocm.core.progress import ProgressCallback
+from insanely_fast_whisper_rocm.core.storage import SQLiteStorage
+from insanely_fast_whisper_rocm.core.streaming import should_stream
 from insanely_fast_whisper_rocm.utils import constants
 from insanely_fast_whisper_rocm.utils.file_utils import cleanup_temp_files
 from insanely_fast_whisper_rocm.utils.filename_generator import (
@@ -42,6 +46,7 @@ from insanely_fast_whisper_rocm.utils.filename_generator import (
     StandardFilenameStrategy,
     TaskType,
 )
+from insanely_fast_whisper_rocm.utils.format_time import format_seconds
 from insanely_fast_whisper_rocm.utils.srt_quality import compute_srt_quality
 
 try:
@@ -128,6 +133,58 @@ def translate(audio_file: Path, **kwargs: object) -> None:
     _run_task(task="translate", audio_file=audio_file, **kwargs)
 
 
+@click.command(short_help="Search archived transcripts")
+@click.argument("query")
+@click.option(
+    "--db",
+    "db_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=lambda: constants.STORAGE_SQLITE_PATH,
+    show_default="STORAGE_SQLITE_PATH",
+    help="SQLite transcript archive to search.",
+)
+@click.option("--limit", type=click.IntRange(min=1), default=20, show_default=True)
+@click.option("--file", "file_filter", help="Only match files containing this text.")
+@click.option("--model", help="Only match results produced by this model.")
+@click.option("--task", type=click.Choice(["transcribe", "translate"]), default=None)
+@click.option("--json", "as_json", is_flag=True, help="Print hits as JSON.")
+def search(
+    query: str,
+    db_path: Path,
+    limit: int,
+    file_filter: str | None,
+    model: str | None,
+    task: str | None,
+    as_json: bool,
+) -> None:
+    """Full-text search for *QUERY* in the SQLite transcript archive.
+
+    Results are archived when ``STORAGE_BACKEND=sqlite``.
+    """
+    if not db_path.exists():
+        click.secho(f"❌ Transcript archive not found: {db_path}", fg="red", err=True)
+        sys.exit(1)
+    try:
+        hits = SQLiteStorage(db_path).search(
+            query, limit=limit, file=file_filter, model=model, task=task
+        )
+    except ValueError as exc:
+        click.secho(f"❌ {exc}", fg="red", err=True)
+        sys.exit(1)
+
+    if as_json:
+        click.echo(json.dumps(hits, indent=2, ensure_ascii=False))
+        return
+    if not hits:
+        click.secho("No matches found.", fg="yellow")
+        return
+    for hit in hits:
+        click.echo(
+            f"{hit['file']} [{format_seconds(hit['start'])} --> "
+            f"{format_seconds(hit['end'])}] {hit['text']}"
+        )
+
+
 # --------------------------------------------------------------------------- #
 # Core execution logic                                                        #
 # --------------------------------------------------------------------------- #
@@ -577,6 +634,9 @@ def _handle_output_and_benchmarks(
     }
 
     formatted_by_format: dict[str, str] = {}
+    # Word extraction and segmentation are shared by every subtitle format
+    # and the quality scorer, so compute them at most once per export.
+    render_plan = RenderPlan(detailed_result)
 
     # ------------------------------------------------------------------ #
     # Compute format quality metrics (if benchmarking enabled)          #
@@ -584,7 +644,7 @@ def _handle_output_and_benchmarks(
     format_quality_by_format: dict[str, Any] = {}
     if benchmark_enabled:
         try:
-            quality_segments = build_quality_segments(detailed_result)
+            quality_segments = build_quality_segments(detailed_result, render_plan)
             logger.debug(
                 "Built %d quality segments for SRT quality scoring",
                 len(quality_segments),
@@ -592,7 +652,7 @@ def _handle_output_and_benchmarks(
             srt_formatter = FORMATTERS["srt"]
             srt_text = formatted_by_format.get("srt")
             if srt_text is None:
-                srt_text = srt_formatter.format(detailed_result)
+                srt_text = srt_formatter.format(detailed_result, plan=render_plan)
                 formatted_by_format["srt"] = srt_text
             srt_quality = compute_srt_quality(
                 segments=quality_segments,
@@ -614,13 +674,17 @@ def _handle_output_and_benchmarks(
     except Exception:  # pragma: no cover
         pass
 
+    stream_large_results = should_stream(detailed_result)
     for idx, fmt in enumerate(formats_to_export):
         if cancellation_token is not None and cancellation_token.cancelled:
             raise TranscriptionCancelledError("Transcription cancelled by user")
         formatter = FORMATTERS[fmt]
         content = formatted_by_format.get(fmt)
-        if content is None:
-            content = formatter.format(detailed_result)
+        # Long transcripts are written fragment by fragment below instead of
+        # being rendered into one large string first.
+        stream_export = content is None and stream_large_results
+        if content is None and not stream_export:
+            content = formatter.format(detailed_result, plan=render_plan)
             formatted_by_format[fmt] = content
         ext = formatter.get_file_extension()
 
@@ -647,8 +711,14 @@ def _handle_output_and_benchmarks(
         try:
             if cancellation_token is not None and cancellation_token.cancelled:
                 raise TranscriptionCancelledError("Transcription cancelled by user")
-            output_path.write_text(content, encoding="utf-8")
-            content_size = len(content) if isinstance(content, str) else 0
+            if stream_export:
+                with output_path.open("w", encoding="utf-8") as stream:
+                    content_size = formatter.write(
+                        detailed_result, stream, plan=render_plan
+                    )
+            else:
+                output_path.write_text(content, encoding="utf-8")
+                content_size = len(content) if isinstance(content, str) else 0
             logger.debug(
                 "Saved %s output to: %s (size=%d bytes)",
                 fmt.upper(),
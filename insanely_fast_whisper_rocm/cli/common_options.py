@@ -49,13 +49,13 @@ def audio_options(func: Callable[..., None]) -> Callable[..., None]:
         click.option(
             "--device",
             "-d",
-            help="Device for inference (cuda:0, cpu, mps)",
+            help="Device for inference (cuda:0, cpu, mps; 0,1 for a device pool)",
             show_default=True,
             default=constants.DEFAULT_DEVICE,
         ),
         click.option(
             "--dtype",
-            type=click.Choice(["float16", "float32"]),
+            type=click.Choice(["float16", "float32", "int8"]),
             default=constants.DEFAULT_DTYPE,
             help="Data type for model inference",
             show_default=True,
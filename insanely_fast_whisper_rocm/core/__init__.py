@@ -13,6 +13,7 @@ and removes external dependencies such as GPU availability or HF downloads.
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -184,6 +185,7 @@ class ASRPipeline(BasePipeline):  # type: ignore[misc]
         timestamp_type: str,
         progress_callback: Callable[[str], None] | None = None,
         cancellation_token: CancellationToken | None = None,
+        inference_lock: threading.Lock | None = None,
     ) -> dict[str, Any]:
         """Return a canned transcription result from the dummy backend.
 
@@ -195,11 +197,13 @@ class ASRPipeline(BasePipeline):  # type: ignore[misc]
             progress_callback: Optional callback forwarded by the base pipeline.
             cancellation_token: Cooperative cancellation token forwarded to the
                 backend stub.
+            inference_lock: Ignored; the stub holds no model.
 
         Returns:
             dict[str, Any]: Deterministic transcription payload for fast tests.
         """
-        _ = progress_callback  # Avoid unused-variable warnings in minimal stub.
+        # Avoid unused-variable warnings in minimal stub.
+        _ = progress_callback, inference_lock
         return self.asr_backend.process_audio(
             prepared_data,
             language,
@@ -8,36 +8,90 @@ from __future__ import annotations
 
 import gc
 import logging
+import os
 import time
 import warnings
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
 
 import torch
 from transformers import (
+    AutoConfig,
     AutoFeatureExtractor,
     AutoModelForSpeechSeq2Seq,
     AutoTokenizer,
     GenerationConfig,
+    StoppingCriteria,
+    StoppingCriteriaList,
     pipeline,
 )
+from transformers.pipelines.audio_utils import ffmpeg_read
 from transformers.utils import logging as hf_logging
 
+from insanely_fast_whisper_rocm.core.assisted_generation import (
+    AssistanceMeter,
+    assistant_incompatibility,
+    summarize_assistance,
+)
 from insanely_fast_whisper_rocm.core.cancellation import CancellationToken
+from insanely_fast_whisper_rocm.core.compiled_decoding import (
+    enable_compiled_decoding,
+)
+from insanely_fast_whisper_rocm.core.converted_weights import (
+    converted_model_dir,
+    load_converted_model,
+    source_checkpoint,
+    store_converted_model,
+)
 from insanely_fast_whisper_rocm.core.errors import (
     DeviceNotFoundError,
     InferenceOOMError,
     ModelLoadingOOMError,
     TranscriptionError,
 )
+from insanely_fast_whisper_rocm.core.generation_guard import (
+    WHISPER_MAX_TARGET_POSITIONS,
+    BudgetMonitor,
+    RepetitionGuard,
+    compression_ratio,
+    max_new_tokens_for,
+)
+from insanely_fast_whisper_rocm.core.model_capabilities import (
+    ModelCapabilities,
+    load_profile,
+    model_revision,
+    probe_capabilities,
+    store_profile,
+)
 from insanely_fast_whisper_rocm.core.oom_utils import classify_oom_error
 from insanely_fast_whisper_rocm.core.progress import NoOpProgress, ProgressCallback
+from insanely_fast_whisper_rocm.core.quantization import INT8_DTYPE, load_int8_model
 from insanely_fast_whisper_rocm.core.utils import convert_device_string
+from insanely_fast_whisper_rocm.utils import constants
+from insanely_fast_whisper_rocm.utils.upload_admission import probe_duration
 
 # Placeholder for logger, will be configured properly later
 logger = logging.getLogger(__name__)
 
+# (task, language, return_timestamps) of a prebuilt pipeline kwargs template
+_KwargsKey = tuple[str, str | None, bool | str]
+_T = TypeVar("_T")
+
+
+def _quiet_transformers() -> None:
+    """Silence noisy Transformers warnings about chunking and deprecations."""
+    warnings.filterwarnings(
+        "ignore",
+        message="Using `chunk_length_s` is very experimental*",
+        category=UserWarning,
+    )
+    warnings.filterwarnings("ignore", category=FutureWarning, module="transformers")
+    hf_logging.set_verbosity_error()
+
 
 @dataclass
 class HuggingFaceBackendConfig:
@@ -49,6 +103,29 @@ class HuggingFaceBackendConfig:
     batch_size: int
     chunk_length: int
     progress_group_size: int
+    # Draft model for speculative decoding (see `assisted_generation`)
+    assistant_model: str | None = field(
+        default_factory=lambda: constants.DEFAULT_ASSISTANT_MODEL
+    )
+
+
+def _timed_call(
+    timings: dict[str, float],
+    phase: str,
+    func: Callable[..., _T],
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> _T:
+    """Call ``func`` and record its duration under ``phase``.
+
+    Returns:
+        _T: The call's result.
+    """
+    started = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        timings[phase] = round(time.perf_counter() - started, 3)
 
 
 class ASRBackend(ABC):  # pylint: disable=too-few-public-methods
@@ -67,6 +144,20 @@ class ASRBackend(ABC):  # pylint: disable=too-few-public-methods
     ) -> dict[str, Any]:
         """Processes the audio file and returns the result."""
 
+    def detect_language(self, audio_file_paths: list[str]) -> str | None:
+        """Identify the spoken language of one or more audio samples.
+
+        Backends that cannot detect the language on its own return None, in
+        which case every `process_audio` call detects it again.
+
+        Args:
+            audio_file_paths: Sample files from the same recording.
+
+        Returns:
+            str | None: A language code such as ``"en"``, or None.
+        """
+        return None
+
 
 class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
     """ASR Backend using Hugging Face Transformers pipeline."""
@@ -81,6 +172,18 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
         self.config = config
         self.effective_device = convert_device_string(self.config.device)
         self.asr_pipe = None  # Lazy initialization
+        # Probed once per loaded pipeline (see `_capabilities`)
+        self.capabilities: ModelCapabilities | None = None
+        self._profiled_pipe: object | None = None
+        self._kwargs_templates: dict[_KwargsKey, dict[str, Any]] = {}
+        # Converted-weights cache entry to write once the model is loaded
+        self._converted_model_dir: Path | None = None
+        # Seconds spent in each model load phase, for cold-start tracking
+        self.load_timings: dict[str, float] = {}
+        # Speculative decoding draft model, loaded with the main model
+        self.assistant: Any | None = None
+        # Why decoding runs without the configured assistant, if it does
+        self.assistant_unavailable: str | None = None
 
         self._validate_device()
 
@@ -90,7 +193,13 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
         Raises:
             DeviceNotFoundError: If the requested CUDA or MPS device is not
                 available on the system.
+            TranscriptionError: If int8 inference is requested off the CPU.
         """
+        if self.config.dtype == INT8_DTYPE and self.effective_device != "cpu":
+            raise TranscriptionError(
+                f"dtype 'int8' is only supported on the CPU, not on "
+                f"{self.effective_device}. Use float16 or float32 instead."
+            )
         if "cuda" in self.effective_device and not torch.cuda.is_available():
             raise DeviceNotFoundError(
                 f"CUDA device {self.effective_device} requested but CUDA is not "
@@ -114,8 +223,6 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
             ModelLoadingOOMError: If model initialization fails due to VRAM.
             TranscriptionError: If the ASR model or associated components fail
                 to load.
-            RuntimeError: Propagated for low-level framework errors that may
-                occur prior to wrapping.
         """
         if self.asr_pipe is None:
             cb = progress_cb or NoOpProgress()
@@ -143,70 +250,50 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
                 "use_safetensors": True,
             }
 
-            # For newer transformers, SDPA is fast. On ROCm it sometimes fails at
-            # runtime on certain stacks; per user preference, try SDPA first and
-            # fallback to 'eager' only if needed. Keep SDPA on CUDA.
+            # SDPA is fast but fails to load on some ROCm stacks; there
+            # `_load_weights` retries with 'eager'.
             if self.effective_device != "cpu":
-                is_rocm = getattr(torch.version, "hip", None) is not None
-                if is_rocm:
-                    model_load_kwargs["attn_implementation"] = "sdpa"
-                    logger.info(
-                        "ROCm detected; trying attn_implementation='sdpa' first"
-                    )
-                else:
-                    model_load_kwargs["attn_implementation"] = "sdpa"
+                model_load_kwargs["attn_implementation"] = "sdpa"
+                # Read the safetensors straight onto the device in the target
+                # dtype instead of staging a CPU copy for the pipeline to move
+                model_load_kwargs["device_map"] = self.effective_device
 
+            load_timings: dict[str, float] = {}
+            load_started = time.perf_counter()
             try:
                 logger.info(
                     "Loading ASR model '%s' with kwargs: %s",
                     self.config.model_name,
                     model_load_kwargs,
                 )
+                # Tokenizer and feature extractor load while the weights do
+                loader = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="model-load"
+                )
                 try:
-                    model = AutoModelForSpeechSeq2Seq.from_pretrained(
-                        self.config.model_name, **model_load_kwargs
+                    tokenizer_future = loader.submit(
+                        _timed_call,
+                        load_timings,
+                        "tokenizer",
+                        AutoTokenizer.from_pretrained,
+                        self.config.model_name,
                     )
-                except (OSError, ValueError, RuntimeError, ImportError) as e_first:
-                    # Check for OOM during first attempt
-                    oom_error = classify_oom_error(e_first)
-                    if oom_error:
-                        raise ModelLoadingOOMError(
-                            f"OOM during initial model load: {str(e_first)}",
-                            device=self.effective_device,
-                            config={"model": self.config.model_name},
-                        ) from e_first
-
-                    # On ROCm, fallback to 'eager' if SDPA attempt fails at load.
-                    if (
-                        getattr(torch.version, "hip", None) is not None
-                        and model_load_kwargs.get("attn_implementation") == "sdpa"
-                    ):
-                        logger.warning(
-                            "Model load with SDPA failed on ROCm, retrying with "
-                            "attn_implementation='eager': %s",
-                            str(e_first),
-                        )
-                        model_load_kwargs["attn_implementation"] = "eager"
-                        logger.info(
-                            "Reloading ASR model '%s' with kwargs: %s",
-                            self.config.model_name,
-                            model_load_kwargs,
-                        )
-                        try:
-                            model = AutoModelForSpeechSeq2Seq.from_pretrained(
-                                self.config.model_name, **model_load_kwargs
-                            )
-                        except RuntimeError as e_retry:
-                            oom_error = classify_oom_error(e_retry)
-                            if oom_error:
-                                raise ModelLoadingOOMError(
-                                    f"OOM during model load retry: {str(e_retry)}",
-                                    device=self.effective_device,
-                                    config={"model": self.config.model_name},
-                                ) from e_retry
-                            raise
-                    else:
-                        raise
+                    feature_extractor_future = loader.submit(
+                        _timed_call,
+                        load_timings,
+                        "feature_extractor",
+                        AutoFeatureExtractor.from_pretrained,
+                        self.config.model_name,
+                    )
+                    model = _timed_call(
+                        load_timings, "weights", self._load_weights, model_load_kwargs
+                    )
+                    tokenizer = tokenizer_future.result()
+                    feature_extractor = feature_extractor_future.result()
+                finally:
+                    # If the weights failed, don't block on component loads
+                    # (possibly network downloads) whose results are discarded
+                    loader.shutdown(wait=False, cancel_futures=True)
                 model_device = getattr(model, "device", None)
                 if model_device is None:
                     model_parameters = getattr(model, "parameters", None)
@@ -226,65 +313,70 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
                         )
                 else:
                     logger.debug("Unable to determine ASR model device")
-                tokenizer = AutoTokenizer.from_pretrained(self.config.model_name)
-                feature_extractor = AutoFeatureExtractor.from_pretrained(
-                    self.config.model_name
-                )
-
-                # Backfill missing Whisper generation config for fine-tuned
-                # checkpoints that did not upload generation_config.json.
-                # This enables timestamp extraction and multilingual task mapping.
-                try:
-                    gen_cfg = getattr(model, "generation_config", None)
-                    missing_ts_cfg = (
-                        gen_cfg is None
-                        or getattr(gen_cfg, "no_timestamps_token_id", None) is None
+                generation_config_started = time.perf_counter()
+                profile = load_profile(self.config.model_name, model_revision(model))
+                if profile is not None and profile.generation_config is not None:
+                    # Reuse the backfill recorded for this revision
+                    model.generation_config = GenerationConfig.from_dict(
+                        profile.generation_config
                     )
-
-                    name = self.config.model_name.lower()
-                    if missing_ts_cfg and ("whisper" in name):
-                        is_en = (".en" in name) or ("-en" in name)
-                        base_id = None
-
-                        if "large" in name:
-                            if ("large-v3" in name) or ("v3" in name):
-                                base_id = "openai/whisper-large-v3"
-                            elif ("large-v2" in name) or ("v2" in name):
-                                base_id = "openai/whisper-large-v2"
-                            else:
-                                base_id = "openai/whisper-large-v2"
-                        elif "medium" in name:
-                            base_id = "openai/whisper-medium" + (".en" if is_en else "")
-                        elif "small" in name:
-                            base_id = "openai/whisper-small" + (".en" if is_en else "")
-                        elif "base" in name:
-                            base_id = "openai/whisper-base" + (".en" if is_en else "")
-                        elif "tiny" in name:
-                            base_id = "openai/whisper-tiny" + (".en" if is_en else "")
-
-                        if base_id:
-                            logger.info(
-                                "Backfilling gen config from %s for %s",
-                                base_id,
-                                self.config.model_name,
-                            )
-                            model.generation_config = GenerationConfig.from_pretrained(
-                                base_id
-                            )
-                except Exception as gen_e:  # pylint: disable=broad-except
-                    logger.warning(
-                        "Failed to backfill generation_config for %s: %s",
+                elif profile is None:
+                    backfill_source = self._backfill_generation_config(model)
+                    profile = probe_capabilities(
                         self.config.model_name,
-                        str(gen_e),
+                        model,
+                        generation_config_source=backfill_source,
+                    )
+                    store_profile(profile)
+                load_timings["generation_config"] = round(
+                    time.perf_counter() - generation_config_started, 3
+                )
+                if self._converted_model_dir is not None:
+                    # Saved with the backfilled generation config, before
+                    # compiled decoding changes it
+                    _timed_call(
+                        load_timings,
+                        "converted_cache",
+                        store_converted_model,
+                        self._converted_model_dir,
+                        model,
                     )
+                    self._converted_model_dir = None
 
-                self.asr_pipe = pipeline(
+                if constants.TORCH_COMPILE:
+                    if self.config.dtype == INT8_DTYPE:
+                        logger.warning(
+                            "TORCH_COMPILE is ignored for int8-quantized models"
+                        )
+                    else:
+                        enable_compiled_decoding(
+                            model, self.effective_device, self.config.batch_size
+                        )
+                # A model placed through device_map is already on its device;
+                # the pipeline rejects an explicit device for such models
+                device_arg = (
+                    None if "device_map" in model_load_kwargs else self.effective_device
+                )
+                self.asr_pipe = _timed_call(
+                    load_timings,
+                    "pipeline",
+                    pipeline,
                     "automatic-speech-recognition",
                     model=model,
                     tokenizer=tokenizer,
                     feature_extractor=feature_extractor,
-                    device=self.effective_device,
+                    device=device_arg,
                 )
+                self._set_capabilities(profile)
+                if self.config.assistant_model:
+                    _timed_call(
+                        load_timings,
+                        "assistant",
+                        self._load_assistant,
+                        model,
+                        model_load_kwargs,
+                    )
+                _quiet_transformers()
                 pipeline_device = getattr(self.asr_pipe, "device", None)
                 if pipeline_device is not None:
                     logger.info(
@@ -292,9 +384,23 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
                         pipeline_device,
                     )
 
+                load_timings["total"] = round(time.perf_counter() - load_started, 3)
+                self.load_timings = load_timings
+                logger.info(
+                    "Model load phases (s): %s",
+                    ", ".join(
+                        f"{phase}={sec:.2f}" for phase, sec in load_timings.items()
+                    ),
+                )
                 cb.on_model_load_finished()
 
             except (OSError, ValueError, RuntimeError, ImportError) as e:
+                if classify_oom_error(e):
+                    raise ModelLoadingOOMError(
+                        f"OOM during model load: {str(e)}",
+                        device=self.effective_device,
+                        config={"model": self.config.model_name},
+                    ) from e
                 logger.error(
                     "Failed to load ASR model '%s': %s",
                     self.config.model_name,
@@ -303,127 +409,280 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
                 )
                 raise TranscriptionError(f"Failed to load ASR model: {str(e)}") from e
 
-    def process_audio(
-        self,
-        audio_file_path: str,
-        language: str | None,
-        task: str,
-        return_timestamps_value: bool | str,
-        progress_cb: ProgressCallback | None = None,
-        cancellation_token: CancellationToken | None = None,
-    ) -> dict[str, Any]:
-        """Process an audio file and return the transcription result.
+    def _load_weights(self, model_load_kwargs: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Load the model, falling back to eager attention on ROCm.
+
+        SDPA fails to load on some ROCm stacks; the model is then loaded again
+        with eager attention. On success ``model_load_kwargs`` holds the
+        attention implementation in use, so the assistant model matches it.
 
         Args:
-            audio_file_path: Input audio path.
-            language: Optional language code.
-            task: "transcribe" or "translate".
-            return_timestamps_value: Whether/how to return timestamps.
-            progress_cb: Optional progress reporter.
-            cancellation_token: Optional cooperative cancellation token.
+            model_load_kwargs: Keyword arguments for ``from_pretrained``.
 
         Returns:
-            dict[str, Any]: Result with text, optional chunks, runtime, and
-            config used.
+            Any: The loaded model.
 
         Raises:
-            InferenceOOMError: If audio processing fails due to VRAM.
-            RuntimeError: If model initialization or inference fails.
-            TranscriptionError: If model loading or inference fails.
+            OSError: If the checkpoint files cannot be read.
+            ValueError: If the checkpoint or load options are invalid.
+            RuntimeError: If loading fails, including running out of memory.
+            ImportError: If a package needed to load the model is missing.
         """
-        logger.debug(
-            "process_audio called: model=%s, return_timestamps_value=%s, task=%s",
+        try:
+            return self._load_model(model_load_kwargs)
+        except (OSError, ValueError, RuntimeError, ImportError) as e:
+            if (
+                classify_oom_error(e)
+                or getattr(torch.version, "hip", None) is None
+                or model_load_kwargs.get("attn_implementation") != "sdpa"
+            ):
+                raise
+            logger.warning(
+                "Model load with SDPA failed on ROCm, retrying with "
+                "attn_implementation='eager': %s",
+                str(e),
+            )
+        model_load_kwargs["attn_implementation"] = "eager"
+        return self._load_model(model_load_kwargs)
+
+    def _load_model(self, model_load_kwargs: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Load the checkpoint, quantized to int8 if ``dtype`` is "int8".
+
+        Args:
+            model_load_kwargs: Keyword arguments for ``from_pretrained``.
+
+        Returns:
+            The loaded model.
+        """
+        if self.config.dtype != INT8_DTYPE:
+            return self._load_float_model(model_load_kwargs)
+        try:
+            model_config = AutoConfig.from_pretrained(self.config.model_name)
+            revision = getattr(model_config, "_commit_hash", None)
+        except (OSError, ValueError) as e:
+            logger.debug(
+                "Could not resolve revision of %s: %s", self.config.model_name, e
+            )
+            model_config = revision = None
+        return load_int8_model(
             self.config.model_name,
-            return_timestamps_value,
-            task,
+            revision,
+            lambda: AutoModelForSpeechSeq2Seq.from_pretrained(
+                self.config.model_name, **model_load_kwargs
+            ),
+            lambda: self._int8_skeleton(model_config),
         )
 
-        cb = progress_cb or NoOpProgress()
-        if cancellation_token is not None:
-            cancellation_token.raise_if_cancelled()
-        if self.asr_pipe is None:
-            self._initialize_pipeline(progress_cb=cb)
-            if cancellation_token is not None:
-                cancellation_token.raise_if_cancelled()
+    def _int8_skeleton(self, model_config: Any) -> Any:  # noqa: ANN401
+        """Build the float32 model without loading or initializing its weights.
 
-        start_time = time.perf_counter()
+        Args:
+            model_config: The checkpoint's model config.
 
-        # ------------------------------------------------------------------
-        # Timestamp capability detection for distil-whisper variants
-        # ------------------------------------------------------------------
-        _return_timestamps_value = return_timestamps_value
-        if _return_timestamps_value and "distil-whisper" in self.config.model_name:
-            logger.debug(
-                "Distil-whisper model detected: %s, checking timestamp support",
-                self.config.model_name,
+        Returns:
+            The model with uninitialized CPU weights and the checkpoint's
+            generation config.
+        """
+        with torch.device("meta"):
+            model = AutoModelForSpeechSeq2Seq.from_config(model_config).float()
+        model.to_empty(device="cpu")
+        try:
+            model.generation_config = GenerationConfig.from_pretrained(
+                self.config.model_name
             )
-            # distil-whisper versions ≥ v2 have timestamp support; earlier ones do not.
-            # Determine this heuristically from the model name.
-            # Examples that support timestamps:
-            #   distil-whisper/distil-large-v2
-            #   distil-whisper/distil-medium.en-v2
-            # Anything ending in "-v2" or "-v3" (or greater) is considered supported.
-            supports_timestamps = False
+        except OSError as e:  # Backfilled later, like for a float load
+            logger.debug("No generation config for %s: %s", self.config.model_name, e)
+        return model
+
+    def _load_float_model(self, model_load_kwargs: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Load the checkpoint, from the converted-weights cache if possible.
+
+        A checkpoint stored in another dtype than requested is read from
+        ``CONVERTED_MODEL_CACHE_DIR`` when a converted copy of its revision
+        exists; otherwise it is converted while loading and
+        ``_converted_model_dir`` is set so `_initialize_pipeline` caches it.
+
+        Args:
+            model_load_kwargs: Keyword arguments for ``from_pretrained``.
+
+        Returns:
+            The loaded model.
+        """
+        self._converted_model_dir = None
+        source = (
+            source_checkpoint(self.config.model_name)
+            if constants.CONVERTED_MODEL_CACHE
+            else None
+        )
+        dtype = str(model_load_kwargs["dtype"]).removeprefix("torch.")
+        if source is not None and source.dtype not in (None, dtype):
+            path = converted_model_dir(self.config.model_name, source.revision, dtype)
+            model = load_converted_model(path, model_load_kwargs)
+            if model is not None:
+                # Keeps revision-keyed capability profiles working
+                model.config._commit_hash = source.revision  # noqa: SLF001
+                return model
+            self._converted_model_dir = path
+        return AutoModelForSpeechSeq2Seq.from_pretrained(
+            self.config.model_name, **model_load_kwargs
+        )
+
+    def _load_assistant(self, model: object, model_load_kwargs: dict[str, Any]) -> None:
+        """Load the configured assistant model next to the main model.
+
+        Any problem leaves ``self.assistant`` unset and records the reason in
+        ``assistant_unavailable``; decoding then runs without speculation.
+
+        Args:
+            model: The loaded main model.
+            model_load_kwargs: Keyword arguments used for the main model.
+        """
+        name = self.config.assistant_model
+        self.assistant = None
+        self.assistant_unavailable = None
+        if name == self.config.model_name:
+            self.assistant_unavailable = "assistant is the main model"
+        else:
             try:
-                # Extract the suffix after the last "-v"
-                last_part = self.config.model_name.split("-v")[-1]
-                # Handle decimal versions like "v3.5" by extracting just the major
-                # version
-                version_str = last_part.split("/")[0].split(".")[0]
-                version_num = int(version_str)
-                supports_timestamps = version_num >= 2
-                logger.debug(
-                    "Distil-whisper version detection: last_part=%s, version_str=%s, "
-                    "version_num=%d, supports_timestamps=%s",
-                    last_part,
-                    version_str,
-                    version_num,
-                    supports_timestamps,
-                )
-            except (ValueError, IndexError) as e:
-                # Fallback: if model name explicitly contains "large-v2" etc.
-                logger.debug(
-                    "Version parsing failed for %s: %s, using fallback check",
-                    self.config.model_name,
-                    e,
-                )
-                supports_timestamps = any(
-                    token in self.config.model_name for token in ("-v2", "-v3", "-v4")
-                )
-                logger.debug(
-                    "Fallback check result: supports_timestamps=%s", supports_timestamps
+                assistant = AutoModelForSpeechSeq2Seq.from_pretrained(
+                    name, **model_load_kwargs
                 )
+                if "device_map" not in model_load_kwargs:
+                    assistant = assistant.to(self.effective_device)
+            except (OSError, ValueError, RuntimeError, ImportError) as e:
+                self.assistant_unavailable = f"assistant failed to load: {e}"
+            else:
+                self.assistant_unavailable = assistant_incompatibility(model, assistant)
+                if self.assistant_unavailable is None:
+                    self.assistant = assistant.eval()
+        if self.assistant is not None:
+            logger.info("Speculative decoding with assistant model %s", name)
+        else:
+            logger.warning(
+                "Not using assistant model %s: %s", name, self.assistant_unavailable
+            )
 
-            if not supports_timestamps:
-                logger.warning(
-                    "Timestamp generation not supported for model %s; disabling.",
-                    self.config.model_name,
-                )
-                _return_timestamps_value = False
+    def _backfill_generation_config(self, model: object) -> str | None:
+        """Backfill a missing Whisper generation config from the base checkpoint.
 
-        if _return_timestamps_value:
-            gen_cfg = getattr(self.asr_pipe.model, "generation_config", None)
-            no_ts_token_id = getattr(gen_cfg, "no_timestamps_token_id", None)
-            if no_ts_token_id is None:
-                logger.warning(
-                    (
-                        "Timestamp generation not properly configured for model %s; "
-                        "disabling."
-                    ),
+        Fine-tuned checkpoints that did not upload ``generation_config.json``
+        lack timestamp and multilingual task settings.
+
+        Args:
+            model: The freshly loaded model.
+
+        Returns:
+            str | None: The checkpoint the config was copied from, if any.
+        """
+        try:
+            gen_cfg = getattr(model, "generation_config", None)
+            missing_ts_cfg = (
+                gen_cfg is None
+                or getattr(gen_cfg, "no_timestamps_token_id", None) is None
+            )
+
+            name = self.config.model_name.lower()
+            if not (missing_ts_cfg and ("whisper" in name)):
+                return None
+            is_en = (".en" in name) or ("-en" in name)
+            base_id = None
+
+            if "large" in name:
+                if ("large-v3" in name) or ("v3" in name):
+                    base_id = "openai/whisper-large-v3"
+                elif ("large-v2" in name) or ("v2" in name):
+                    base_id = "openai/whisper-large-v2"
+                else:
+                    base_id = "openai/whisper-large-v2"
+            elif "medium" in name:
+                base_id = "openai/whisper-medium" + (".en" if is_en else "")
+            elif "small" in name:
+                base_id = "openai/whisper-small" + (".en" if is_en else "")
+            elif "base" in name:
+                base_id = "openai/whisper-base" + (".en" if is_en else "")
+            elif "tiny" in name:
+                base_id = "openai/whisper-tiny" + (".en" if is_en else "")
+
+            if base_id:
+                logger.info(
+                    "Backfilling gen config from %s for %s",
+                    base_id,
                     self.config.model_name,
                 )
-                _return_timestamps_value = False
-
-        # These are the arguments that will be passed to the pipeline
-        # Suppress noisy warnings from HF transformers related to experimental
-        # chunk_length and deprecations.
-        warnings.filterwarnings(
-            "ignore",
-            message="Using `chunk_length_s` is very experimental*",
-            category=UserWarning,
+                model.generation_config = GenerationConfig.from_pretrained(base_id)
+            return base_id
+        except Exception as gen_e:  # pylint: disable=broad-except
+            logger.warning(
+                "Failed to backfill generation_config for %s: %s",
+                self.config.model_name,
+                str(gen_e),
+            )
+            return None
+
+    def _set_capabilities(self, profile: ModelCapabilities | None) -> None:
+        """Bind a capability profile to the current pipeline.
+
+        Args:
+            profile: The profile, or None to probe the pipeline's model.
+        """
+        if profile is None:
+            profile = probe_capabilities(self.config.model_name, self.asr_pipe.model)
+        self.capabilities = profile
+        self._profiled_pipe = self.asr_pipe
+        self._kwargs_templates.clear()
+
+    def _capabilities(self) -> ModelCapabilities:
+        """Return the profile of the loaded pipeline, probing it if needed.
+
+        Pipelines injected without `_initialize_pipeline` are probed on first
+        use.
+
+        Returns:
+            ModelCapabilities: The current profile.
+        """
+        if self.capabilities is None or self._profiled_pipe is not self.asr_pipe:
+            self._set_capabilities(None)
+            _quiet_transformers()
+        assert self.capabilities is not None
+        return self.capabilities
+
+    def _pipeline_kwargs(
+        self, task: str, language: str | None, return_timestamps_value: bool | str
+    ) -> dict[str, Any]:
+        """Return pipeline kwargs for a call, built once per combination.
+
+        Args:
+            task: "transcribe" or "translate".
+            language: Optional language code.
+            return_timestamps_value: Requested timestamp mode.
+
+        Returns:
+            dict[str, Any]: A fresh copy of the prebuilt kwargs.
+        """
+        key: _KwargsKey = (task, language, return_timestamps_value)
+        template = self._kwargs_templates.get(key)
+        if template is None:
+            template = self._build_pipeline_kwargs(*key)
+            self._kwargs_templates[key] = template
+        return {**template, "generate_kwargs": dict(template["generate_kwargs"])}
+
+    def _build_pipeline_kwargs(
+        self, task: str, language: str | None, return_timestamps_value: bool | str
+    ) -> dict[str, Any]:
+        """Build the pipeline kwargs for one (task, language, timestamps) mode.
+
+        Args:
+            task: "transcribe" or "translate".
+            language: Optional language code.
+            return_timestamps_value: Requested timestamp mode.
+
+        Returns:
+            dict[str, Any]: Keyword arguments for the Transformers pipeline.
+        """
+        caps = self._capabilities()
+        _return_timestamps_value = (
+            return_timestamps_value if caps.supports_timestamps else False
         )
-        warnings.filterwarnings("ignore", category=FutureWarning, module="transformers")
-        hf_logging.set_verbosity_error()
 
         # CRITICAL FIX: Disable chunk_length_s when using word-level timestamps
         # to avoid Transformers bug where all words get the same timestamp.
@@ -448,22 +707,9 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
             },
         }
 
-        # Determine if the model is multilingual.
-        # Newer Transformers versions expose language/task maps via `task_to_id`,
-        # older checkpoints used `lang_to_id`. We treat presence of either as a
-        # sign the model supports multilingual/translation tasks.
-        lang_to_id = getattr(self.asr_pipe.model.config, "lang_to_id", None)
-        task_to_id = getattr(self.asr_pipe.model.config, "task_to_id", None)
-
-        is_multilingual = False
-        if task_to_id is not None:
-            is_multilingual = True
-        elif isinstance(lang_to_id, dict) and len(lang_to_id) > 1:
-            is_multilingual = True
-
         # Previously we blocked translate for English-only models. With the updated
         # check, only warn (do not raise) so the underlying pipeline can handle it.
-        if not is_multilingual and task == "translate":
+        if not caps.multilingual and task == "translate":
             logger.warning(
                 (
                     "Translate requested but multilingual markers not found for "
@@ -472,19 +718,9 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
                 self.config.model_name,
             )
 
-        # Older checkpoints may ship with generation configs that predate the
-        # introduction of task/language mappings. Passing "task" or "language"
-        # to such models triggers a ValueError. Only forward these parameters
-        # when the generation config exposes the required attributes.
-        gen_cfg = getattr(self.asr_pipe.model, "generation_config", None)
-        has_task_mappings = False
-        if gen_cfg is not None:
-            has_task_mappings = any(
-                getattr(gen_cfg, attr, None) is not None
-                for attr in ("task_to_id", "lang_to_id")
-            )
-
-        if has_task_mappings:
+        # Only forward task/language when the generation config exposes the
+        # required mappings.
+        if caps.task_mappings:
             pipeline_kwargs["generate_kwargs"]["task"] = task
             # If translate task and no explicit language provided, default to English
             if language and language.lower() != "none":
@@ -497,6 +733,269 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
                 "falling back to default transcription.",
                 self.config.model_name,
             )
+        return pipeline_kwargs
+
+    def _generation_budget(self, audio_file_path: str) -> int | None:
+        """Return ``max_new_tokens`` for one decode window of the audio file.
+
+        Args:
+            audio_file_path: The chunk about to be decoded.
+
+        Returns:
+            int | None: The token cap, or None if the duration is unknown.
+        """
+        container = "wav" if str(audio_file_path).lower().endswith(".wav") else None
+        duration = probe_duration(str(audio_file_path), container)
+        if duration is not None and self.config.chunk_length:
+            # The Transformers pipeline decodes at most chunk_length seconds
+            # per generate() call.
+            duration = min(duration, float(self.config.chunk_length))
+        max_target_positions = getattr(
+            getattr(self.asr_pipe.model, "config", None), "max_target_positions", None
+        )
+        if not isinstance(max_target_positions, int):
+            max_target_positions = WHISPER_MAX_TARGET_POSITIONS
+        return max_new_tokens_for(duration, max_target_positions=max_target_positions)
+
+    def _guarded_call(
+        self,
+        audio_file_path: str,
+        pipeline_kwargs: dict[str, Any],
+        guard_events: list[dict[str, Any]],
+        cancellation_token: CancellationToken | None = None,
+        extra_criteria: list[StoppingCriteria] | None = None,
+    ) -> dict[str, Any]:
+        """Run the pipeline on one chunk, retrying it once if decoding loops.
+
+        A decode loops when `RepetitionGuard` stopped it early or its text
+        compresses beyond ``GENERATION_COMPRESSION_RATIO_THRESHOLD``. The retry
+        adds ``GENERATION_RETRY_REPETITION_PENALTY``; the less repetitive of
+        the two outputs is kept. A kept output whose decode ran into
+        ``max_new_tokens`` is recorded as ``max_new_tokens_reached``, since it
+        may be cut short.
+
+        Args:
+            audio_file_path: The chunk to decode.
+            pipeline_kwargs: Keyword arguments for the Transformers pipeline.
+            guard_events: Receives one record per guard trigger.
+            cancellation_token: Optional cooperative cancellation token.
+            extra_criteria: Further stopping criteria for every decode.
+
+        Returns:
+            dict[str, Any]: Raw pipeline output.
+        """
+        extra_criteria = extra_criteria or []
+        chunk_name = os.path.basename(str(audio_file_path))
+        budget = pipeline_kwargs["generate_kwargs"].get("max_new_tokens")
+
+        def decode(
+            kwargs: dict[str, Any], *criteria: StoppingCriteria
+        ) -> tuple[dict[str, Any], bool]:
+            monitor = BudgetMonitor(budget) if budget else None
+            stopping = [*criteria, *extra_criteria, *filter(None, [monitor])]
+            if stopping:
+                kwargs["generate_kwargs"]["stopping_criteria"] = StoppingCriteriaList(
+                    stopping
+                )
+            outputs = self.asr_pipe(str(audio_file_path), **kwargs)
+            return outputs, monitor is not None and monitor.reached
+
+        def keep(outputs: dict[str, Any], capped: bool) -> dict[str, Any]:
+            if capped:
+                logger.warning(
+                    "Decoding %s stopped at max_new_tokens=%s; output may be cut",
+                    audio_file_path,
+                    budget,
+                )
+                guard_events.append({
+                    "chunk": chunk_name,
+                    "reason": "max_new_tokens_reached",
+                    "max_new_tokens": budget,
+                })
+            return outputs
+
+        if not constants.GENERATION_REPETITION_GUARD:
+            return keep(*decode(pipeline_kwargs))
+
+        def run(kwargs: dict[str, Any]) -> tuple[dict[str, Any], bool, bool, float]:
+            guard = RepetitionGuard()
+            outputs, capped = decode(kwargs, guard)
+            ratio = compression_ratio(outputs.get("text", ""))
+            return outputs, capped, guard.triggered, ratio
+
+        threshold = constants.GENERATION_COMPRESSION_RATIO_THRESHOLD
+        outputs, capped, looped, ratio = run(pipeline_kwargs)
+        if not looped and ratio <= threshold:
+            return keep(outputs, capped)
+
+        event: dict[str, Any] = {
+            "chunk": chunk_name,
+            "reason": "repetition_loop" if looped else "compression_ratio",
+            "compression_ratio": round(ratio, 2),
+            "max_new_tokens": pipeline_kwargs["generate_kwargs"].get("max_new_tokens"),
+        }
+        logger.warning(
+            "Runaway generation on %s (%s, compression ratio %.2f); retrying chunk",
+            audio_file_path,
+            event["reason"],
+            ratio,
+        )
+        if cancellation_token is not None:
+            cancellation_token.raise_if_cancelled()
+        retry_kwargs = {
+            **pipeline_kwargs,
+            "generate_kwargs": {
+                **pipeline_kwargs["generate_kwargs"],
+                "repetition_penalty": constants.GENERATION_RETRY_REPETITION_PENALTY,
+            },
+        }
+        retry, retry_capped, retry_looped, retry_ratio = run(retry_kwargs)
+        event["retry_compression_ratio"] = round(retry_ratio, 2)
+        event["resolved"] = not retry_looped and retry_ratio <= threshold
+        event["kept"] = "retry" if retry_ratio <= ratio else "original"
+        guard_events.append(event)
+        if event["kept"] == "retry":
+            return keep(retry, retry_capped)
+        return keep(outputs, capped)
+
+    def _assisted_call(
+        self,
+        audio_file_path: str,
+        pipeline_kwargs: dict[str, Any],
+        guard_events: list[dict[str, Any]],
+        cancellation_token: CancellationToken | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any] | None]:
+        """Decode one chunk with the assistant model when it can be used.
+
+        Assisted generation decodes one sequence at a time and cannot produce
+        word timestamps; such calls, and calls failing in assisted mode, are
+        decoded by the main model alone.
+
+        Args:
+            audio_file_path: The chunk to decode.
+            pipeline_kwargs: Keyword arguments for the Transformers pipeline.
+            guard_events: Receives one record per guard trigger.
+            cancellation_token: Optional cooperative cancellation token.
+
+        Returns:
+            tuple[dict[str, Any], dict[str, Any] | None]: Raw pipeline output
+            and the ``assisted_generation`` metadata (None without an
+            assistant configured).
+
+        Raises:
+            RuntimeError: If the assisted decode runs out of memory.
+        """
+        name = self.config.assistant_model
+        reason = self.assistant_unavailable
+        if name and reason is None and pipeline_kwargs["return_timestamps"] == "word":
+            reason = "word timestamps are decoded without the assistant"
+        if not name or self.assistant is None or reason is not None:
+            outputs = self._guarded_call(
+                audio_file_path, pipeline_kwargs, guard_events, cancellation_token
+            )
+            return outputs, (
+                {"assistant_model": name, "fallback_reason": reason} if name else None
+            )
+
+        assisted_kwargs = {
+            **pipeline_kwargs,
+            "batch_size": 1,
+            "generate_kwargs": {
+                **pipeline_kwargs["generate_kwargs"],
+                "assistant_model": self.assistant,
+            },
+        }
+        meter = AssistanceMeter()
+        failure: Exception | None = None
+        try:
+            with meter.attach(self.asr_pipe.model, self.assistant):
+                outputs = self._guarded_call(
+                    audio_file_path,
+                    assisted_kwargs,
+                    guard_events,
+                    cancellation_token,
+                    extra_criteria=[meter],
+                )
+        except RuntimeError as e:
+            if classify_oom_error(e):
+                raise
+            failure = e
+        except (ValueError, TypeError) as e:
+            failure = e
+        else:
+            return outputs, summarize_assistance(
+                name, meter.drafted, meter.accepted, meter.verify_passes
+            )
+
+        logger.warning(
+            "Assisted decoding failed for %s, decoding without assistant: %s",
+            audio_file_path,
+            failure,
+        )
+        outputs = self._guarded_call(
+            audio_file_path, pipeline_kwargs, guard_events, cancellation_token
+        )
+        return outputs, {
+            "assistant_model": name,
+            "fallback_reason": f"assisted decoding failed: {failure}",
+        }
+
+    def process_audio(
+        self,
+        audio_file_path: str,
+        language: str | None,
+        task: str,
+        return_timestamps_value: bool | str,
+        progress_cb: ProgressCallback | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> dict[str, Any]:
+        """Process an audio file and return the transcription result.
+
+        Args:
+            audio_file_path: Input audio path.
+            language: Optional language code.
+            task: "transcribe" or "translate".
+            return_timestamps_value: Whether/how to return timestamps.
+            progress_cb: Optional progress reporter.
+            cancellation_token: Optional cooperative cancellation token.
+
+        Returns:
+            dict[str, Any]: Result with text, optional chunks, runtime, and
+            config used.
+
+        Raises:
+            InferenceOOMError: If audio processing fails due to VRAM.
+            RuntimeError: If model initialization or inference fails.
+            TranscriptionError: If model loading or inference fails.
+        """
+        logger.debug(
+            "process_audio called: model=%s, return_timestamps_value=%s, task=%s",
+            self.config.model_name,
+            return_timestamps_value,
+            task,
+        )
+
+        cb = progress_cb or NoOpProgress()
+        if cancellation_token is not None:
+            cancellation_token.raise_if_cancelled()
+        if self.asr_pipe is None:
+            self._initialize_pipeline(progress_cb=cb)
+            if cancellation_token is not None:
+                cancellation_token.raise_if_cancelled()
+
+        start_time = time.perf_counter()
+
+        # Capabilities are probed once per loaded model, and the kwargs for
+        # each (task, language, timestamps) combination are built once.
+        pipeline_kwargs = self._pipeline_kwargs(task, language, return_timestamps_value)
+        _return_timestamps_value = pipeline_kwargs["return_timestamps"]
+        chunk_length_value = pipeline_kwargs["chunk_length_s"]
+        # Silent or noisy chunks must not decode until the model's limit
+        max_new_tokens = self._generation_budget(audio_file_path)
+        if max_new_tokens is not None:
+            pipeline_kwargs["generate_kwargs"]["max_new_tokens"] = max_new_tokens
+        guard_events: list[dict[str, Any]] = []
+        assistance: dict[str, Any] | None = None
 
         try:
             logger.debug(
@@ -510,7 +1009,9 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
             if cancellation_token is not None:
                 cancellation_token.raise_if_cancelled()
             try:
-                outputs = self.asr_pipe(str(audio_file_path), **pipeline_kwargs)
+                outputs, assistance = self._assisted_call(
+                    audio_file_path, pipeline_kwargs, guard_events, cancellation_token
+                )
             except RuntimeError as e:
                 oom_error = classify_oom_error(e)
                 if oom_error:
@@ -540,13 +1041,21 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
                 )
 
                 # Retry with chunk-level timestamps instead of word-level
-                fallback_kwargs = pipeline_kwargs.copy()
+                fallback_kwargs = {
+                    **pipeline_kwargs,
+                    "generate_kwargs": dict(pipeline_kwargs["generate_kwargs"]),
+                }
                 fallback_kwargs["return_timestamps"] = True  # chunk-level timestamps
 
                 try:
                     if cancellation_token is not None:
                         cancellation_token.raise_if_cancelled()
-                    outputs = self.asr_pipe(str(audio_file_path), **fallback_kwargs)
+                    outputs = self._guarded_call(
+                        audio_file_path,
+                        fallback_kwargs,
+                        guard_events,
+                        cancellation_token,
+                    )
                     logger.info(
                         "Successfully completed transcription with chunk-level "
                         "timestamps fallback for %s",
@@ -615,8 +1124,13 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
                 "chunk_length_s": self.config.chunk_length,
                 "task": task,
                 "return_timestamps": return_timestamps_value,
+                "max_new_tokens": max_new_tokens,
             },
         }
+        if guard_events:
+            result["generation_guard"] = guard_events
+        if assistance is not None:
+            result["assisted_generation"] = assistance
         logger.debug(
             "Transcription completed in %.2fs for %s", elapsed_time, audio_file_path
         )
@@ -628,6 +1142,65 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
         )
         return result
 
+    def detect_language(self, audio_file_paths: list[str]) -> str | None:
+        """Identify the spoken language from the opening window of each sample.
+
+        The samples are encoded as one batch and Whisper's language token is
+        predicted once per sample; the most frequent language wins, ties going
+        to the earliest sample.
+
+        Args:
+            audio_file_paths: Sample files from the same recording.
+
+        Returns:
+            str | None: A language code such as ``"en"``, or None if the model
+            has no language tokens or detection failed.
+        """
+        if not audio_file_paths:
+            return None
+        if self.asr_pipe is None:
+            self._initialize_pipeline()
+        model = self.asr_pipe.model
+        gen_cfg = getattr(model, "generation_config", None)
+        if not callable(getattr(model, "detect_language", None)) or not getattr(
+            gen_cfg, "lang_to_id", None
+        ):
+            return None
+
+        feature_extractor = self.asr_pipe.feature_extractor
+        sampling_rate = feature_extractor.sampling_rate
+        window = int(getattr(feature_extractor, "n_samples", 30 * sampling_rate))
+        try:
+            samples = []
+            for path in audio_file_paths:
+                with open(path, "rb") as handle:
+                    samples.append(ffmpeg_read(handle.read(), sampling_rate)[:window])
+            features = feature_extractor(
+                samples, sampling_rate=sampling_rate, return_tensors="pt"
+            ).input_features.to(model.device, dtype=model.dtype)
+            with torch.inference_mode():
+                token_ids = model.detect_language(input_features=features)
+        except (OSError, ValueError, RuntimeError, TypeError) as e:
+            logger.warning(
+                "Language detection failed, falling back to per-chunk detection: %s", e
+            )
+            return None
+
+        tokens = self.asr_pipe.tokenizer.convert_ids_to_tokens([
+            int(token_id) for token_id in token_ids.view(-1)
+        ])
+        languages = [token.strip("<|>") for token in tokens if token]
+        if not languages:
+            return None
+        language = max(languages, key=languages.count)
+        logger.info(
+            "Detected language '%s' from %d sample(s): %s",
+            language,
+            len(languages),
+            languages,
+        )
+        return language
+
     def close(self) -> None:
         """Release model resources and free accelerator caches.
 
@@ -643,6 +1216,8 @@ class HuggingFaceBackend(ASRBackend):  # pylint: disable=too-few-public-methods
             if getattr(self, "asr_pipe", None) is not None:
                 # Explicitly drop references to model/tokenizer/feature_extractor
                 self.asr_pipe = None
+            self._profiled_pipe = None
+            self.assistant = None
         finally:
             # Best-effort device cache cleanup
             try:
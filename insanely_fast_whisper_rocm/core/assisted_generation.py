@@ -0,0 +1,187 @@
+"""Speculative (assisted) decoding with a smaller draft model.
+
+Whisper's decoder is memory-bandwidth bound: every generated token costs one
+pass over the full decoder weights. With an assistant checkpoint configured
+(``HuggingFaceBackendConfig.assistant_model``, e.g. a distil-whisper model for
+a large-v3 main model), the assistant drafts several tokens and the main model
+verifies all of them in a single pass, keeping the longest agreeing prefix.
+Output is identical to greedy decoding with the main model alone.
+
+`assistant_incompatibility` decides whether a model pair can be used
+together, and `AssistanceMeter` measures how many drafted tokens were
+accepted so results can report the acceptance rate and the resulting
+reduction in main-model decoder passes.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import torch
+from transformers import StoppingCriteria
+
+
+def assistant_incompatibility(model: object, assistant: object) -> str | None:
+    """Explain why ``assistant`` cannot draft tokens for ``model``.
+
+    Both models must share the tokenizer vocabulary and the log-mel input
+    features (large-v3 uses 128 mel bins, earlier checkpoints 80).
+
+    Args:
+        model: The loaded main model.
+        assistant: The loaded assistant model.
+
+    Returns:
+        str | None: The reason the pair is incompatible, or None if it is not.
+    """
+    main_config = getattr(model, "config", None)
+    assistant_config = getattr(assistant, "config", None)
+    for attr, label in (("vocab_size", "vocabulary"), ("num_mel_bins", "mel bins")):
+        main_value = getattr(main_config, attr, None)
+        assistant_value = getattr(assistant_config, attr, None)
+        if main_value != assistant_value:
+            return (
+                f"{label} differ (main model {main_value}, assistant {assistant_value})"
+            )
+    return None
+
+
+def summarize_assistance(
+    assistant_model: str, drafted: int, accepted: int, verify_passes: int
+) -> dict[str, Any]:
+    """Build the ``assisted_generation`` result metadata.
+
+    Args:
+        assistant_model: The assistant checkpoint.
+        drafted: Tokens drafted by the assistant.
+        accepted: Drafted tokens the main model accepted.
+        verify_passes: Main-model decoder passes.
+
+    Returns:
+        dict[str, Any]: The counters plus ``acceptance_rate`` and
+        ``estimated_speedup``, the tokens produced per main-model decoder pass
+        (1.0 means no gain; the assistant's own cost is not included).
+    """
+    return {
+        "assistant_model": assistant_model,
+        "drafted_tokens": drafted,
+        "accepted_tokens": accepted,
+        "verify_passes": verify_passes,
+        "acceptance_rate": round(accepted / drafted, 3) if drafted else 0.0,
+        "estimated_speedup": (
+            round((accepted + verify_passes) / verify_passes, 2)
+            if verify_passes
+            else 1.0
+        ),
+    }
+
+
+def combine_assistance(
+    stats: Iterable[dict[str, Any] | None],
+) -> dict[str, Any] | None:
+    """Merge the ``assisted_generation`` metadata of several chunks.
+
+    Args:
+        stats: Per-chunk metadata; None entries are skipped.
+
+    Returns:
+        dict[str, Any] | None: The combined counters, the first fallback
+        record if no chunk was measured, or None if no chunk has metadata.
+    """
+    entries = [entry for entry in stats if entry]
+    measured = [entry for entry in entries if "drafted_tokens" in entry]
+    if not measured:
+        # Only fallbacks: report the first reason
+        return entries[0] if entries else None
+    return summarize_assistance(
+        measured[0]["assistant_model"],
+        sum(entry["drafted_tokens"] for entry in measured),
+        sum(entry["accepted_tokens"] for entry in measured),
+        sum(entry["verify_passes"] for entry in measured),
+    )
+
+
+class AssistanceMeter(StoppingCriteria):
+    """Count drafted and accepted tokens during assisted generation.
+
+    Used as a stopping criterion that never stops: assisted decoding calls it
+    once per verification pass, after the accepted tokens plus the main
+    model's own next token were appended. The assistant's decoder passes in
+    between are the drafted tokens. Only passes on the creating thread are
+    counted, so concurrent calls sharing the models do not mix.
+
+    The first pass of every generate() call is not measured, since its
+    prompt length is unknown; the main model's encoder pass marks that start.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.drafted = 0
+        self.accepted = 0
+        self.verify_passes = 0
+        self._thread = threading.get_ident()
+        self._pending_drafts = 0
+        self._last_length: int | None = None
+
+    @contextmanager
+    def attach(self, model: Any, assistant: Any) -> Iterator[AssistanceMeter]:  # noqa: ANN401
+        """Observe the models' passes for the duration of the block.
+
+        Args:
+            model: The main model.
+            assistant: The assistant model.
+
+        Yields:
+            AssistanceMeter: This meter.
+        """
+        handles = [
+            model.get_encoder().register_forward_hook(self._on_generate_start),
+            assistant.get_decoder().register_forward_hook(self._on_draft),
+        ]
+        try:
+            yield self
+        finally:
+            for handle in handles:
+                handle.remove()
+
+    def _on_generate_start(self, *_: object) -> None:
+        """Start a new generate() call."""
+        if threading.get_ident() == self._thread:
+            self._last_length = None
+            self._pending_drafts = 0
+
+    def _on_draft(self, *_: object) -> None:
+        """Count one drafted token."""
+        if threading.get_ident() == self._thread:
+            self._pending_drafts += 1
+
+    def __call__(
+        self,
+        input_ids: torch.LongTensor,
+        scores: torch.FloatTensor | None,
+        **kwargs: object,
+    ) -> torch.BoolTensor:
+        """Record one verification pass.
+
+        Args:
+            input_ids: Tokens generated so far, shape ``(1, length)``.
+            scores: Prediction scores (unused).
+            **kwargs: Additional generation state (unused).
+
+        Returns:
+            torch.BoolTensor: All False; the meter never stops generation.
+        """
+        length = input_ids.shape[-1]
+        if self._last_length is not None and length > self._last_length:
+            self.verify_passes += 1
+            # Each pass appends the accepted drafts plus one token of its own
+            self.accepted += min(length - self._last_length - 1, self._pending_drafts)
+            self.drafted += self._pending_drafts
+        self._last_length = length
+        self._pending_drafts = 0
+        return torch.zeros(
+            input_ids.shape[0], dtype=torch.bool, device=input_ids.device
+        )
@@ -7,6 +7,10 @@ time. It exposes acquire/release helpers that manage a reference count.
 By default, entries are kept warm when their refcount drops to zero to maximize
 reuse. Set the environment variable ``IFW_EAGER_MODEL_RELEASE=1`` to eagerly
 close and remove cache entries when their refcount hits zero.
+
+A config whose device lists several devices (``"0,1"``) is cached as one
+`DevicePoolBackend` holding a replica per device, and with ``CPU_WORKERS`` > 1
+a ``"cpu"`` config is served by a `CpuWorkerPoolBackend` of worker processes.
 """
 
 from __future__ import annotations
@@ -19,10 +23,19 @@ from collections.abc import Hashable, Iterator
 from dataclasses import dataclass
 
 from insanely_fast_whisper_rocm.core.asr_backend import (
+    ASRBackend,
     HuggingFaceBackend,
     HuggingFaceBackendConfig,
 )
+from insanely_fast_whisper_rocm.core.cpu_pool import CpuWorkerPoolBackend
+from insanely_fast_whisper_rocm.core.device_pool import (
+    DevicePoolBackend,
+    is_cpu_only,
+    is_device_pool,
+)
 from insanely_fast_whisper_rocm.core.pipeline import WhisperPipeline
+from insanely_fast_whisper_rocm.core.result_writer import get_result_writer
+from insanely_fast_whisper_rocm.utils import constants
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +50,7 @@ class _CacheEntry:
         ref_count: Number of active borrowers for this pipeline.
     """
 
-    backend: HuggingFaceBackend
+    backend: ASRBackend
     pipeline: WhisperPipeline
     ref_count: int = 0
 
@@ -47,6 +60,11 @@ _CACHE: dict[tuple[Hashable, ...], _CacheEntry] = {}
 _LOCK = threading.RLock()
 _EAGER_RELEASE = os.getenv("IFW_EAGER_MODEL_RELEASE", "0") in ("1", "true", "True")
 
+# Serializes decoding on cached single-model pipelines: backends are not
+# thread-safe, and an OOM retry closes the cached backend (see
+# `invalidate_gpu_cache`). Pool backends serialize per replica instead.
+INFERENCE_LOCK = threading.Lock()
+
 
 def _make_key(
     cfg: HuggingFaceBackendConfig,
@@ -73,9 +91,24 @@ def _make_key(
         int(cfg.progress_group_size),
         bool(save_transcriptions),
         os.path.abspath(output_dir),
+        cfg.assistant_model,
     )
 
 
+def _create_backend(cfg: HuggingFaceBackendConfig) -> ASRBackend:
+    """Create the backend serving a configuration.
+
+    Returns:
+        ASRBackend: A device pool for a device list, a CPU worker pool for
+        ``"cpu"`` when ``CPU_WORKERS`` > 1, else a plain `HuggingFaceBackend`.
+    """
+    if is_device_pool(cfg.device):
+        return DevicePoolBackend(cfg)
+    if cfg.device == "cpu" and constants.CPU_WORKERS > 1:
+        return CpuWorkerPoolBackend(cfg)
+    return HuggingFaceBackend(config=cfg)
+
+
 def acquire_pipeline(
     cfg: HuggingFaceBackendConfig,
     *,
@@ -104,11 +137,16 @@ def acquire_pipeline(
     with _LOCK:
         entry = _CACHE.get(key)
         if entry is None:
-            backend = HuggingFaceBackend(config=cfg)
+            backend = _create_backend(cfg)
             pipeline = WhisperPipeline(
                 asr_backend=backend,
                 save_transcriptions=save_transcriptions,
                 output_dir=normalized_output_dir,
+                result_writer=(
+                    get_result_writer()
+                    if save_transcriptions and constants.ASYNC_RESULT_WRITES
+                    else None
+                ),
             )
             entry = _CacheEntry(backend=backend, pipeline=pipeline, ref_count=0)
             _CACHE[key] = entry
@@ -149,7 +187,7 @@ def invalidate_gpu_cache() -> None:
         for key, entry in _CACHE.items():
             # The key's second element is the device string
             device = key[1]
-            if isinstance(device, str) and device != "cpu":
+            if isinstance(device, str) and not is_cpu_only(device):
                 try:
                     logger.info("Invalidating GPU cache entry for device: %s", device)
                     entry.backend.close()
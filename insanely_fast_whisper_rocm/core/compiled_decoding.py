@@ -0,0 +1,174 @@
+"""Static-shape compiled decoding.
+
+By default every generate() call grows a dynamic KV cache and runs eager
+kernels. With ``TORCH_COMPILE`` enabled, `enable_compiled_decoding` switches a
+loaded model to a static KV cache sized for the decoder's full context and
+lets Transformers compile the decoding step with ``torch.compile``.
+
+Compiled graphs are specialised to input shapes, so shapes are kept to a small
+fixed set:
+
+- Audio length: the Whisper feature extractor already pads every chunk to
+  30 seconds of log-mel frames, whatever ``chunk_length`` is.
+- Decoder length: the static cache always holds ``max_target_positions``
+  tokens, so different ``max_new_tokens`` budgets reuse one cache layout.
+- Batch size: the last batch of a file is usually smaller than the configured
+  batch size. `BucketedGenerate` pads each batch to the next power of two (at
+  most the configured batch size) and drops the padded rows from the output,
+  so at most ``log2(batch_size) + 1`` batch shapes are ever compiled.
+
+Inductor's on-disk caches are pointed at ``TORCH_COMPILE_CACHE_DIR`` so
+compiled kernels survive restarts; a restarted process still traces the model
+but skips most kernel compilation and autotuning.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Callable
+from typing import Any
+
+import torch
+from torch.nn import functional as F  # noqa: N812
+from transformers import CompileConfig
+
+from insanely_fast_whisper_rocm.utils import constants
+
+logger = logging.getLogger(__name__)
+
+
+def bucket_batch_size(rows: int, limit: int) -> int:
+    """Return the padded batch size for ``rows`` inputs.
+
+    Args:
+        rows: Number of inputs in the batch.
+        limit: Configured batch size; buckets never exceed it.
+
+    Returns:
+        int: The smallest power of two holding ``rows``, capped at ``limit``
+        (and never below ``rows``).
+    """
+    bucket = 1
+    while bucket < rows:
+        bucket *= 2
+    return max(rows, min(bucket, limit))
+
+
+def _take_rows(value: Any, rows: int, padded: int) -> Any:  # noqa: ANN401
+    """Drop padded rows from a generate() output.
+
+    Returns:
+        Any: ``value`` without the padded rows; values without a batch
+        dimension are returned unchanged.
+    """
+    if isinstance(value, torch.Tensor):
+        return value[:rows] if value.dim() and value.shape[0] == padded else value
+    if isinstance(value, dict):
+        # Also covers ModelOutput, which is a dict subclass
+        for key in list(value.keys()):
+            value[key] = _take_rows(value[key], rows, padded)
+        return value
+    if isinstance(value, list) and len(value) == padded:
+        return value[:rows]
+    return value
+
+
+class BucketedGenerate:
+    """Wrap a model's generate() to run on bucketed batch sizes."""
+
+    def __init__(self, generate: Callable[..., Any], limit: int) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            generate: The model's bound generate() method.
+            limit: Configured batch size, the largest bucket.
+        """
+        self._generate = generate
+        self.limit = limit
+
+    def __call__(
+        self,
+        input_features: torch.Tensor | None = None,
+        attention_mask: torch.Tensor | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401 - generate() returns tensors or ModelOutput
+        """Pad the batch to its bucket, generate, and drop the padded rows.
+
+        Padded rows repeat the last real row. Zero log-mel features are not
+        silence and can make Whisper decode a full window of hallucinated
+        tokens, whereas a copy of a real row costs no more than that row.
+
+        Args:
+            input_features: Log-mel features, shape ``(batch, mels, frames)``.
+            attention_mask: Optional feature attention mask.
+            **kwargs: Further generate() arguments.
+
+        Returns:
+            Any: The generate() output for the real rows only.
+        """
+        if input_features is None:
+            return self._generate(attention_mask=attention_mask, **kwargs)
+        rows = input_features.shape[0]
+        padded = bucket_batch_size(rows, self.limit)
+        if padded == rows:
+            return self._generate(
+                input_features=input_features, attention_mask=attention_mask, **kwargs
+            )
+        extra = padded - rows
+        input_features = torch.cat([
+            input_features,
+            input_features[-1:].expand(extra, -1, -1),
+        ])
+        if attention_mask is not None:
+            attention_mask = F.pad(attention_mask, (0, 0, 0, extra), value=1)
+        outputs = self._generate(
+            input_features=input_features, attention_mask=attention_mask, **kwargs
+        )
+        return _take_rows(outputs, rows, padded)
+
+
+def _persist_compile_caches() -> None:
+    """Keep Inductor's compiled kernels and autotuning results on disk."""
+    cache_dir = os.path.expanduser(constants.TORCH_COMPILE_CACHE_DIR)
+    # Read by Inductor whenever it resolves its cache location
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", cache_dir)
+    try:
+        from torch._inductor import config as inductor_config  # noqa: PLC0415
+    except ImportError:  # pragma: no cover - builds without Inductor
+        return
+    inductor_config.fx_graph_cache = True
+    if hasattr(inductor_config, "autotune_local_cache"):
+        inductor_config.autotune_local_cache = True
+
+
+def enable_compiled_decoding(model: Any, device: str, batch_size: int) -> None:  # noqa: ANN401
+    """Configure a loaded Whisper model for static-shape compiled decoding.
+
+    Must run before the model's generation config is copied into a pipeline.
+
+    Args:
+        model: The loaded model.
+        device: Effective device string ("cpu", "cuda:0", "mps", ...).
+        batch_size: Configured batch size, the largest batch bucket.
+    """
+    _persist_compile_caches()
+    generation_config = model.generation_config
+    generation_config.cache_implementation = "static"
+    # One cache layout for every token budget
+    generation_config.max_cache_len = getattr(
+        model.config, "max_target_positions", None
+    )
+    compile_config = CompileConfig(
+        fullgraph=False, dynamic=False, mode=constants.TORCH_COMPILE_MODE
+    )
+    if not device.startswith("cuda"):
+        # Transformers only compiles on CUDA/ROCm unless told otherwise
+        compile_config._compile_all_devices = True  # noqa: SLF001
+    generation_config.compile_config = compile_config
+    model.generate = BucketedGenerate(model.generate, batch_size)
+    logger.info(
+        "Compiled decoding enabled (static KV cache, mode=%s, batch buckets <= %d)",
+        constants.TORCH_COMPILE_MODE,
+        batch_size,
+    )
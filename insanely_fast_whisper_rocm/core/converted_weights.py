@@ -0,0 +1,129 @@
+"""Cache of checkpoints converted to a non-native dtype.
+
+Loading a checkpoint in a dtype other than the one it was published in (a
+float32 checkpoint as float16, or a float16 one for the float32 CPU fallback)
+converts every tensor on each load. The first such load saves the converted
+model, with its (possibly backfilled) generation config, as safetensors under
+``CONVERTED_MODEL_CACHE_DIR``. Later loads memory-map that copy directly.
+
+Entries are keyed by the source checkpoint's revision as recorded in the local
+Hugging Face cache, so resolving them needs no network access. A new upstream
+revision gets its own entry once the source checkpoint is downloaded again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from huggingface_hub import try_to_load_from_cache
+from transformers import AutoModelForSpeechSeq2Seq
+
+from insanely_fast_whisper_rocm.utils import constants
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SourceCheckpoint:
+    """A checkpoint found in the local Hugging Face cache."""
+
+    revision: str
+    dtype: str | None
+
+
+def source_checkpoint(model_name: str) -> SourceCheckpoint | None:
+    """Look up the locally cached revision and stored dtype of a checkpoint.
+
+    Args:
+        model_name: Hugging Face model identifier.
+
+    Returns:
+        SourceCheckpoint | None: The cached checkpoint, or None for local
+        directories and checkpoints that were never downloaded.
+    """
+    try:
+        config_path = try_to_load_from_cache(model_name, "config.json")
+    except ValueError:  # Not a repo id, e.g. a local directory
+        return None
+    if not isinstance(config_path, str):
+        return None
+    try:
+        with open(config_path, encoding="utf-8") as handle:
+            config = json.load(handle)
+    except (OSError, ValueError) as e:
+        logger.debug("Unreadable cached config for %s: %s", model_name, e)
+        return None
+    # Files live under snapshots/<commit>/
+    return SourceCheckpoint(
+        revision=Path(config_path).parent.name,
+        dtype=config.get("dtype") or config.get("torch_dtype"),
+    )
+
+
+def converted_model_dir(model_name: str, revision: str, dtype: str) -> Path:
+    """Return the directory a converted checkpoint revision is cached in.
+
+    Args:
+        model_name: Hugging Face model identifier.
+        revision: Source checkpoint revision.
+        dtype: Target dtype name, e.g. "float16".
+
+    Returns:
+        Path: Location under ``CONVERTED_MODEL_CACHE_DIR``.
+    """
+    safe_name = model_name.strip("/").replace("/", "--")
+    return (
+        Path(constants.CONVERTED_MODEL_CACHE_DIR).expanduser()
+        / f"{safe_name}@{revision}-{dtype}"
+    )
+
+
+def load_converted_model(path: Path, load_kwargs: dict[str, Any]) -> Any | None:  # noqa: ANN401
+    """Load a cached converted checkpoint.
+
+    Args:
+        path: Directory from `converted_model_dir`.
+        load_kwargs: Keyword arguments for ``from_pretrained``.
+
+    Returns:
+        The model, or None if the entry is missing or unreadable.
+    """
+    if not (path / "config.json").is_file():
+        return None
+    try:
+        model = AutoModelForSpeechSeq2Seq.from_pretrained(str(path), **load_kwargs)
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable converted model %s: %s", path, e)
+        return None
+    logger.info("Loaded converted model from %s", path)
+    return model
+
+
+def store_converted_model(path: Path, model: Any) -> None:  # noqa: ANN401
+    """Atomically save a converted model to the cache.
+
+    Args:
+        path: Directory from `converted_model_dir`.
+        model: The loaded, converted model.
+    """
+    tmp_dir: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=path.parent, suffix=".tmp")
+        model.save_pretrained(tmp_dir, safe_serialization=True)
+        os.replace(tmp_dir, path)
+        tmp_dir = None
+        logger.info("Cached converted model at %s", path)
+    except (OSError, RuntimeError, ValueError) as e:
+        # Includes losing the rename race to another process
+        logger.warning("Could not cache converted model to %s: %s", path, e)
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -0,0 +1,275 @@
+"""Multi-process CPU inference.
+
+PyTorch's intra-op threading stops scaling after a few cores for Whisper's
+decoder, so one process cannot use a large CPU. With ``CPU_WORKERS`` > 1,
+`backend_cache` serves ``device="cpu"`` configs (including the OOM fallback)
+through `CpuWorkerPoolBackend`: that many spawned worker processes, each
+running its own `HuggingFaceBackend` with ``CPU_WORKER_THREADS`` torch threads.
+
+Calls queue on the pool and the next idle worker takes them, so concurrent
+requests and the chunks of one long file (see `WhisperPipeline`'s
+``parallelism`` check) fan out across the workers. Every worker loads its own
+model copy; safetensors checkpoints are memory-mapped while loading, so the
+workers read the weights from the shared page cache rather than each reading
+the file from disk.
+
+A worker that dies (e.g. killed by the OOM killer) breaks the whole pool; the
+failing calls raise `TranscriptionError` and the pool is replaced, so later
+calls start fresh workers.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+import torch
+
+from insanely_fast_whisper_rocm.core.asr_backend import (
+    ASRBackend,
+    HuggingFaceBackend,
+    HuggingFaceBackendConfig,
+)
+from insanely_fast_whisper_rocm.core.cancellation import CancellationToken
+from insanely_fast_whisper_rocm.core.errors import TranscriptionError
+from insanely_fast_whisper_rocm.core.progress import ProgressCallback
+from insanely_fast_whisper_rocm.utils import constants
+
+logger = logging.getLogger(__name__)
+
+# How often a waiting caller checks its cancellation token
+_CANCEL_POLL_SECONDS = 0.5
+
+BackendFactory = Callable[[HuggingFaceBackendConfig], ASRBackend]
+
+# The backend of the current worker process, set by `_init_worker`
+_WORKER_BACKEND: ASRBackend | None = None
+
+
+def worker_threads(workers: int) -> int:
+    """Return the torch thread count of each of ``workers`` processes.
+
+    Args:
+        workers: Number of worker processes.
+
+    Returns:
+        int: ``CPU_WORKER_THREADS`` if set, else the CPU cores split evenly
+        between the workers (at least 1).
+    """
+    if constants.CPU_WORKER_THREADS > 0:
+        return constants.CPU_WORKER_THREADS
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def _init_worker(
+    config: HuggingFaceBackendConfig, threads: int, backend_factory: BackendFactory
+) -> None:
+    """Pin the worker's thread count and create its backend."""
+    global _WORKER_BACKEND  # noqa: PLW0603 - one backend per worker process
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:  # pragma: no cover - already fixed in this process
+        pass
+    _WORKER_BACKEND = backend_factory(config)
+
+
+def _worker_process_audio(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Run `ASRBackend.process_audio` in a worker.
+
+    Returns:
+        dict[str, Any]: The worker backend's result.
+    """
+    assert _WORKER_BACKEND is not None
+    return _WORKER_BACKEND.process_audio(**kwargs)
+
+
+def _worker_detect_language(audio_file_paths: list[str]) -> str | None:
+    """Run `ASRBackend.detect_language` in a worker.
+
+    Returns:
+        str | None: The detected language code, or None.
+    """
+    assert _WORKER_BACKEND is not None
+    return _WORKER_BACKEND.detect_language(audio_file_paths)
+
+
+class CpuWorkerPoolBackend(ASRBackend):
+    """Run CPU inference on a pool of single-model worker processes."""
+
+    def __init__(
+        self,
+        config: HuggingFaceBackendConfig,
+        workers: int | None = None,
+        threads: int | None = None,
+        backend_factory: BackendFactory = HuggingFaceBackend,
+    ) -> None:
+        """Set up the pool; worker processes start with the first call.
+
+        Args:
+            config: CPU backend configuration shared by every worker.
+            workers: Number of worker processes. Defaults to ``CPU_WORKERS``.
+            threads: Torch threads per worker. Defaults to `worker_threads`.
+            backend_factory: Picklable callable creating a worker's backend.
+        """
+        self.config = config
+        self.workers = max(1, workers if workers is not None else constants.CPU_WORKERS)
+        self.threads = threads if threads is not None else worker_threads(self.workers)
+        self._backend_factory = backend_factory
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+        logger.info(
+            "CPU worker pool: %d processes x %d threads", self.workers, self.threads
+        )
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        """Create the worker pool; processes start with its first call.
+
+        Returns:
+            ProcessPoolExecutor: A pool of spawned worker processes.
+        """
+        # Forking a process that already runs torch threads is unsafe
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.config, self.threads, self._backend_factory),
+        )
+
+    def _replace_broken(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """Swap a broken pool for a new one, unless another caller already did.
+
+        Args:
+            broken: The pool that raised `BrokenProcessPool`.
+
+        Returns:
+            ProcessPoolExecutor: The current, working pool.
+        """
+        with self._lock:
+            if self._executor is broken:
+                logger.warning("CPU worker pool broke; starting new workers")
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._new_executor()
+            return self._executor
+
+    def _call(
+        self,
+        fn: Callable[[Any], Any],
+        arg: Any,  # noqa: ANN401 - forwarded to the worker function
+        cancellation_token: CancellationToken | None,
+    ) -> Any:  # noqa: ANN401 - result type depends on ``fn``
+        """Run ``fn(arg)`` on the next idle worker.
+
+        Returns:
+            Any: The call's result.
+
+        Raises:
+            TranscriptionError: If the worker process died; the pool is
+                replaced before raising.
+        """
+        with self._lock:
+            executor = self._executor
+        try:
+            try:
+                future = executor.submit(fn, arg)
+            except BrokenProcessPool:
+                # Broken by an earlier call whose caller did not notice yet
+                executor = self._replace_broken(executor)
+                future = executor.submit(fn, arg)
+            return self._wait(future, cancellation_token)
+        except BrokenProcessPool as e:
+            self._replace_broken(executor)
+            raise TranscriptionError(f"CPU worker process failed: {e}") from e
+
+    @property
+    def parallelism(self) -> int:
+        """int: Number of calls the pool can run at once without queueing."""
+        return self.workers
+
+    def _wait(
+        self, future: Future[Any], cancellation_token: CancellationToken | None
+    ) -> Any:  # noqa: ANN401 - result type depends on the submitted call
+        """Wait for a worker call, honouring cancellation.
+
+        A cancelled caller stops waiting; a call already running in a worker
+        finishes there and its result is dropped.
+
+        Returns:
+            Any: The call's result.
+        """
+        while True:
+            if cancellation_token is not None:
+                try:
+                    cancellation_token.raise_if_cancelled()
+                except BaseException:
+                    future.cancel()
+                    raise
+            try:
+                return future.result(timeout=_CANCEL_POLL_SECONDS)
+            except FutureTimeoutError:
+                continue
+
+    def process_audio(
+        self,
+        audio_file_path: str,
+        language: str | None,
+        task: str,
+        return_timestamps_value: bool | str,
+        progress_cb: ProgressCallback | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> dict[str, Any]:
+        """Transcribe a file on the next idle worker.
+
+        Progress callbacks and the cancellation token stay in this process;
+        the worker reports no intermediate progress.
+
+        Args:
+            audio_file_path: Path to the audio file.
+            language: Optional language code.
+            task: "transcribe" or "translate".
+            return_timestamps_value: Timestamp mode passed to the worker.
+            progress_cb: Optional progress callback (unused by workers).
+            cancellation_token: Optional cancellation token, checked while
+                waiting.
+
+        Returns:
+            dict[str, Any]: The worker's result.
+        """
+        return self._call(
+            _worker_process_audio,
+            {
+                "audio_file_path": audio_file_path,
+                "language": language,
+                "task": task,
+                "return_timestamps_value": return_timestamps_value,
+            },
+            cancellation_token,
+        )
+
+    def detect_language(self, audio_file_paths: list[str]) -> str | None:
+        """Detect the spoken language on the next idle worker.
+
+        Args:
+            audio_file_paths: Sample files from the same recording.
+
+        Returns:
+            str | None: A language code, or None if detection failed.
+        """
+        try:
+            return self._call(_worker_detect_language, audio_file_paths, None)
+        except TranscriptionError as e:
+            logger.warning("Language detection in CPU worker failed: %s", e)
+            return None
+
+    def close(self) -> None:
+        """Stop the worker processes and release their models."""
+        with self._lock:
+            executor = self._executor
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,200 @@
+"""Device pool: one model replica per device behind a single backend.
+
+A backend config whose ``device`` lists several devices separated by commas
+(e.g. ``"0,1"`` or ``WHISPER_DEVICE=0,1``) selects pool mode. `DevicePoolBackend`
+then loads one `HuggingFaceBackend` replica per listed device and sends every
+call to the replica with the fewest calls in flight. Each replica runs one call
+at a time, so calls beyond the pool size queue on a replica. Concurrent
+requests therefore spread across the devices, and `WhisperPipeline` decodes the
+chunks of a long file on all replicas at once (see its ``parallelism``
+check), merging the chunk results back in order.
+
+The same device may be listed more than once; ``"cpu,cpu"`` runs two CPU
+replicas, which is how pool mode is exercised without GPUs.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+from collections.abc import Iterator
+from dataclasses import replace
+from typing import Any
+
+from insanely_fast_whisper_rocm.core.asr_backend import (
+    ASRBackend,
+    HuggingFaceBackend,
+    HuggingFaceBackendConfig,
+)
+from insanely_fast_whisper_rocm.core.cancellation import CancellationToken
+from insanely_fast_whisper_rocm.core.progress import ProgressCallback
+
+logger = logging.getLogger(__name__)
+
+
+def pool_devices(device: str) -> list[str]:
+    """Split a device string into the devices of a pool.
+
+    Args:
+        device: A single device (``"0"``, ``"cpu"``) or a comma-separated list.
+
+    Returns:
+        list[str]: The listed devices, in order; a single entry for a plain
+        device string.
+    """
+    return [part.strip() for part in device.split(",") if part.strip()]
+
+
+def is_device_pool(device: str) -> bool:
+    """Tell whether a device string selects pool mode.
+
+    Args:
+        device: The configured device string.
+
+    Returns:
+        bool: True if it lists more than one device.
+    """
+    return len(pool_devices(device)) > 1
+
+
+def is_cpu_only(device: str) -> bool:
+    """Tell whether a device string, pooled or not, uses only the CPU.
+
+    Args:
+        device: The configured device string.
+
+    Returns:
+        bool: True if every listed device is ``"cpu"``.
+    """
+    return all(part == "cpu" for part in pool_devices(device))
+
+
+class DevicePoolBackend(ASRBackend):
+    """Dispatch ASR calls to the least-loaded of several device replicas."""
+
+    def __init__(self, config: HuggingFaceBackendConfig) -> None:
+        """Create one replica per device listed in ``config.device``.
+
+        Replicas load their model lazily on first use, like any
+        `HuggingFaceBackend`.
+
+        Args:
+            config: Pool configuration; its ``device`` is a comma-separated
+                device list and every other field is shared by the replicas.
+        """
+        self.config = config
+        self.devices = pool_devices(config.device)
+        self.replicas: list[HuggingFaceBackend] = [
+            HuggingFaceBackend(config=replace(config, device=device))
+            for device in self.devices
+        ]
+        self._lock = threading.Lock()
+        # A replica's pipeline is not thread-safe
+        self._replica_locks = [threading.Lock() for _ in self.replicas]
+        self._in_flight = [0] * len(self.replicas)
+        self._completed = [0] * len(self.replicas)
+        logger.info(
+            "Device pool with %d replicas: %s",
+            len(self.replicas),
+            ", ".join(self.devices),
+        )
+
+    @property
+    def parallelism(self) -> int:
+        """int: Number of calls the pool can run at once without queueing."""
+        return len(self.replicas)
+
+    @contextlib.contextmanager
+    def _lease(self) -> Iterator[HuggingFaceBackend]:
+        """Reserve the least-loaded replica for one call.
+
+        Ties go to the replica that has completed the fewest calls, so
+        sequential calls still rotate through the pool. The replica is held
+        exclusively while it is yielded.
+
+        Yields:
+            HuggingFaceBackend: The chosen replica.
+        """
+        with self._lock:
+            index = min(
+                range(len(self.replicas)),
+                key=lambda i: (self._in_flight[i], self._completed[i]),
+            )
+            self._in_flight[index] += 1
+        try:
+            with self._replica_locks[index]:
+                yield self.replicas[index]
+        finally:
+            with self._lock:
+                self._in_flight[index] -= 1
+                self._completed[index] += 1
+
+    def process_audio(
+        self,
+        audio_file_path: str,
+        language: str | None,
+        task: str,
+        return_timestamps_value: bool | str,
+        progress_cb: ProgressCallback | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> dict[str, Any]:
+        """Transcribe a file on the least-loaded replica.
+
+        Args:
+            audio_file_path: Path to the audio file.
+            language: Optional language code.
+            task: "transcribe" or "translate".
+            return_timestamps_value: Timestamp mode passed to the replica.
+            progress_cb: Optional progress callback.
+            cancellation_token: Optional cancellation token.
+
+        Returns:
+            dict[str, Any]: The replica's result.
+        """
+        with self._lease() as replica:
+            return replica.process_audio(
+                audio_file_path=audio_file_path,
+                language=language,
+                task=task,
+                return_timestamps_value=return_timestamps_value,
+                progress_cb=progress_cb,
+                cancellation_token=cancellation_token,
+            )
+
+    def detect_language(self, audio_file_paths: list[str]) -> str | None:
+        """Detect the spoken language on the least-loaded replica.
+
+        Args:
+            audio_file_paths: Sample files from the same recording.
+
+        Returns:
+            str | None: A language code, or None if detection failed.
+        """
+        with self._lease() as replica:
+            return replica.detect_language(audio_file_paths)
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Return the load of every replica.
+
+        Returns:
+            list[dict[str, Any]]: Per replica, its ``device`` plus the
+            ``in_flight`` and ``completed`` call counts.
+        """
+        with self._lock:
+            return [
+                {"device": device, "in_flight": in_flight, "completed": completed}
+                for device, in_flight, completed in zip(
+                    self.devices, self._in_flight, self._completed, strict=True
+                )
+            ]
+
+    def close(self) -> None:
+        """Release the models of all replicas."""
+        for replica in self.replicas:
+            try:
+                replica.close()
+            except Exception as e:  # pragma: no cover - defensive cleanup
+                logger.warning(
+                    "Failed to close replica on %s: %s", replica.config.device, e
+                )
@@ -10,9 +10,11 @@ import json
 import logging
 import math
 import re
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, TextIO
 
 from insanely_fast_whisper_rocm.core.segmentation import (
+    Segment,
     Word,
     segment_words,
     split_lines,
@@ -141,11 +143,84 @@ def _result_to_words(result: dict[str, Any]) -> list[Word] | None:
     return words_list if words_list else None
 
 
-def build_quality_segments(result: dict[str, Any]) -> list[dict[str, Any]]:
+class RenderPlan:
+    """Per-result cache of word extraction and readable segmentation.
+
+    Word extraction and `segment_words` are the expensive parts of subtitle
+    rendering. A plan computes them lazily, at most once, so every formatter
+    and the quality scorer can share the work when exporting one result in
+    several formats.
+
+    Attributes:
+        result: The transcription result the plan was built for.
+    """
+
+    def __init__(self, result: dict[str, Any]) -> None:
+        """Initialize the plan for ``result``.
+
+        Args:
+            result: The transcription result to render.
+        """
+        self.result = result
+        self._words: list[Word] | None = None
+        self._words_extracted = False
+        self._segments: list[Segment] | None = None
+
+    @classmethod
+    def resolve(
+        cls, result: dict[str, Any], plan: RenderPlan | None = None
+    ) -> RenderPlan:
+        """Return ``plan`` when it belongs to ``result``, else a fresh plan.
+
+        Args:
+            result: The transcription result being rendered.
+            plan: Optional plan supplied by the caller.
+
+        Returns:
+            A plan whose ``result`` is ``result``.
+        """
+        if plan is not None and plan.result is result:
+            return plan
+        return cls(result)
+
+    @property
+    def words(self) -> list[Word] | None:
+        """Word-level timestamps extracted from the result, if any."""
+        if not self._words_extracted:
+            self._words = _result_to_words(self.result)
+            self._words_extracted = True
+        return self._words
+
+    @property
+    def segments(self) -> list[Segment]:
+        """Readable segments produced by `segment_words` from `words`."""
+        if self._segments is None:
+            words = self.words
+            self._segments = segment_words(words) if words else []
+        return self._segments
+
+    @property
+    def has_timing_bug(self) -> bool:
+        """Whether the leading word timestamps are all identical.
+
+        Some backends emit the same timestamp for every word; subtitles built
+        from such data would collapse, so SRT output falls back to chunks.
+        """
+        words = self.words
+        if not words:
+            return False
+        return len({w.start for w in words[:10]}) <= 1
+
+
+def build_quality_segments(
+    result: dict[str, Any], plan: RenderPlan | None = None
+) -> list[dict[str, Any]]:
     """Build readability-aware segments for quality scoring.
 
     Args:
         result: Transcription result containing raw word-level timestamps.
+        plan: Optional shared `RenderPlan` for ``result`` to reuse segmentation
+            already computed by the formatters.
 
     Returns:
         Segments with ``start``, ``end``, and ``text`` keys suitable for
@@ -155,7 +230,8 @@ def build_quality_segments(result: dict[str, Any]) -> list[dict[str, Any]]:
         are returned.
     """
     logger.info("[build_quality_segments] Processing result for quality scoring")
-    words = _result_to_words(result)
+    plan = RenderPlan.resolve(result, plan)
+    words = plan.words
     if words:
         word_span = words[-1].end - words[0].start if words else 0
         avg_word_dur = sum(w.end - w.start for w in words) / len(words)
@@ -166,7 +242,7 @@ def build_quality_segments(result: dict[str, Any]) -> list[dict[str, Any]]:
             avg_word_dur,
         )
         quality_segments: list[dict[str, Any]] = []
-        for seg in segment_words(words):
+        for seg in plan.segments:
             quality_segments.append({
                 "start": float(seg.start),
                 "end": float(seg.end),
@@ -222,17 +298,58 @@ class BaseFormatter:
     """Base class for all formatters."""
 
     @classmethod
-    def format(cls, result: dict[str, Any]) -> str:
+    def format(cls, result: dict[str, Any], plan: RenderPlan | None = None) -> str:
         """Format the transcription result.
 
         Args:
             result: The transcription result from ASRPipeline
+            plan: Optional shared `RenderPlan` for ``result``.
 
         Returns:
             Formatted string
         """
         raise NotImplementedError("Subclasses must implement this method")
 
+    @classmethod
+    def iter_format(
+        cls, result: dict[str, Any], plan: RenderPlan | None = None
+    ) -> Iterator[str]:
+        """Yield the formatted output in fragments.
+
+        Subclasses override this to emit output incrementally; joining the
+        fragments must equal `format`. The default yields `format` whole.
+
+        Args:
+            result: The transcription result from ASRPipeline
+            plan: Optional shared `RenderPlan` for ``result``.
+
+        Yields:
+            str: Consecutive fragments of the formatted output.
+        """
+        yield cls.format(result, plan)
+
+    @classmethod
+    def write(
+        cls,
+        result: dict[str, Any],
+        stream: TextIO,
+        plan: RenderPlan | None = None,
+    ) -> int:
+        """Write the formatted output to ``stream`` fragment by fragment.
+
+        Args:
+            result: The transcription result from ASRPipeline
+            stream: Open text stream to write to.
+            plan: Optional shared `RenderPlan` for ``result``.
+
+        Returns:
+            int: Number of characters written.
+        """
+        written = 0
+        for fragment in cls.iter_format(result, plan):
+            written += stream.write(fragment)
+        return written
+
     @classmethod
     def get_file_extension(cls) -> str:
         """Get the file extension for this format."""
@@ -243,11 +360,12 @@ class TxtFormatter(BaseFormatter):
     """Formatter for plain text output."""
 
     @classmethod
-    def format(cls, result: dict[str, Any]) -> str:
+    def format(cls, result: dict[str, Any], plan: RenderPlan | None = None) -> str:
         """Format as plain text.
 
         Args:
             result: The transcription result from ASRPipeline
+            plan: Unused; accepted for interface compatibility.
 
         Returns:
             str: The formatted text.
@@ -264,6 +382,21 @@ class TxtFormatter(BaseFormatter):
             logger.exception(f"[TxtFormatter] Failed to format TXT: {e}")
             return ""
 
+    @classmethod
+    def iter_format(
+        cls, result: dict[str, Any], plan: RenderPlan | None = None
+    ) -> Iterator[str]:
+        """Yield the plain text one line at a time.
+
+        Args:
+            result: The transcription result from ASRPipeline
+            plan: Unused; accepted for interface compatibility.
+
+        Yields:
+            str: Consecutive lines of the text, with their line endings.
+        """
+        yield from cls.format(result, plan).splitlines(keepends=True)
+
     @classmethod
     def get_file_extension(cls) -> str:
         """Get the file extension for this format.
@@ -294,7 +427,7 @@ class SrtFormatter(BaseFormatter):
         return cls._HYPHEN_SPACING_PATTERN.sub("-", text)
 
     @classmethod
-    def format(cls, result: dict[str, Any]) -> str:
+    def format(cls, result: dict[str, Any], plan: RenderPlan | None = None) -> str:
         """Format as SRT subtitles with timestamps.
 
         This method uses a segmentation pipeline to create readable subtitles
@@ -303,15 +436,56 @@ class SrtFormatter(BaseFormatter):
 
         Args:
             result: The transcription result from ASRPipeline.
+            plan: Optional shared `RenderPlan` for ``result``.
 
         Returns:
             The formatted SRT subtitles as a string.
         """
+        return "".join(cls.iter_format(result, plan))
+
+    @classmethod
+    def iter_format(
+        cls, result: dict[str, Any], plan: RenderPlan | None = None
+    ) -> Iterator[str]:
+        """Yield SRT output one cue at a time.
+
+        Joining the fragments gives exactly the output of `format`.
+
+        Args:
+            result: The transcription result from ASRPipeline.
+            plan: Optional shared `RenderPlan` for ``result``.
+
+        Yields:
+            str: Numbered SRT cues, each prefixed by the blank-line separator
+            except the first.
+        """
+        for position, (index, body) in enumerate(cls.iter_cues(result, plan)):
+            cue = f"{index}\n{body}"
+            yield cue if position == 0 else f"\n{cue}"
+
+    @classmethod
+    def iter_cues(
+        cls, result: dict[str, Any], plan: RenderPlan | None = None
+    ) -> Iterator[tuple[int, str]]:
+        """Return an iterator over ``(index, body)`` pairs for each SRT cue.
+
+        Segmentation and chunk normalization run eagerly; the per-cue text is
+        rendered lazily so callers can stream cues without holding the whole
+        document in memory. ``body`` is the timing line and wrapped text.
+
+        Args:
+            result: The transcription result from ASRPipeline.
+            plan: Optional shared `RenderPlan` for ``result``.
+
+        Returns:
+            An iterator of cue numbers and cue bodies.
+        """
         logger.debug(f"[SrtFormatter] Formatting result: keys={list(result.keys())}")
 
         # Attempt to use the new segmentation pipeline first
         if USE_READABLE_SUBTITLES:
-            words = _result_to_words(result)
+            plan = RenderPlan.resolve(result, plan)
+            words = plan.words
             if words:
                 logger.info(
                     "[SrtFormatter] Found %d words, using segmentation pipeline.",
@@ -320,36 +494,21 @@ class SrtFormatter(BaseFormatter):
                 # CRITICAL FIX: For word-level timestamps:
                 # Check if they appear corrupted (e.g., all timestamps
                 # are the same value indicating a backend bug)
-                word_timestamps = [w.start for w in words[:10]]  # Check first 10 words
-                has_timing_bug = len(set(word_timestamps)) <= 1  # All same timestamp
-
-                if has_timing_bug:
+                if plan.has_timing_bug:
                     logger.warning(
                         "[SrtFormatter] Detected word-level timestamp bug "
                         "(all words have same timestamp). "
                         "Using fallback chunk-based formatting to avoid gaps."
                     )
                 else:
-                    segments = segment_words(words)
+                    segments = plan.segments
                     logger.info(
                         "[SrtFormatter] segment_words() produced %d segments "
                         "from %d words.",
                         len(segments),
                         len(words),
                     )
-                    srt_content = []
-                    for i, segment in enumerate(segments, 1):
-                        start = format_srt_time(segment.start)
-                        end = format_srt_time(segment.end)
-                        wrapped = split_lines(segment.text)
-                        normalized_text = cls._normalize_hyphen_spacing(wrapped)
-                        srt_content.append(
-                            f"{i}\n{start} --> {end}\n{normalized_text}\n"
-                        )
-                    logger.info(
-                        "[SrtFormatter] Returning %d SRT segments.", len(srt_content)
-                    )
-                    return "\n".join(srt_content)
+                    return cls._iter_segment_cues(segments)
             else:
                 logger.info("[SrtFormatter] No words found, using fallback.")
 
@@ -362,7 +521,7 @@ class SrtFormatter(BaseFormatter):
                 logger.warning(
                     "[SrtFormatter] No 'chunks' or 'segments' found in result."
                 )
-                return ""
+                return iter(())
 
             # Normalize timestamp format (convert "timestamp" tuples to "start"/"end")
             normalized_chunks: list[dict[str, Any]] = []
@@ -394,42 +553,70 @@ class SrtFormatter(BaseFormatter):
 
             chunks = validate_timestamps(normalized_chunks)
             chunks = cls._split_chunks_by_duration(chunks)
+        except (TypeError, KeyError, AttributeError, IndexError) as e:
+            logger.exception(f"[SrtFormatter] Failed to format SRT: {e}")
+            return iter(())
 
-            srt_content = []
-            for i, chunk in enumerate(chunks, 1):
-                try:
-                    # Adapt to different timestamp formats
-                    start_sec, end_sec = -1, -1
-                    if (
-                        "timestamp" in chunk
-                        and isinstance(chunk["timestamp"], (list, tuple))
-                        and len(chunk["timestamp"]) == 2
-                    ):
-                        start_sec, end_sec = chunk["timestamp"]
-                    elif "start" in chunk and "end" in chunk:
-                        start_sec, end_sec = chunk["start"], chunk["end"]
+        return cls._iter_chunk_cues(chunks)
 
-                    if start_sec == -1 or end_sec == -1:
-                        continue
+    @classmethod
+    def _iter_segment_cues(cls, segments: list[Segment]) -> Iterator[tuple[int, str]]:
+        """Render readable segments as SRT cue bodies.
 
-                    start = format_srt_time(start_sec)
-                    end = format_srt_time(end_sec)
-                    text = chunk.get("text", "").strip()
+        Args:
+            segments: Segments produced by `segment_words`.
 
-                    # Apply line splitting for readability
-                    formatted_text = split_lines(text)
-                    formatted_text = cls._normalize_hyphen_spacing(formatted_text)
+        Yields:
+            tuple[int, str]: Cue number and cue body.
+        """
+        for i, segment in enumerate(segments, 1):
+            start = format_srt_time(segment.start)
+            end = format_srt_time(segment.end)
+            wrapped = split_lines(segment.text)
+            normalized_text = cls._normalize_hyphen_spacing(wrapped)
+            yield i, f"{start} --> {end}\n{normalized_text}\n"
+        logger.info("[SrtFormatter] Returning %d SRT segments.", len(segments))
 
-                    srt_content.append(f"{i}\n{start} --> {end}\n{formatted_text}\n")
-                except (TypeError, KeyError, AttributeError, IndexError) as chunk_e:
-                    logger.error(
-                        f"[SrtFormatter] Failed to format chunk #{i}: {chunk_e}"
-                    )
-            return "\n".join(srt_content)
+    @classmethod
+    def _iter_chunk_cues(
+        cls, chunks: list[dict[str, Any]]
+    ) -> Iterator[tuple[int, str]]:
+        """Render normalized raw chunks as SRT cue bodies.
 
-        except (TypeError, KeyError, AttributeError, IndexError) as e:
-            logger.exception(f"[SrtFormatter] Failed to format SRT: {e}")
-            return ""
+        Args:
+            chunks: Chunks with validated ``start``/``end`` timings.
+
+        Yields:
+            tuple[int, str]: Cue number and cue body. Chunks that cannot be
+            rendered are logged and skipped without renumbering.
+        """
+        for i, chunk in enumerate(chunks, 1):
+            try:
+                # Adapt to different timestamp formats
+                start_sec, end_sec = -1, -1
+                if (
+                    "timestamp" in chunk
+                    and isinstance(chunk["timestamp"], (list, tuple))
+                    and len(chunk["timestamp"]) == 2
+                ):
+                    start_sec, end_sec = chunk["timestamp"]
+                elif "start" in chunk and "end" in chunk:
+                    start_sec, end_sec = chunk["start"], chunk["end"]
+
+                if start_sec == -1 or end_sec == -1:
+                    continue
+
+                start = format_srt_time(start_sec)
+                end = format_srt_time(end_sec)
+                text = chunk.get("text", "").strip()
+
+                # Apply line splitting for readability
+                formatted_text = split_lines(text)
+                formatted_text = cls._normalize_hyphen_spacing(formatted_text)
+            except (TypeError, KeyError, AttributeError, IndexError) as chunk_e:
+                logger.error(f"[SrtFormatter] Failed to format chunk #{i}: {chunk_e}")
+                continue
+            yield i, f"{start} --> {end}\n{formatted_text}\n"
 
     @classmethod
     def get_file_extension(cls) -> str:
@@ -519,7 +706,7 @@ class VttFormatter(BaseFormatter):
     """Formatter for WebVTT subtitles."""
 
     @classmethod
-    def format(cls, result: dict[str, Any]) -> str:
+    def format(cls, result: dict[str, Any], plan: RenderPlan | None = None) -> str:
         """Format as WebVTT subtitles with timestamps.
 
         This method uses a segmentation pipeline to create readable subtitles
@@ -528,24 +715,62 @@ class VttFormatter(BaseFormatter):
 
         Args:
             result: The transcription result from ASRPipeline.
+            plan: Optional shared `RenderPlan` for ``result``.
 
         Returns:
             The formatted WebVTT subtitles as a string.
         """
+        return "".join(cls.iter_format(result, plan))
+
+    @classmethod
+    def iter_format(
+        cls, result: dict[str, Any], plan: RenderPlan | None = None
+    ) -> Iterator[str]:
+        """Yield WebVTT output as the header followed by one cue at a time.
+
+        Joining the fragments gives exactly the output of `format`.
+
+        Args:
+            result: The transcription result from ASRPipeline.
+            plan: Optional shared `RenderPlan` for ``result``.
+
+        Yields:
+            str: The ``WEBVTT`` header, then each cue prefixed by its blank-line
+            separator.
+        """
+        cues = cls.iter_cues(result, plan)
+        if cues is None:
+            yield "WEBVTT\n\n"
+            return
+        yield "WEBVTT\n"
+        for body in cues:
+            yield f"\n{body}"
+
+    @classmethod
+    def iter_cues(
+        cls, result: dict[str, Any], plan: RenderPlan | None = None
+    ) -> Iterator[str] | None:
+        """Return an iterator over WebVTT cue bodies.
+
+        Segmentation and chunk normalization run eagerly; the per-cue text is
+        rendered lazily so callers can stream cues.
+
+        Args:
+            result: The transcription result from ASRPipeline.
+            plan: Optional shared `RenderPlan` for ``result``.
+
+        Returns:
+            An iterator of cue bodies, or ``None`` when the result holds no
+            usable chunks and only an empty document should be written.
+        """
         logger.debug(f"[VttFormatter] Formatting result: keys={list(result.keys())}")
 
         # Attempt to use the new segmentation pipeline first
         if USE_READABLE_SUBTITLES:
-            words = _result_to_words(result)
-            if words:
+            plan = RenderPlan.resolve(result, plan)
+            if plan.words:
                 logger.debug("[VttFormatter] Found words, using segmentation.")
-                segments = segment_words(words)
-                vtt_content = ["WEBVTT\n"]
-                for segment in segments:
-                    start = format_vtt_time(segment.start)
-                    end = format_vtt_time(segment.end)
-                    vtt_content.append(f"{start} --> {end}\n{segment.text}\n")
-                return "\n".join(vtt_content)
+                return cls._iter_segment_cues(plan.segments)
 
         # Fallback to old chunk-based formatting if no words are found
         logger.debug("[VttFormatter] No word-level timestamps, using chunk fallback.")
@@ -555,7 +780,7 @@ class VttFormatter(BaseFormatter):
                 logger.warning(
                     "[VttFormatter] No 'chunks' or 'segments' found in result."
                 )
-                return "WEBVTT\n\n"
+                return None
 
             # Normalize timestamp format (convert "timestamp" tuples to "start"/"end")
             normalized_chunks: list[dict[str, Any]] = []
@@ -580,38 +805,62 @@ class VttFormatter(BaseFormatter):
             )
 
             chunks = validate_timestamps(normalized_chunks)
+        except (TypeError, KeyError, AttributeError, IndexError) as e:
+            logger.exception(f"[VttFormatter] Failed to format VTT: {e}")
+            return None
 
-            vtt_content = ["WEBVTT\n"]
-            for chunk in chunks:
-                try:
-                    start_sec, end_sec = -1, -1
-                    if (
-                        "timestamp" in chunk
-                        and isinstance(chunk["timestamp"], (list, tuple))
-                        and len(chunk["timestamp"]) == 2
-                    ):
-                        start_sec, end_sec = chunk["timestamp"]
-                    elif "start" in chunk and "end" in chunk:
-                        start_sec, end_sec = chunk["start"], chunk["end"]
+        return cls._iter_chunk_cues(chunks)
+
+    @staticmethod
+    def _iter_segment_cues(segments: list[Segment]) -> Iterator[str]:
+        """Render readable segments as WebVTT cue bodies.
 
-                    if start_sec == -1 or end_sec == -1:
-                        continue
+        Args:
+            segments: Segments produced by `segment_words`.
 
-                    start = format_vtt_time(start_sec)
-                    end = format_vtt_time(end_sec)
-                    text = chunk.get("text", "").strip()
+        Yields:
+            str: One cue body per segment.
+        """
+        for segment in segments:
+            start = format_vtt_time(segment.start)
+            end = format_vtt_time(segment.end)
+            yield f"{start} --> {end}\n{segment.text}\n"
 
-                    # Apply line splitting for readability
-                    formatted_text = split_lines(text)
+    @staticmethod
+    def _iter_chunk_cues(chunks: list[dict[str, Any]]) -> Iterator[str]:
+        """Render normalized raw chunks as WebVTT cue bodies.
 
-                    vtt_content.append(f"{start} --> {end}\n{formatted_text}\n")
-                except (TypeError, KeyError, AttributeError, IndexError) as chunk_e:
-                    logger.error(f"[VttFormatter] Failed to format chunk: {chunk_e}")
-            return "\n".join(vtt_content)
+        Args:
+            chunks: Chunks with validated ``start``/``end`` timings.
 
-        except (TypeError, KeyError, AttributeError, IndexError) as e:
-            logger.exception(f"[VttFormatter] Failed to format VTT: {e}")
-            return "WEBVTT\n\n"
+        Yields:
+            str: One cue body per renderable chunk.
+        """
+        for chunk in chunks:
+            try:
+                start_sec, end_sec = -1, -1
+                if (
+                    "timestamp" in chunk
+                    and isinstance(chunk["timestamp"], (list, tuple))
+                    and len(chunk["timestamp"]) == 2
+                ):
+                    start_sec, end_sec = chunk["timestamp"]
+                elif "start" in chunk and "end" in chunk:
+                    start_sec, end_sec = chunk["start"], chunk["end"]
+
+                if start_sec == -1 or end_sec == -1:
+                    continue
+
+                start = format_vtt_time(start_sec)
+                end = format_vtt_time(end_sec)
+                text = chunk.get("text", "").strip()
+
+                # Apply line splitting for readability
+                formatted_text = split_lines(text)
+            except (TypeError, KeyError, AttributeError, IndexError) as chunk_e:
+                logger.error(f"[VttFormatter] Failed to format chunk: {chunk_e}")
+                continue
+            yield f"{start} --> {end}\n{formatted_text}\n"
 
     @classmethod
     def get_file_extension(cls) -> str:
@@ -628,11 +877,12 @@ class JsonFormatter(BaseFormatter):
     """Formatter for JSON output."""
 
     @classmethod
-    def format(cls, result: dict[str, Any]) -> str:
+    def format(cls, result: dict[str, Any], plan: RenderPlan | None = None) -> str:
         """Format as pretty-printed JSON.
 
         Args:
             result: The result to format.
+            plan: Unused; accepted for interface compatibility.
 
         Returns:
             str: The formatted JSON string.
@@ -645,6 +895,25 @@ class JsonFormatter(BaseFormatter):
             logger.exception(f"[JsonFormatter] Failed to format JSON: {e}")
             return "{}"
 
+    @classmethod
+    def iter_format(
+        cls, result: dict[str, Any], plan: RenderPlan | None = None
+    ) -> Iterator[str]:
+        """Yield pretty-printed JSON incrementally via `json.JSONEncoder`.
+
+        Unlike `format`, serialization errors cannot be replaced by ``{}`` once
+        output has started, so they propagate to the caller.
+
+        Args:
+            result: The result to format.
+            plan: Unused; accepted for interface compatibility.
+
+        Yields:
+            str: Consecutive fragments of the JSON document.
+        """
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+        yield from encoder.iterencode(result)
+
     @classmethod
     def get_file_extension(cls) -> str:
         """Get the file extension for this formatter.
@@ -0,0 +1,186 @@
+"""Generation budget and runaway-decoding guard for Whisper.
+
+On noisy or silent audio Whisper sometimes falls into a repetition loop and
+keeps decoding until the model's token limit, so one bad chunk can take many
+times longer than a normal one. Two guards keep that in check:
+
+* `max_new_tokens_for` caps the new tokens of a decode by the chunk's audio
+  duration and an expected speech rate (``GENERATION_TOKENS_PER_SECOND``,
+  off by default); `BudgetMonitor` reports decodes that ran into the cap.
+* `RepetitionGuard` is a stopping criterion that ends a sequence as soon as
+  its recent tokens compress too well, i.e. it is looping.
+
+`compression_ratio` applies the same test to decoded text, like Whisper's
+reference implementation does, so loops that slipped through are caught too.
+"""
+
+from __future__ import annotations
+
+import math
+import zlib
+
+import numpy as np
+import torch
+from transformers import StoppingCriteria
+
+from insanely_fast_whisper_rocm.utils import constants
+
+# Whisper decodes at most this many positions (prompt tokens included)
+WHISPER_MAX_TARGET_POSITIONS = 448
+# Upper bound of the decoder prompt (<|startoftranscript|>, language, task,
+# <|notimestamps|>)
+_PROMPT_TOKENS = 4
+
+
+def max_new_tokens_for(
+    duration_s: float | None,
+    *,
+    max_target_positions: int = WHISPER_MAX_TARGET_POSITIONS,
+) -> int | None:
+    """Return the token budget for decoding ``duration_s`` seconds of audio.
+
+    Args:
+        duration_s: Audio duration of the decoded chunk, if known.
+        max_target_positions: Decoder length limit of the model.
+
+    Returns:
+        int | None: The ``max_new_tokens`` cap, or None to keep the model's
+        default (unknown duration or ``GENERATION_TOKENS_PER_SECOND`` is 0).
+    """
+    rate = constants.GENERATION_TOKENS_PER_SECOND
+    if duration_s is None or duration_s <= 0 or rate <= 0:
+        return None
+    budget = math.ceil(duration_s * rate) + constants.GENERATION_TOKEN_MARGIN
+    return max(1, min(budget, max_target_positions - _PROMPT_TOKENS))
+
+
+def compression_ratio(text: str) -> float:
+    """Return how well ``text`` compresses; looping text scores high.
+
+    Args:
+        text: Decoded text.
+
+    Returns:
+        float: Raw size divided by zlib-compressed size (0.0 for empty text).
+    """
+    raw = text.encode("utf-8")
+    if not raw:
+        return 0.0
+    return len(raw) / len(zlib.compress(raw))
+
+
+class RepetitionGuard(StoppingCriteria):
+    """Stop sequences whose most recent tokens are a repetition loop.
+
+    Every ``stride`` steps the last ``window`` generated tokens of each
+    sequence are compressed; a ratio above ``threshold`` means the sequence
+    keeps repeating itself, and it is finished early.
+    """
+
+    def __init__(
+        self,
+        threshold: float | None = None,
+        window: int = 64,
+        stride: int = 8,
+    ) -> None:
+        """Initialize the guard.
+
+        Args:
+            threshold: Compression ratio treated as a loop. Defaults to
+                ``GENERATION_COMPRESSION_RATIO_THRESHOLD``.
+            window: Number of recent tokens inspected.
+            stride: Check every ``stride`` generation steps.
+        """
+        if threshold is None:
+            threshold = constants.GENERATION_COMPRESSION_RATIO_THRESHOLD
+        self.threshold = threshold
+        self.window = window
+        self.stride = max(1, stride)
+        self.triggered = False
+        self._prompt_length = 0
+        self._last_length: int | None = None
+
+    def __call__(
+        self,
+        input_ids: torch.LongTensor,
+        scores: torch.FloatTensor | None,
+        **kwargs: object,
+    ) -> torch.BoolTensor:
+        """Flag looping sequences.
+
+        Args:
+            input_ids: Tokens generated so far, shape ``(batch, length)``.
+            scores: Prediction scores (unused).
+            **kwargs: Additional generation state (unused).
+
+        Returns:
+            torch.BoolTensor: Per-sequence flags; True finishes a sequence.
+        """
+        done = torch.zeros(
+            input_ids.shape[0], dtype=torch.bool, device=input_ids.device
+        )
+        length = input_ids.shape[-1]
+        # The pipeline reuses one guard for every generate() call of a batch
+        # loop; a sequence that did not grow means a new call started.
+        if self._last_length is None or length <= self._last_length:
+            self._prompt_length = length
+        self._last_length = length
+        generated = length - self._prompt_length
+        if generated < self.window or generated % self.stride:
+            return done
+        # Whisper's vocabulary fits into 16 bits; wider ids would make every
+        # window look compressible.
+        tails = input_ids[:, -self.window :].to("cpu", torch.int64).numpy()
+        for row, tail in enumerate(tails):
+            raw = tail.astype(np.uint16 if tail.max() < 2**16 else np.uint32).tobytes()
+            if len(raw) / len(zlib.compress(raw)) > self.threshold:
+                done[row] = True
+                self.triggered = True
+        return done
+
+
+class BudgetMonitor(StoppingCriteria):
+    """Record whether a decode ran until its ``max_new_tokens`` cap.
+
+    The monitor never stops a sequence itself; generation ends at the cap
+    anyway. It only notes that it did, since that output may be truncated.
+    """
+
+    def __init__(self, max_new_tokens: int) -> None:
+        """Initialize the monitor.
+
+        Args:
+            max_new_tokens: The cap passed to ``generate``.
+        """
+        self.max_new_tokens = max_new_tokens
+        self.reached = False
+        self._first_length = 0
+        self._last_length: int | None = None
+
+    def __call__(
+        self,
+        input_ids: torch.LongTensor,
+        scores: torch.FloatTensor | None,
+        **kwargs: object,
+    ) -> torch.BoolTensor:
+        """Note when the generated length reaches the cap.
+
+        Args:
+            input_ids: Tokens generated so far, shape ``(batch, length)``.
+            scores: Prediction scores (unused).
+            **kwargs: Additional generation state (unused).
+
+        Returns:
+            torch.BoolTensor: All False; the monitor does not stop sequences.
+        """
+        length = input_ids.shape[-1]
+        # Called once per generated token, after it was appended; a sequence
+        # that did not grow means a new generate() call started.
+        if self._last_length is None or length <= self._last_length:
+            self._first_length = length
+        self._last_length = length
+        if length - self._first_length + 1 >= self.max_new_tokens:
+            self.reached = True
+        return torch.zeros(
+            input_ids.shape[0], dtype=torch.bool, device=input_ids.device
+        )
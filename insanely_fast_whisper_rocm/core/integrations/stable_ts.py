@@ -2,16 +2,38 @@
 
 Provides `stabilize_timestamps` to refine Whisper transcription results using
 `stable-whisper`'s `transcribe_any` convenience function.
+
+Audio is handed to stable-ts as 16 kHz PCM rather than a path. Unless the
+caller passes PCM it already holds, the samples are memory-mapped from the
+16 kHz mono WAV that `ensure_wav` produces for transcription (WAV inputs are
+used as they are), so stabilization reads the audio without decoding it
+again. Demucs output is cached on disk per audio content hash and
+memory-mapped on reuse, so a file is denoised at most once.
+
+Long inputs can be stabilized in chunks: the chunk offsets recorded by
+`WhisperPipeline._execute_asr` are grouped into windows that are decoded and
+refined independently on a worker pool, so only a few windows of audio are
+in memory at once, and the refined segments are shifted back into place.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import struct
+import tempfile
+import threading
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from insanely_fast_whisper_rocm.audio.conversion import ensure_wav
 from insanely_fast_whisper_rocm.utils import constants
+from insanely_fast_whisper_rocm.utils.file_utils import cleanup_temp_files
 from insanely_fast_whisper_rocm.utils.timestamp_utils import (
     normalize_timestamp_format,
     validate_timestamps,
@@ -19,6 +41,11 @@ from insanely_fast_whisper_rocm.utils.timestamp_utils import (
 
 logger = logging.getLogger(__name__)
 
+try:  # pragma: no cover - optional dependency
+    import ffmpeg  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - handled gracefully
+    ffmpeg = None  # type: ignore
+
 try:
     import stable_whisper  # type: ignore
 
@@ -34,6 +61,225 @@ except ImportError as err:  # pragma: no cover
     _postprocess = None
     _postprocess_alt = None
 
+# Sample rate expected by stable-ts and Whisper
+SAMPLE_RATE = 16000
+# WAV format tag, channels, sample rate and bits per sample of mappable audio
+_PCM16_MONO = (1, 1, SAMPLE_RATE, 16)
+
+_CACHE_LOCK = threading.Lock()
+# (resolved path, size, mtime_ns) -> audio hash, so files are hashed once
+_AUDIO_KEYS: dict[tuple[str, int, int], str] = {}
+
+
+def audio_hash(audio_path: str | Path) -> str:
+    """Return a content hash identifying the audio file at ``audio_path``.
+
+    The hash is memoized per path, size and modification time.
+
+    Args:
+        audio_path: Path to the audio file.
+
+    Returns:
+        str: Hex SHA-256 digest of the file contents.
+    """
+    path = Path(audio_path)
+    stat = path.stat()
+    stamp = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    with _CACHE_LOCK:
+        cached = _AUDIO_KEYS.get(stamp)
+    if cached is not None:
+        return cached
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    key = digest.hexdigest()
+    with _CACHE_LOCK:
+        _AUDIO_KEYS[stamp] = key
+    return key
+
+
+def _pcm16_data_span(wav_path: Path) -> tuple[int, int] | None:
+    """Locate the samples of a 16 kHz mono 16-bit PCM WAV file.
+
+    Args:
+        wav_path: Path to the WAV file.
+
+    Returns:
+        tuple[int, int] | None: Byte offset and length of the sample data, or
+        None if the file is not in that format.
+    """
+    with wav_path.open("rb") as handle:
+        riff = handle.read(12)
+        if riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+            return None
+        fmt: tuple[int, ...] | None = None
+        while len(header := handle.read(8)) == 8:
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"data":
+                if fmt != _PCM16_MONO:
+                    return None
+                offset = handle.tell()
+                # Streamed WAVs may leave the size unset
+                return offset, min(size, wav_path.stat().st_size - offset)
+            if chunk_id == b"fmt ":
+                tag, channels, rate, _, _, bits = struct.unpack(
+                    "<HHIIHH", handle.read(16)
+                )
+                fmt = (tag, channels, rate, bits)
+                size -= 16
+            handle.seek(size + (size & 1), os.SEEK_CUR)
+    return None
+
+
+def _mapped_samples(wav_path: Path) -> np.ndarray | None:
+    """Memory-map the samples of a 16 kHz mono 16-bit PCM WAV file.
+
+    Args:
+        wav_path: Path to the WAV file.
+
+    Returns:
+        np.ndarray | None: Read-only int16 samples, or None if the file is
+        not in that format.
+    """
+    try:
+        span = _pcm16_data_span(wav_path)
+    except (OSError, struct.error):
+        return None
+    if span is None:
+        return None
+    offset, size = span
+    if size < 2:
+        return np.zeros(0, dtype=np.int16)
+    return np.memmap(wav_path, dtype="<i2", mode="r", offset=offset, shape=(size // 2,))
+
+
+def _map_source_audio(audio_path: Path) -> tuple[np.ndarray | None, str | None]:
+    """Memory-map the 16 kHz PCM of ``audio_path``.
+
+    Non-WAV inputs are converted by `ensure_wav`, the conversion the pipeline
+    runs before transcribing.
+
+    Args:
+        audio_path: Path to the original audio.
+
+    Returns:
+        tuple[np.ndarray | None, str | None]: The int16 samples (None when
+        the audio is not available as 16 kHz mono 16-bit PCM) and the
+        converted WAV to remove once stabilization is done, if any.
+    """
+    try:
+        wav_path = ensure_wav(audio_path)
+    except (OSError, RuntimeError) as exc:
+        logger.warning("stable-ts: could not convert %s: %s", audio_path, exc)
+        return None, None
+    converted = wav_path if wav_path != str(audio_path) else None
+    samples = _mapped_samples(Path(wav_path))
+    if samples is None and converted is not None:
+        cleanup_temp_files([converted])
+        converted = None
+    return samples, converted
+
+
+def _as_float_pcm(samples: np.ndarray) -> np.ndarray:
+    """Return float32 PCM in ``[-1, 1]`` for int16 or float samples.
+
+    Returns:
+        np.ndarray: Float32 samples; float input is returned unchanged.
+    """
+    if samples.dtype == np.int16:
+        return np.divide(samples, 32768.0, dtype=np.float32)
+    return samples
+
+
+def _denoised_pcm(sw_audio: Any, pcm: np.ndarray, key: str) -> np.ndarray:  # noqa: ANN401
+    """Return Demucs-denoised 16 kHz PCM, reusing the on-disk cache.
+
+    Args:
+        sw_audio: The ``stable_whisper.audio`` module.
+        pcm: Decoded 16 kHz mono PCM of the original audio.
+        key: Content hash of the original audio.
+
+    Returns:
+        np.ndarray: Denoised PCM, memory-mapped from the cache file.
+    """
+    cache_dir = Path(constants.STABILIZATION_CACHE_DIR).expanduser()
+    cache_file = cache_dir / f"{key}.demucs.npy"
+    if cache_file.exists():
+        logger.info("stable-ts: reusing cached Demucs output %s", cache_file)
+        return np.load(cache_file, mmap_mode="c")
+
+    import torch  # noqa: PLC0415 - only needed when Demucs actually runs
+
+    model = sw_audio.get_denoiser_func("demucs", "load")(True)
+    denoised = sw_audio.get_denoiser_func("demucs", "run")(
+        audio=torch.from_numpy(np.ascontiguousarray(pcm)),
+        input_sr=SAMPLE_RATE,
+        output_sr=SAMPLE_RATE,
+        model=model,
+        verbose=None,
+    )
+    samples = np.asarray(denoised.detach().cpu().numpy(), dtype=np.float32)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".npy.tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            np.save(handle, samples)
+        os.replace(tmp_name, cache_file)
+    except OSError as exc:
+        logger.warning("Could not cache Demucs output for %s: %s", key, exc)
+        Path(tmp_name).unlink(missing_ok=True)
+        return samples
+    return np.load(cache_file, mmap_mode="c")
+
+
+def _prepare_audio(
+    audio_path: Path | None,
+    pcm: np.ndarray | None,
+    demucs: bool,
+) -> tuple[str | np.ndarray, bool]:
+    """Resolve the audio handed to stable-ts.
+
+    Falls back to the file path (letting stable-ts decode and denoise) when
+    the installed stable-ts does not expose its audio helpers or when
+    decoding here fails.
+
+    Args:
+        audio_path: Path to the original audio, if known.
+        pcm: 16 kHz mono PCM (float or int16) supplied by the caller or
+            mapped from the source WAV, if any.
+        demucs: Whether Demucs denoising is requested.
+
+    Returns:
+        tuple[str | np.ndarray, bool]: The audio source (PCM at
+        `SAMPLE_RATE` or a path string) and whether stable-ts still has to
+        run Demucs itself.
+    """
+    if pcm is not None:
+        pcm = _as_float_pcm(pcm)
+    sw_audio = getattr(stable_whisper, "audio", None)
+    has_helpers = sw_audio is not None and hasattr(sw_audio, "load_audio")
+    if not has_helpers:
+        return (pcm if pcm is not None else str(audio_path)), demucs
+    try:
+        if pcm is None:
+            pcm = np.asarray(
+                sw_audio.load_audio(str(audio_path), sr=SAMPLE_RATE, verbose=None),
+                dtype=np.float32,
+            )
+        if not demucs:
+            return pcm, False
+        # Only the Demucs cache needs a content key
+        if audio_path is not None:
+            key = audio_hash(audio_path)
+        else:
+            key = hashlib.sha256(np.ascontiguousarray(pcm).tobytes()).hexdigest()
+        return _denoised_pcm(sw_audio, pcm, key), False
+    except Exception as exc:  # noqa: BLE001 - stable-ts can still do the work
+        logger.warning("stable-ts: preparing audio failed (%s); deferring", exc)
+        return (pcm if pcm is not None else str(audio_path)), demucs
+
 
 def _to_dict(obj: object) -> dict[str, Any]:
     """Convert the result object returned by *stable-whisper* to a dictionary.
@@ -83,6 +329,178 @@ def _convert_to_stable(result: dict[str, Any]) -> dict[str, Any]:
     return converted
 
 
+def _chunk_windows(
+    offsets: list[float], min_seconds: float
+) -> list[tuple[float, float | None]]:
+    """Group pipeline chunk offsets into stabilization windows.
+
+    Consecutive chunks are joined until a window spans at least
+    ``min_seconds``; windows always start and end on a chunk boundary.
+
+    Args:
+        offsets: Start time of every pipeline chunk, in seconds.
+        min_seconds: Minimum window length.
+
+    Returns:
+        list[tuple[float, float | None]]: ``(start, end)`` windows; the last
+        one is open-ended.
+    """
+    ordered = sorted(float(o) for o in offsets)
+    if not ordered:
+        return []
+    windows: list[tuple[float, float | None]] = []
+    start = ordered[0]
+    for offset in ordered[1:]:
+        if offset - start >= min_seconds:
+            windows.append((start, offset))
+            start = offset
+    windows.append((start, None))
+    return windows
+
+
+def _load_window(audio_path: Path, start: float, end: float | None) -> np.ndarray:
+    """Decode one window of ``audio_path`` to 16 kHz mono PCM.
+
+    Args:
+        audio_path: Path to the audio file.
+        start: Window start in seconds.
+        end: Window end in seconds, or None for the end of the file.
+
+    Returns:
+        np.ndarray: Float32 PCM samples of the window.
+
+    Raises:
+        RuntimeError: If FFmpeg is unavailable or decoding fails.
+    """
+    if ffmpeg is None:
+        raise RuntimeError("FFmpeg (ffmpeg-python) is required for chunked decoding")
+    input_kwargs: dict[str, Any] = {"ss": start}
+    if end is not None:
+        input_kwargs["t"] = end - start
+    try:
+        out, _ = (
+            ffmpeg
+            .input(str(audio_path), **input_kwargs)
+            .output("pipe:", format="f32le", ac=1, ar=SAMPLE_RATE)
+            .run(capture_stdout=True, capture_stderr=True, quiet=True)
+        )
+    except ffmpeg.Error as exc:  # type: ignore[attr-defined]
+        raise RuntimeError(f"Failed to decode {audio_path} at {start}s: {exc}") from exc
+    return np.frombuffer(out, dtype=np.float32)
+
+
+def _shift_segments(segments: list[dict[str, Any]], offset: float) -> list[dict]:
+    """Return copies of ``segments`` with all timestamps moved by ``offset``.
+
+    Args:
+        segments: Segments with ``start``/``end`` and optional ``words``.
+        offset: Seconds to add.
+
+    Returns:
+        list[dict]: Shifted segment copies.
+    """
+
+    def _add(value: object) -> object:
+        return value + offset if isinstance(value, (int, float)) else value
+
+    shifted: list[dict] = []
+    for segment in segments:
+        moved = {**segment, "start": _add(segment.get("start"))}
+        moved["end"] = _add(segment.get("end"))
+        if isinstance(segment.get("words"), list):
+            moved["words"] = [
+                {**w, "start": _add(w.get("start")), "end": _add(w.get("end"))}
+                if isinstance(w, dict)
+                else w
+                for w in segment["words"]
+            ]
+        shifted.append(moved)
+    return shifted
+
+
+def _stabilize_chunked(
+    result: dict[str, Any],
+    windows: list[tuple[float, float | None]],
+    audio_path: Path | None,
+    audio: np.ndarray | None,
+    options: dict[str, Any],
+    progress_cb: Callable[[str], None] | None,
+) -> dict[str, Any]:
+    """Stabilize ``result`` window by window on a worker pool.
+
+    Args:
+        result: Merged transcription result.
+        windows: Windows produced by `_chunk_windows`.
+        audio_path: Path to the original audio, used when ``audio`` is None.
+        audio: PCM of the whole file (float or memory-mapped int16), if any.
+        options: ``demucs``, ``vad`` and ``vad_threshold`` for each window.
+        progress_cb: Optional callback receiving status updates.
+
+    Returns:
+        dict[str, Any]: The result with stabilized, re-offset segments.
+        Windows that fail to stabilize keep their original segments.
+    """
+    segments = _convert_to_stable(result).get("segments", [])
+    buckets: list[list[dict[str, Any]]] = [[] for _ in windows]
+    for segment in segments:
+        index = 0
+        for i, (start, _) in enumerate(windows):
+            if segment["start"] >= start:
+                index = i
+        buckets[index].append(segment)
+
+    total = len(windows)
+    done = 0
+    done_lock = threading.Lock()
+
+    def _run(index: int) -> list[dict[str, Any]]:
+        nonlocal done
+        start, end = windows[index]
+        window_segments = buckets[index]
+        if window_segments:
+            if end is not None:
+                # Cover segments that run slightly past the chunk boundary
+                end = max(end, max(seg["end"] for seg in window_segments))
+            if audio is not None:
+                first = int(start * SAMPLE_RATE)
+                last = None if end is None else int(end * SAMPLE_RATE)
+                pcm = audio[first:last]
+            else:
+                pcm = _load_window(audio_path, start, end)  # type: ignore[arg-type]
+            local = {
+                "text": "".join(seg.get("text", "") for seg in window_segments),
+                "segments": _shift_segments(window_segments, -start),
+            }
+            refined = stabilize_timestamps(local, audio=pcm, **options)
+            output = _shift_segments(refined.get("segments") or [], start)
+        else:
+            output = []
+        with done_lock:
+            done += 1
+            if progress_cb:
+                progress_cb(f"stable-ts: chunk {done}/{total} stabilized")
+        return output
+
+    workers = max(1, min(constants.STABILIZE_WORKERS, total))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stable-ts") as ex:
+        parts = list(ex.map(_run, range(total)))
+
+    merged_segments = [seg for part in parts for seg in part]
+    merged = {
+        **result,
+        "segments": merged_segments,
+        "text": "".join(seg.get("text", "") for seg in merged_segments).strip(),
+        "stabilized": True,
+        "segments_count": len(merged_segments),
+        "stabilization_path": "chunked",
+    }
+    merged.pop("chunks", None)
+    logger.info(
+        "stable-ts: stabilized %d segments in %d chunks", len(merged_segments), total
+    )
+    return merged
+
+
 def stabilize_timestamps(
     result: dict[str, Any],
     *,
@@ -90,6 +508,8 @@ def stabilize_timestamps(
     vad: bool = False,
     vad_threshold: float = 0.35,
     progress_cb: Callable[[str], None] | None = None,
+    audio: np.ndarray | None = None,
+    chunked: bool | None = None,
 ) -> dict[str, Any]:
     """Return a copy of *result* with word-level timestamps via stable-ts.
 
@@ -99,6 +519,12 @@ def stabilize_timestamps(
         vad: Whether to run Voice Activity Detection.
         vad_threshold: VAD threshold when ``vad`` is True.
         progress_cb: Optional callback receiving human-readable status updates.
+        audio: Optional decoded mono PCM at `SAMPLE_RATE` that the caller
+            already holds. When omitted, the samples of the file named in
+            ``result`` are memory-mapped (see `_map_source_audio`).
+        chunked: Stabilize per pipeline chunk window (see ``chunk_offsets``
+            in ``result``) instead of in one call. Defaults to
+            ``STABILIZE_CHUNKED``.
 
     Returns:
         A refined result dictionary. If stabilization fails, the original
@@ -119,7 +545,10 @@ def stabilize_timestamps(
         return result
 
     audio_path_str = result.get("original_file") or result.get("audio_file_path")
-    if not audio_path_str:
+    audio_path: Path | None = None
+    if audio_path_str:
+        audio_path = Path(audio_path_str).expanduser().resolve()
+    elif audio is None:
         logger.error(
             "Audio path missing from transcription result; cannot stabilize timestamps"
         )
@@ -128,13 +557,89 @@ def stabilize_timestamps(
         return result
 
     # Respect filesystem in production; allow skipping in tests.
-    audio_path = Path(audio_path_str).expanduser().resolve()
-    if not audio_path.exists() and not constants.SKIP_FS_CHECKS:
+    if (
+        audio is None
+        and audio_path is not None
+        and not audio_path.exists()
+        and not constants.SKIP_FS_CHECKS
+    ):
         logger.error("Audio file not found for stabilization: %s", audio_path)
         if progress_cb:
             progress_cb("stable-ts: audio file not found; skipping")
         return result
 
+    converted: str | None = None
+    if audio is None and audio_path is not None and audio_path.exists():
+        audio, converted = _map_source_audio(audio_path)
+    try:
+        return _stabilize(
+            result,
+            audio_path=audio_path,
+            audio=audio,
+            demucs=demucs,
+            vad=vad,
+            vad_threshold=vad_threshold,
+            progress_cb=progress_cb,
+            chunked=chunked,
+        )
+    finally:
+        if converted is not None:
+            cleanup_temp_files([converted])
+
+
+def _stabilize(
+    result: dict[str, Any],
+    *,
+    audio_path: Path | None,
+    audio: np.ndarray | None,
+    demucs: bool,
+    vad: bool,
+    vad_threshold: float,
+    progress_cb: Callable[[str], None] | None,
+    chunked: bool | None,
+) -> dict[str, Any]:
+    """Refine ``result`` once its audio source is resolved.
+
+    Args:
+        result: Base transcription result to refine.
+        audio_path: Path to the original audio, if known.
+        audio: 16 kHz mono PCM (float or int16), if available.
+        demucs: Whether to run Demucs denoising.
+        vad: Whether to run Voice Activity Detection.
+        vad_threshold: VAD threshold when ``vad`` is True.
+        progress_cb: Optional callback receiving status updates.
+        chunked: See `stabilize_timestamps`.
+
+    Returns:
+        dict[str, Any]: The refined result, or ``result`` on failure.
+    """
+    if constants.STABILIZE_CHUNKED if chunked is None else chunked:
+        windows = _chunk_windows(
+            result.get("chunk_offsets") or [], constants.STABILIZE_CHUNK_MIN_SECONDS
+        )
+        if len(windows) > 1:
+            if progress_cb:
+                progress_cb(f"stable-ts: stabilizing {len(windows)} chunks")
+            try:
+                return _stabilize_chunked(
+                    result,
+                    windows,
+                    audio_path,
+                    audio,
+                    {"demucs": demucs, "vad": vad, "vad_threshold": vad_threshold},
+                    progress_cb,
+                )
+            except Exception as exc:  # noqa: BLE001 - fall back to a single pass
+                logger.warning("Chunked stabilization failed: %s", exc, exc_info=True)
+                if progress_cb:
+                    progress_cb("stable-ts: chunked mode failed; running single pass")
+
+    audio_source, run_demucs = _prepare_audio(audio_path, audio, demucs)
+    # PCM needs its sample rate; paths are probed by stable-ts itself
+    audio_kwargs: dict[str, Any] = (
+        {"input_sr": SAMPLE_RATE} if isinstance(audio_source, np.ndarray) else {}
+    )
+
     # Prepare a stable-whisper–compatible dict
     converted = _convert_to_stable(result)
 
@@ -158,14 +663,15 @@ def stabilize_timestamps(
             try:
                 refined = func(  # type: ignore[misc]
                     converted,
-                    audio=str(audio_path),
-                    demucs=demucs,
+                    audio=audio_source,
+                    demucs=run_demucs,
                     vad=vad,
                     vad_threshold=vad_threshold,
+                    **audio_kwargs,
                 )
             except TypeError:
                 # Some versions may not accept the same kwargs; retry with minimal args.
-                refined = func(converted, audio=str(audio_path))  # type: ignore[misc]
+                refined = func(converted, audio=audio_source, **audio_kwargs)  # type: ignore[misc]
             refined_dict = _to_dict(refined)
             merged = {**result, **refined_dict, "stabilized": True}
             if "segments" in merged:
@@ -219,11 +725,12 @@ def stabilize_timestamps(
             )
         refined = stable_whisper.transcribe_any(
             inference_func,
-            audio=str(audio_path),
-            denoiser="demucs" if demucs else None,
+            audio=audio_source,
+            denoiser="demucs" if run_demucs else None,
             vad=vad,
             vad_threshold=vad_threshold,
             check_sorted=False,
+            **audio_kwargs,
         )
         refined_dict = _to_dict(refined)
         output_segs = refined_dict.get("segments", [])
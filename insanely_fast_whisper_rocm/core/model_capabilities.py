@@ -0,0 +1,273 @@
+"""Per-checkpoint capability profiles for the Hugging Face backend.
+
+Whether a checkpoint can emit timestamps, is multilingual, or accepts
+``task``/``language`` generate arguments never changes once it is loaded.
+`probe_capabilities` works this out once per loaded model, and the backend
+then reuses the resulting `ModelCapabilities` for every chunk it decodes.
+
+Profiles are also kept in a process-wide registry and, for checkpoints with a
+known hub revision, persisted as JSON under ``MODEL_PROFILE_CACHE_DIR``. A
+later load of the same revision reuses the stored profile, including any
+generation config backfilled from the base Whisper checkpoint, so it is not
+fetched again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import transformers
+
+from insanely_fast_whisper_rocm.utils import constants
+
+logger = logging.getLogger(__name__)
+
+# Bump when the probing rules change so stale profiles are re-probed.
+PROFILE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ModelCapabilities:
+    """What a loaded checkpoint supports."""
+
+    model_name: str
+    revision: str | None
+    # Chunk/word timestamps can be requested
+    supports_timestamps: bool
+    # The model config carries language/task token maps
+    multilingual: bool
+    # The generation config accepts ``task``/``language`` generate kwargs
+    task_mappings: bool
+    # Generation config backfilled from a base checkpoint, if any
+    generation_config_source: str | None = None
+    generation_config: dict[str, Any] | None = field(default=None, compare=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the profile for persistence.
+
+        Returns:
+            dict[str, Any]: JSON-compatible profile data.
+        """
+        return {
+            **asdict(self),
+            "profile_version": PROFILE_VERSION,
+            "transformers_version": transformers.__version__,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ModelCapabilities | None:
+        """Rebuild a persisted profile.
+
+        Args:
+            data: Output of `to_dict`.
+
+        Returns:
+            ModelCapabilities | None: The profile, or None if it was written by
+            other probing rules or another Transformers version.
+        """
+        if (
+            data.get("profile_version") != PROFILE_VERSION
+            or data.get("transformers_version") != transformers.__version__
+        ):
+            return None
+        try:
+            return cls(
+                model_name=data["model_name"],
+                revision=data["revision"],
+                supports_timestamps=bool(data["supports_timestamps"]),
+                multilingual=bool(data["multilingual"]),
+                task_mappings=bool(data["task_mappings"]),
+                generation_config_source=data.get("generation_config_source"),
+                generation_config=data.get("generation_config"),
+            )
+        except KeyError:
+            return None
+
+
+def model_revision(model: object) -> str | None:
+    """Return the hub commit a model was loaded from.
+
+    Args:
+        model: A loaded Transformers model.
+
+    Returns:
+        str | None: The commit hash, or None for local or unknown checkpoints.
+    """
+    revision = getattr(getattr(model, "config", None), "_commit_hash", None)
+    return revision if isinstance(revision, str) and revision else None
+
+
+def _distil_supports_timestamps(model_name: str) -> bool:
+    """Tell whether a distil-whisper checkpoint emits timestamps.
+
+    distil-whisper versions >= v2 have timestamp support; earlier ones do not.
+    This is determined heuristically from the model name, e.g.
+    ``distil-whisper/distil-large-v2`` or ``distil-whisper/distil-medium.en-v2``.
+
+    Args:
+        model_name: Hugging Face model identifier.
+
+    Returns:
+        bool: True if the checkpoint supports timestamps.
+    """
+    try:
+        # Extract the suffix after the last "-v"; handle decimal versions like
+        # "v3.5" by using just the major version
+        last_part = model_name.split("-v")[-1]
+        version_str = last_part.split("/")[0].split(".")[0]
+        return int(version_str) >= 2
+    except (ValueError, IndexError) as e:
+        logger.debug(
+            "Version parsing failed for %s: %s, using fallback check", model_name, e
+        )
+        return any(token in model_name for token in ("-v2", "-v3", "-v4"))
+
+
+def probe_capabilities(
+    model_name: str,
+    model: object,
+    *,
+    generation_config_source: str | None = None,
+) -> ModelCapabilities:
+    """Inspect a loaded model once and summarize what it supports.
+
+    Args:
+        model_name: Hugging Face model identifier.
+        model: The loaded model, with any generation config backfill applied.
+        generation_config_source: Checkpoint the generation config was
+            backfilled from, if any.
+
+    Returns:
+        ModelCapabilities: The probed profile.
+    """
+    supports_timestamps = True
+    if "distil-whisper" in model_name and not _distil_supports_timestamps(model_name):
+        logger.warning(
+            "Timestamp generation not supported for model %s; disabling.",
+            model_name,
+        )
+        supports_timestamps = False
+
+    gen_cfg = getattr(model, "generation_config", None)
+    if supports_timestamps and getattr(gen_cfg, "no_timestamps_token_id", None) is None:
+        logger.warning(
+            "Timestamp generation not properly configured for model %s; disabling.",
+            model_name,
+        )
+        supports_timestamps = False
+
+    # Newer Transformers versions expose language/task maps via `task_to_id`,
+    # older checkpoints used `lang_to_id`. We treat presence of either as a
+    # sign the model supports multilingual/translation tasks.
+    model_config = getattr(model, "config", None)
+    lang_to_id = getattr(model_config, "lang_to_id", None)
+    multilingual = getattr(model_config, "task_to_id", None) is not None or (
+        isinstance(lang_to_id, dict) and len(lang_to_id) > 1
+    )
+
+    # Older checkpoints may ship with generation configs that predate the
+    # introduction of task/language mappings; passing "task" or "language"
+    # to such models raises a ValueError.
+    task_mappings = gen_cfg is not None and any(
+        getattr(gen_cfg, attr, None) is not None
+        for attr in ("task_to_id", "lang_to_id")
+    )
+
+    backfilled: dict[str, Any] | None = None
+    if generation_config_source is not None and callable(
+        getattr(gen_cfg, "to_dict", None)
+    ):
+        backfilled = gen_cfg.to_dict()
+
+    return ModelCapabilities(
+        model_name=model_name,
+        revision=model_revision(model),
+        supports_timestamps=supports_timestamps,
+        multilingual=multilingual,
+        task_mappings=task_mappings,
+        generation_config_source=generation_config_source,
+        generation_config=backfilled,
+    )
+
+
+_PROFILES: dict[tuple[str, str], ModelCapabilities] = {}
+_PROFILES_LOCK = threading.Lock()
+
+
+def _profile_path(model_name: str, revision: str) -> Path:
+    """Return the file a profile is persisted in.
+
+    Returns:
+        Path: Location under ``MODEL_PROFILE_CACHE_DIR``.
+    """
+    safe_name = model_name.strip("/").replace("/", "--")
+    return (
+        Path(constants.MODEL_PROFILE_CACHE_DIR).expanduser()
+        / f"{safe_name}@{revision}.json"
+    )
+
+
+def load_profile(model_name: str, revision: str | None) -> ModelCapabilities | None:
+    """Return a previously stored profile for a checkpoint revision.
+
+    Args:
+        model_name: Hugging Face model identifier.
+        revision: Hub commit of the checkpoint.
+
+    Returns:
+        ModelCapabilities | None: The profile, or None if none is stored.
+    """
+    if revision is None:
+        return None
+    key = (model_name, revision)
+    with _PROFILES_LOCK:
+        profile = _PROFILES.get(key)
+    if profile is not None:
+        return profile
+    path = _profile_path(model_name, revision)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable model profile %s: %s", path, e)
+        return None
+    profile = ModelCapabilities.from_dict(data) if isinstance(data, dict) else None
+    if profile is None or (profile.model_name, profile.revision) != key:
+        logger.info("Ignoring outdated model profile %s", path)
+        return None
+    logger.info("Loaded model profile for %s@%s", model_name, revision[:12])
+    with _PROFILES_LOCK:
+        _PROFILES[key] = profile
+    return profile
+
+
+def store_profile(profile: ModelCapabilities) -> None:
+    """Remember a profile and persist it when its revision is known.
+
+    Args:
+        profile: The profile to store.
+    """
+    if profile.revision is None:
+        return
+    with _PROFILES_LOCK:
+        _PROFILES[(profile.model_name, profile.revision)] = profile
+    path = _profile_path(profile.model_name, profile.revision)
+    tmp_name: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(profile.to_dict(), handle, indent=2, default=str)
+        os.replace(tmp_name, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("Could not persist model profile to %s: %s", path, e)
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.unlink(tmp_name)
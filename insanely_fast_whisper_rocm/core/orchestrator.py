@@ -7,7 +7,9 @@ when GPU memory is exhausted.
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import threading
 from collections.abc import Callable
 from typing import Any
 
@@ -16,13 +18,18 @@ from insanely_fast_whisper_rocm.core.backend_cache import (
     borrow_pipeline,
     invalidate_gpu_cache,
 )
+from insanely_fast_whisper_rocm.core.cancellation import CancellationToken
+from insanely_fast_whisper_rocm.core.device_pool import is_cpu_only
 from insanely_fast_whisper_rocm.core.errors import (
     InferenceOOMError,
     ModelLoadingOOMError,
     TranscriptionError,
 )
 from insanely_fast_whisper_rocm.core.progress import ProgressCallback
-from insanely_fast_whisper_rocm.utils.constants import MIN_BATCH_SIZE
+from insanely_fast_whisper_rocm.utils.constants import (
+    CPU_FALLBACK_DTYPE,
+    MIN_BATCH_SIZE,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +59,7 @@ def _backend_config_to_dict(config: HuggingFaceBackendConfig) -> dict[str, Any]:
         "batch_size": config.batch_size,
         "chunk_length": config.chunk_length,
         "progress_group_size": config.progress_group_size,
+        "assistant_model": config.assistant_model,
     }
 
 
@@ -86,6 +94,7 @@ class TranscriptionOrchestrator:
             batch_size=new_batch_size,
             chunk_length=config.chunk_length,
             progress_group_size=config.progress_group_size,
+            assistant_model=config.assistant_model,
         )
 
     def _get_cpu_fallback_config(
@@ -103,10 +112,11 @@ class TranscriptionOrchestrator:
         return HuggingFaceBackendConfig(
             model_name=config.model_name,
             device="cpu",
-            dtype="float32",  # CPU usually prefers float32
+            dtype=CPU_FALLBACK_DTYPE,  # float32 unless int8 is configured
             batch_size=min(config.batch_size, 2),
             chunk_length=min(config.chunk_length, 15),
             progress_group_size=config.progress_group_size,
+            assistant_model=config.assistant_model,
         )
 
     def run_transcription(
@@ -120,6 +130,8 @@ class TranscriptionOrchestrator:
         warning_callback: Callable[[str], None] | None = None,
         save_transcriptions: bool = True,
         output_dir: str = "transcripts",
+        cancellation_token: CancellationToken | None = None,
+        inference_lock: threading.Lock | None = None,
     ) -> dict[str, Any]:
         """Run transcription with automatic retry and OOM recovery.
 
@@ -134,6 +146,10 @@ class TranscriptionOrchestrator:
                 (e.g., UI notifications).
             save_transcriptions: Whether to persist results to disk.
             output_dir: Directory for persisted results.
+            cancellation_token: Optional token checked between pipeline stages.
+            inference_lock: Optional lock shared with other callers of the
+                cached pipelines. It is held only while chunks are decoded
+                and while an OOM fallback closes cached GPU backends.
 
         Returns:
             The transcription result dictionary.
@@ -184,6 +200,8 @@ class TranscriptionOrchestrator:
                         task=task,
                         timestamp_type=timestamp_type,
                         progress_callback=progress_callback,
+                        cancellation_token=cancellation_token,
+                        inference_lock=inference_lock,
                     )
 
                 # Attach attempt history for callers (WebUI/API) to display.
@@ -199,7 +217,7 @@ class TranscriptionOrchestrator:
                     attempt_history[-1]["status"] = "failed"
                     attempt_history[-1]["error_type"] = type(e).__name__
                     attempt_history[-1]["error"] = str(e)
-                if current_config.device == "cpu":
+                if is_cpu_only(current_config.device):
                     logger.error("OOM on CPU during model loading. Cannot recover.")
                     raise
 
@@ -217,7 +235,8 @@ class TranscriptionOrchestrator:
                     warning_callback(msg)
 
                 # Invalidate GPU cache to free memory before switching to CPU
-                invalidate_gpu_cache()
+                with inference_lock or contextlib.nullcontext():
+                    invalidate_gpu_cache()
 
                 current_config = cpu_config
                 attempt_index += 1
@@ -229,7 +248,7 @@ class TranscriptionOrchestrator:
                     attempt_history[-1]["status"] = "failed"
                     attempt_history[-1]["error_type"] = type(e).__name__
                     attempt_history[-1]["error"] = str(e)
-                if current_config.device == "cpu":
+                if is_cpu_only(current_config.device):
                     logger.error("OOM on CPU during inference. Cannot recover.")
                     raise
 
@@ -263,7 +282,8 @@ class TranscriptionOrchestrator:
                         warning_callback(msg)
 
                     # Invalidate GPU cache to free memory before switching to CPU
-                    invalidate_gpu_cache()
+                    with inference_lock or contextlib.nullcontext():
+                        invalidate_gpu_cache()
 
                     current_config = cpu_config
 
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import contextlib
 import gc
 import logging
+import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,9 +23,11 @@ from insanely_fast_whisper_rocm.audio import conversion as audio_conversion
 from insanely_fast_whisper_rocm.audio import processing as audio_processing
 from insanely_fast_whisper_rocm.audio import results as audio_results
 from insanely_fast_whisper_rocm.core.asr_backend import ASRBackend
+from insanely_fast_whisper_rocm.core.assisted_generation import combine_assistance
 from insanely_fast_whisper_rocm.core.cancellation import CancellationToken
 from insanely_fast_whisper_rocm.core.errors import TranscriptionError
 from insanely_fast_whisper_rocm.core.progress import NoOpProgress, ProgressCallback
+from insanely_fast_whisper_rocm.core.result_writer import BackgroundResultWriter
 from insanely_fast_whisper_rocm.core.storage import BaseStorage, StorageFactory
 from insanely_fast_whisper_rocm.utils import constants, file_utils
 from insanely_fast_whisper_rocm.utils.filename_generator import (
@@ -33,6 +40,11 @@ logger = logging.getLogger(__name__)
 
 InputType = TypeVar("InputType")
 
+# Audio content hash -> detected language, most recently used last
+_LANGUAGE_CACHE: OrderedDict[str, str] = OrderedDict()
+_LANGUAGE_CACHE_LOCK = threading.Lock()
+_LANGUAGE_CACHE_ITEMS = 1024
+
 # ---------------------------------------------------------------------------
 # Lightweight configuration/result dataclasses for test compatibility
 # ---------------------------------------------------------------------------
@@ -69,6 +81,7 @@ class ProgressEvent:
     total_chunks: int | None = None
     message: str | None = None
     result: dict[str, Any] | None = None  # For chunk_complete or pipeline_complete
+    chunk_start_time: float | None = None  # Offset of the chunk in the audio (s)
 
 
 class BasePipeline(ABC):
@@ -80,6 +93,7 @@ class BasePipeline(ABC):
         storage_backend: BaseStorage | None = None,
         save_transcriptions: bool = True,
         output_dir: str = "transcripts",
+        result_writer: BackgroundResultWriter | None = None,
     ) -> None:
         """Initializes the BasePipeline.
 
@@ -88,6 +102,9 @@ class BasePipeline(ABC):
             storage_backend: The storage backend for saving results.
             save_transcriptions: Whether to save transcriptions to disk.
             output_dir: The directory to save transcriptions in.
+            result_writer: Optional background writer. When set, results are
+                written asynchronously and ``save_complete``/``save_error``
+                events are sent to listeners once the write finishes.
         """
         self.asr_backend = asr_backend
         self.storage_backend = (
@@ -95,6 +112,7 @@ class BasePipeline(ABC):
         )
         self.save_transcriptions = save_transcriptions
         self.output_dir = Path(output_dir)
+        self.result_writer = result_writer
         self._listeners: list[ProgressCallback] = []
         self.pipeline_id = str(uuid.uuid4())
         # Initialize filename generator with standard strategy
@@ -130,6 +148,7 @@ class BasePipeline(ABC):
         original_filename: str | None = None,
         progress_callback: ProgressCallback | None = None,
         cancellation_token: CancellationToken | None = None,
+        inference_lock: threading.Lock | None = None,
         # Other common parameters for all pipelines
     ) -> dict[str, Any]:
         """Template method defining the overall ASR algorithm skeleton.
@@ -170,6 +189,7 @@ class BasePipeline(ABC):
                 timestamp_type,
                 progress_cb,
                 token,
+                inference_lock=inference_lock,
             )
             if token is not None:
                 token.raise_if_cancelled()
@@ -265,6 +285,7 @@ class BasePipeline(ABC):
         timestamp_type: str | bool,
         progress_callback: ProgressCallback,
         cancellation_token: CancellationToken | None,
+        inference_lock: threading.Lock | None = None,
     ) -> dict[str, Any]:
         """Execute the core ASR task using the backend. Returns raw ASR output."""
 
@@ -339,6 +360,19 @@ class BasePipeline(ABC):
         # now that `JsonStorage` is flexible or will be adapted.
 
         try:
+            if self.result_writer is not None:
+                # A cached pipeline may start another run before the write
+                # finishes; report the write under the id of this run.
+                pipeline_id = self.pipeline_id
+                return self.result_writer.submit(
+                    self.storage_backend,
+                    result,
+                    save_path_base,
+                    task,
+                    on_done=lambda path, error: self._on_result_written(
+                        pipeline_id, audio_file_path, path, error
+                    ),
+                )
             # Pass the full path (directory + filename_with_extension) to the
             # storage backend. The `task` argument for storage.save might be
             # redundant if already in filename.
@@ -357,6 +391,81 @@ class BasePipeline(ABC):
             )
             return None
 
+    def _on_result_written(
+        self,
+        pipeline_id: str,
+        audio_file_path: Path,
+        output_path: str,
+        error: BaseException | None,
+    ) -> None:
+        """Report the outcome of a background write to listeners.
+
+        Args:
+            pipeline_id: Id of the run that produced the result.
+            audio_file_path: Audio file the result belongs to.
+            output_path: Location the result was written to.
+            error: The write failure, or None on success.
+        """
+        if error is None:
+            logger.info("Result saved to %s", output_path)
+        self._notify_listeners(
+            ProgressEvent(
+                event_type="save_complete" if error is None else "save_error",
+                pipeline_id=pipeline_id,
+                file_path=str(audio_file_path),
+                message=output_path if error is None else str(error),
+            )
+        )
+
+
+def _cached_language(audio_key: str | None) -> str | None:
+    """Return the language detected earlier for the same audio content.
+
+    Returns:
+        str | None: The cached language code, if any.
+    """
+    if audio_key is None:
+        return None
+    with _LANGUAGE_CACHE_LOCK:
+        language = _LANGUAGE_CACHE.get(audio_key)
+        if language is not None:
+            _LANGUAGE_CACHE.move_to_end(audio_key)
+        return language
+
+
+def _remember_language(audio_key: str | None, language: str) -> None:
+    """Cache the language detected for an audio content hash."""
+    if audio_key is None:
+        return
+    with _LANGUAGE_CACHE_LOCK:
+        _LANGUAGE_CACHE[audio_key] = language
+        _LANGUAGE_CACHE.move_to_end(audio_key)
+        while len(_LANGUAGE_CACHE) > _LANGUAGE_CACHE_ITEMS:
+            _LANGUAGE_CACHE.popitem(last=False)
+
+
+@contextlib.contextmanager
+def _holding(
+    lock: threading.Lock | None, token: CancellationToken | None
+) -> Iterator[None]:
+    """Hold ``lock``, if given, for the duration of the block.
+
+    Waiting for the lock still honours cancellation.
+
+    Yields:
+        None: Once the lock is held.
+    """
+    if lock is None:
+        yield
+        return
+    while not lock.acquire(timeout=0.5):
+        if token is not None:
+            token.raise_if_cancelled()
+    try:
+        yield
+    finally:
+        lock.release()
+
 
 class WhisperPipeline(BasePipeline):
     """Whisper-specific pipeline implementation."""
@@ -381,6 +490,58 @@ class WhisperPipeline(BasePipeline):
             raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
         return str(audio_file_path)
 
+    def _identify_language(
+        self,
+        audio_path: str,
+        chunk_data: list[tuple[str, float]],
+        inference_lock: threading.Lock | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> str | None:
+        """Detect the language of a multi-chunk file once.
+
+        Detection runs on up to ``LANGUAGE_DETECTION_SAMPLE_CHUNKS`` evenly
+        spaced chunks, so a silent or music-only intro does not decide the
+        language of the whole file. The result is cached per audio content
+        hash, so re-running the same file skips detection. Only the detection
+        decode holds ``inference_lock``; hashing and the cache lookup do not.
+
+        Args:
+            audio_path: The input file, used for the content hash.
+            chunk_data: Chunk paths and offsets from ``split_audio``.
+            inference_lock: Lock held while the backend detects the language.
+            cancellation_token: Checked while waiting for ``inference_lock``.
+
+        Returns:
+            str | None: The detected language code, or None when the stage is
+            disabled or the backend cannot detect languages.
+        """
+        samples = constants.LANGUAGE_DETECTION_SAMPLE_CHUNKS
+        if samples <= 0 or len(chunk_data) < 2:
+            return None
+        try:
+            from insanely_fast_whisper_rocm.core.integrations.stable_ts import (
+                audio_hash,
+            )
+
+            audio_key: str | None = audio_hash(audio_path)
+        except OSError as exc:
+            logger.debug("Not caching the language of %s: %s", audio_path, exc)
+            audio_key = None
+        language = _cached_language(audio_key)
+        if language is not None:
+            logger.info("Reusing detected language '%s' for %s", language, audio_path)
+            return language
+
+        count = min(samples, len(chunk_data))
+        step = len(chunk_data) / count
+        sample_paths = [chunk_data[int(i * step)][0] for i in range(count)]
+        with _holding(inference_lock, cancellation_token):
+            detected = self.asr_backend.detect_language(sample_paths)
+        if not isinstance(detected, str) or not detected:
+            return None
+        _remember_language(audio_key, detected)
+        return detected
+
     def _execute_asr(
         self,
         prepared_data: str,  # This is the audio_file_path from _prepare_input
@@ -389,9 +550,14 @@ class WhisperPipeline(BasePipeline):
         timestamp_type: str | bool,
         progress_callback: ProgressCallback,
         cancellation_token: CancellationToken | None,
+        inference_lock: threading.Lock | None = None,
     ) -> dict[str, Any]:
         """Execute ASR for a single audio file, handling chunking internally.
 
+        ``inference_lock``, if given, is held while chunks are decoded, after
+        the audio has been converted and split. Pool backends
+        (``parallelism`` > 1) are not locked.
+
         Returns:
             The raw ASR output dictionary.
 
@@ -459,6 +625,7 @@ class WhisperPipeline(BasePipeline):
             raise TranscriptionError("No audio chunks produced for transcription.")
 
         progress_callback.on_chunking_started(total_chunks)
+
         progress_callback.on_inference_started(total_chunks)
 
         # Suppress premature completion events from the backend while we
@@ -494,81 +661,143 @@ class WhisperPipeline(BasePipeline):
                 return
 
         progress_proxy = _ProgressProxy(progress_callback)
+        detected_language: str | None = None
 
-        try:
-            for idx, (chunk_path, chunk_start_time) in enumerate(chunk_data, start=1):
-                if token is not None:
-                    token.raise_if_cancelled()
-                self._notify_listeners(
-                    ProgressEvent(
-                        event_type="chunk_start",
-                        pipeline_id=self.pipeline_id,
-                        file_path=prepared_data,
-                        chunk_num=idx,
-                        total_chunks=total_chunks,
-                        message=(
-                            f"Processing chunk {idx}/{total_chunks} for {prepared_data}"
-                        ),
-                    )
-                )
+        def decode_chunk(idx: int, chunk_path: str) -> dict[str, Any]:
+            """Transcribe one chunk on the backend.
 
-                asr_raw_result = self.asr_backend.process_audio(
-                    audio_file_path=chunk_path,
-                    language=language,
-                    task=task,
-                    return_timestamps_value=return_timestamps_value,
-                    progress_cb=progress_proxy,
-                    cancellation_token=token,
+            Returns:
+                dict[str, Any]: The backend's raw result for the chunk.
+            """
+            if token is not None:
+                token.raise_if_cancelled()
+            self._notify_listeners(
+                ProgressEvent(
+                    event_type="chunk_start",
+                    pipeline_id=self.pipeline_id,
+                    file_path=prepared_data,
+                    chunk_num=idx,
+                    total_chunks=total_chunks,
+                    message=(
+                        f"Processing chunk {idx}/{total_chunks} for {prepared_data}"
+                    ),
                 )
-                if token is not None:
-                    token.raise_if_cancelled()
-                logger.debug(
-                    "Chunk %d/%d processed: text_len=%d, segments=%d",
-                    idx,
-                    total_chunks,
-                    len(asr_raw_result.get("text", "")),
-                    len(
-                        asr_raw_result.get("segments")
-                        or asr_raw_result.get("chunks")
-                        or []
+            )
+            asr_raw_result = self.asr_backend.process_audio(
+                audio_file_path=chunk_path,
+                language=language,
+                task=task,
+                return_timestamps_value=return_timestamps_value,
+                progress_cb=progress_proxy,
+                cancellation_token=token,
+            )
+            if token is not None:
+                token.raise_if_cancelled()
+            logger.debug(
+                "Chunk %d/%d processed: text_len=%d, segments=%d",
+                idx,
+                total_chunks,
+                len(asr_raw_result.get("text", "")),
+                len(
+                    asr_raw_result.get("segments") or asr_raw_result.get("chunks") or []
+                ),
+            )
+            return asr_raw_result
+
+        def finish_chunk(idx: int, asr_raw_result: dict[str, Any]) -> None:
+            """Report a decoded chunk and free the memory it used."""
+            self._notify_listeners(
+                ProgressEvent(
+                    event_type="chunk_complete",
+                    pipeline_id=self.pipeline_id,
+                    file_path=prepared_data,
+                    chunk_num=idx,
+                    total_chunks=total_chunks,
+                    result=asr_raw_result,
+                    chunk_start_time=chunk_data[idx - 1][1],
+                    message=(
+                        f"Completed chunk {idx}/{total_chunks} for {prepared_data}"
                     ),
                 )
+            )
 
-                self._notify_listeners(
-                    ProgressEvent(
-                        event_type="chunk_complete",
-                        pipeline_id=self.pipeline_id,
-                        file_path=prepared_data,
-                        chunk_num=idx,
-                        total_chunks=total_chunks,
-                        result=asr_raw_result,
-                        message=(
-                            f"Completed chunk {idx}/{total_chunks} for {prepared_data}"
-                        ),
-                    )
+            # CRITICAL FIX: Free GPU memory after each chunk to prevent accumulation
+            # that causes memory access faults on long audio files (>20 minutes).
+            # See: to-do/fix-backend-cache-resource-cleanup.md
+            try:
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+                if hasattr(torch, "mps") and torch.backends.mps.is_available():
+                    torch.mps.empty_cache()  # type: ignore[attr-defined]
+            except Exception:  # pragma: no cover - defensive cleanup
+                pass
+
+            # Force garbage collection to reclaim CPU memory from processed chunks
+            gc.collect()
+
+            completed_index = idx - 1
+            try:
+                progress_callback.on_chunk_done(completed_index)
+                progress_callback.on_inference_batch_done(completed_index)
+            except Exception:  # pragma: no cover - defensive
+                pass
+
+        parallelism = getattr(self.asr_backend, "parallelism", 1)
+        if not isinstance(parallelism, int):
+            parallelism = 1
+        if parallelism > 1:
+            # Pools serialize calls per replica or worker themselves, so
+            # concurrent requests spread across them instead of queueing here.
+            inference_lock = None
+
+        try:
+            # Whisper would otherwise detect the language again for every
+            # chunk, costing a decoder pass each time and sometimes switching
+            # languages mid-file. Translation needs the source language too.
+            if not language or language.lower() == "none":
+                detected_language = self._identify_language(
+                    prepared_data, chunk_data, inference_lock, token
                 )
-                chunk_results.append((asr_raw_result, chunk_start_time))
-
-                # CRITICAL FIX: Free GPU memory after each chunk to prevent accumulation
-                # that causes memory access faults on long audio files (>20 minutes).
-                # See: to-do/fix-backend-cache-resource-cleanup.md
-                try:
-                    if torch.cuda.is_available():
-                        torch.cuda.empty_cache()
-                    if hasattr(torch, "mps") and torch.backends.mps.is_available():
-                        torch.mps.empty_cache()  # type: ignore[attr-defined]
-                except Exception:  # pragma: no cover - defensive cleanup
-                    pass
-
-                # Force garbage collection to reclaim CPU memory from processed chunks
-                gc.collect()
-
-                completed_index = idx - 1
-                try:
-                    progress_callback.on_chunk_done(completed_index)
-                    progress_callback.on_inference_batch_done(completed_index)
-                except Exception:  # pragma: no cover - defensive
-                    pass
+                if detected_language is not None:
+                    language = detected_language
+
+            # Conversion and splitting above overlap with other requests;
+            # only decoding needs the model to itself.
+            with _holding(inference_lock, token):
+                workers = min(parallelism, total_chunks)
+                if workers > 1:
+                    # A device pool decodes several chunks at once; results are
+                    # put back in chunk order before merging.
+                    logger.debug(
+                        "Dispatching %d chunks to %d workers", total_chunks, workers
+                    )
+                    results_by_index: dict[int, dict[str, Any]] = {}
+                    executor = ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix="chunk-dispatch"
+                    )
+                    try:
+                        futures = {
+                            executor.submit(decode_chunk, idx, chunk_path): idx
+                            for idx, (chunk_path, _) in enumerate(chunk_data, start=1)
+                        }
+                        for future in as_completed(futures):
+                            idx = futures[future]
+                            results_by_index[idx] = future.result()
+                            finish_chunk(idx, results_by_index[idx])
+                    finally:
+                        # Chunk files are removed below; no worker may still read them
+                        executor.shutdown(wait=True, cancel_futures=True)
+                    chunk_results.extend(
+                        (results_by_index[idx], start)
+                        for idx, (_, start) in enumerate(chunk_data, start=1)
+                    )
+                else:
+                    for idx, (chunk_path, chunk_start_time) in enumerate(
+                        chunk_data, start=1
+                    ):
+                        asr_raw_result = decode_chunk(idx, chunk_path)
+                        finish_chunk(idx, asr_raw_result)
+                        chunk_results.append((asr_raw_result, chunk_start_time))
         finally:
             cleanup_paths: list[str] = []
             if total_chunks > 1:
@@ -588,6 +817,13 @@ class WhisperPipeline(BasePipeline):
 
         if total_chunks > 1:
             combined = audio_results.merge_chunk_results(chunk_results)
+            # Chunk boundaries let stabilization work window by window
+            combined["chunk_offsets"] = [start for _, start in chunk_results]
+            assistance = combine_assistance(
+                result.get("assisted_generation") for result, _ in chunk_results
+            )
+            if assistance is not None:
+                combined["assisted_generation"] = assistance
             if token is not None:
                 token.raise_if_cancelled()
             logger.debug(
@@ -603,6 +839,9 @@ class WhisperPipeline(BasePipeline):
         if token is not None:
             token.raise_if_cancelled()
 
+        if detected_language is not None:
+            combined["detected_language"] = detected_language
+
         # Do not signal completion here; the outer process() handles it once.
         return combined
 
@@ -0,0 +1,257 @@
+"""Background writer that persists pipeline results off the request path.
+
+`BasePipeline._save_result` hands finished results to a `BackgroundResultWriter`
+when one is configured. The writer serializes them on a small thread pool while
+the caller returns the final output path immediately, so large JSON writes no
+longer add to request latency or keep a borrowed pipeline (and its GPU) busy.
+
+The number of results waiting to be written is bounded: once
+``max_pending`` writes are outstanding, `submit` blocks until one finishes,
+applying backpressure instead of buffering unbounded results in memory.
+
+Durability is guaranteed by flushing on shutdown: the API lifespan and the CLI
+call `shutdown_result_writer`, and an ``atexit`` hook covers other entry points.
+"""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from pathlib import Path
+from typing import Any
+
+from insanely_fast_whisper_rocm.core.storage import BaseStorage
+from insanely_fast_whisper_rocm.utils import constants
+
+logger = logging.getLogger(__name__)
+
+# Called with (output_path, error) once a write finishes; error is None on success.
+WriteCallback = Callable[[str, BaseException | None], None]
+
+
+class BackgroundResultWriter:
+    """Bounded thread pool that writes results through a storage backend."""
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 8) -> None:
+        """Initialize the writer.
+
+        Args:
+            max_workers: Number of writer threads.
+            max_pending: Maximum number of queued or running writes before
+                `submit` blocks.
+        """
+        self._max_workers = max(1, max_workers)
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._lock = threading.Lock()
+        # Several writes may share a path, e.g. every SQLite save.
+        self._pending: dict[str, list[Future[str]]] = {}
+        # Failed writes not yet observed through `wait_for`.
+        self._failed: set[str] = set()
+
+    def submit(
+        self,
+        storage: BaseStorage,
+        data: dict[str, Any],
+        destination_path: Path,
+        task: str,
+        on_done: WriteCallback | None = None,
+    ) -> str:
+        """Queue a result for writing and return its final output path.
+
+        Args:
+            storage: Storage backend performing the write.
+            data: Result to persist. It is deep-copied, so callers may keep
+                modifying it.
+            destination_path: Path passed to ``storage.save``.
+            task: The task being performed (e.g., "transcribe").
+            on_done: Optional callback invoked from the writer thread.
+
+        Returns:
+            str: The path the result will be available at once written.
+        """
+        output_path = str(storage.output_path(destination_path))
+        snapshot = copy.deepcopy(data)
+        self._slots.acquire()
+        with self._lock:
+            # Worker threads are (re)started lazily so a writer stays usable
+            # after `shutdown`, e.g. by pipelines cached across CLI invocations.
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="result-writer"
+                )
+            future = self._executor.submit(
+                self._write, storage, snapshot, destination_path, task, output_path
+            )
+            self._pending.setdefault(output_path, []).append(future)
+        future.add_done_callback(lambda done: self._finish(output_path, done, on_done))
+        return output_path
+
+    @staticmethod
+    def _write(
+        storage: BaseStorage,
+        data: dict[str, Any],
+        destination_path: Path,
+        task: str,
+        output_path: str,
+    ) -> str:
+        """Perform a single write on a worker thread.
+
+        Returns:
+            str: The path reported by the storage backend.
+
+        Raises:
+            OSError: If the storage backend reports a failed save.
+        """
+        saved = storage.save(data, destination_path, task)
+        if not saved:
+            raise OSError(f"Storage backend failed to save {output_path}")
+        return saved
+
+    def _finish(
+        self, output_path: str, future: Future[str], on_done: WriteCallback | None
+    ) -> None:
+        """Release the queue slot and report the outcome of a write."""
+        error = future.exception()
+        with self._lock:
+            futures = self._pending.get(output_path, [])
+            if future in futures:
+                futures.remove(future)
+            if not futures:
+                self._pending.pop(output_path, None)
+            if error is not None:
+                self._failed.add(output_path)
+            else:
+                self._failed.discard(output_path)
+        self._slots.release()
+        if error is not None:
+            logger.error("Background write of %s failed: %s", output_path, error)
+        if on_done is not None:
+            try:
+                on_done(output_path, error)
+            except Exception:  # noqa: BLE001 - callbacks must not kill the pool
+                logger.exception("Result writer callback failed for %s", output_path)
+
+    @property
+    def pending_count(self) -> int:
+        """int: Number of writes that have not finished yet."""
+        with self._lock:
+            return sum(len(futures) for futures in self._pending.values())
+
+    def wait_for(self, output_path: str | Path, timeout: float | None = None) -> bool:
+        """Block until every write for ``output_path`` has finished.
+
+        Args:
+            output_path: Path returned by `submit`.
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            bool: False if a write is still running after ``timeout`` or one
+            failed, True otherwise (including when nothing was pending).
+            A failure is reported once.
+        """
+        key = str(output_path)
+        with self._lock:
+            futures = list(self._pending.get(key, ()))
+        if futures:
+            _, not_done = wait_futures(futures, timeout=timeout)
+            if not_done:
+                return False
+        with self._lock:
+            failed = key in self._failed
+            self._failed.discard(key)
+        return not failed and all(future.exception() is None for future in futures)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queued write has finished.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            bool: True if all writes finished within ``timeout``.
+        """
+        with self._lock:
+            futures = [f for pending in self._pending.values() for f in pending]
+        if not futures:
+            return True
+        logger.info("Flushing %d pending result write(s)", len(futures))
+        _, not_done = wait_futures(futures, timeout=timeout)
+        if not_done:
+            logger.warning(
+                "%d result write(s) still pending after %.1fs", len(not_done), timeout
+            )
+        return not not_done
+
+    def shutdown(self, timeout: float | None = None) -> bool:
+        """Flush pending writes and stop the worker threads.
+
+        A later `submit` starts new worker threads.
+
+        Args:
+            timeout: Maximum seconds to wait for pending writes.
+
+        Returns:
+            bool: True if all writes finished within ``timeout``.
+        """
+        flushed = self.flush(timeout)
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=flushed)
+        return flushed
+
+
+_WRITER: BackgroundResultWriter | None = None
+_WRITER_LOCK = threading.Lock()
+
+
+def get_result_writer() -> BackgroundResultWriter:
+    """Return the process-wide background writer, creating it on first use.
+
+    Returns:
+        BackgroundResultWriter: The shared writer sized by
+        ``RESULT_WRITER_WORKERS`` and ``RESULT_WRITER_MAX_PENDING``.
+    """
+    global _WRITER
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = BackgroundResultWriter(
+                max_workers=constants.RESULT_WRITER_WORKERS,
+                max_pending=constants.RESULT_WRITER_MAX_PENDING,
+            )
+        return _WRITER
+
+
+def wait_for_result(output_path: str | Path, timeout: float | None = None) -> bool:
+    """Wait for a pending background write, if any.
+
+    Args:
+        output_path: Path returned by the pipeline as ``output_file_path``.
+        timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+    Returns:
+        bool: False if the write is still running or failed, True otherwise
+        (including when no write for ``output_path`` is pending).
+    """
+    writer = _WRITER
+    return True if writer is None else writer.wait_for(output_path, timeout)
+
+
+def shutdown_result_writer(timeout: float | None = None) -> None:
+    """Flush the shared writer and stop its threads until next use.
+
+    Args:
+        timeout: Maximum seconds to wait for pending writes.
+    """
+    writer = _WRITER
+    if writer is not None:
+        writer.shutdown(timeout)
+
+
+atexit.register(shutdown_result_writer)
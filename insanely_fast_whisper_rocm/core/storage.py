@@ -1,15 +1,41 @@
 """Storage backend abstractions and implementations for ASR results."""
 
+import gzip
 import json
 
 # Placeholder for logger
 import logging
+import os
+import re
+import sqlite3
+import tempfile
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from insanely_fast_whisper_rocm.core.formatters import RenderPlan
+from insanely_fast_whisper_rocm.utils import constants
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# Marker written in place of a ``segments`` list that duplicated ``chunks``.
+SEGMENTS_ALIAS_KEY = "_segments_alias"
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Queries using any FTS5 operator are passed through unchanged.
+_FTS_SYNTAX = re.compile(r'["*():^]|\b(?:AND|OR|NOT|NEAR)\b')
+
 
 class BaseStorage(ABC):  # pylint: disable=too-few-public-methods
     """Abstract base class for storage backends."""
@@ -20,6 +46,17 @@ class BaseStorage(ABC):  # pylint: disable=too-few-public-methods
     ) -> str | None:
         """Saves the data to the specified destination."""
 
+    def output_path(self, destination_path: Path) -> Path:
+        """Return where `save` will store data for ``destination_path``.
+
+        Args:
+            destination_path: The path that would be passed to `save`.
+
+        Returns:
+            Path: The final location of the saved data.
+        """
+        return destination_path
+
 
 class JsonStorage(BaseStorage):  # pylint: disable=too-few-public-methods
     """Stores transcription results as JSON files."""
@@ -44,9 +81,7 @@ class JsonStorage(BaseStorage):  # pylint: disable=too-few-public-methods
         # The destination_path is now expected to be the full desired filename
         # (e.g., "audio_transcribe_20230101T120000Z.json") as generated by
         # FilenameGenerator.
-        # Using .with_suffix('.json') ensures it has the .json extension,
-        # which is benign if destination_path already has it.
-        output_filename = destination_path.with_suffix(".json")
+        output_filename = self.output_path(destination_path)
 
         try:
             with open(output_filename, "w", encoding="utf-8") as f:
@@ -62,16 +97,566 @@ class JsonStorage(BaseStorage):  # pylint: disable=too-few-public-methods
             )
             return None
 
+    def output_path(self, destination_path: Path) -> Path:
+        """Return ``destination_path`` with a ``.json`` extension.
+
+        Using ``.with_suffix('.json')`` is benign if ``destination_path``
+        already has it.
+
+        Args:
+            destination_path: The path that would be passed to `save`.
+
+        Returns:
+            Path: The JSON file `save` writes.
+        """
+        return destination_path.with_suffix(".json")
+
+    @staticmethod
+    def load(source_path: Path | str) -> dict[str, Any]:
+        """Load a result saved by any JSON storage variant.
+
+        Plain, compact, gzip- and zstd-compressed files are detected from
+        their leading bytes, and ``segments`` lists that were de-duplicated
+        against ``chunks`` are restored.
+
+        Args:
+            source_path: Path to the saved result.
+
+        Returns:
+            dict[str, Any]: The stored transcription result.
+
+        Raises:
+            RuntimeError: If the file is zstd-compressed but the optional
+                ``zstandard`` package is not installed.
+        """
+        raw = Path(source_path).read_bytes()
+        if raw.startswith(_GZIP_MAGIC):
+            raw = gzip.decompress(raw)
+        elif raw.startswith(_ZSTD_MAGIC):
+            if zstandard is None:
+                raise RuntimeError(
+                    f"{source_path} is zstd-compressed; install 'zstandard' to read it"
+                )
+            raw = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if isinstance(data, dict) and data.pop(SEGMENTS_ALIAS_KEY, None) == "chunks":
+            data["segments"] = data.get("chunks", [])
+        return data
+
+
+class FastJsonStorage(JsonStorage):  # pylint: disable=too-few-public-methods
+    """Stores transcription results as compact, optionally compressed JSON.
+
+    Compared to `JsonStorage` this backend:
+
+    - serializes with ``orjson`` when installed (standard ``json`` otherwise),
+    - writes compact JSON without indentation,
+    - stores a ``segments`` list identical to ``chunks`` only once,
+    - optionally compresses with gzip or zstd (``zstandard`` package), and
+    - writes to a temporary file that is atomically renamed into place.
+
+    Files written by this backend are read back with `JsonStorage.load`.
+    """
+
+    COMPRESSION_SUFFIXES = {"none": ".json", "gzip": ".json.gz", "zstd": ".json.zst"}
+
+    def __init__(self, compression: str = "none", dedupe: bool = True) -> None:
+        """Initialize the storage backend.
+
+        Args:
+            compression: One of ``"none"``, ``"gzip"`` or ``"zstd"``.
+            dedupe: Whether to drop ``segments`` when it duplicates ``chunks``.
+
+        Raises:
+            ValueError: If ``compression`` is not supported.
+            RuntimeError: If zstd compression is requested but the optional
+                ``zstandard`` package is not installed.
+        """
+        if compression not in self.COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported storage compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise RuntimeError(
+                "zstd compression requires the optional 'zstandard' package"
+            )
+        self.compression = compression
+        self.dedupe = dedupe
+
+    def save(
+        self, data: dict[str, Any], destination_path: Path, task: str
+    ) -> str | None:
+        """Saves the transcription data as compact JSON via an atomic rename.
+
+        Args:
+            data: The transcription data to save.
+            destination_path: The path to save the data to.
+            task: The task being performed (e.g., "transcribe" or "translate").
+
+        Returns:
+            str | None: The path to the saved file, or None if an error occurred.
+        """
+        destination_path.parent.mkdir(parents=True, exist_ok=True)
+        output_filename = self.output_path(destination_path)
+        tmp_name: str | None = None
+        try:
+            payload = self._compress(self._serialize(data))
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=f".{output_filename.name}.",
+                suffix=".tmp",
+                dir=output_filename.parent,
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, output_filename)
+            tmp_name = None
+            logger.info(
+                "Transcription result saved to %s (%d bytes)",
+                output_filename,
+                len(payload),
+            )
+            return str(output_filename)
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(
+                "Error saving transcription to %s: %s",
+                output_filename,
+                e,
+                exc_info=True,
+            )
+            return None
+        finally:
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    def output_path(self, destination_path: Path) -> Path:
+        """Return ``destination_path`` with the suffix for the compression.
+
+        Args:
+            destination_path: The path that would be passed to `save`.
+
+        Returns:
+            Path: The ``.json``, ``.json.gz`` or ``.json.zst`` file `save` writes.
+        """
+        return destination_path.with_suffix(self.COMPRESSION_SUFFIXES[self.compression])
+
+    def _serialize(self, data: dict[str, Any]) -> bytes:
+        """Encode ``data`` as compact UTF-8 JSON.
+
+        Args:
+            data: The transcription data to encode.
+
+        Returns:
+            bytes: The encoded document.
+        """
+        payload = data
+        if self.dedupe:
+            segments = data.get("segments")
+            if segments is not None and (
+                segments is data.get("chunks") or segments == data.get("chunks")
+            ):
+                payload = {k: v for k, v in data.items() if k != "segments"}
+                payload[SEGMENTS_ALIAS_KEY] = "chunks"
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    def _compress(self, payload: bytes) -> bytes:
+        """Apply the configured compression to ``payload``.
+
+        Args:
+            payload: Encoded JSON document.
+
+        Returns:
+            bytes: The compressed (or unchanged) document.
+        """
+        if self.compression == "gzip":
+            return gzip.compress(payload, compresslevel=6)
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=3).compress(payload)
+        return payload
+
+
+class SQLiteStorage(BaseStorage):
+    """Stores transcription results in an indexed, searchable SQLite archive.
+
+    Each result becomes one row in ``results`` (indexed on file, model, task
+    and creation time) with its segments and word timings normalized into the
+    ``segments`` and ``words`` tables. Segment text is mirrored into an FTS5
+    index when the SQLite build supports it; otherwise `search` falls back to
+    a ``LIKE`` scan. All rows of one result are written in a single
+    transaction.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS results (
+            id INTEGER PRIMARY KEY,
+            file TEXT NOT NULL,
+            audio_path TEXT,
+            model TEXT,
+            task TEXT,
+            language TEXT,
+            created_at TEXT NOT NULL,
+            runtime_seconds REAL,
+            text TEXT,
+            metadata TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_results_file ON results(file);
+        CREATE INDEX IF NOT EXISTS idx_results_model ON results(model);
+        CREATE INDEX IF NOT EXISTS idx_results_task ON results(task);
+        CREATE INDEX IF NOT EXISTS idx_results_created_at ON results(created_at);
+        CREATE TABLE IF NOT EXISTS segments (
+            id INTEGER PRIMARY KEY,
+            result_id INTEGER NOT NULL REFERENCES results(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            start_time REAL,
+            end_time REAL,
+            text TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_segments_result
+            ON segments(result_id, position);
+        CREATE TABLE IF NOT EXISTS words (
+            id INTEGER PRIMARY KEY,
+            segment_id INTEGER NOT NULL REFERENCES segments(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            start_time REAL,
+            end_time REAL,
+            word TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_words_segment ON words(segment_id, position);
+    """
+    _FTS_SCHEMA = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(
+            text, content='segments', content_rowid='id'
+        );
+    """
+    # Keys stored in dedicated columns/tables rather than in ``metadata``.
+    _COLUMN_KEYS = frozenset({
+        "text",
+        "chunks",
+        "segments",
+        "original_file",
+        "audio_file_path",
+        "task_type",
+        "processed_at",
+        "runtime_seconds",
+    })
+
+    def __init__(self, db_path: Path | str | None = None) -> None:
+        """Initialize the storage backend and create the schema if needed.
+
+        Args:
+            db_path: Database file. Defaults to ``constants.STORAGE_SQLITE_PATH``.
+        """
+        self.db_path = Path(db_path or constants.STORAGE_SQLITE_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(self._SCHEMA)
+            try:
+                conn.executescript(self._FTS_SCHEMA)
+                self.fts_enabled = True
+            except sqlite3.OperationalError:
+                logger.warning(
+                    "SQLite FTS5 unavailable; transcript search will use LIKE scans"
+                )
+                self.fts_enabled = False
+        conn.close()
+
+    def output_path(self, destination_path: Path) -> Path:
+        """Return the archive database, which holds every saved result.
+
+        Args:
+            destination_path: The path that would be passed to `save`.
+
+        Returns:
+            Path: The SQLite database file.
+        """
+        return self.db_path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the archive.
+
+        A connection per operation keeps the backend safe to share between
+        threads.
+
+        Returns:
+            sqlite3.Connection: A connection with foreign keys and WAL enabled.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        return conn
+
+    def save(
+        self, data: dict[str, Any], destination_path: Path, task: str
+    ) -> str | None:
+        """Archives the transcription data in the SQLite database.
+
+        Args:
+            data: The transcription data to save.
+            destination_path: The path the JSON backends would write to; its
+                name is used as the file key when ``original_file`` is missing.
+            task: The task being performed (e.g., "transcribe" or "translate").
+
+        Returns:
+            str | None: The database path, or None if an error occurred.
+        """
+        config = data.get("config_used") or {}
+        metadata = {k: v for k, v in data.items() if k not in self._COLUMN_KEYS}
+        segments = _archive_segments(data)
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    cursor = conn.execute(
+                        "INSERT INTO results (file, audio_path, model, task, "
+                        "language, created_at, runtime_seconds, text, metadata) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            str(data.get("original_file") or destination_path.name),
+                            data.get("audio_file_path"),
+                            config.get("model"),
+                            data.get("task_type") or task,
+                            data.get("language") or config.get("language"),
+                            data.get("processed_at")
+                            or datetime.now(timezone.utc).isoformat(),
+                            data.get("runtime_seconds"),
+                            data.get("text", ""),
+                            json.dumps(metadata, ensure_ascii=False, default=str),
+                        ),
+                    )
+                    result_id = cursor.lastrowid
+                    self._insert_segments(conn, result_id, segments)
+            finally:
+                conn.close()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.error(
+                "Error archiving transcription in %s: %s",
+                self.db_path,
+                e,
+                exc_info=True,
+            )
+            return None
+        logger.info(
+            "Transcription result archived in %s (result id %d, %d segments)",
+            self.db_path,
+            result_id,
+            len(segments),
+        )
+        return str(self.db_path)
+
+    def _insert_segments(
+        self, conn: sqlite3.Connection, result_id: int, segments: list[Any]
+    ) -> None:
+        """Batch-insert segments, words and FTS rows for one result.
+
+        Args:
+            conn: Connection with an open transaction.
+            result_id: Row id of the owning result.
+            segments: Segment or chunk dictionaries from the result.
+        """
+        segment_rows = []
+        words_by_position: dict[int, list[Any]] = {}
+        for position, segment in enumerate(segments):
+            if not isinstance(segment, dict):
+                continue
+            start, end = _segment_bounds(segment)
+            segment_rows.append((
+                result_id,
+                position,
+                start,
+                end,
+                str(segment.get("text", "")).strip(),
+            ))
+            if isinstance(segment.get("words"), list):
+                words_by_position[position] = segment["words"]
+        conn.executemany(
+            "INSERT INTO segments (result_id, position, start_time, end_time, text) "
+            "VALUES (?, ?, ?, ?, ?)",
+            segment_rows,
+        )
+        if self.fts_enabled:
+            conn.execute(
+                "INSERT INTO segments_fts (rowid, text) "
+                "SELECT id, text FROM segments WHERE result_id = ?",
+                (result_id,),
+            )
+        if not words_by_position:
+            return
+        segment_ids = dict(
+            conn.execute(
+                "SELECT position, id FROM segments WHERE result_id = ?", (result_id,)
+            ).fetchall()
+        )
+        conn.executemany(
+            "INSERT INTO words (segment_id, position, start_time, end_time, word) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    segment_ids[position],
+                    index,
+                    word.get("start"),
+                    word.get("end"),
+                    str(word.get("word", word.get("text", ""))),
+                )
+                for position, words in words_by_position.items()
+                for index, word in enumerate(words)
+                if isinstance(word, dict)
+            ],
+        )
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 20,
+        file: str | None = None,
+        model: str | None = None,
+        task: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Search archived segment text.
+
+        Args:
+            query: Full-text query. With FTS5 this accepts the FTS5 query
+                syntax, and plain text matches segments containing every
+                word; otherwise it is matched as a substring.
+            limit: Maximum number of hits to return.
+            file: Only return hits from results whose file contains this value.
+            model: Only return hits produced by this model.
+            task: Only return hits for this task.
+
+        Returns:
+            list[dict[str, Any]]: Hits ordered by relevance (FTS5) or time,
+            each with ``result_id``, ``file``, ``model``, ``task``,
+            ``created_at``, ``start``, ``end`` and ``text``.
+
+        Raises:
+            ValueError: If ``query`` is not a valid FTS5 query.
+        """
+        filters = []
+        params: list[Any] = []
+        if self.fts_enabled:
+            source = "segments_fts JOIN segments s ON s.id = segments_fts.rowid"
+            filters.append("segments_fts MATCH ?")
+            params.append(_fts_query(query))
+            order = "segments_fts.rank"
+        else:
+            source = "segments s"
+            filters.append("s.text LIKE ?")
+            params.append(f"%{query}%")
+            order = "r.created_at DESC, s.position"
+        if file:
+            filters.append("r.file LIKE ?")
+            params.append(f"%{file}%")
+        if model:
+            filters.append("r.model = ?")
+            params.append(model)
+        if task:
+            filters.append("r.task = ?")
+            params.append(task)
+        sql = (
+            "SELECT r.id AS result_id, r.file, r.model, r.task, r.created_at, "
+            "s.start_time AS start, s.end_time AS end, s.text "
+            f"FROM {source} "
+            "JOIN results r ON r.id = s.result_id "
+            f"WHERE {' AND '.join(filters)} ORDER BY {order} LIMIT ?"
+        )
+        params.append(limit)
+        conn = self._connect()
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query {query!r}: {e}") from e
+        finally:
+            conn.close()
+        return [dict(row) for row in rows]
+
+
+def _fts_query(query: str) -> str:
+    """Quote each word of a plain-text query for FTS5 ``MATCH``.
+
+    Punctuation such as the apostrophe in ``it's`` is FTS5 syntax, so plain
+    words are matched as quoted strings; queries that already use FTS5
+    operators are returned unchanged.
+
+    Args:
+        query: The user's search query.
+
+    Returns:
+        str: A query safe to pass to ``MATCH``.
+    """
+    if _FTS_SYNTAX.search(query):
+        return query
+    return " ".join(f'"{word}"' for word in query.split())
+
+
+def _archive_segments(data: dict[str, Any]) -> list[Any]:
+    """Return the segments to archive for a result.
+
+    Word-level results carry one chunk per word, so their words are grouped
+    into readable segments with `segment_words`; each segment keeps its
+    words for the ``words`` table.
+
+    Args:
+        data: The transcription result.
+
+    Returns:
+        list[Any]: Segment or chunk dictionaries.
+    """
+    config = data.get("config_used") or {}
+    if config.get("return_timestamps") == "word":
+        segments = RenderPlan(data).segments
+        if segments:
+            return [
+                {
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": " ".join(segment.text.split()),
+                    "words": [
+                        {"word": word.text, "start": word.start, "end": word.end}
+                        for word in segment.words
+                    ],
+                }
+                for segment in segments
+            ]
+    return data.get("segments") or data.get("chunks") or []
+
+
+def _segment_bounds(segment: dict[str, Any]) -> tuple[float | None, float | None]:
+    """Return the start/end seconds of a chunk or segment dictionary.
+
+    Args:
+        segment: Chunk (``timestamp`` pair) or segment (``start``/``end``).
+
+    Returns:
+        tuple[float | None, float | None]: Start and end, None when unknown.
+    """
+    timestamp = segment.get("timestamp")
+    if isinstance(timestamp, (list, tuple)) and len(timestamp) == 2:
+        return timestamp[0], timestamp[1]
+    return segment.get("start"), segment.get("end")
+
 
 class StorageFactory:  # pylint: disable=too-few-public-methods
     """Factory for creating storage instances."""
 
     @staticmethod
-    def create(kind: str = "json") -> BaseStorage:
+    def create(kind: str | None = None, **options: Any) -> BaseStorage:  # noqa: ANN401
         """Creates a storage backend based on the kind specified.
 
         Args:
-            kind: The kind of storage to create. Defaults to "json".
+            kind: The kind of storage to create: ``"json"`` (pretty-printed),
+                ``"json-fast"`` (compact, atomic, optionally compressed) or
+                ``"sqlite"`` (searchable archive). Defaults to
+                ``constants.STORAGE_BACKEND``.
+            **options: Backend-specific options. ``json-fast`` accepts
+                ``compression`` (defaults to ``constants.STORAGE_COMPRESSION``)
+                and ``dedupe``; ``sqlite`` accepts ``db_path``.
 
         Returns:
             BaseStorage: The created storage instance.
@@ -80,9 +665,12 @@ class StorageFactory:  # pylint: disable=too-few-public-methods
             ValueError: If the specified kind is not supported.
 
         """
+        kind = kind or constants.STORAGE_BACKEND
         if kind == "json":
             return JsonStorage()
-        # Add other storage types here in the future
-        # elif kind == "sqlite":
-        #     return SQLiteStorage()
+        if kind == "json-fast":
+            options.setdefault("compression", constants.STORAGE_COMPRESSION)
+            return FastJsonStorage(**options)
+        if kind == "sqlite":
+            return SQLiteStorage(**options)
         raise ValueError(f"Unsupported storage kind: {kind}")
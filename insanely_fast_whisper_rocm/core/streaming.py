@@ -0,0 +1,202 @@
+"""Streaming export helpers for transcription results.
+
+The formatters in `core.formatters` expose ``iter_format`` generators that emit
+output one cue (or JSON fragment) at a time. This module builds on them to:
+
+- decide when a result is large enough to be worth streaming,
+- encode formatter output for HTTP streaming responses, and
+- write subtitles incrementally while the pipeline is still producing chunks.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterator
+from typing import Any, TextIO
+
+from insanely_fast_whisper_rocm.core.formatters import (
+    BaseFormatter,
+    RenderPlan,
+    SrtFormatter,
+    VttFormatter,
+)
+from insanely_fast_whisper_rocm.utils import constants
+
+logger = logging.getLogger(__name__)
+
+
+def should_stream(result: dict[str, Any]) -> bool:
+    """Return whether ``result`` is large enough to export via streaming.
+
+    Small results render faster as a single string; long transcripts are
+    streamed so the full document never sits in memory at once.
+
+    Args:
+        result: The transcription result to export.
+
+    Returns:
+        bool: True when the result holds at least
+        ``constants.STREAMING_EXPORT_MIN_SEGMENTS`` chunks or segments.
+    """
+    items = result.get("chunks") or result.get("segments") or []
+    return isinstance(items, list) and (
+        len(items) >= constants.STREAMING_EXPORT_MIN_SEGMENTS
+    )
+
+
+def iter_encoded(
+    formatter: type[BaseFormatter],
+    result: dict[str, Any],
+    plan: RenderPlan | None = None,
+    encoding: str = "utf-8",
+) -> Iterator[bytes]:
+    """Yield formatter output as encoded bytes for streaming HTTP responses.
+
+    Args:
+        formatter: Formatter class used to render ``result``.
+        result: The transcription result to render.
+        plan: Optional shared `RenderPlan` for ``result``.
+        encoding: Text encoding applied to each fragment.
+
+    Yields:
+        bytes: Encoded output fragments.
+    """
+    for fragment in formatter.iter_format(result, plan):
+        yield fragment.encode(encoding)
+
+
+class ChunkStreamWriter:
+    """Progress listener that writes subtitles as pipeline chunks complete.
+
+    Register an instance with `BasePipeline.add_listener`. Each
+    ``chunk_complete`` event is shifted by its chunk offset, rendered, and
+    appended to ``stream``, so output is available before the whole file has
+    been transcribed. Pool backends finish chunks out of order; those results
+    are held back until every earlier chunk has been written. Cues never span
+    chunk boundaries, so the output is a preview of, not identical to, the
+    export rendered from the merged result.
+
+    Supported formats are ``"srt"``, ``"vtt"`` and ``"txt"``.
+    """
+
+    SUPPORTED_FORMATS = ("srt", "vtt", "txt")
+
+    def __init__(self, stream: TextIO, export_format: str) -> None:
+        """Initialize the writer.
+
+        Args:
+            stream: Open text stream receiving the rendered output.
+            export_format: One of ``SUPPORTED_FORMATS``.
+
+        Raises:
+            ValueError: If ``export_format`` cannot be written incrementally.
+        """
+        if export_format not in self.SUPPORTED_FORMATS:
+            raise ValueError(
+                f"Format '{export_format}' does not support incremental writing"
+            )
+        self.stream = stream
+        self.export_format = export_format
+        self.cues_written = 0
+        self._text_written = False
+        self._next_chunk = 1
+        self._pending: dict[int, tuple[dict[str, Any], float]] = {}
+        # Parallel dispatch notifies listeners from worker threads
+        self._lock = threading.Lock()
+        if export_format == "vtt":
+            self.stream.write("WEBVTT\n")
+
+    def __call__(self, event: object) -> None:
+        """Handle a pipeline progress event.
+
+        Args:
+            event: A `ProgressEvent`; only ``chunk_complete`` events are used.
+        """
+        if getattr(event, "event_type", None) != "chunk_complete":
+            return
+        result = getattr(event, "result", None)
+        if not isinstance(result, dict):
+            return
+        offset = float(getattr(event, "chunk_start_time", None) or 0.0)
+        chunk_num = getattr(event, "chunk_num", None)
+        with self._lock:
+            if not isinstance(chunk_num, int):
+                self.write_chunk(result, offset)
+                return
+            self._pending[chunk_num] = (result, offset)
+            while self._next_chunk in self._pending:
+                self.write_chunk(*self._pending.pop(self._next_chunk))
+                self._next_chunk += 1
+
+    def write_chunk(self, result: dict[str, Any], offset: float = 0.0) -> None:
+        """Render one chunk result and append it to the stream.
+
+        Args:
+            result: Raw chunk result with chunk-relative timestamps.
+            offset: Start time of the chunk within the full audio, in seconds.
+        """
+        if self.export_format == "txt":
+            text = str(result.get("text", "")).strip()
+            if text:
+                # Mirrors merge_chunk_results, which joins chunk texts by a blank line
+                self.stream.write(f"\n\n{text}" if self._text_written else text)
+                self._text_written = True
+            self.stream.flush()
+            return
+
+        shifted = _shift_result(result, offset)
+        if self.export_format == "srt":
+            for _, body in SrtFormatter.iter_cues(shifted):
+                self.cues_written += 1
+                prefix = "" if self.cues_written == 1 else "\n"
+                self.stream.write(f"{prefix}{self.cues_written}\n{body}")
+        else:
+            for body in VttFormatter.iter_cues(shifted) or ():
+                self.cues_written += 1
+                self.stream.write(f"\n{body}")
+        self.stream.flush()
+        logger.debug(
+            "ChunkStreamWriter: wrote chunk at offset %.2fs (%d cues so far)",
+            offset,
+            self.cues_written,
+        )
+
+
+def _shift_result(result: dict[str, Any], offset: float) -> dict[str, Any]:
+    """Return a copy of a chunk result with all timestamps moved by ``offset``.
+
+    The pipeline later merges the same chunk dictionaries in place, so the
+    input is never mutated.
+
+    Args:
+        result: Raw chunk result with chunk-relative timestamps.
+        offset: Seconds to add to every timestamp.
+
+    Returns:
+        dict[str, Any]: A result containing ``text`` and shifted ``chunks``.
+    """
+
+    def _add(value: object) -> object:
+        return value + offset if isinstance(value, (int, float)) else value
+
+    shifted_chunks: list[dict[str, Any]] = []
+    for chunk in result.get("chunks") or result.get("segments") or []:
+        if not isinstance(chunk, dict):
+            continue
+        shifted = dict(chunk)
+        timestamp = chunk.get("timestamp")
+        if isinstance(timestamp, (list, tuple)) and len(timestamp) == 2:
+            shifted["timestamp"] = [_add(timestamp[0]), _add(timestamp[1])]
+        for key in ("start", "end"):
+            if key in chunk:
+                shifted[key] = _add(chunk[key])
+        if isinstance(chunk.get("words"), list):
+            shifted["words"] = [
+                {**word, "start": _add(word.get("start")), "end": _add(word.get("end"))}
+                if isinstance(word, dict)
+                else word
+                for word in chunk["words"]
+            ]
+        shifted_chunks.append(shifted)
+    return {"text": result.get("text", ""), "chunks": shifted_chunks}
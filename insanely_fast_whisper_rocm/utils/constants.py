@@ -128,6 +128,9 @@ SKIP_FS_CHECKS = os.getenv("IFW_SKIP_FS_CHECKS", "0") == "1" or IS_TEST_ENV
 
 # Model configuration
 DEFAULT_MODEL = os.getenv("WHISPER_MODEL", "distil-whisper/distil-large-v3")
+# Optional smaller checkpoint that drafts tokens for the main model
+# (speculative decoding), e.g. distil-whisper/distil-large-v3 for large-v3
+DEFAULT_ASSISTANT_MODEL = os.getenv("WHISPER_ASSISTANT_MODEL") or None
 DEFAULT_DEVICE = os.getenv(
     "WHISPER_DEVICE", "0"
 )  # Use "0" for CUDA, "mps" for Apple Silicon
@@ -140,6 +143,11 @@ if _TIMESTAMP_TYPE_ENV not in ("chunk", "word"):
 DEFAULT_TIMESTAMP_TYPE: Literal["chunk", "word"] = _TIMESTAMP_TYPE_ENV
 
 DEFAULT_LANGUAGE = os.getenv("WHISPER_LANGUAGE", "None")  # None means auto-detect
+# Auto-detection runs once per multi-chunk file on this many evenly spaced
+# chunks, and the result is reused for every chunk (0 detects per chunk)
+LANGUAGE_DETECTION_SAMPLE_CHUNKS = int(
+    os.getenv("LANGUAGE_DETECTION_SAMPLE_CHUNKS", "3")
+)
 DEFAULT_DTYPE = os.getenv("WHISPER_DTYPE", "float16")  # Data type for model inference
 DEFAULT_BETTER_TRANSFORMER = (
     os.getenv("WHISPER_BETTER_TRANSFORMER", "false").lower() == "true"
@@ -147,12 +155,83 @@ DEFAULT_BETTER_TRANSFORMER = (
 DEFAULT_CHUNK_LENGTH = int(
     os.getenv("WHISPER_CHUNK_LENGTH", "30")
 )  # Audio chunk length in seconds
+# Optional generation budget: new tokens per decode are capped at chunk duration
+# times this token rate plus a margin (0, the default, keeps the model's limit)
+GENERATION_TOKENS_PER_SECOND = float(os.getenv("GENERATION_TOKENS_PER_SECOND", "0"))
+GENERATION_TOKEN_MARGIN = int(os.getenv("GENERATION_TOKEN_MARGIN", "16"))
+# Stop and retry chunks whose output loops (compresses beyond the threshold)
+GENERATION_REPETITION_GUARD = (
+    os.getenv("GENERATION_REPETITION_GUARD", "true").lower() == "true"
+)
+GENERATION_COMPRESSION_RATIO_THRESHOLD = float(
+    os.getenv("GENERATION_COMPRESSION_RATIO_THRESHOLD", "2.4")
+)
+GENERATION_RETRY_REPETITION_PENALTY = float(
+    os.getenv("GENERATION_RETRY_REPETITION_PENALTY", "1.3")
+)
+# Capability profiles of loaded checkpoints, persisted per hub revision
+MODEL_PROFILE_CACHE_DIR = os.getenv(
+    "MODEL_PROFILE_CACHE_DIR",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "insanely-fast-whisper-rocm", "profiles"
+    ),
+)
+# CPU inference in worker processes, each with its own model copy and
+# CPU_WORKER_THREADS intra-op threads (0 = cores / workers); 0 or 1 worker keeps
+# CPU inference in the serving process
+CPU_WORKERS = int(os.getenv("CPU_WORKERS", "0"))
+CPU_WORKER_THREADS = int(os.getenv("CPU_WORKER_THREADS", "0"))
+# Precision of the CPU fallback after GPU OOM ("float32", or "int8" for
+# dynamically quantized linear layers)
+CPU_FALLBACK_DTYPE = os.getenv("CPU_FALLBACK_DTYPE", "float32")
+# int8-quantized models, cached per hub revision so they are quantized once
+QUANTIZED_MODEL_CACHE_DIR = os.getenv(
+    "QUANTIZED_MODEL_CACHE_DIR",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "insanely-fast-whisper-rocm", "quantized"
+    ),
+)
+
+# Checkpoints loaded in another dtype than published are saved converted (with
+# their backfilled generation config) per source revision and memory-mapped on
+# later loads
+CONVERTED_MODEL_CACHE = os.getenv("CONVERTED_MODEL_CACHE", "true").lower() == "true"
+CONVERTED_MODEL_CACHE_DIR = os.getenv(
+    "CONVERTED_MODEL_CACHE_DIR",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "insanely-fast-whisper-rocm", "converted"
+    ),
+)
+# Static KV cache plus torch.compile'd decoding (see core/compiled_decoding.py);
+# compiled kernels are cached on disk so restarts skip most compilation
+TORCH_COMPILE = os.getenv("WHISPER_TORCH_COMPILE", "false").lower() == "true"
+TORCH_COMPILE_MODE = os.getenv("WHISPER_TORCH_COMPILE_MODE", "reduce-overhead")
+TORCH_COMPILE_CACHE_DIR = os.getenv(
+    "TORCH_COMPILE_CACHE_DIR",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "insanely-fast-whisper-rocm", "inductor"
+    ),
+)
 
 # Processing limits and timeouts
 MAX_BATCH_SIZE = 32  # Maximum allowed batch size
 MIN_BATCH_SIZE = 1  # Minimum allowed batch size
 COMMAND_TIMEOUT_SECONDS = 3600  # Maximum time allowed for processing (1 hour)
-MAX_AUDIO_SIZE_MB = 100  # Maximum allowed audio file size in MB
+# Uploads larger than this are rejected with 413 while they are streamed
+MAX_AUDIO_SIZE_MB = int(os.getenv("MAX_AUDIO_SIZE_MB", "100"))
+# Uploads whose header-reported duration exceeds this are rejected with 413
+# (0 disables the check)
+MAX_AUDIO_DURATION_SECONDS = int(os.getenv("MAX_AUDIO_DURATION_SECONDS", "0"))
+# Identical concurrent API requests (same file content and parameters) share
+# one inference instead of each running their own
+API_COALESCE_REQUESTS = os.getenv("API_COALESCE_REQUESTS", "true").lower() == "true"
+# Batch endpoint: maximum files per request (archives count their members) and
+# files prepared/post-processed at once; inference itself is serialized
+API_BATCH_MAX_FILES = int(os.getenv("API_BATCH_MAX_FILES", "50"))
+API_BATCH_CONCURRENCY = int(os.getenv("API_BATCH_CONCURRENCY", "2"))
+# Opt-in: lets API requests reference files under this directory by path (e.g.
+# a shared volume) so they are read in place instead of uploaded. Empty disables.
+API_LOCAL_INPUT_ROOT = os.getenv("API_LOCAL_INPUT_ROOT", "")
 MAX_CONCURRENT_REQUESTS = 10  # Maximum number of concurrent processing requests
 
 # Progress UI granularity
@@ -170,7 +249,17 @@ MAX_SPEAKERS = 10  # Maximum number of speakers for diarization
 
 # File handling
 UPLOAD_DIR = os.getenv("WHISPER_UPLOAD_DIR", "temp_uploads")
-TEMP_FILE_TTL_SECONDS = 3600  # Time-to-live for temporary files (1 hour)
+# Temporary uploads and intermediate audio older than this are removed by the
+# background janitor once no job uses them (0 disables expiry).
+TEMP_FILE_TTL_SECONDS = int(os.getenv("TEMP_FILE_TTL_SECONDS", "3600"))
+# Upper bound for tracked temporary files; the oldest unused ones are evicted
+# first (0 disables the quota).
+TEMP_SPACE_QUOTA_MB = int(os.getenv("TEMP_SPACE_QUOTA_MB", "10240"))
+TEMP_SWEEP_INTERVAL_SECONDS = int(os.getenv("TEMP_SWEEP_INTERVAL_SECONDS", "300"))
+# Leftover uploads may belong to another instance sharing UPLOAD_DIR; they are
+# only swept once older than this, which must exceed the longest job. Tracked
+# artifacts still leased after this long are treated as leaked.
+TEMP_ORPHAN_AGE_SECONDS = int(os.getenv("TEMP_ORPHAN_AGE_SECONDS", "86400"))
 DEFAULT_TRANSCRIPTS_DIR = os.getenv(
     "WHISPER_TRANSCRIPTS_DIR", "transcripts"
 )  # Default directory for saving transcripts
@@ -189,6 +278,27 @@ APP_TIMEZONE = os.getenv(
 SAVE_TRANSCRIPTIONS = (
     os.getenv("SAVE_TRANSCRIPTIONS", "true").lower() == "true"
 )  # Whether to save transcriptions to disk
+STREAMING_EXPORT_MIN_SEGMENTS = int(
+    os.getenv("STREAMING_EXPORT_MIN_SEGMENTS", "2000")
+)  # Results with at least this many chunks/segments are exported incrementally
+STORAGE_BACKEND = os.getenv(
+    "STORAGE_BACKEND", "json"
+).lower()  # Result storage backend: "json", "json-fast" or "sqlite"
+STORAGE_COMPRESSION = os.getenv(
+    "STORAGE_COMPRESSION", "none"
+).lower()  # "json-fast" compression: "none", "gzip" or "zstd"
+STORAGE_SQLITE_PATH = os.getenv(
+    "STORAGE_SQLITE_PATH", os.path.join(DEFAULT_TRANSCRIPTS_DIR, "transcripts.sqlite3")
+)  # Transcript archive used by the "sqlite" storage backend and search
+ASYNC_RESULT_WRITES = (
+    os.getenv("ASYNC_RESULT_WRITES", "true").lower() == "true"
+)  # Persist results on a background writer instead of inside process()
+RESULT_WRITER_WORKERS = int(
+    os.getenv("RESULT_WRITER_WORKERS", "2")
+)  # Threads used by the background result writer
+RESULT_WRITER_MAX_PENDING = int(
+    os.getenv("RESULT_WRITER_MAX_PENDING", "8")
+)  # Queued writes before new results block until a write finishes
 
 # Audio chunking configuration
 AUDIO_CHUNK_DURATION = float(
@@ -245,6 +355,17 @@ DEFAULT_STABILIZE = os.getenv("STABILIZE_DEFAULT", "false").lower() == "true"
 DEFAULT_DEMUCS = os.getenv("DEMUCS_DEFAULT", "false").lower() == "true"
 DEFAULT_VAD = os.getenv("VAD_DEFAULT", "false").lower() == "true"
 DEFAULT_VAD_THRESHOLD = float(os.getenv("VAD_THRESHOLD_DEFAULT", "0.35"))
+# Stabilize long audio per pipeline chunk window on a worker pool
+STABILIZE_CHUNKED = os.getenv("STABILIZE_CHUNKED", "false").lower() == "true"
+STABILIZE_CHUNK_MIN_SECONDS = float(os.getenv("STABILIZE_CHUNK_MIN_SECONDS", "300"))
+STABILIZE_WORKERS = int(os.getenv("STABILIZE_WORKERS", "2"))
+# Demucs output cached per audio content hash (memory-mapped on reuse)
+STABILIZATION_CACHE_DIR = os.getenv(
+    "STABILIZATION_CACHE_DIR",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "insanely-fast-whisper-rocm", "stabilization"
+    ),
+)
 
 
 # ROCm/HIP Configuration (for AMD GPUs)
@@ -339,6 +460,21 @@ DEFAULT_RESPONSE_FORMAT = "json"
 WEBUI_HOST = os.getenv("WEBUI_HOST", "0.0.0.0")  # WebUI server host
 WEBUI_PORT = int(os.getenv("WEBUI_PORT", "7860"))  # WebUI server port
 DEV_WEBUI_PORT = int(os.getenv("DEV_WEBUI_PORT", "7862"))  # Development WebUI port
+WEBUI_BATCH_CONCURRENCY = int(
+    os.getenv("WEBUI_BATCH_CONCURRENCY", "2")
+)  # Files of a WebUI batch prepared/post-processed concurrently (1 = sequential)
+WEBUI_ZIP_STORE_ONLY = (
+    os.getenv("WEBUI_ZIP_STORE_ONLY", "false").lower() == "true"
+)  # Store batch ZIP entries uncompressed (fastest, largest archives)
+WEBUI_ZIP_COMPRESSION_LEVEL = int(
+    os.getenv("WEBUI_ZIP_COMPRESSION_LEVEL", "6")
+)  # Deflate level for batch ZIPs: 0 (fastest) .. 9 (smallest)
+WEBUI_RESULT_CACHE_MB = int(
+    os.getenv("WEBUI_RESULT_CACHE_MB", "64")
+)  # Rendered TXT/SRT/JSON kept per session for repeated downloads and ZIPs
+WEBUI_RESULT_CACHE_SESSIONS = int(
+    os.getenv("WEBUI_RESULT_CACHE_SESSIONS", "16")
+)  # Sessions whose rendered results are kept (least recently used dropped)
 
 # API version (tests expect a specific string). Prefer package metadata but
 # fall back to the expected default for local/test runs.
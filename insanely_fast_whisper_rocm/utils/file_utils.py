@@ -2,19 +2,32 @@
 
 import logging
 import os
-import shutil
 import tempfile
 import uuid
+from typing import BinaryIO
 
 from fastapi import HTTPException, UploadFile
 
+from insanely_fast_whisper_rocm.utils import constants
 from insanely_fast_whisper_rocm.utils.constants import (
     SUPPORTED_AUDIO_FORMATS,
     UPLOAD_DIR,
 )
+from insanely_fast_whisper_rocm.utils.temp_space import (
+    release_temp_path,
+    track_temp_path,
+)
+from insanely_fast_whisper_rocm.utils.upload_admission import (
+    SNIFF_BYTES,
+    probe_duration,
+    sniff_audio_format,
+)
 
 logger = logging.getLogger(__name__)
 
+# Uploads are copied to disk in pieces of this size, never as a whole.
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
 
 def validate_audio_file(file: UploadFile) -> None:
     """Validate that the uploaded file is a supported audio format.
@@ -36,6 +49,153 @@ def validate_audio_file(file: UploadFile) -> None:
         )
 
 
+def _remove_partial(path: str) -> None:
+    """Delete a rejected or partially written upload."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def save_stream(
+    source: BinaryIO, destination: str, declared_size: int | None = None
+) -> str:
+    """Copy an upload to ``destination`` while enforcing the admission limits.
+
+    The source is read in `UPLOAD_CHUNK_BYTES` pieces. Its container format is
+    sniffed from the first bytes and the byte limit (``MAX_AUDIO_SIZE_MB``) is
+    checked while copying, so garbage or oversized uploads are rejected before
+    they are fully written. Once on disk, the duration is read from the file
+    headers and checked against ``MAX_AUDIO_DURATION_SECONDS``.
+
+    Args:
+        source: Binary stream of the upload (e.g. ``UploadFile.file``).
+        destination: Path to write the upload to.
+        declared_size: Size announced by the client, checked before reading.
+
+    Returns:
+        str: ``destination``.
+
+    Raises:
+        HTTPException: 413 if the upload exceeds the size or duration limit,
+            415 if its content is not a recognized audio or video container.
+    """
+    limit = constants.MAX_AUDIO_SIZE_MB * 1024 * 1024
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"File exceeds the {constants.MAX_AUDIO_SIZE_MB} MB upload limit",
+    )
+    if limit and isinstance(declared_size, int) and declared_size > limit:
+        raise too_large
+
+    container: str | None = None
+    written = 0
+    with open(destination, "wb") as buffer:
+        try:
+            head = source.read(max(SNIFF_BYTES, UPLOAD_CHUNK_BYTES))
+            container = sniff_audio_format(head)
+            if container is None:
+                raise HTTPException(
+                    status_code=415,
+                    detail="File content is not a supported audio format",
+                )
+            chunk = head
+            while chunk:
+                written += len(chunk)
+                if limit and written > limit:
+                    raise too_large
+                buffer.write(chunk)
+                chunk = source.read(UPLOAD_CHUNK_BYTES)
+        except HTTPException:
+            buffer.close()
+            _remove_partial(destination)
+            raise
+
+    try:
+        _check_duration(destination, container)
+    except HTTPException:
+        _remove_partial(destination)
+        raise
+    return destination
+
+
+def resolve_local_input(path: str) -> str:
+    """Validate a server-side input path so it can be read in place.
+
+    Local-path ingestion is opt-in: it is only available when
+    ``API_LOCAL_INPUT_ROOT`` is set, and only for files inside that directory
+    after resolving symlinks. The file gets the same format and duration
+    checks as an upload, but is never copied, moved or deleted.
+
+    Args:
+        path: Absolute path, or a path relative to ``API_LOCAL_INPUT_ROOT``.
+
+    Returns:
+        str: The resolved path of the file.
+
+    Raises:
+        HTTPException: 403 if the mode is disabled or ``path`` lies outside
+            the allowed root, 404 if it is not a file, 415 if its extension
+            or content is not a supported audio format, 413 if it exceeds the
+            duration limit.
+    """
+    root = constants.API_LOCAL_INPUT_ROOT
+    if not root:
+        raise HTTPException(
+            status_code=403, detail="Local path ingestion is not enabled"
+        )
+    root = os.path.realpath(root)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root:
+        raise HTTPException(
+            status_code=403, detail="Path is outside the allowed input directory"
+        )
+    if not os.path.isfile(resolved):
+        raise HTTPException(status_code=404, detail=f"File not found: {path}")
+    if os.path.splitext(resolved)[1].lower() not in SUPPORTED_AUDIO_FORMATS:
+        raise HTTPException(
+            status_code=415,
+            detail=(
+                "Unsupported file format. Supported formats: "
+                f"{', '.join(SUPPORTED_AUDIO_FORMATS)}"
+            ),
+        )
+    try:
+        with open(resolved, "rb") as handle:
+            container = sniff_audio_format(handle.read(SNIFF_BYTES))
+    except OSError as e:
+        raise HTTPException(
+            status_code=403, detail=f"Cannot read {path}: {e.strerror}"
+        ) from e
+    if container is None:
+        raise HTTPException(
+            status_code=415, detail="File content is not a supported audio format"
+        )
+    _check_duration(resolved, container)
+    return resolved
+
+
+def _check_duration(path: str, container: str | None) -> None:
+    """Enforce ``MAX_AUDIO_DURATION_SECONDS`` using the file headers.
+
+    Args:
+        path: The audio file.
+        container: Container name from `sniff_audio_format`.
+
+    Raises:
+        HTTPException: 413 if the reported duration exceeds the limit.
+    """
+    max_duration = constants.MAX_AUDIO_DURATION_SECONDS
+    if max_duration <= 0:
+        return
+    duration = probe_duration(path, container)
+    if duration is not None and duration > max_duration:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Audio duration {duration:.0f}s exceeds the {max_duration}s limit",
+        )
+
+
 def save_upload_file(file: UploadFile) -> str:
     """Save an uploaded file to disk with a unique filename.
 
@@ -46,18 +206,19 @@ def save_upload_file(file: UploadFile) -> str:
         str: Path to the saved file
 
     Raises:
-        HTTPException: If there's an error saving the file
-    """
+        HTTPException: If the upload is rejected by the admission checks
+            (413/415) or there's an error saving the file
+    """  # noqa: DOC502
     os.makedirs(UPLOAD_DIR, exist_ok=True)
 
     temp_filename = f"{str(uuid.uuid4())}_{file.filename}"
     temp_filepath = os.path.join(UPLOAD_DIR, temp_filename)
 
     try:
-        with open(temp_filepath, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        return temp_filepath
+        save_stream(file.file, temp_filepath, getattr(file, "size", None))
+        return track_temp_path(temp_filepath)
     except OSError as e:
+        _remove_partial(temp_filepath)
         raise HTTPException(
             status_code=500, detail=f"Error saving uploaded file: {str(e)}"
         ) from e
@@ -73,6 +234,7 @@ def cleanup_temp_files(file_paths: list[str]) -> None:
         try:
             if os.path.isfile(file_path):
                 os.unlink(file_path)
+            release_temp_path(file_path)
             # Try to remove parent directory if it's empty
             dir_path = os.path.dirname(file_path)
             # Ensure we only attempt to remove directories from the designated
@@ -84,6 +246,7 @@ def cleanup_temp_files(file_paths: list[str]) -> None:
                 ):
                     try:
                         os.rmdir(dir_path)
+                        release_temp_path(dir_path)
                     except OSError:  # Catch potential race conditions or
                         # other errors
                         pass  # Don't raise if cleanup fails
@@ -129,22 +292,38 @@ class FileHandler:
             str: Path to the saved file
 
         Raises:
-            HTTPException: If there's an error saving the file
-        """
+            HTTPException: If the upload is rejected by the admission checks
+                (413/415) or there's an error saving the file
+        """  # noqa: DOC502
         temp_filename = f"{str(uuid.uuid4())}_{file.filename}"
         temp_filepath = os.path.join(self.upload_dir, temp_filename)
 
         try:
-            with open(temp_filepath, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            save_stream(file.file, temp_filepath, getattr(file, "size", None))
             logger.info("File saved temporarily as: %s", temp_filepath)
-            return temp_filepath
+            return track_temp_path(temp_filepath)
         except OSError as e:
             logger.error("Error saving uploaded file: %s", str(e))
+            _remove_partial(temp_filepath)
             raise HTTPException(
                 status_code=500, detail=f"Error saving uploaded file: {str(e)}"
             ) from e
 
+    def resolve_local_input(self, path: str) -> str:
+        """Validate a server-side input path so it can be read in place.
+
+        Args:
+            path: Absolute path, or a path relative to ``API_LOCAL_INPUT_ROOT``.
+
+        Returns:
+            str: The resolved path of the file.
+
+        Raises:
+            HTTPException: If local-path ingestion is disabled or the path is
+                not an allowed, supported audio file.
+        """  # noqa: DOC502
+        return resolve_local_input(path)
+
     def cleanup(self, file_path: str) -> None:
         """Clean up a temporary file.
 
@@ -155,6 +334,7 @@ class FileHandler:
             if os.path.exists(file_path):
                 logger.debug("Cleaning up temporary file: %s", file_path)
                 os.remove(file_path)
+            release_temp_path(file_path)
         except OSError as e:
             logger.warning("Failed to cleanup file %s: %s", file_path, e)
             # Don't raise - cleanup failures shouldn't break the API
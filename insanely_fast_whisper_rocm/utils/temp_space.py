@@ -0,0 +1,505 @@
+"""Janitor for temporary uploads and intermediate audio files.
+
+Uploads, converted WAVs, extracted video audio and chunk directories are
+normally removed by the request that created them. Crashed or cancelled runs
+can leave them behind, so long-running servers slowly fill the disk.
+
+`TempSpaceManager` keeps a registry of the artifacts created by the audio
+helpers and the upload handlers. An artifact is leased to the job that created
+it until the job releases it (`cleanup_temp_files` does so in the owners'
+``finally`` blocks). A lease still held after ``TEMP_ORPHAN_AGE_SECONDS``,
+longer than any job runs, was leaked by its owner and no longer protects the
+artifact. A background sweep removes unleased artifacts older than
+``TEMP_FILE_TTL_SECONDS`` and, once the total size exceeds
+``TEMP_SPACE_QUOTA_MB``, evicts the oldest unleased ones first.
+
+Leftovers of earlier processes are swept as orphans. Temp directories are
+named with `temp_prefix`, which records the owner's PID: those of a process
+that is still running are never touched, others are removed once older than
+the TTL. Uploads (``<uuid>_<name>`` files in ``UPLOAD_DIR``) and artifacts
+without an owner PID carry no ownership, so they are only removed once older
+than ``TEMP_ORPHAN_AGE_SECONDS``, well above any job's run time.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from insanely_fast_whisper_rocm.utils import constants
+
+logger = logging.getLogger(__name__)
+
+# Prefixes of the temp directories and files created by this package.
+TEMP_PREFIXES = (
+    "converted_audio_",
+    "extracted_audio_",
+    "audio_chunks_",
+    "ifw_export_",
+)
+
+# Names of saved uploads and batch archives in ``UPLOAD_DIR``.
+_UPLOAD_NAME = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}(?:_|\.zip$)"
+)
+
+
+def temp_prefix(kind: str) -> str:
+    """Return the name prefix for a temp artifact owned by this process.
+
+    Args:
+        kind: One of `TEMP_PREFIXES`.
+
+    Returns:
+        str: ``kind`` followed by the current PID, e.g. ``"audio_chunks_42_"``.
+    """
+    return f"{kind}{os.getpid()}_"
+
+
+def _owner_pid(name: str) -> int | None:
+    """Return the PID recorded by `temp_prefix` in an artifact name.
+
+    Returns:
+        int | None: The owner PID, or None for names without one.
+    """
+    for kind in TEMP_PREFIXES:
+        if name.startswith(kind):
+            pid, sep, _ = name[len(kind) :].partition("_")
+            return int(pid) if sep and pid.isdigit() else None
+    return None
+
+
+def _is_running(pid: int) -> bool:
+    """Tell whether another process with ``pid`` is alive.
+
+    Returns:
+        bool: True if the process exists; unknown states count as alive.
+    """
+    if pid == os.getpid():
+        return False
+    if os.name == "nt":  # os.kill() would terminate the process
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:  # e.g. EPERM: it exists but belongs to another user
+        return True
+    return True
+
+
+@dataclass
+class TempSpaceStats:
+    """Usage and eviction counters of a `TempSpaceManager`."""
+
+    tracked: int = 0
+    tracked_bytes: int = 0
+    quota_bytes: int = 0
+    ttl_seconds: float = 0.0
+    expired: int = 0
+    evicted: int = 0
+    orphans_removed: int = 0
+    bytes_freed: int = 0
+    last_sweep: float | None = None
+
+
+@dataclass
+class _Entry:
+    """A tracked artifact."""
+
+    created: float
+    leased: bool = True
+
+
+def _path_size(path: str) -> int:
+    """Return the size of a file or directory tree in bytes.
+
+    Args:
+        path: File or directory to measure.
+
+    Returns:
+        int: Total size, or 0 if ``path`` vanished while measuring.
+    """
+    try:
+        if not os.path.isdir(path):
+            return os.path.getsize(path)
+        total = 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    continue
+        return total
+    except OSError:
+        return 0
+
+
+def _remove(path: str) -> bool:
+    """Delete a file or directory tree.
+
+    Args:
+        path: File or directory to delete.
+
+    Returns:
+        bool: True if ``path`` no longer exists afterwards.
+    """
+    try:
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        elif os.path.lexists(path):
+            os.unlink(path)
+    except OSError as exc:
+        logger.warning("Failed to remove temporary artifact %s: %s", path, exc)
+        return False
+    return True
+
+
+def _scan(root: str) -> list[os.DirEntry[str]]:
+    """List a directory, treating a missing or unreadable one as empty.
+
+    Returns:
+        list[os.DirEntry[str]]: The entries of ``root``.
+    """
+    try:
+        with os.scandir(os.path.abspath(root)) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+class TempSpaceManager:
+    """Registry of temporary artifacts with TTL and disk quota enforcement."""
+
+    def __init__(
+        self,
+        ttl_seconds: float | None = None,
+        quota_bytes: int | None = None,
+        upload_dir: str | None = None,
+        temp_dir: str | None = None,
+        orphan_age_seconds: float | None = None,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            ttl_seconds: Maximum age of an artifact. Defaults to
+                ``TEMP_FILE_TTL_SECONDS``; 0 disables expiry.
+            quota_bytes: Maximum total size of tracked artifacts. Defaults to
+                ``TEMP_SPACE_QUOTA_MB`` mebibytes; 0 disables the quota.
+            upload_dir: Directory scanned for orphaned uploads. Defaults to
+                ``UPLOAD_DIR``.
+            temp_dir: Directory scanned for orphaned temp directories.
+                Defaults to `tempfile.gettempdir`.
+            orphan_age_seconds: Minimum age of orphans whose owner is unknown,
+                and the age after which a lease counts as leaked. Defaults to
+                ``TEMP_ORPHAN_AGE_SECONDS``; never below the TTL.
+        """
+        if ttl_seconds is None:
+            ttl_seconds = constants.TEMP_FILE_TTL_SECONDS
+        if quota_bytes is None:
+            quota_bytes = constants.TEMP_SPACE_QUOTA_MB * 1024 * 1024
+        if orphan_age_seconds is None:
+            orphan_age_seconds = constants.TEMP_ORPHAN_AGE_SECONDS
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.orphan_age_seconds = max(self.ttl_seconds, float(orphan_age_seconds))
+        self.quota_bytes = max(0, int(quota_bytes))
+        self.upload_dir = upload_dir if upload_dir is not None else constants.UPLOAD_DIR
+        self.temp_dir = temp_dir
+        self._stats = TempSpaceStats()
+        # Sizes are measured at sweep time because directories are registered
+        # before their files are written.
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def track(self, path: str | Path, lease: bool = True) -> str:
+        """Register a temporary file or directory.
+
+        Args:
+            path: The artifact to manage.
+            lease: Keep the artifact until `release` is called. Pass False for
+                artifacts handed off without an owner (e.g. downloads), which
+                are only kept for the TTL.
+
+        Returns:
+            str: ``path`` as a string, for call chaining.
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            entry = self._entries.setdefault(key, _Entry(time.time(), lease))
+            entry.leased = entry.leased or lease
+        return str(path)
+
+    def release(self, path: str | Path) -> None:
+        """End an artifact's lease once its owner is done with it.
+
+        Removed artifacts are forgotten; leftovers become evictable.
+
+        Args:
+            path: A previously tracked artifact.
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            if not os.path.lexists(key):
+                self._entries.pop(key, None)
+            elif key in self._entries:
+                self._entries[key].leased = False
+
+    def _forget(self, path: str) -> None:
+        """Stop managing an artifact that no longer exists."""
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def sweep(self, now: float | None = None) -> int:
+        """Remove expired artifacts, then evict the oldest beyond the quota.
+
+        Leased artifacts are kept but count towards the quota; leases older
+        than ``orphan_age_seconds`` are treated as leaked and ignored.
+
+        Args:
+            now: Current time, for testing. Defaults to `time.time`.
+
+        Returns:
+            int: Number of bytes freed.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            entries = sorted(
+                (
+                    (path, entry.created, entry.leased)
+                    for path, entry in self._entries.items()
+                ),
+                key=lambda item: item[1],
+            )
+
+        freed = 0
+        live: list[tuple[str, bool, int]] = []
+        for path, created, leased in entries:
+            if not os.path.lexists(path):
+                self._forget(path)
+                continue
+            if (
+                leased
+                and self.orphan_age_seconds
+                and now - created > self.orphan_age_seconds
+            ):
+                logger.warning("Ignoring leaked lease on %s", path)
+                leased = False
+            size = _path_size(path)
+            expired = bool(self.ttl_seconds) and now - created > self.ttl_seconds
+            if expired and not leased and self._discard(path):
+                freed += size
+                self._stats.expired += 1
+                logger.info("Removed expired temporary artifact %s", path)
+                continue
+            live.append((path, leased, size))
+
+        total = sum(size for _, _, size in live)
+        if self.quota_bytes:
+            for path, leased, size in live:
+                if total <= self.quota_bytes:
+                    break
+                if leased:
+                    continue
+                if self._discard(path):
+                    freed += size
+                    total -= size
+                    self._stats.evicted += 1
+                    logger.info(
+                        "Evicted temporary artifact %s (%d bytes) to stay within "
+                        "the %d byte quota",
+                        path,
+                        size,
+                        self.quota_bytes,
+                    )
+
+        freed += self.sweep_orphans(now)
+        with self._lock:
+            self._stats.bytes_freed += freed
+            self._stats.tracked_bytes = total
+            self._stats.last_sweep = now
+        return freed
+
+    def sweep_orphans(self, now: float | None = None) -> int:
+        """Remove stale leftovers that are not tracked by this process.
+
+        Temp directories of running processes are skipped; see the module
+        docstring for the ages that apply.
+
+        Args:
+            now: Current time, for testing. Defaults to `time.time`.
+
+        Returns:
+            int: Number of bytes freed.
+        """
+        if not self.ttl_seconds:
+            return 0
+        now = time.time() if now is None else now
+        with self._lock:
+            tracked = set(self._entries)
+
+        # (path, minimum age)
+        candidates: list[tuple[str, float]] = []
+        temp_dir = self.temp_dir or tempfile.gettempdir()
+        for entry in _scan(temp_dir):
+            if not entry.name.startswith(TEMP_PREFIXES):
+                continue
+            pid = _owner_pid(entry.name)
+            if pid is None:
+                candidates.append((entry.path, self.orphan_age_seconds))
+            elif not _is_running(pid):
+                candidates.append((entry.path, self.ttl_seconds))
+        candidates.extend(
+            (entry.path, self.orphan_age_seconds)
+            for entry in _scan(self.upload_dir)
+            if _UPLOAD_NAME.match(entry.name)
+        )
+
+        freed = 0
+        for path, min_age in candidates:
+            if path in tracked:
+                continue
+            try:
+                age = now - os.lstat(path).st_mtime
+            except OSError:
+                continue
+            if age <= min_age:
+                continue
+            size = _path_size(path)
+            if _remove(path):
+                freed += size
+                with self._lock:
+                    self._stats.orphans_removed += 1
+                logger.info("Removed orphaned temporary artifact %s", path)
+        return freed
+
+    def stats(self) -> dict[str, Any]:
+        """Return usage and eviction counters.
+
+        Returns:
+            dict[str, Any]: A snapshot of `TempSpaceStats` fields.
+            ``tracked_bytes`` is measured at the last sweep.
+        """
+        with self._lock:
+            self._stats.tracked = len(self._entries)
+            self._stats.quota_bytes = self.quota_bytes
+            self._stats.ttl_seconds = self.ttl_seconds
+            return asdict(self._stats)
+
+    def start(self, interval: float | None = None) -> None:
+        """Sweep once, then keep sweeping on a daemon thread.
+
+        Calling `start` on a running manager does nothing.
+
+        Args:
+            interval: Seconds between sweeps. Defaults to
+                ``TEMP_SWEEP_INTERVAL_SECONDS``.
+        """
+        if interval is None:
+            interval = constants.TEMP_SWEEP_INTERVAL_SECONDS
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(max(1.0, float(interval)),),
+                name="temp-janitor",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop the background sweep.
+
+        Args:
+            timeout: Maximum seconds to wait for a running sweep.
+        """
+        self._stop.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self, interval: float) -> None:
+        """Background loop; the first sweep runs immediately."""
+        while True:
+            try:
+                self.sweep()
+            except Exception:  # noqa: BLE001 - the janitor must keep running
+                logger.exception("Temporary file sweep failed")
+            if self._stop.wait(interval):
+                return
+
+    def _discard(self, path: str) -> bool:
+        """Delete a tracked artifact and forget it.
+
+        Returns:
+            bool: True if the artifact is gone.
+        """
+        removed = _remove(path)
+        if removed:
+            self._forget(path)
+        return removed
+
+
+_MANAGER: TempSpaceManager | None = None
+_MANAGER_LOCK = threading.Lock()
+
+
+def get_temp_manager() -> TempSpaceManager:
+    """Return the process-wide temp-space manager, creating it on first use.
+
+    Returns:
+        TempSpaceManager: The shared manager.
+    """
+    global _MANAGER
+    with _MANAGER_LOCK:
+        if _MANAGER is None:
+            _MANAGER = TempSpaceManager()
+        return _MANAGER
+
+
+def track_temp_path(path: str | Path, lease: bool = True) -> str:
+    """Register ``path`` with the shared manager.
+
+    Args:
+        path: A temporary file or directory created by this package.
+        lease: Keep ``path`` until `release_temp_path` is called (see
+            `TempSpaceManager.track`).
+
+    Returns:
+        str: ``path`` as a string.
+    """
+    return get_temp_manager().track(path, lease=lease)
+
+
+def release_temp_path(path: str | Path) -> None:
+    """End the lease on ``path`` in the shared manager, if it was tracked.
+
+    Args:
+        path: A temporary file or directory its owner is done with.
+    """
+    manager = _MANAGER
+    if manager is not None:
+        manager.release(path)
+
+
+def stop_temp_janitor() -> None:
+    """Stop the shared manager's background sweep, if running."""
+    manager = _MANAGER
+    if manager is not None:
+        manager.stop()
+
+
+atexit.register(stop_temp_janitor)
@@ -0,0 +1,132 @@
+"""Cheap admission checks for uploaded audio.
+
+Uploads are checked before any decoding happens: the container format is
+sniffed from the first bytes, and the duration is read from the file headers
+(WAV and FLAC natively, other containers through ``ffprobe`` when
+``ffmpeg-python`` is installed). `FileHandler` uses these helpers to reject
+garbage or oversized uploads with 413/415 instead of failing deep inside the
+pipeline.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+
+try:  # pragma: no cover - optional dependency
+    import ffmpeg  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - handled gracefully
+    ffmpeg = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Bytes needed by `sniff_audio_format`.
+SNIFF_BYTES = 12
+
+
+def sniff_audio_format(head: bytes) -> str | None:
+    """Identify an audio or video container from its leading bytes.
+
+    Args:
+        head: At least the first `SNIFF_BYTES` bytes of the file.
+
+    Returns:
+        str | None: A container name ("wav", "flac", "mp3", "mp4", "ogg",
+        "matroska" or "avi"), or None if the signature is not recognized.
+    """
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "wav"
+    if head[:4] == b"RIFF" and head[8:12] == b"AVI ":
+        return "avi"
+    if head[:4] == b"fLaC":
+        return "flac"
+    if head[:3] == b"ID3" or (len(head) > 1 and head[0] == 0xFF and head[1] >= 0xE0):
+        return "mp3"
+    if head[4:8] == b"ftyp":
+        return "mp4"
+    if head[:4] == b"OggS":
+        return "ogg"
+    if head[:4] == b"\x1a\x45\xdf\xa3":
+        return "matroska"
+    return None
+
+
+def _wav_duration(path: str) -> float | None:
+    """Read the duration of a RIFF/WAVE file from its chunk headers.
+
+    Returns:
+        float | None: Duration in seconds, or None if the headers are invalid.
+    """
+    byte_rate = 0
+    with open(path, "rb") as handle:
+        handle.seek(12)
+        while True:
+            header = handle.read(8)
+            if len(header) < 8:
+                return None
+            chunk_id, size = header[:4], struct.unpack("<I", header[4:])[0]
+            if chunk_id == b"data":
+                if not byte_rate:
+                    return None
+                # Streamed WAVs leave the size unset; use what is on disk.
+                remaining = os.path.getsize(path) - handle.tell()
+                if size in (0, 0xFFFFFFFF) or size > remaining:
+                    size = remaining
+                return size / byte_rate
+            if chunk_id == b"fmt ":
+                fmt = handle.read(size)
+                if len(fmt) < 12:
+                    return None
+                byte_rate = struct.unpack("<I", fmt[8:12])[0]
+                handle.seek(size & 1, os.SEEK_CUR)  # chunks are word-aligned
+                continue
+            handle.seek(size + (size & 1), os.SEEK_CUR)
+
+
+def _flac_duration(path: str) -> float | None:
+    """Read the duration of a FLAC file from its STREAMINFO block.
+
+    Returns:
+        float | None: Duration in seconds, or None if it is not recorded.
+    """
+    with open(path, "rb") as handle:
+        head = handle.read(4 + 4 + 18)
+    if len(head) < 26 or head[4] & 0x7F != 0:  # STREAMINFO must come first
+        return None
+    info = int.from_bytes(head[18:26], "big")
+    sample_rate = info >> 44
+    total_samples = info & 0xFFFFFFFFF
+    if not sample_rate or not total_samples:
+        return None
+    return total_samples / sample_rate
+
+
+def probe_duration(path: str, container: str | None = None) -> float | None:
+    """Return the duration of an audio file without decoding it.
+
+    Args:
+        path: The file to inspect.
+        container: Container name from `sniff_audio_format`, if known.
+
+    Returns:
+        float | None: Duration in seconds, or None if it cannot be determined
+        from the headers.
+    """
+    try:
+        if container == "wav":
+            return _wav_duration(path)
+        if container == "flac":
+            return _flac_duration(path)
+    except (OSError, struct.error) as exc:
+        logger.debug("Header duration probe failed for %s: %s", path, exc)
+        return None
+
+    if ffmpeg is None:
+        return None
+    try:
+        info = ffmpeg.probe(path)
+        return float(info["format"]["duration"])
+    except (ffmpeg.Error, OSError, KeyError, TypeError, ValueError) as exc:
+        logger.debug("ffprobe could not determine duration of %s: %s", path, exc)
+        return None
@@ -15,6 +15,10 @@ from insanely_fast_whisper_rocm.webui.merge_handler import (
     get_merge_handler,
     merge_files,
 )
+from insanely_fast_whisper_rocm.webui.result_store import (
+    ResultStore,
+    get_session_store,
+)
 
 # Import main components for external use
 from insanely_fast_whisper_rocm.webui.ui import create_ui_components
@@ -44,4 +48,7 @@ __all__ = [
     "MergeResult",
     "get_merge_handler",
     "merge_files",
+    # Memoized renderings
+    "ResultStore",
+    "get_session_store",
 ]
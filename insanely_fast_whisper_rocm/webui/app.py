@@ -17,6 +17,7 @@ from insanely_fast_whisper_rocm.utils.constants import (
     DEFAULT_VAD_THRESHOLD,
 )
 from insanely_fast_whisper_rocm.utils.download_hf_model import download_model_if_needed
+from insanely_fast_whisper_rocm.utils.temp_space import get_temp_manager
 from insanely_fast_whisper_rocm.webui.ui import create_ui_components
 
 # Configure logger
@@ -115,6 +116,9 @@ def launch_webui(
         default_vad_threshold=vad_threshold,
     )
 
+    # Remove leftovers of earlier runs and keep temporary files bounded
+    get_temp_manager().start()
+
     # Launch the interface
     logger.info("Launching WebUI on %s:%s", host, port)
     iface.launch(
@@ -12,6 +12,7 @@ import logging
 import threading
 import time
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -21,6 +22,7 @@ import gradio as gr
 
 from insanely_fast_whisper_rocm.audio.processing import extract_audio_from_video
 from insanely_fast_whisper_rocm.core.asr_backend import HuggingFaceBackendConfig
+from insanely_fast_whisper_rocm.core.backend_cache import INFERENCE_LOCK
 from insanely_fast_whisper_rocm.core.cancellation import CancellationToken
 from insanely_fast_whisper_rocm.core.errors import (
     OutOfMemoryError,
@@ -31,6 +33,7 @@ from insanely_fast_whisper_rocm.core.formatters import FORMATTERS
 from insanely_fast_whisper_rocm.core.integrations.stable_ts import stabilize_timestamps
 from insanely_fast_whisper_rocm.core.orchestrator import create_orchestrator
 from insanely_fast_whisper_rocm.core.progress import ProgressCallback
+from insanely_fast_whisper_rocm.core.result_writer import wait_for_result
 from insanely_fast_whisper_rocm.utils import (
     DEFAULT_BATCH_SIZE,
     DEFAULT_DEMUCS,
@@ -42,6 +45,7 @@ from insanely_fast_whisper_rocm.utils import (
     DEFAULT_TRANSCRIPTS_DIR,
     DEFAULT_VAD,
     DEFAULT_VAD_THRESHOLD,
+    cleanup_temp_files,
     constants,
 )
 from insanely_fast_whisper_rocm.utils.filename_generator import (
@@ -49,6 +53,7 @@ from insanely_fast_whisper_rocm.utils.filename_generator import (
     StandardFilenameStrategy,
     TaskType,
 )
+from insanely_fast_whisper_rocm.webui.result_store import ResultStore
 from insanely_fast_whisper_rocm.webui.zip_creator import (
     BatchZipBuilder,
     ZipConfiguration,
@@ -95,17 +100,131 @@ class FileHandlingConfig:
     temp_uploads_dir: str = DEFAULT_TRANSCRIPTS_DIR
 
 
+class _BatchProgress:
+    """Thread-safe view of a Gradio tracker shared by concurrent batch files.
+
+    Files of a batch report progress from worker threads, and the loop that
+    collects their outcomes reports each finished file. Overall progress is
+    kept monotonic so updates from a file that started earlier but reports
+    later never move the bar backwards.
+    """
+
+    def __init__(self, tracker: gr.Progress) -> None:
+        """Wrap ``tracker``.
+
+        Args:
+            tracker: The Gradio progress tracker for the request.
+        """
+        self._tracker = tracker
+        self._lock = threading.Lock()
+        self._fraction = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        """bool: Whether the user cancelled the request."""
+        return bool(getattr(self._tracker, "cancelled", False))
+
+    def __call__(self, fraction: float | None, desc: str | None = None) -> None:
+        """Forward an update, clamping the fraction to never decrease.
+
+        Args:
+            fraction: Overall progress (0.0-1.0) or None for indeterminate.
+            desc: Progress description.
+        """
+        with self._lock:
+            if fraction is not None:
+                self._fraction = fraction = max(fraction, self._fraction)
+            self._tracker(fraction, desc=desc)
+
+
+class _TrackerCancellationToken(CancellationToken):
+    """Cancellation token that also observes the Gradio tracker's flag.
+
+    The token is checked by the pipeline, including while it waits for the
+    shared inference lock, where no progress update would notice a
+    cancellation from the UI.
+    """
+
+    def __init__(self, tracker: gr.Progress | None) -> None:
+        """Initialize the token.
+
+        Args:
+            tracker: The Gradio progress tracker of the request, if any.
+        """
+        super().__init__()
+        self._tracker = tracker
+
+    @property
+    def cancelled(self) -> bool:
+        """bool: Whether the token or the tracker was cancelled."""
+        if getattr(self._tracker, "cancelled", False):
+            self.cancel()
+        return super().cancelled
+
+
+# Batch download archives: key -> (filename suffix, formats, organize_by_format)
+_BATCH_ZIP_SPECS: dict[str, tuple[str, list[str], bool]] = {
+    "all": ("all_formats", ["txt", "srt", "json"], True),
+    "txt": ("txt_only", ["txt"], False),
+    "srt": ("srt_only", ["srt"], False),
+    "json": ("json_only", ["json"], False),
+}
+
+
+def _open_batch_zip_builders(
+    output_dir: Path, timestamp_str: str, result_store: ResultStore
+) -> dict[str, BatchZipBuilder]:
+    """Open the batch download archives before any file has finished.
+
+    Each successful result is appended with `BatchZipBuilder.add_file_async`
+    as soon as it is available, so finishing the batch only writes the
+    summaries and central directories. Archives that fail to open are left
+    out and reported as unavailable when the batch completes.
+
+    Args:
+        output_dir: Directory receiving the archives.
+        timestamp_str: Timestamp used as batch id and in the filenames.
+        result_store: Store of memoized renderings shared by all archives.
+
+    Returns:
+        dict[str, BatchZipBuilder]: Open builders keyed as in `_BATCH_ZIP_SPECS`.
+    """
+    builders: dict[str, BatchZipBuilder] = {}
+    for key, (suffix, _, organize_by_format) in _BATCH_ZIP_SPECS.items():
+        builder = BatchZipBuilder(
+            config=ZipConfiguration(
+                temp_dir=str(output_dir),
+                organize_by_format=organize_by_format,
+                include_summary=True,
+            ),
+            result_store=result_store,
+        )
+        try:
+            builder.create(
+                batch_id=timestamp_str,
+                filename=f"batch_archive_{timestamp_str}_{suffix}.zip",
+            )
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            logger.error("Failed to open %s ZIP for batch: %s", key, e)
+            continue
+        builders[key] = builder
+    return builders
+
+
 def _prepare_temp_downloadable_file(
     raw_data: dict[str, Any],
     format_type: str,  # "txt" or "srt"
     original_audio_stem: str,
     temp_dir: Path,
     task: TaskType,
+    result_store: ResultStore | None = None,
 ) -> str:
     """Generate and persist a temporary downloadable file for the WebUI.
 
     Generates content for TXT or SRT, saves it to a temporary file, and
-    returns the file path.
+    returns the file path. With a ``result_store``, the rendering is shared
+    with other exports and a file already written for the same result and
+    format is returned as is.
 
     Args:
         raw_data: The raw transcription result data.
@@ -113,6 +232,7 @@ def _prepare_temp_downloadable_file(
         original_audio_stem: Stem of the original audio file name.
         temp_dir: Directory to write the temporary file to.
         task: The task used for filename generation.
+        result_store: Optional store of memoized renderings and files.
 
     Returns:
         str: Absolute path to the generated temporary file.
@@ -121,11 +241,17 @@ def _prepare_temp_downloadable_file(
         ValueError: If a formatter for the given format is not available.
         OSError: If writing the temporary file fails.
     """
-    formatter = FORMATTERS.get(format_type)
-    if not formatter:
-        raise ValueError(f"No formatter available for type: {format_type}")
-
-    content = formatter.format(raw_data)
+    if result_store is not None:
+        cached_path = result_store.cached_file(raw_data, format_type)
+        if cached_path is not None:
+            logger.debug("Reusing download file: %s", cached_path)
+            return cached_path
+        content = result_store.render(raw_data, format_type)
+    else:
+        formatter = FORMATTERS.get(format_type)
+        if not formatter:
+            raise ValueError(f"No formatter available for type: {format_type}")
+        content = formatter.format(raw_data)
 
     # Use the global WEBUI_FILENAME_GENERATOR for consistent naming
     # Filename will be like: audio_stem_task_timestamp.format
@@ -147,12 +273,14 @@ def _prepare_temp_downloadable_file(
         with open(temp_file_path, "w", encoding="utf-8") as f:
             f.write(content)
         logger.info("Created temporary download file: %s", temp_file_path)
-        return str(temp_file_path)
     except OSError as e:
         logger.error(
             "Failed to create temporary download file %s: %s", temp_file_path, e
         )
         raise
+    if result_store is not None:
+        result_store.remember_file(raw_data, format_type, str(temp_file_path))
+    return str(temp_file_path)
 
 
 def _is_stabilization_corrupt(segments: list[dict]) -> bool:
@@ -244,6 +372,7 @@ def transcribe(
         TranscriptionError: If the transcription process fails
         TranscriptionCancelledError: If the transcription is cancelled by user
     """
+    temp_files: list[str] = []
     try:
         logger.info(
             "Starting transcription for file: %s (File %d/%d)",
@@ -253,7 +382,7 @@ def transcribe(
         )
         original_file_name_for_desc = Path(audio_file_path).name
 
-        cancellation_token = CancellationToken()
+        cancellation_token = _TrackerCancellationToken(progress_tracker_instance)
 
         def _ensure_not_cancelled() -> None:
             """Raise an exception if the transcription has been cancelled."""
@@ -266,7 +395,6 @@ def transcribe(
         _ensure_not_cancelled()
 
         # --- Video detection & audio extraction ---
-        temp_files: list[str] = []
         if Path(audio_file_path).suffix.lower() in constants.SUPPORTED_VIDEO_FORMATS:
             logger.info("Detected video input – extracting audio track…")
             try:
@@ -515,6 +643,10 @@ def transcribe(
                 warning_callback=_warning_callback,
                 save_transcriptions=file_config.save_transcriptions,
                 output_dir=file_config.temp_uploads_dir,
+                cancellation_token=cancellation_token,
+                # Other files of a concurrent batch, and API requests, share
+                # the model; audio conversion and splitting overlap with them.
+                inference_lock=INFERENCE_LOCK,
             )
         except OutOfMemoryError as oom:
             error_msg = (
@@ -680,6 +812,9 @@ def transcribe(
     except Exception as e:
         logger.error("Error during transcription: %s", str(e))
         raise TranscriptionError(f"Transcription failed: {str(e)}") from e
+    finally:
+        # Also ends the extracted audio's lease (see `TempSpaceManager`)
+        cleanup_temp_files(temp_files)
 
 
 def process_transcription_request(  # pylint: disable=too-many-locals, too-many-statements, too-many-branches
@@ -687,6 +822,7 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
     transcription_config: TranscriptionConfig,
     file_handling_config: FileHandlingConfig,
     progress_tracker: gr.Progress | None = None,
+    result_store: ResultStore | None = None,
 ) -> tuple[
     str, Any, Any, dict[str, Any], dict[str, Any], dict[str, Any], dict[str, Any]
 ]:
@@ -700,6 +836,10 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
         transcription_config: Configuration for transcription.
         file_handling_config: Configuration for file handling.
         progress_tracker: Optional progress tracker for real-time progress updates.
+        result_store: Store of memoized renderings for the user's session.
+            Every export of a result (display text, downloads, ZIPs) renders
+            each format once through it. A request-local store is used if
+            omitted.
 
     Returns:
         Tuple of Gradio UI component updates for transcription output, JSON output,
@@ -711,6 +851,8 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
     """
     all_results_data = []
     processed_files_summary = []
+    if result_store is None:
+        result_store = ResultStore()
 
     # Initialize default Gradio button updates (hidden) early so error paths can
     # safely reference them.
@@ -723,6 +865,42 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
     num_files = len(audio_paths)
     current_task_type = TaskType(transcription_config.task)  # For filename generator
 
+    # Common configuration timestamp for all zip files
+    timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+    batch_zips: dict[str, BatchZipBuilder] = (
+        _open_batch_zip_builders(output_base_dir, timestamp_str, result_store)
+        if num_files > 1
+        else {}
+    )
+
+    # Multi-file batches run up to WEBUI_BATCH_CONCURRENCY files at once:
+    # decoding is serialized by the shared INFERENCE_LOCK, while audio
+    # preparation and stabilization of other files overlap with it.
+    # Outcomes are still consumed below in upload order.
+    concurrency = max(1, min(constants.WEBUI_BATCH_CONCURRENCY, num_files))
+    executor: ThreadPoolExecutor | None = None
+    pending: list[Future[dict[str, Any]]] = []
+    # Workers and this loop report through one monotonic view of the tracker
+    shared_tracker = (
+        _BatchProgress(progress_tracker) if progress_tracker is not None else None
+    )
+    if concurrency > 1:
+        executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="webui-batch"
+        )
+        pending = [
+            executor.submit(
+                transcribe,
+                str(Path(path)),
+                transcription_config,
+                file_handling_config,
+                progress_tracker_instance=shared_tracker,
+                current_file_idx=idx,
+                total_files_for_session=num_files,
+            )
+            for idx, path in enumerate(audio_paths)
+        ]
+
     for idx, audio_file_path_str in enumerate(audio_paths):
         audio_file_path = Path(audio_file_path_str)
         file_name_for_log = audio_file_path.name
@@ -731,15 +909,18 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
         # based on current_file_idx and total_files_for_session.
 
         try:
-            # Pass the main progress tracker to the transcribe function
-            result_dict = transcribe(
-                str(audio_file_path),
-                transcription_config,
-                file_handling_config,
-                progress_tracker_instance=progress_tracker,
-                current_file_idx=idx,
-                total_files_for_session=num_files,
-            )
+            if executor is not None:
+                result_dict = pending[idx].result()
+            else:
+                # Pass the main progress tracker to the transcribe function
+                result_dict = transcribe(
+                    str(audio_file_path),
+                    transcription_config,
+                    file_handling_config,
+                    progress_tracker_instance=shared_tracker,
+                    current_file_idx=idx,
+                    total_files_for_session=num_files,
+                )
 
             # The asr_pipeline.process() returns the transcription data directly.
             # Stabilization is performed inside transcribe() when enabled, so we
@@ -747,6 +928,12 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
             raw_transcription_result = result_dict
             # This is the path to the JSON file saved by the pipeline
             json_file_path_from_pipeline = result_dict.get("output_file_path")
+            # The pipeline may still be writing it in the background; it is
+            # offered for download below, so it has to exist on disk first.
+            if json_file_path_from_pipeline and not wait_for_result(
+                json_file_path_from_pipeline
+            ):
+                json_file_path_from_pipeline = None
 
             if (
                 not json_file_path_from_pipeline
@@ -789,9 +976,16 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
             processed_files_summary.append(
                 f"{file_name_for_log}: Transcribed successfully."
             )
+            # Compress this file's entries while the next file transcribes
+            for key, builder in batch_zips.items():
+                builder.add_file_async(
+                    str(audio_file_path),
+                    raw_transcription_result,
+                    _BATCH_ZIP_SPECS[key][1],
+                )
 
-            if progress_tracker is not None:
-                progress_tracker(
+            if shared_tracker is not None:
+                shared_tracker(
                     (idx + 1) / num_files,
                     desc=f"Completed file {idx + 1}/{num_files}: {file_name_for_log}",
                 )
@@ -801,6 +995,12 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
                 "Transcription cancelled by user during processing of %s",
                 file_name_for_log,
             )
+            if executor is not None:
+                # Drop files that have not started; running ones observe the
+                # cancelled tracker and stop at their next checkpoint.
+                executor.shutdown(wait=True, cancel_futures=True)
+            for builder in batch_zips.values():
+                builder.discard()
             raise
         except TranscriptionError as e:
             logger.error("Error transcribing %s: %s", file_name_for_log, e)
@@ -809,8 +1009,8 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
                 "audio_original_path": str(audio_file_path),
                 "error": str(e),
             })
-            if progress_tracker is not None:
-                progress_tracker(
+            if shared_tracker is not None:
+                shared_tracker(
                     (idx + 1) / num_files,
                     desc=(
                         f"Error processing file {idx + 1}/{num_files}: "
@@ -852,8 +1052,8 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
                 "audio_original_path": str(audio_file_path),
                 "error": str(e),
             })
-            if progress_tracker is not None:
-                progress_tracker(
+            if shared_tracker is not None:
+                shared_tracker(
                     (idx + 1) / num_files,
                     desc=(
                         f"Critical error file {idx + 1}/{num_files}: "
@@ -882,6 +1082,9 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
                 dl_btn_hidden_update,  # json_btn_update
             )
 
+    if executor is not None:
+        executor.shutdown(wait=True)
+
     if not all_results_data:
         return (
             "No files processed.",
@@ -901,6 +1104,8 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
     successful_results = [res for res in all_results_data if "error" not in res]
 
     if not successful_results:
+        for builder in batch_zips.values():
+            builder.discard()
         error_summary_msg = "\n".join(processed_files_summary)
         transcription_output_val = (
             f"All {num_files} files failed to process.\nDetails:\n{error_summary_msg}"
@@ -920,17 +1125,11 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
             dl_btn_hidden_update,
         )
 
-    # Common configuration timestamp for all zip files
-    timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-
     if num_files == 1:
         first_success = successful_results[0]
-        # Use FORMATTERS for display text
-        display_txt_formatter = FORMATTERS.get("txt")
-        transcription_output_val = (
-            display_txt_formatter.format(first_success["raw_result"])
-            if display_txt_formatter
-            else "Could not format text output."
+        # Display text is memoized and reused by the TXT download and ZIP
+        transcription_output_val = result_store.render(
+            first_success["raw_result"], "txt"
         )
         json_output_val = _build_ui_json_summary(
             first_success["raw_result"],
@@ -947,6 +1146,7 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
                     first_success["audio_original_stem"],
                     output_base_dir,
                     current_task_type,
+                    result_store=result_store,
                 ),
                 visible=True,
                 interactive=True,
@@ -963,6 +1163,7 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
                     first_success["audio_original_stem"],
                     output_base_dir,
                     current_task_type,
+                    result_store=result_store,
                 ),
                 visible=True,
                 interactive=True,
@@ -972,9 +1173,20 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
             srt_btn_update = dl_btn_hidden_update
 
         try:
-            # JSON button points to the already saved pipeline JSON
+            # Reuse the pipeline's JSON file when it holds just this result;
+            # SQLite archives and compressed files are rendered instead.
+            json_download = first_success.get("json_file_path")
+            if not json_download or Path(json_download).suffix.lower() != ".json":
+                json_download = _prepare_temp_downloadable_file(
+                    first_success["raw_result"],
+                    "json",
+                    first_success["audio_original_stem"],
+                    output_base_dir,
+                    current_task_type,
+                    result_store=result_store,
+                )
             json_btn_update = gr.update(
-                value=first_success["json_file_path"],
+                value=json_download,
                 visible=True,
                 interactive=True,
             )
@@ -989,7 +1201,9 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
                 organize_by_format=False,
                 include_summary=False,
             )
-            single_zip_builder = BatchZipBuilder(config=single_zip_config)
+            single_zip_builder = BatchZipBuilder(
+                config=single_zip_config, result_store=result_store
+            )
             # Use original audio stem for a more descriptive ZIP name
             zip_filename = (
                 f"{first_success['audio_original_stem']}_ALL_{timestamp_str}.zip"
@@ -1091,23 +1305,8 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
 
         # 1. Download All (ZIP) - contains txt, srt, json, organized by format
         try:
-            all_zip_config = ZipConfiguration(
-                temp_dir=str(output_base_dir),
-                organize_by_format=True,
-                include_summary=True,
-            )  # Enable summary for main zip
-            all_zip_builder = BatchZipBuilder(config=all_zip_config)
-            all_zip_filename = f"batch_archive_{timestamp_str}_all_formats.zip"
-            all_zip_builder.create(batch_id=timestamp_str, filename=all_zip_filename)
-            all_zip_builder.add_batch_files(
-                {
-                    res["audio_original_path"]: res["raw_result"]
-                    for res in successful_results
-                },
-                formats=["txt", "srt", "json"],
-            )
-
-            all_zip_path, _ = all_zip_builder.build()  # build() adds summary
+            # Entries were added as files finished; build() adds the summary
+            all_zip_path, _ = batch_zips["all"].build()
 
             zip_btn_update = gr.update(
                 value=all_zip_path,  # Use the returned path
@@ -1136,23 +1335,7 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
 
         if txt_files_exist:
             try:
-                txt_zip_config = ZipConfiguration(
-                    temp_dir=str(output_base_dir), organize_by_format=False
-                )  # Flat for single type
-                txt_zip_builder = BatchZipBuilder(config=txt_zip_config)
-                txt_zip_filename = f"batch_archive_{timestamp_str}_txt_only.zip"
-                txt_zip_builder.create(
-                    batch_id=timestamp_str, filename=txt_zip_filename
-                )
-                txt_zip_builder.add_batch_files(
-                    {
-                        res["audio_original_path"]: res["raw_result"]
-                        for res in successful_results
-                    },
-                    formats=["txt"],
-                )
-
-                txt_zip_path, _ = txt_zip_builder.build()  # build() adds summary
+                txt_zip_path, _ = batch_zips["txt"].build()
                 txt_btn_update = gr.update(
                     value=txt_zip_path,
                     visible=True,
@@ -1180,23 +1363,7 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
 
         if srt_files_exist:
             try:
-                srt_zip_config = ZipConfiguration(
-                    temp_dir=str(output_base_dir), organize_by_format=False
-                )
-                srt_zip_builder = BatchZipBuilder(config=srt_zip_config)
-                srt_zip_filename = f"batch_archive_{timestamp_str}_srt_only.zip"
-                srt_zip_builder.create(
-                    batch_id=timestamp_str, filename=srt_zip_filename
-                )
-                srt_zip_builder.add_batch_files(
-                    {
-                        res["audio_original_path"]: res["raw_result"]
-                        for res in successful_results
-                    },
-                    formats=["srt"],
-                )
-
-                srt_zip_path, _ = srt_zip_builder.build()  # build() adds summary
+                srt_zip_path, _ = batch_zips["srt"].build()
                 srt_btn_update = gr.update(
                     value=srt_zip_path,
                     visible=True,
@@ -1227,23 +1394,7 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
 
         if json_files_exist:
             try:
-                json_zip_config = ZipConfiguration(
-                    temp_dir=str(output_base_dir), organize_by_format=False
-                )
-                json_zip_builder = BatchZipBuilder(config=json_zip_config)
-                json_zip_filename = f"batch_archive_{timestamp_str}_json_only.zip"
-                json_zip_builder.create(
-                    batch_id=timestamp_str, filename=json_zip_filename
-                )
-                json_zip_builder.add_batch_files(
-                    {
-                        res["audio_original_path"]: res["raw_result"]
-                        for res in successful_results
-                    },
-                    formats=["json"],
-                )
-
-                json_zip_path, _ = json_zip_builder.build()  # build() adds summary
+                json_zip_path, _ = batch_zips["json"].build()
                 json_btn_update = gr.update(
                     value=json_zip_path,
                     visible=True,
@@ -1275,9 +1426,9 @@ def process_transcription_request(  # pylint: disable=too-many-locals, too-many-
         raw_result_state_val = None
         # All buttons remain hidden (dl_btn_hidden)
 
-    if progress_tracker is not None:
+    if shared_tracker is not None:
         # Final update to 100% if all files processed (or attempted)
-        progress_tracker(1.0, desc="Done")
+        shared_tracker(1.0, desc="Done")
 
     logger.info(
         "WebUI response summary: transcription_text_len=%s json_keys=%s state=%s ",
@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from insanely_fast_whisper_rocm.core.formatters import FORMATTERS
+from insanely_fast_whisper_rocm.webui.result_store import ResultStore
 
 # Configure logger
 logger = logging.getLogger("insanely_fast_whisper_rocm.webui.merge_handler")
@@ -43,14 +43,21 @@ class MergeResult:
 class MergeHandler(ABC):
     """Abstract base class for format-specific merge handlers."""
 
-    def __init__(self, config: MergeConfiguration | None = None) -> None:
+    def __init__(
+        self,
+        config: MergeConfiguration | None = None,
+        result_store: ResultStore | None = None,
+    ) -> None:
         """Initialize the merge handler.
 
         Args:
             config: Optional merge configuration. If not provided, a default
                 configuration is used.
+            result_store: Optional store of memoized renderings; per-file
+                content already rendered for a download or ZIP is reused.
         """
         self.config = config or MergeConfiguration()
+        self.result_store = result_store if result_store is not None else ResultStore()
         self.warnings = []
 
     def merge_files(self, file_results: dict[str, dict[str, Any]]) -> MergeResult:
@@ -249,7 +256,7 @@ class TxtMerger(MergeHandler):
         Returns:
             The formatted TXT content string.
         """
-        return FORMATTERS["txt"].format(result_data).strip()
+        return self.result_store.render(result_data, "txt").strip()
 
     def get_format_name(self) -> str:
         """Return the human-readable format name handled by this merger.
@@ -263,13 +270,18 @@ class TxtMerger(MergeHandler):
 class SrtMerger(MergeHandler):
     """Merge handler for SRT format."""
 
-    def __init__(self, config: MergeConfiguration | None = None) -> None:
+    def __init__(
+        self,
+        config: MergeConfiguration | None = None,
+        result_store: ResultStore | None = None,
+    ) -> None:
         """Initialize the SRT merger.
 
         Args:
             config: Optional merge configuration.
+            result_store: Optional store of memoized renderings.
         """
-        super().__init__(config)
+        super().__init__(config, result_store)
         self.entry_counter = 1
 
     def _is_valid_file_result(self, result_data: dict[str, Any]) -> bool:
@@ -294,7 +306,7 @@ class SrtMerger(MergeHandler):
         Returns:
             The formatted SRT content with renumbered entries.
         """
-        srt_content = FORMATTERS["srt"].format(result_data)
+        srt_content = self.result_store.render(result_data, "srt")
         return self._renumber_srt(srt_content)
 
     def _renumber_srt(self, content: str) -> str:
@@ -362,7 +374,7 @@ class VttMerger(MergeHandler):
         Returns:
             The formatted VTT content string.
         """
-        return FORMATTERS["vtt"].format(result_data)
+        return self.result_store.render(result_data, "vtt")
 
     def _finalize_content(self, content: str) -> str:
         """Finalize VTT content with WEBVTT header.
@@ -393,13 +405,16 @@ MERGE_HANDLERS = {
 
 
 def get_merge_handler(
-    format_type: str, config: MergeConfiguration | None = None
+    format_type: str,
+    config: MergeConfiguration | None = None,
+    result_store: ResultStore | None = None,
 ) -> MergeHandler:
     """Get merge handler for format.
 
     Args:
         format_type: One of "txt", "srt", or "vtt".
         config: Optional merge configuration.
+        result_store: Optional store of memoized renderings.
 
     Returns:
         MergeHandler: A handler instance for the requested format.
@@ -411,20 +426,23 @@ def get_merge_handler(
     if not handler_class:
         available = list(MERGE_HANDLERS.keys())
         raise ValueError(f"Unsupported format: {format_type}. Available: {available}")
-    return handler_class(config)
+    return handler_class(config, result_store)
 
 
 def merge_files(
-    file_results: dict[str, dict[str, Any]], format_type: str
+    file_results: dict[str, dict[str, Any]],
+    format_type: str,
+    result_store: ResultStore | None = None,
 ) -> MergeResult:
     """Convenience function to merge files.
 
     Args:
         file_results: Mapping of file paths to result data.
         format_type: Target format for merge ("txt", "srt", or "vtt").
+        result_store: Optional store of memoized renderings to reuse.
 
     Returns:
         MergeResult: The result including merged content and stats.
     """
-    merger = get_merge_handler(format_type)
+    merger = get_merge_handler(format_type, result_store=result_store)
     return merger.merge_files(file_results)
@@ -0,0 +1,273 @@
+"""Per-session memo of rendered transcription results for the WebUI.
+
+After a run the WebUI exports the same raw results several times: the
+on-screen text, the TXT/SRT download buttons, and one or more ZIP archives
+and merged files. `ResultStore` keeps each raw result together with a shared
+`RenderPlan` and its formatted output per format, so every consumer after the
+first reuses the rendering instead of formatting the result again.
+
+Stores are bounded LRUs sized in approximate characters held by each raw
+result, its render plan and its renderings, and one store is kept per Gradio
+session (see `get_session_store`), so long-lived sessions cannot
+grow memory without bound.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from insanely_fast_whisper_rocm.core.formatters import FORMATTERS, RenderPlan
+from insanely_fast_whisper_rocm.utils import constants
+
+logger = logging.getLogger(__name__)
+
+# Rough cost of one Python number or container next to its text, in characters
+_VALUE_OVERHEAD = 64
+
+
+def _approx_chars(value: Any) -> int:  # noqa: ANN401
+    """Estimate the memory held by a raw result value.
+
+    Returns:
+        int: Text length plus `_VALUE_OVERHEAD` per number and container.
+    """
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return _VALUE_OVERHEAD + sum(
+            len(str(key)) + _approx_chars(item) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return _VALUE_OVERHEAD + sum(_approx_chars(item) for item in value)
+    return _VALUE_OVERHEAD
+
+
+@dataclass
+class _Entry:
+    """Cached renderings of one raw result."""
+
+    result: dict[str, Any]
+    plan: RenderPlan
+    # Raw result plus its plan, which holds a word or segment per chunk
+    base_size: int
+    renderings: dict[str, str] = field(default_factory=dict)
+    # format -> path of a download file already written for this result
+    files: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """int: Approximate memory held by the entry, in characters."""
+        return self.base_size + sum(len(text) for text in self.renderings.values())
+
+
+@dataclass
+class ResultStoreStats:
+    """Hit/miss counters of a `ResultStore`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class ResultStore:
+    """Size-bounded LRU of raw results and their memoized renderings.
+
+    Results are keyed by identity: a store entry holds a reference to the raw
+    result dict, so its ``id`` cannot be reused while the entry is cached.
+    Results must not be mutated after they are first rendered.
+    """
+
+    # Backstop for many tiny results; the character budget binds first
+    MAX_ENTRIES = 256
+
+    def __init__(self, max_chars: int | None = None) -> None:
+        """Initialize the store.
+
+        Args:
+            max_chars: Upper bound for the cached results, plans and
+                renderings, in approximate characters.
+                Defaults to ``WEBUI_RESULT_CACHE_MB`` mebibytes.
+        """
+        if max_chars is None:
+            max_chars = constants.WEBUI_RESULT_CACHE_MB * 1024 * 1024
+        self.max_chars = max(0, max_chars)
+        self.stats = ResultStoreStats()
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached results.
+
+        Returns:
+            int: Number of results currently held.
+        """
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """int: Approximate characters currently held by cached entries."""
+        with self._lock:
+            return self._size
+
+    def plan_for(self, result: dict[str, Any]) -> RenderPlan:
+        """Return the shared `RenderPlan` for ``result``.
+
+        Args:
+            result: The raw transcription result.
+
+        Returns:
+            RenderPlan: A plan reused by every rendering of ``result``.
+        """
+        with self._lock:
+            return self._entry(result).plan
+
+    def render(self, result: dict[str, Any], format_type: str) -> str:
+        """Return ``result`` formatted as ``format_type``, rendering it once.
+
+        Args:
+            result: The raw transcription result.
+            format_type: A key of `FORMATTERS` (e.g. "txt", "srt", "json").
+
+        Returns:
+            str: The formatted content.
+
+        Raises:
+            ValueError: If no formatter exists for ``format_type``.
+        """
+        formatter = FORMATTERS.get(format_type)
+        if not formatter:
+            raise ValueError(f"No formatter available for type: {format_type}")
+        with self._lock:
+            entry = self._entry(result)
+            cached = entry.renderings.get(format_type)
+            if cached is not None:
+                self.stats.hits += 1
+                return cached
+            self.stats.misses += 1
+            plan = entry.plan
+
+        # Format outside the lock; a concurrent duplicate render is harmless.
+        content = formatter.format(result, plan=plan)
+        with self._lock:
+            entry = self._entries.get(id(result))
+            if entry is not None and entry.result is result:
+                if format_type not in entry.renderings:
+                    entry.renderings[format_type] = content
+                    self._size += len(content)
+                self._evict()
+        return content
+
+    def cached_file(self, result: dict[str, Any], format_type: str) -> str | None:
+        """Return a download file previously recorded for ``result``.
+
+        Args:
+            result: The raw transcription result.
+            format_type: Format of the file.
+
+        Returns:
+            str | None: The path if it was recorded and still exists.
+        """
+        with self._lock:
+            entry = self._entries.get(id(result))
+            if entry is None or entry.result is not result:
+                return None
+            path = entry.files.get(format_type)
+        if path and os.path.exists(path):
+            return path
+        return None
+
+    def remember_file(
+        self, result: dict[str, Any], format_type: str, path: str
+    ) -> None:
+        """Record a download file written for ``result``.
+
+        Args:
+            result: The raw transcription result.
+            format_type: Format of the file.
+            path: Location of the written file.
+        """
+        with self._lock:
+            self._entry(result).files[format_type] = path
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _entry(self, result: dict[str, Any]) -> _Entry:
+        """Return the entry for ``result``, creating it as most recent.
+
+        Must be called with the lock held.
+
+        Args:
+            result: The raw transcription result.
+
+        Returns:
+            _Entry: The cache entry for ``result``.
+        """
+        key = id(result)
+        entry = self._entries.get(key)
+        if entry is None or entry.result is not result:
+            if entry is not None:
+                self._size -= entry.size
+            entry = _Entry(
+                result=result,
+                plan=RenderPlan(result),
+                base_size=2 * _approx_chars(result),
+            )
+            self._entries[key] = entry
+            self._size += entry.base_size
+        self._entries.move_to_end(key)
+        # A result larger than the whole budget is rendered but not kept
+        self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the bounds hold.
+
+        Must be called with the lock held.
+        """
+        while self._entries and (
+            self._size > self.max_chars or len(self._entries) > self.MAX_ENTRIES
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+            self.stats.evictions += 1
+            logger.debug("Evicted cached result (%d chars)", entry.size)
+
+
+_SESSION_STORES: OrderedDict[str, ResultStore] = OrderedDict()
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session_store(session_id: str | None) -> ResultStore:
+    """Return the result store of a Gradio session.
+
+    At most ``WEBUI_RESULT_CACHE_SESSIONS`` stores are kept; the least recently
+    used session loses its store first.
+
+    Args:
+        session_id: The Gradio ``session_hash``, or None when unknown.
+
+    Returns:
+        ResultStore: The session's store, or a fresh unshared store when
+        ``session_id`` is None.
+    """
+    if session_id is None:
+        return ResultStore()
+    with _SESSION_LOCK:
+        store = _SESSION_STORES.get(session_id)
+        if store is None:
+            store = _SESSION_STORES[session_id] = ResultStore()
+        _SESSION_STORES.move_to_end(session_id)
+        while len(_SESSION_STORES) > max(1, constants.WEBUI_RESULT_CACHE_SESSIONS):
+            _SESSION_STORES.popitem(last=False)
+        return store
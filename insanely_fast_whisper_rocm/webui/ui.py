@@ -24,6 +24,7 @@ from insanely_fast_whisper_rocm.webui.handlers import (
     TranscriptionConfig,
     process_transcription_request,
 )
+from insanely_fast_whisper_rocm.webui.result_store import get_session_store
 
 # Configure logger
 logger = logging.getLogger("insanely_fast_whisper_rocm.webui.ui")
@@ -59,10 +60,13 @@ def _create_processing_options_ui() -> tuple[gr.Dropdown, gr.Slider]:
     """
     with gr.Accordion("Processing Options", open=False):
         dtype = gr.Dropdown(
-            choices=["float16", "float32"],
+            choices=["float16", "float32", "int8"],
             value="float16",
             label="Precision",
-            info="Lower precision (float16) is faster but may be less accurate",
+            info=(
+                "Lower precision (float16) is faster but may be less accurate; "
+                "int8 is for CPU inference only"
+            ),
         )
         chunk_length = gr.Slider(
             minimum=10,
@@ -172,10 +176,14 @@ def _process_transcription_request_wrapper(
     vad_threshold: float,
     save_transcriptions: bool,
     temp_uploads_dir: str,
+    request: gr.Request | None = None,
     progress: gr.Progress | None = None,
 ) -> tuple[object, ...]:
     """Wrapper to adapt Gradio inputs to process_transcription_request.
 
+    Gradio injects ``request``; its session hash selects the session's
+    memoized result store.
+
     Returns:
         tuple: The outputs expected by the Gradio click handler (text,
         JSON, state, and download button updates).
@@ -207,6 +215,7 @@ def _process_transcription_request_wrapper(
         transcription_config=transcription_cfg,
         file_handling_config=file_handling_cfg,
         progress_tracker=progress,
+        result_store=get_session_store(getattr(request, "session_hash", None)),
     )
 
 
@@ -16,6 +16,7 @@ import torch
 from insanely_fast_whisper_rocm.core.utils import (
     convert_device_string as core_convert_device_string,
 )
+from insanely_fast_whisper_rocm.utils.temp_space import temp_prefix, track_temp_path
 
 # Configure logger
 logger = logging.getLogger("insanely_fast_whisper_rocm.webui.utils")
@@ -53,12 +54,15 @@ def save_temp_file(
         else:
             # Original behavior: generate a random filename
             suffix = f".{extension}" if extension else ""
-            fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix="ifw_export_")
+            fd, temp_path = tempfile.mkstemp(
+                suffix=suffix, prefix=temp_prefix("ifw_export_")
+            )
             with os.fdopen(fd, "w", encoding="utf-8") as tmp:
                 tmp.write(content)
 
         logger.debug("[save_temp_file] Temp file created at: %s", temp_path)
-        return temp_path
+        # Handed to Gradio for download; only the TTL bounds its lifetime
+        return track_temp_path(temp_path, lease=False)
     except OSError as e:
         logger.error("[save_temp_file] Failed to save temp file: %s", e)
         raise
@@ -12,6 +12,7 @@ import re
 import tempfile
 import unicodedata
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -19,17 +20,33 @@ from types import TracebackType
 from typing import Any
 
 from insanely_fast_whisper_rocm.core.formatters import FORMATTERS
+from insanely_fast_whisper_rocm.utils import constants
+from insanely_fast_whisper_rocm.webui.result_store import ResultStore
 
 # Configure logger
 logger = logging.getLogger("insanely_fast_whisper_rocm.webui.zip_creator")
 
 
+def _default_compression_method() -> int:
+    """Return the ZIP method selected by ``WEBUI_ZIP_STORE_ONLY``.
+
+    Returns:
+        int: ``zipfile.ZIP_STORED`` in store-only mode, else ``ZIP_DEFLATED``.
+    """
+    return (
+        zipfile.ZIP_STORED if constants.WEBUI_ZIP_STORE_ONLY else zipfile.ZIP_DEFLATED
+    )
+
+
 @dataclass
 class ZipConfiguration:
     """Configuration for ZIP archive creation."""
 
-    compression_method: int = zipfile.ZIP_DEFLATED
-    compression_level: int | None = None  # None for default
+    compression_method: int = field(default_factory=_default_compression_method)
+    # Ignored for ZIP_STORED; None uses the zlib default
+    compression_level: int | None = field(
+        default_factory=lambda: constants.WEBUI_ZIP_COMPRESSION_LEVEL
+    )
     include_summary: bool = True
     include_merged: bool = False
     organize_by_format: bool = True
@@ -56,15 +73,27 @@ class BatchZipBuilder:
 
     Uses Builder Pattern to incrementally construct ZIP archives with flexible
     organization strategies and comprehensive error handling.
+
+    Results can be appended while a batch is still running with
+    `add_file_async`: each file is rendered and compressed on a single
+    background thread, so `build` only has to write the summary and the
+    central directory.
     """
 
-    def __init__(self, config: ZipConfiguration | None = None) -> None:
+    def __init__(
+        self,
+        config: ZipConfiguration | None = None,
+        result_store: ResultStore | None = None,
+    ) -> None:
         """Initialize the ZIP builder.
 
         Args:
             config: ZIP configuration options.
+            result_store: Store of memoized renderings shared with other
+                exports of the same results. A private store is used if omitted.
         """
         self.config = config or ZipConfiguration()
+        self.result_store = result_store if result_store is not None else ResultStore()
         self.stats = ZipStats()
 
         # Builder state
@@ -80,6 +109,9 @@ class BatchZipBuilder:
         ] = {}  # file_path -> result_data
         self._merged_content: dict[str, str] = {}  # format -> merged_content
         self._custom_files: list[tuple] = []  # [(archive_path, content)]
+        # Single worker so archive entries are written one at a time, in order
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: list[Future[None]] = []
 
         logger.debug("Initialized BatchZipBuilder with config: %s", self.config)
 
@@ -148,9 +180,69 @@ class BatchZipBuilder:
         if not self._is_open:
             raise RuntimeError("ZIP archive is not open")
         assert self._zipfile is not None, "ZIP file not initialized"
+        self.wait_pending()
 
         self._individual_files.update(file_results)
+        self._write_entries(file_results, formats)
+        logger.info(
+            "Added %d batch files in %d formats", len(file_results), len(formats)
+        )
+        return self
+
+    def add_file_async(
+        self, file_path: str, result_data: dict[str, Any], formats: list[str]
+    ) -> Future[None]:
+        """Render and append one result on the background thread.
+
+        Call this as each file of a batch finishes; `build` waits for all
+        queued files before finalizing the archive. Failures are recorded in
+        ``stats.errors`` and re-raised from the returned future.
+
+        Args:
+            file_path: Source file path used to name the archive entries.
+            result_data: Transcription result for ``file_path``.
+            formats: List of formats to include.
+
+        Returns:
+            Future[None]: Completes once the entries are in the archive.
 
+        Raises:
+            RuntimeError: If the ZIP archive is not open.
+        """
+        if not self._is_open:
+            raise RuntimeError("ZIP archive is not open")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="zip-builder"
+            )
+        self._individual_files[file_path] = result_data
+        future = self._executor.submit(
+            self._write_entries, {file_path: result_data}, formats
+        )
+        self._pending.append(future)
+        return future
+
+    def wait_pending(self) -> None:
+        """Block until every file queued with `add_file_async` is written."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result()
+            except Exception:  # noqa: BLE001 - already recorded in stats.errors
+                pass
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _write_entries(
+        self, file_results: dict[str, dict[str, Any]], formats: list[str]
+    ) -> None:
+        """Render ``file_results`` and write them using the configured layout.
+
+        Args:
+            file_results: Dictionary of ``file_path -> transcription_result``.
+            formats: List of formats to include.
+        """
         try:
             if self.config.organize_by_format:
                 self._add_files_by_format(file_results, formats)
@@ -158,12 +250,6 @@ class BatchZipBuilder:
                 self._add_files_by_source(file_results, formats)
             else:
                 self._add_files_flat(file_results, formats)
-
-            logger.info(
-                "Added %d batch files in %d formats", len(file_results), len(formats)
-            )
-            return self
-
         except Exception as e:
             error_msg = "Failed to add batch files: %s"
             logger.error(error_msg, str(e))
@@ -193,6 +279,8 @@ class BatchZipBuilder:
             raise RuntimeError("ZIP archive is not open")
         assert self._zipfile is not None, "ZIP file not initialized"
 
+        self.wait_pending()
+
         try:
             merged_base = merged_filename or f"batch_merged_{self._batch_id}"
 
@@ -234,6 +322,8 @@ class BatchZipBuilder:
             raise RuntimeError("ZIP archive is not open")
         assert self._zipfile is not None, "ZIP file not initialized"
 
+        self.wait_pending()
+
         try:
             self._zipfile.writestr(archive_path, content)
             self._track_addition(archive_path, len(content.encode("utf-8")))
@@ -266,6 +356,7 @@ class BatchZipBuilder:
 
         if not self.config.include_summary:
             return self
+        self.wait_pending()
 
         try:
             summary = self._generate_summary(include_stats)
@@ -299,6 +390,9 @@ class BatchZipBuilder:
             raise RuntimeError("ZIP archive is not open")
 
         try:
+            # Entries queued with add_file_async are already compressed; only
+            # the summary and the central directory remain to be written.
+            self.wait_pending()
             # Add summary automatically if enabled
             if self.config.include_summary:
                 self.add_summary(include_stats=True)
@@ -664,10 +758,10 @@ class BatchZipBuilder:
         Raises:
             ValueError: If the requested ``format_type`` is unknown.
         """
-        formatter = FORMATTERS.get(format_type)
-        if not formatter:
-            raise ValueError(f"Unknown format: {format_type}")
-        return formatter.format(result_data)
+        try:
+            return self.result_store.render(result_data, format_type)
+        except ValueError as e:
+            raise ValueError(f"Unknown format: {format_type}") from e
 
     def _get_base_filename(self, file_path: str) -> str:
         """Get base filename from path with safe Unicode normalization.
@@ -810,6 +904,7 @@ class BatchZipBuilder:
             exc_val: Exception instance if one occurred, otherwise None.
             exc_tb: Traceback if one occurred, otherwise None.
         """
+        self.wait_pending()
         if self._is_open and self._zipfile:
             try:
                 self._zipfile.close()
@@ -818,6 +913,24 @@ class BatchZipBuilder:
             finally:
                 self._is_open = False
 
+    def discard(self) -> None:
+        """Abandon the archive: stop background work, close and delete it."""
+        self.wait_pending()
+        if self._zipfile is not None:
+            try:
+                self._zipfile.close()
+            except OSError as e:
+                logger.error("Error closing ZIP file: %s", str(e))
+            self._zipfile = None
+        self._is_open = False
+        if self._zip_path and os.path.exists(self._zip_path):
+            try:
+                os.remove(self._zip_path)
+            except OSError as e:
+                logger.warning(
+                    "Could not remove discarded ZIP %s: %s", self._zip_path, e
+                )
+
 
 # Convenience function for simple ZIP creation
 def create_batch_zip(
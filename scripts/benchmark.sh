@@ -106,7 +106,8 @@ MODELS=(
 )
 MODEL=""               # Back-compat single-model flag; accumulated into MODELS
 DEVICE=""              # Let CLI defaults apply when empty
-DTYPE=""               # float16|float32
+DTYPE=""               # float16|float32|int8
+COMPILE=false          # static KV cache + torch.compile (WHISPER_TORCH_COMPILE)
 LANGUAGE=""            # e.g. en; empty=auto
 EXPORT_FORMAT="srt"      # srt|json|txt|all
 TIMESTAMP_TYPES=(chunk word)
@@ -139,7 +140,8 @@ ${BOLD}${CYAN}Options:${RESET}
                                       openai/whisper-medium, distil-whisper/distil-large-v3
       --models LIST                   Comma-separated model list (overrides defaults)
       --device NAME                   Device for inference (e.g., cuda:0, cpu)
-      --dtype {float16,float32}       Data type for inference
+      --dtype {float16,float32,int8}  Data type for inference (int8: CPU only)
+      --compile                       Compiled decoding (static KV cache + torch.compile)
       --language CODE                 Language code (empty=auto)
       --export-format FMT             Export format: srt|json|txt|all (default: $EXPORT_FORMAT)
       --timestamp-types LIST          Comma-separated: chunk,word (default: chunk,word)
@@ -253,6 +255,8 @@ parse_args() {
         CHUNK_LENGTH="${1#*=}"; shift ;;
       --no-timestamps)
         NO_TIMESTAMPS=true; shift ;;
+      --compile)
+        COMPILE=true; shift ;;
       --stabilize)
         STABILIZE=true; shift ;;
       --no-stabilize)
@@ -355,6 +359,7 @@ build_cmd() {
   local vad_flag="${8:-$VAD}"
 
   local cmd=(pdm run cli transcribe)
+  if [[ "$COMPILE" == true ]]; then cmd=(env WHISPER_TORCH_COMPILE=true "${cmd[@]}"); fi
   cmd+=("--timestamp-type" "$ts_type")
   # Add one or more --export-format flags (supports "srt json" space-separated)
   IFS=' ' read -r -a __fmts <<< "$fmt_list"
@@ -408,6 +413,7 @@ main() {
   echo -e "${BOLD}Models:${RESET}        ${MAGENTA}${MODELS[*]}${RESET}"
   echo -e "${BOLD}Device:${RESET}        ${YELLOW}${DEVICE:-<default>} ${RESET}"
   echo -e "${BOLD}DType:${RESET}         ${YELLOW}${DTYPE:-<default>} ${RESET}"
+  echo -e "${BOLD}Compile:${RESET}       ${YELLOW}$COMPILE${RESET}"
   echo -e "${BOLD}Language:${RESET}      ${YELLOW}${LANGUAGE:-auto} ${RESET}"
   echo -e "${BOLD}Export:${RESET}        ${GREEN}${EXPORT_FORMAT}${RESET}"
   echo -e "${BOLD}Timestamp(s):${RESET}  ${GREEN}${TIMESTAMP_TYPES[*]}${RESET}"
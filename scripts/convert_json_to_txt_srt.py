@@ -12,7 +12,6 @@ Requires: insanely_fast_whisper_rocm in PYTHONPATH or installed.
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import sys
@@ -22,6 +21,7 @@ import click
 # Import formatters from core
 try:
     from insanely_fast_whisper_rocm.core.formatters import SrtFormatter, TxtFormatter
+    from insanely_fast_whisper_rocm.core.storage import JsonStorage
 except ImportError:
     print(
         "Error: Could not import formatters. Make sure "
@@ -86,10 +86,9 @@ def cli(
     logger.debug(f"Output dir: {output_dir}")
     logger.debug(f"Formats: {formats}")
 
-    # Load JSON
+    # Load JSON (plain, compact or gzip/zstd-compressed)
     try:
-        with open(input_path, encoding="utf-8") as f:
-            result = json.load(f)
+        result = JsonStorage.load(input_path)
     except Exception as e:
         logger.error(f"Failed to load JSON: {e}")
         sys.exit(1)
@@ -99,7 +98,8 @@ def cli(
         output_dir = os.path.dirname(os.path.abspath(input_path))
     os.makedirs(output_dir, exist_ok=True)
 
-    basename = os.path.splitext(os.path.basename(input_path))[0]
+    basename = os.path.basename(input_path).removesuffix(".gz").removesuffix(".zst")
+    basename = os.path.splitext(basename)[0]
     for fmt in formats:
         formatter = FORMATTER_MAP[fmt]
         try:
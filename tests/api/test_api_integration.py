@@ -52,7 +52,7 @@ def mock_audio_file() -> tuple[str, BytesIO, str]:
     Returns:
         tuple[str, BytesIO, str]: Tuple of filename, file-like object, and MIME type.
     """
-    return ("test.mp3", BytesIO(b"fake audio content"), "audio/mpeg")
+    return ("test.mp3", BytesIO(b"ID3fake audio content"), "audio/mpeg")
 
 
 @pytest.fixture
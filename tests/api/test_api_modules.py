@@ -209,7 +209,7 @@ class TestFileHandler:
         # Create mock UploadFile
         mock_file = Mock(spec=UploadFile)
         mock_file.filename = "test.mp3"
-        mock_file.file = BytesIO(b"test audio content")
+        mock_file.file = BytesIO(b"ID3test audio content")
 
         # Save file
         saved_path = handler.save_upload(mock_file)
@@ -222,7 +222,7 @@ class TestFileHandler:
         # Verify content
         with open(saved_path, "rb") as f:
             content = f.read()
-        assert content == b"test audio content"
+        assert content == b"ID3test audio content"
 
     def test_cleanup_removes_file(self, tmp_path: Path) -> None:
         """Test cleanup removes the specified file."""
@@ -50,6 +50,31 @@ class TestAppLifecycle:
 
                 asyncio.run(run_test())
 
+    def test_lifespan_flushes_result_writer_before_clearing_cache(self) -> None:
+        """Pending background result writes are flushed on shutdown."""
+        app = FastAPI()
+        calls: list[str] = []
+
+        with (
+            patch("insanely_fast_whisper_rocm.api.app.run_startup_sequence"),
+            patch(
+                "insanely_fast_whisper_rocm.api.app.shutdown_result_writer",
+                side_effect=lambda: calls.append("flush"),
+            ),
+            patch(
+                "insanely_fast_whisper_rocm.api.app.clear_cache",
+                side_effect=lambda **_: calls.append("clear"),
+            ),
+        ):
+
+            async def run_test() -> None:
+                async with lifespan(app):
+                    assert calls == []
+
+            asyncio.run(run_test())
+
+        assert calls == ["flush", "clear"]
+
     def test_lifespan_logs_shutdown_messages(self) -> None:
         """Verify that shutdown logs informative messages.
 
@@ -0,0 +1,199 @@
+"""Tests for the multi-file batch endpoint."""
+
+from __future__ import annotations
+
+import io
+import json
+import wave
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from insanely_fast_whisper_rocm.api import routes
+from insanely_fast_whisper_rocm.api.dependencies import (
+    get_asr_pipeline,
+    get_file_handler,
+)
+from insanely_fast_whisper_rocm.main import app
+from insanely_fast_whisper_rocm.utils import FileHandler, constants
+
+
+def _wav_bytes(marker: int) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(8000)
+        handle.writeframes(bytes([marker, 0]) * 800)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    """Client with a stub pipeline, a temp upload dir and a fake orchestrator.
+
+    Files whose first sample is 0xEE fail during transcription.
+
+    Yields:
+        TestClient: The configured client.
+    """
+    pipeline = MagicMock()
+    pipeline.asr_backend.config = "cfg"
+    app.dependency_overrides[get_asr_pipeline] = lambda: pipeline
+    app.dependency_overrides[get_file_handler] = lambda: FileHandler(
+        upload_dir=str(tmp_path / "uploads")
+    )
+
+    def run_transcription(audio_path: str, **_: object) -> dict[str, Any]:
+        marker = Path(audio_path).read_bytes()[44]
+        if marker == 0xEE:
+            raise RuntimeError("decoder exploded")
+        text = f"file {marker}"
+        return {"text": text, "chunks": [{"text": text, "timestamp": [0.0, 1.0]}]}
+
+    orchestrator = MagicMock()
+    orchestrator.run_transcription.side_effect = run_transcription
+    monkeypatch.setattr(routes, "create_orchestrator", lambda: orchestrator)
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_asr_pipeline, None)
+        app.dependency_overrides.pop(get_file_handler, None)
+
+
+def _records(response: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_batch__ndjson_isolates_per_file_errors(
+    client: TestClient, tmp_path: Path
+) -> None:
+    """Good files succeed while rejected and failing files report errors."""
+    response = client.post(
+        "/v1/audio/batch",
+        files=[
+            ("files", ("a.wav", _wav_bytes(1), "audio/wav")),
+            ("files", ("broken.mp3", b"not audio", "audio/mpeg")),
+            ("files", ("a.wav", _wav_bytes(0xEE), "audio/wav")),
+            ("files", ("b.wav", _wav_bytes(2), "audio/wav")),
+        ],
+        data={"response_format": "text"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = _records(response)
+    assert records[-1] == {"summary": {"succeeded": 2, "failed": 2}}
+    by_index = {r["index"]: r for r in records[:-1]}
+    assert by_index[0] == {
+        "index": 0,
+        "filename": "a.wav",
+        "status_code": 200,
+        "result": "file 1",
+    }
+    assert by_index[1]["status_code"] == 415
+    assert by_index[2]["filename"] == "a (2).wav"
+    assert by_index[2]["status_code"] == 500
+    assert "decoder exploded" in by_index[2]["error"]
+    assert by_index[3]["result"] == "file 2"
+    assert not list((tmp_path / "uploads").glob("*"))
+
+
+def test_batch__zip_archive_input_and_zip_output(client: TestClient) -> None:
+    """Archive members are processed and results come back as a ZIP."""
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as bundle:
+        bundle.writestr("clips/one.wav", _wav_bytes(1))
+        bundle.writestr("clips/two.wav", _wav_bytes(0xEE))
+        bundle.writestr("README.md", "ignored")
+        bundle.writestr("__MACOSX/clips/._one.wav", "ignored")
+
+    response = client.post(
+        "/v1/audio/batch",
+        files=[("files", ("bundle.zip", archive.getvalue(), "application/zip"))],
+        data={"response_format": "srt", "output": "zip"},
+    )
+
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as result:
+        names = set(result.namelist())
+        assert "srt/one.srt" in names
+        assert "file 1" in result.read("srt/one.srt").decode()
+        errors = json.loads(result.read("errors.json"))
+    assert [e["filename"] for e in errors] == ["bundle.zip/clips/two.wav"]
+
+
+def test_batch__enforces_file_limit(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Files beyond API_BATCH_MAX_FILES are rejected individually."""
+    monkeypatch.setattr(constants, "API_BATCH_MAX_FILES", 1)
+
+    response = client.post(
+        "/v1/audio/batch",
+        files=[
+            ("files", ("a.wav", _wav_bytes(1), "audio/wav")),
+            ("files", ("b.wav", _wav_bytes(2), "audio/wav")),
+        ],
+    )
+
+    records = {r.get("index"): r for r in _records(response)}
+    assert records[0]["result"] == {"text": "file 1"}
+    assert records[1]["status_code"] == 413
+
+
+def test_batch__accepts_body_above_single_file_limit(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The request limit scales with the number of files a batch may hold."""
+    monkeypatch.setattr(constants, "MAX_AUDIO_SIZE_MB", 1)
+    monkeypatch.setattr(constants, "API_BATCH_MAX_FILES", 4)
+    padding = b"\0" * (900 * 1024)
+    files = [
+        ("files", (f"{i}.wav", _wav_bytes(i + 1) + padding, "audio/wav"))
+        for i in range(3)
+    ]
+
+    response = client.post(
+        "/v1/audio/batch", files=files, data={"response_format": "text"}
+    )
+
+    assert response.status_code == 200
+    assert _records(response)[-1] == {"summary": {"succeeded": 3, "failed": 0}}
+
+    monkeypatch.setattr(constants, "API_BATCH_MAX_FILES", 1)
+    response = client.post(
+        "/v1/audio/batch", files=files, data={"response_format": "text"}
+    )
+    assert response.status_code == 413
+
+
+def test_batch__archive_limit_scales_with_batch_size(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An archive may be as large as the batch it carries."""
+    monkeypatch.setattr(constants, "MAX_AUDIO_SIZE_MB", 1)
+    monkeypatch.setattr(constants, "API_BATCH_MAX_FILES", 4)
+    padding = b"\0" * (900 * 1024)
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as bundle:
+        for i in range(3):
+            bundle.writestr(f"{i}.wav", _wav_bytes(i + 1) + padding)
+    files = [("files", ("bundle.zip", archive.getvalue(), "application/zip"))]
+
+    response = client.post(
+        "/v1/audio/batch", files=files, data={"response_format": "text"}
+    )
+    assert _records(response)[-1] == {"summary": {"succeeded": 3, "failed": 0}}
+
+    monkeypatch.setattr(constants, "API_BATCH_MAX_FILES", 2)
+    response = client.post(
+        "/v1/audio/batch", files=files, data={"response_format": "text"}
+    )
+    (error,) = [r for r in _records(response) if r.get("status_code") == 413]
+    assert "Archive exceeds the upload limit" in error["error"]
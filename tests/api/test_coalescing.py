@@ -0,0 +1,130 @@
+"""Tests for single-flight request coalescing in the API."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from insanely_fast_whisper_rocm.api import routes
+from insanely_fast_whisper_rocm.api.coalescing import RequestCoalescer
+from insanely_fast_whisper_rocm.api.responses import ResponseFormatter
+
+
+async def _wait_until(predicate: Callable[[], object], timeout: float = 5.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+def test_run__duplicates_share_one_job() -> None:
+    """Concurrent callers with one key run the job once and share the result."""
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def job() -> dict[str, str]:
+        calls.append(1)
+        release.wait(timeout=5)
+        return {"text": "shared"}
+
+    async def scenario() -> list[dict[str, str]]:
+        first = asyncio.ensure_future(coalescer.run("k", job))
+        await _wait_until(lambda: calls)
+        rest = [asyncio.ensure_future(coalescer.run("k", job)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(first, *rest)
+
+    results = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert coalescer.stats() == {
+        "executed": 1,
+        "coalesced": 2,
+        "failed": 0,
+        "in_flight": 0,
+    }
+
+
+def test_run__failure_reaches_every_caller_and_key_is_freed() -> None:
+    """A failing job raises for all attached callers; the next call reruns it."""
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+
+    def failing() -> None:
+        release.wait(timeout=5)
+        raise RuntimeError("boom")
+
+    async def scenario() -> list[object]:
+        tasks = [asyncio.ensure_future(coalescer.run("k", failing)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        outcomes.append(await coalescer.run("k", lambda: "again"))
+        return outcomes
+
+    outcomes = asyncio.run(scenario())
+
+    assert [type(o) for o in outcomes[:2]] == [RuntimeError, RuntimeError]
+    assert outcomes[2] == "again"
+    assert coalescer.stats()["failed"] == 1
+    assert coalescer.stats()["executed"] == 2
+
+
+def test_process_upload__coalesces_same_content_per_format(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Two uploads with equal bytes share one inference, formatted per caller."""
+    coalescer = RequestCoalescer()
+    monkeypatch.setattr(routes, "get_request_coalescer", lambda: coalescer)
+    release = threading.Event()
+    orchestrator = MagicMock()
+
+    def run_transcription(**_: object) -> dict[str, Any]:
+        release.wait(timeout=5)
+        return {"text": "hi", "chunks": [{"text": "hi", "timestamp": [0.0, 1.0]}]}
+
+    orchestrator.run_transcription.side_effect = run_transcription
+    monkeypatch.setattr(routes, "create_orchestrator", lambda: orchestrator)
+    uploads = []
+    for name in ("a.wav", "b.wav", "c.wav"):
+        uploads.append(tmp_path / name)
+        uploads[-1].write_bytes(b"RIFF-same-bytes" if name != "c.wav" else b"other")
+    params = {
+        "task": "transcribe",
+        "language": None,
+        "timestamp_type": "chunk",
+        "stabilize": False,
+        "demucs": False,
+        "vad": False,
+        "vad_threshold": 0.35,
+    }
+
+    async def scenario() -> list[dict[str, Any]]:
+        tasks = [
+            asyncio.ensure_future(routes._process_upload(str(p), "cfg", **params))
+            for p in uploads
+        ]
+        await _wait_until(lambda: coalescer.in_flight == 2)
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(scenario())
+
+    assert orchestrator.run_transcription.call_count == 2
+    assert coalescer.stats()["coalesced"] == 1
+    assert results[0] is results[1]
+    text = ResponseFormatter.format_transcription(results[0], "text")
+    srt = ResponseFormatter.format_transcription(results[1], "srt")
+    assert text.body == b"hi"
+    assert b"00:00:00,000 --> 00:00:01,000" in srt.body
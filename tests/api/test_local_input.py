@@ -0,0 +1,144 @@
+"""Tests for opt-in server-side path ingestion."""
+
+from __future__ import annotations
+
+import io
+import os
+import wave
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from insanely_fast_whisper_rocm.api import routes
+from insanely_fast_whisper_rocm.api.dependencies import (
+    get_asr_pipeline,
+    get_file_handler,
+)
+from insanely_fast_whisper_rocm.main import app
+from insanely_fast_whisper_rocm.utils import FileHandler, constants
+from insanely_fast_whisper_rocm.utils.file_utils import resolve_local_input
+
+
+def _write_wav(path: Path) -> Path:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(8000)
+        handle.writeframes(b"\0\0" * 800)
+    path.write_bytes(buffer.getvalue())
+    return path
+
+
+@pytest.fixture
+def input_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Enable local ingestion below a fresh directory.
+
+    Returns:
+        Path: The allowed input root.
+    """
+    root = tmp_path / "shared"
+    root.mkdir()
+    monkeypatch.setattr(constants, "API_LOCAL_INPUT_ROOT", str(root))
+    return root
+
+
+def test_resolve_local_input__disabled_by_default(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Without a configured root every path is refused."""
+    monkeypatch.setattr(constants, "API_LOCAL_INPUT_ROOT", "")
+    audio = _write_wav(tmp_path / "a.wav")
+    with pytest.raises(HTTPException) as excinfo:
+        resolve_local_input(str(audio))
+    assert excinfo.value.status_code == 403
+
+
+def test_resolve_local_input__accepts_relative_and_absolute(input_root: Path) -> None:
+    """Paths inside the root resolve to the file itself."""
+    audio = _write_wav(input_root / "a.wav")
+    assert resolve_local_input("a.wav") == os.path.realpath(audio)
+    assert resolve_local_input(str(audio)) == os.path.realpath(audio)
+
+
+def test_resolve_local_input__rejects_escapes(input_root: Path, tmp_path: Path) -> None:
+    """Traversal and symlinks leading out of the root are refused."""
+    outside = _write_wav(tmp_path / "secret.wav")
+    (input_root / "link.wav").symlink_to(outside)
+    for candidate in ("../secret.wav", str(outside), "link.wav"):
+        with pytest.raises(HTTPException) as excinfo:
+            resolve_local_input(candidate)
+        assert excinfo.value.status_code == 403
+
+
+def test_resolve_local_input__missing_and_invalid_files(input_root: Path) -> None:
+    """Missing files give 404 and non-audio content gives 415."""
+    with pytest.raises(HTTPException) as excinfo:
+        resolve_local_input("missing.wav")
+    assert excinfo.value.status_code == 404
+
+    (input_root / "fake.wav").write_bytes(b"not audio at all")
+    with pytest.raises(HTTPException) as excinfo:
+        resolve_local_input("fake.wav")
+    assert excinfo.value.status_code == 415
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    """Client with a stub pipeline that records the transcribed path.
+
+    Yields:
+        TestClient: The configured client.
+    """
+    pipeline = MagicMock()
+    pipeline.asr_backend.config = "cfg"
+    app.dependency_overrides[get_asr_pipeline] = lambda: pipeline
+    app.dependency_overrides[get_file_handler] = lambda: FileHandler(
+        upload_dir=str(tmp_path / "uploads")
+    )
+    orchestrator = MagicMock()
+
+    def run_transcription(audio_path: str, **_: object) -> dict[str, Any]:
+        return {"text": os.path.basename(audio_path), "chunks": []}
+
+    orchestrator.run_transcription.side_effect = run_transcription
+    monkeypatch.setattr(routes, "create_orchestrator", lambda: orchestrator)
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_asr_pipeline, None)
+        app.dependency_overrides.pop(get_file_handler, None)
+
+
+def test_transcriptions__reads_path_in_place(
+    client: TestClient, input_root: Path, tmp_path: Path
+) -> None:
+    """A referenced file is transcribed without being copied or deleted."""
+    audio = _write_wav(input_root / "talk.wav")
+    response = client.post(
+        "/v1/audio/transcriptions",
+        data={"path": "talk.wav", "response_format": "text"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.text == "talk.wav"
+    assert audio.exists()
+    assert not list((tmp_path / "uploads").glob("*"))
+
+
+def test_transcriptions__requires_exactly_one_input(
+    client: TestClient, input_root: Path
+) -> None:
+    """Sending neither or both of ``file`` and ``path`` is a client error."""
+    audio = _write_wav(input_root / "talk.wav")
+    assert client.post("/v1/audio/transcriptions").status_code == 400
+    response = client.post(
+        "/v1/audio/translations",
+        data={"path": "talk.wav"},
+        files={"file": ("talk.wav", audio.read_bytes(), "audio/wav")},
+    )
+    assert response.status_code == 400
@@ -1,5 +1,6 @@
 """Unit tests for response_format handling on transcription and translation endpoints."""
 
+import asyncio
 import io
 from collections.abc import Generator
 from typing import Any
@@ -198,3 +199,35 @@ def test_response_format_variants(
 
     if response_format == RESPONSE_FORMAT_TEXT:
         assert response.text == "hello world"
+
+
+@pytest.mark.parametrize(
+    "endpoint", ["/v1/audio/transcriptions", "/v1/audio/translations"]
+)
+@patch("insanely_fast_whisper_rocm.api.routes.create_orchestrator")
+def test_upload_is_saved_off_the_event_loop(
+    mock_create_orchestrator: Mock,
+    endpoint: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Saving and probing the upload must not block the event loop."""
+    mock_create_orchestrator.return_value.run_transcription.return_value = {
+        "text": "hello world",
+        "chunks": [],
+    }
+    on_loop: list[bool] = []
+
+    def save_upload(_self: object, _file: object) -> str:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            on_loop.append(False)
+        else:
+            on_loop.append(True)
+        return "dummy_path.wav"
+
+    monkeypatch.setattr(_StubFileHandler, "save_upload", save_upload)
+    response = _post_file(TestClient(app), endpoint)
+
+    assert response.status_code == 200
+    assert on_loop == [False]
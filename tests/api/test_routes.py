@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import inspect
+import threading
+import time
+import types
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
+from insanely_fast_whisper_rocm.api import routes
 from insanely_fast_whisper_rocm.api.dependencies import (
     get_asr_pipeline,
     get_file_handler,
@@ -15,7 +26,12 @@ from insanely_fast_whisper_rocm.api.routes import (
     create_translation,
     router,
 )
-from insanely_fast_whisper_rocm.utils import SUPPORTED_RESPONSE_FORMATS
+from insanely_fast_whisper_rocm.core import orchestrator as orchestrator_module
+from insanely_fast_whisper_rocm.core import pipeline as pipeline_module
+from insanely_fast_whisper_rocm.core.asr_backend import HuggingFaceBackendConfig
+from insanely_fast_whisper_rocm.core.pipeline import WhisperPipeline
+from insanely_fast_whisper_rocm.core.storage import SQLiteStorage
+from insanely_fast_whisper_rocm.utils import SUPPORTED_RESPONSE_FORMATS, constants
 
 
 def test_create_transcription_unsupported_response_format() -> None:
@@ -142,3 +158,139 @@ def test_route_dependencies() -> None:
     # Just check that these can be imported without errors
     assert callable(get_asr_pipeline)
     assert callable(get_file_handler)
+
+
+def test_search_transcripts__returns_hits(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The search endpoint returns archived, timestamped segments."""
+    db_path = tmp_path / "archive.sqlite3"
+    SQLiteStorage(db_path).save(
+        {
+            "text": "Hello there.",
+            "chunks": [{"text": "Hello there.", "timestamp": [1.0, 2.0]}],
+            "original_file": "talk.mp3",
+        },
+        tmp_path / "talk.json",
+        "transcribe",
+    )
+    monkeypatch.setattr(constants, "STORAGE_SQLITE_PATH", str(db_path))
+    app = FastAPI()
+    app.include_router(router)
+
+    response = TestClient(app).get("/v1/transcripts/search", params={"q": "hello"})
+
+    assert response.status_code == 200
+    hit = response.json()["hits"][0]
+    assert (hit["file"], hit["start"], hit["end"]) == ("talk.mp3", 1.0, 2.0)
+
+
+def test_search_transcripts__missing_archive_is_404(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Searching before anything was archived returns 404."""
+    monkeypatch.setattr(
+        constants, "STORAGE_SQLITE_PATH", str(tmp_path / "missing.sqlite3")
+    )
+    app = FastAPI()
+    app.include_router(router)
+
+    response = TestClient(app).get("/v1/transcripts/search", params={"q": "x"})
+
+    assert response.status_code == 404
+
+
+class _ConcurrencyBackend:
+    """Backend stub recording how many decodes run at once."""
+
+    def __init__(self, parallelism: int) -> None:
+        self.parallelism = parallelism
+        self.config = types.SimpleNamespace(chunk_length=30)
+        self.active = 0
+        self.peak = 0
+        self.guard = threading.Lock()
+        # Lets two pool calls prove they overlap without sleeping
+        self.both_running = threading.Barrier(2, timeout=5)
+
+    def process_audio(self, **_: object) -> dict[str, object]:
+        with self.guard:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            if self.parallelism > 1:
+                self.both_running.wait()
+            else:
+                time.sleep(0.02)
+        finally:
+            with self.guard:
+                self.active -= 1
+        return {"text": "ok", "chunks": []}
+
+
+def _run_jobs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, backend: _ConcurrencyBackend
+) -> list[dict[str, object]]:
+    """Run two API jobs at once through the real orchestrator and pipeline.
+
+    Returns:
+        list[dict[str, object]]: The job results.
+    """
+    pipeline = WhisperPipeline(asr_backend=backend, save_transcriptions=False)
+
+    @contextlib.contextmanager
+    def borrow(*_: object, **__: object) -> Iterator[WhisperPipeline]:
+        yield pipeline
+
+    monkeypatch.setattr(orchestrator_module, "borrow_pipeline", borrow)
+    monkeypatch.setattr(pipeline_module.audio_conversion, "ensure_wav", str)
+    monkeypatch.setattr(
+        pipeline_module.audio_processing,
+        "split_audio",
+        lambda path, **_: [(path, 0.0)],
+    )
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"RIFF")
+    job = functools.partial(
+        routes._run_asr_job,
+        backend_config=HuggingFaceBackendConfig(
+            model_name="openai/whisper-tiny",
+            device="cpu",
+            dtype="float32",
+            batch_size=1,
+            chunk_length=30,
+            progress_group_size=1,
+        ),
+        task="transcribe",
+        language="en",
+        timestamp_type="chunk",
+        stabilize=False,
+        demucs=False,
+        vad=False,
+        vad_threshold=0.35,
+    )
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        return list(pool.map(job, [str(audio)] * 2))
+
+
+def test_run_asr_job__serializes_single_model_decoding(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Concurrent jobs never decode on a single-model pipeline at once."""
+    backend = _ConcurrencyBackend(parallelism=1)
+
+    results = _run_jobs(monkeypatch, tmp_path, backend)
+
+    assert [r["text"] for r in results] == ["ok", "ok"]
+    assert backend.peak == 1
+
+
+def test_run_asr_job__pool_backends_decode_concurrently(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Jobs on a pool backend overlap instead of queueing on the global lock."""
+    backend = _ConcurrencyBackend(parallelism=2)
+
+    results = _run_jobs(monkeypatch, tmp_path, backend)
+
+    assert [r["text"] for r in results] == ["ok", "ok"]
+    assert backend.peak == 2
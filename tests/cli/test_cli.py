@@ -19,6 +19,7 @@ from insanely_fast_whisper_rocm.core.errors import (
     TranscriptionError,
 )
 from insanely_fast_whisper_rocm.core.progress import ProgressCallback
+from insanely_fast_whisper_rocm.core.storage import SQLiteStorage
 
 
 class TestCLIFacade:
@@ -1085,3 +1086,32 @@ class TestBenchmarkCollection:
 
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+class TestSearchCommand:
+    """Tests for the transcript archive ``search`` command."""
+
+    def test_search__prints_timestamped_hits(self, tmp_path: Path) -> None:
+        """Matching segments are printed with their file and timings."""
+        db_path = tmp_path / "archive.sqlite3"
+        SQLiteStorage(db_path).save(
+            {
+                "text": "Hello there.",
+                "chunks": [{"text": "Hello there.", "timestamp": [61.5, 63.0]}],
+                "original_file": "talk.mp3",
+            },
+            tmp_path / "talk.json",
+            "transcribe",
+        )
+
+        result = CliRunner().invoke(cli, ["search", "hello", "--db", str(db_path)])
+
+        assert result.exit_code == 0, result.output
+        assert "talk.mp3 [00:01:01.500 --> 00:01:03.000] Hello there." in result.output
+
+    def test_search__missing_archive_fails(self, tmp_path: Path) -> None:
+        """A missing database is reported instead of being created."""
+        db_path = tmp_path / "missing.sqlite3"
+        result = CliRunner().invoke(cli, ["search", "x", "--db", str(db_path)])
+        assert result.exit_code == 1
+        assert not db_path.exists()
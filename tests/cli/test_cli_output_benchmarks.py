@@ -3,6 +3,8 @@
 from pathlib import Path
 from unittest.mock import ANY, Mock, patch
 
+import pytest
+
 from insanely_fast_whisper_rocm.cli.commands import _handle_output_and_benchmarks
 from insanely_fast_whisper_rocm.core.progress import ProgressCallback
 
@@ -380,3 +382,40 @@ class TestOutputAndBenchmarks:
         assert mock_secho.called
         args, kwargs = mock_secho.call_args
         assert "Benchmark saved to" in args[0]
+
+    def test_large_result_is_streamed_to_disk(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Results above the streaming threshold are written without write_text."""
+        from insanely_fast_whisper_rocm.core import streaming
+        from insanely_fast_whisper_rocm.core.formatters import SrtFormatter
+
+        monkeypatch.setattr(streaming.constants, "STREAMING_EXPORT_MIN_SEGMENTS", 1)
+        output = tmp_path / "out.srt"
+
+        with patch("pathlib.Path.write_text") as mock_write:
+            _handle_output_and_benchmarks(
+                task="transcribe",
+                audio_file=self.audio_file,
+                result=self.result,
+                total_time=self.total_time,
+                output=output,
+                export_format="srt",
+                export_format_explicit=True,
+                benchmark_enabled=False,
+                benchmark_extra=(),
+                benchmark_flags=None,
+                benchmark_gpu_stats=None,
+                temp_files=[],
+                progress_cb=None,
+                quiet=True,
+            )
+
+        mock_write.assert_not_called()
+        written = output.read_text(encoding="utf-8")
+        assert "00:00:00,000 --> 00:00:02,000" in written
+        assert written == SrtFormatter.format({
+            "text": self.result["text"],
+            "segments": self.result["chunks"],
+            "chunks": self.result["chunks"],
+        })
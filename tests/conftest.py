@@ -105,3 +105,48 @@ def webui_server(request: pytest.FixtureRequest) -> Generator[str, None, None]:
         process.wait(timeout=10)
     except subprocess.TimeoutExpired:
         process.kill()
+
+
+@pytest.fixture(autouse=True)
+def isolated_temp_manager(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Generator[None, None, None]:
+    """Keep the temp-file janitor away from the real temp and upload dirs.
+
+    Args:
+        tmp_path_factory: Pytest factory to create temporary paths.
+        monkeypatch: Pytest fixture used to swap the shared manager.
+
+    Yields:
+        None: The shared manager is isolated for the duration of the test.
+    """
+    from insanely_fast_whisper_rocm.utils import temp_space
+
+    sandbox = tmp_path_factory.getbasetemp() / "temp-janitor"
+    manager = temp_space.TempSpaceManager(
+        upload_dir=str(sandbox / "uploads"), temp_dir=str(sandbox / "tmp")
+    )
+    monkeypatch.setattr(temp_space, "_MANAGER", manager)
+    yield
+    manager.stop()
+
+
+@pytest.fixture(autouse=True)
+def isolated_model_profiles(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep persisted model capability profiles out of the user cache.
+
+    Args:
+        tmp_path_factory: Pytest factory to create temporary paths.
+        monkeypatch: Pytest fixture used to redirect the profile directory.
+    """
+    from insanely_fast_whisper_rocm.core import model_capabilities
+    from insanely_fast_whisper_rocm.utils import constants
+
+    monkeypatch.setattr(
+        constants,
+        "MODEL_PROFILE_CACHE_DIR",
+        str(tmp_path_factory.mktemp("model-profiles")),
+    )
+    monkeypatch.setattr(model_capabilities, "_PROFILES", {})
@@ -7,6 +7,8 @@ initialization logic including ROCm SDPA fallback.
 from __future__ import annotations
 
 import pathlib
+import threading
+import time
 import types
 from unittest.mock import MagicMock, patch
 
@@ -198,11 +200,16 @@ def test_initialize_pipeline_uses_sdpa_on_cuda(tmp_path: pathlib.Path) -> None:
                     with patch(
                         "insanely_fast_whisper_rocm.core.asr_backend.pipeline",
                         return_value=MagicMock(model=mock_model),
-                    ):
+                    ) as mock_pipeline:
                         backend._initialize_pipeline()
 
     call_kwargs = mock_model_load.call_args[1]
     assert call_kwargs["attn_implementation"] == "sdpa"
+    # Weights are placed by device_map, so the pipeline must not move them
+    assert call_kwargs["device_map"] == "cuda:0"
+    pipeline_kwargs = mock_pipeline.call_args[1]
+    assert pipeline_kwargs["model"] is mock_model
+    assert pipeline_kwargs["device"] is None
 
 
 def test_initialize_pipeline_rocm_fallback_to_eager(tmp_path: pathlib.Path) -> None:
@@ -272,6 +279,7 @@ def test_initialize_pipeline_rocm_fallback_to_eager(tmp_path: pathlib.Path) -> N
     second_call_kwargs = mock_model_load.call_args_list[1][1]
     assert first_call_kwargs["attn_implementation"] == "sdpa"
     assert second_call_kwargs["attn_implementation"] == "eager"
+    assert backend.asr_pipe is not None
 
 
 def test_initialize_pipeline_raises_transcription_error_on_model_load_failure(
@@ -288,9 +296,19 @@ def test_initialize_pipeline_raises_transcription_error_on_model_load_failure(
     )
     backend = HuggingFaceBackend(config)
 
-    with patch(
-        "insanely_fast_whisper_rocm.core.asr_backend.AutoModelForSpeechSeq2Seq.from_pretrained",
-        side_effect=OSError("Model not found"),
+    with (
+        patch(
+            "insanely_fast_whisper_rocm.core.asr_backend.AutoModelForSpeechSeq2Seq.from_pretrained",
+            side_effect=OSError("Model not found"),
+        ),
+        patch(
+            "insanely_fast_whisper_rocm.core.asr_backend.AutoTokenizer.from_pretrained",
+            return_value=MagicMock(),
+        ),
+        patch(
+            "insanely_fast_whisper_rocm.core.asr_backend.AutoFeatureExtractor.from_pretrained",
+            return_value=MagicMock(),
+        ),
     ):
         with pytest.raises(TranscriptionError, match="Failed to load ASR model"):
             backend._initialize_pipeline()
@@ -433,3 +451,97 @@ def test_initialize_pipeline_skips_backfill_when_generation_config_exists(
 
     # Should not attempt backfill
     mock_gen_load.assert_not_called()
+
+
+def test_initialize_pipeline_loads_components_in_parallel_and_times_phases(
+    tmp_path: pathlib.Path,
+) -> None:
+    """Tokenizer and feature extractor load while the weights do."""
+    config = HuggingFaceBackendConfig(
+        model_name="openai/whisper-tiny",
+        device="cpu",
+        dtype="float32",
+        batch_size=4,
+        chunk_length=30,
+        progress_group_size=4,
+    )
+    backend = HuggingFaceBackend(config)
+
+    mock_model = MagicMock()
+    mock_model.generation_config = types.SimpleNamespace(no_timestamps_token_id=50363)
+    mock_model.config = types.SimpleNamespace(lang_to_id=None, task_to_id=None)
+    tokenizer_loaded = threading.Event()
+
+    def load_tokenizer(*_args: object, **_kwargs: object) -> MagicMock:
+        tokenizer_loaded.set()
+        return MagicMock()
+
+    def load_weights(*_args: object, **_kwargs: object) -> MagicMock:
+        # Only returns if the tokenizer loads concurrently
+        assert tokenizer_loaded.wait(timeout=5)
+        return mock_model
+
+    with patch(
+        "insanely_fast_whisper_rocm.core.asr_backend.AutoModelForSpeechSeq2Seq.from_pretrained",
+        side_effect=load_weights,
+    ):
+        with patch(
+            "insanely_fast_whisper_rocm.core.asr_backend.AutoTokenizer.from_pretrained",
+            side_effect=load_tokenizer,
+        ):
+            with patch(
+                "insanely_fast_whisper_rocm.core.asr_backend.AutoFeatureExtractor.from_pretrained",
+                return_value=MagicMock(),
+            ):
+                with patch(
+                    "insanely_fast_whisper_rocm.core.asr_backend.pipeline",
+                    return_value=MagicMock(model=mock_model),
+                ):
+                    backend._initialize_pipeline()
+
+    assert {"weights", "tokenizer", "feature_extractor", "pipeline", "total"} <= set(
+        backend.load_timings
+    )
+    assert backend.load_timings["total"] >= backend.load_timings["weights"]
+
+
+def test_initialize_pipeline_does_not_wait_for_components_after_weight_failure(
+    tmp_path: pathlib.Path,
+) -> None:
+    """A failed weight load returns without waiting for the tokenizer load."""
+    config = HuggingFaceBackendConfig(
+        model_name="openai/whisper-tiny",
+        device="cpu",
+        dtype="float32",
+        batch_size=4,
+        chunk_length=30,
+        progress_group_size=4,
+    )
+    backend = HuggingFaceBackend(config)
+    release = threading.Event()
+
+    def slow_tokenizer(*_args: object, **_kwargs: object) -> MagicMock:
+        release.wait(timeout=10)
+        return MagicMock()
+
+    try:
+        with (
+            patch(
+                "insanely_fast_whisper_rocm.core.asr_backend.AutoModelForSpeechSeq2Seq.from_pretrained",
+                side_effect=OSError("Model not found"),
+            ),
+            patch(
+                "insanely_fast_whisper_rocm.core.asr_backend.AutoTokenizer.from_pretrained",
+                side_effect=slow_tokenizer,
+            ),
+            patch(
+                "insanely_fast_whisper_rocm.core.asr_backend.AutoFeatureExtractor.from_pretrained",
+                return_value=MagicMock(),
+            ),
+        ):
+            started = time.monotonic()
+            with pytest.raises(TranscriptionError, match="Failed to load ASR model"):
+                backend._initialize_pipeline()
+            assert time.monotonic() - started < 5
+    finally:
+        release.set()
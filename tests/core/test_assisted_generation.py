@@ -0,0 +1,219 @@
+"""Tests for speculative decoding with an assistant model."""
+
+from __future__ import annotations
+
+import types
+import wave
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import torch
+from torch import nn
+
+from insanely_fast_whisper_rocm.core.asr_backend import (
+    HuggingFaceBackend,
+    HuggingFaceBackendConfig,
+)
+from insanely_fast_whisper_rocm.core.assisted_generation import (
+    AssistanceMeter,
+    assistant_incompatibility,
+    combine_assistance,
+    summarize_assistance,
+)
+
+_ASSISTANT = "distil-whisper/distil-large-v3"
+
+
+class _Model(nn.Module):
+    """Encoder-decoder stand-in exposing the hooks the meter attaches to."""
+
+    def __init__(self, vocab_size: int = 51866, num_mel_bins: int = 128) -> None:
+        super().__init__()
+        self.config = types.SimpleNamespace(
+            vocab_size=vocab_size,
+            num_mel_bins=num_mel_bins,
+            lang_to_id={"en": 2},
+            task_to_id={},
+            max_target_positions=448,
+        )
+        self.generation_config = types.SimpleNamespace(
+            no_timestamps_token_id=1, lang_to_id={"en": 2}, task_to_id={}
+        )
+        self.encoder = nn.Identity()
+        self.decoder = nn.Identity()
+
+    def get_encoder(self) -> nn.Module:
+        return self.encoder
+
+    def get_decoder(self) -> nn.Module:
+        return self.decoder
+
+
+def _wav(path: Path, seconds: float = 5.0) -> Path:
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(16000)
+        handle.writeframes(b"\0\0" * int(16000 * seconds))
+    return path
+
+
+def test_assistant_incompatibility() -> None:
+    """Vocabulary and mel-bin mismatches are reported, matches are not."""
+    assert assistant_incompatibility(_Model(), _Model()) is None
+    assert "vocabulary" in str(
+        assistant_incompatibility(_Model(), _Model(vocab_size=51865))
+    )
+    assert "mel bins" in str(
+        assistant_incompatibility(_Model(), _Model(num_mel_bins=80))
+    )
+
+
+def test_summarize_and_combine_assistance() -> None:
+    """Chunk counters add up; fallbacks only surface without measurements."""
+    first = summarize_assistance(_ASSISTANT, drafted=10, accepted=8, verify_passes=4)
+    assert first["acceptance_rate"] == 0.8
+    assert first["estimated_speedup"] == 3.0
+
+    second = summarize_assistance(_ASSISTANT, drafted=10, accepted=2, verify_passes=4)
+    fallback = {"assistant_model": _ASSISTANT, "fallback_reason": "word timestamps"}
+    combined = combine_assistance([first, None, fallback, second])
+    assert combined is not None
+    assert combined["drafted_tokens"] == 20
+    assert combined["accepted_tokens"] == 10
+    assert combined["acceptance_rate"] == 0.5
+
+    assert combine_assistance([None, fallback]) == fallback
+    assert combine_assistance([None]) is None
+
+
+def test_meter_counts_drafted_and_accepted_tokens() -> None:
+    """Each verification pass accepts the drafts its length growth implies."""
+    model, assistant = _Model(), _Model()
+    meter = AssistanceMeter()
+    x = torch.zeros(1)
+
+    def draft(n: int) -> None:
+        for _ in range(n):
+            assistant.get_decoder()(x)
+
+    with meter.attach(model, assistant):
+        model.get_encoder()(x)  # generate() starts
+        assert not meter(torch.zeros(1, 3, dtype=torch.long), None).any()
+        draft(3)  # 2 accepted + 1 own token
+        meter(torch.zeros(1, 6, dtype=torch.long), None)
+        draft(2)  # all accepted + 1 own token
+        meter(torch.zeros(1, 9, dtype=torch.long), None)
+    # Hooks are removed with the block
+    draft(5)
+
+    assert (meter.drafted, meter.accepted, meter.verify_passes) == (5, 4, 2)
+
+
+class _Pipe:
+    """ASR pipeline stub; fails assisted calls when ``assisted_error`` is set."""
+
+    def __init__(self, assisted_error: Exception | None = None) -> None:
+        self.model = _Model()
+        self.assisted_error = assisted_error
+        self.calls: list[dict[str, Any]] = []
+
+    def __call__(self, _path: str, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        """Record the call.
+
+        Returns:
+            dict[str, Any]: A fixed transcription.
+        """
+        self.calls.append(kwargs)
+        if self.assisted_error and "assistant_model" in kwargs["generate_kwargs"]:
+            raise self.assisted_error
+        return {"text": "hello there"}
+
+
+def _backend(pipe: _Pipe) -> HuggingFaceBackend:
+    backend = HuggingFaceBackend(
+        HuggingFaceBackendConfig(
+            model_name="openai/whisper-large-v3",
+            device="cpu",
+            dtype="float32",
+            batch_size=8,
+            chunk_length=30,
+            progress_group_size=1,
+            assistant_model=_ASSISTANT,
+        )
+    )
+    backend.asr_pipe = pipe
+    backend.assistant = _Model()
+    return backend
+
+
+def test_process_audio__decodes_with_assistant(tmp_path: Path) -> None:
+    """The assistant is passed to generate() one sequence at a time."""
+    pipe = _Pipe()
+    backend = _backend(pipe)
+    result = backend.process_audio(
+        str(_wav(tmp_path / "a.wav")), "en", "transcribe", False
+    )
+
+    (call,) = pipe.calls
+    assert call["batch_size"] == 1
+    assert call["generate_kwargs"]["assistant_model"] is backend.assistant
+    assert any(
+        isinstance(c, AssistanceMeter)
+        for c in call["generate_kwargs"]["stopping_criteria"]
+    )
+    assert result["assisted_generation"]["assistant_model"] == _ASSISTANT
+    assert "fallback_reason" not in result["assisted_generation"]
+
+
+def test_process_audio__word_timestamps_skip_assistant(tmp_path: Path) -> None:
+    """Word timestamps decode with the main model alone."""
+    pipe = _Pipe()
+    result = _backend(pipe).process_audio(
+        str(_wav(tmp_path / "a.wav")), "en", "transcribe", "word"
+    )
+
+    assert "assistant_model" not in pipe.calls[0]["generate_kwargs"]
+    assert "word timestamps" in result["assisted_generation"]["fallback_reason"]
+
+
+def test_process_audio__falls_back_when_assisted_decoding_fails(
+    tmp_path: Path,
+) -> None:
+    """An assisted-mode error is retried without the assistant."""
+    pipe = _Pipe(assisted_error=ValueError("assisted generation needs batch 1"))
+    result = _backend(pipe).process_audio(
+        str(_wav(tmp_path / "a.wav")), "en", "transcribe", False
+    )
+
+    assert result["text"] == "hello there"
+    assert len(pipe.calls) == 2
+    assert pipe.calls[1]["batch_size"] == 8
+    assert "batch 1" in result["assisted_generation"]["fallback_reason"]
+
+
+@pytest.mark.parametrize(
+    ("assistant", "reason"),
+    [(_Model(), None), (_Model(num_mel_bins=80), "mel bins")],
+)
+def test_load_assistant__checks_compatibility(
+    assistant: _Model, reason: str | None
+) -> None:
+    """Only compatible assistants are kept; otherwise the reason is recorded."""
+    backend = _backend(_Pipe())
+    with patch(
+        "insanely_fast_whisper_rocm.core.asr_backend.AutoModelForSpeechSeq2Seq"
+        ".from_pretrained",
+        return_value=assistant,
+    ) as from_pretrained:
+        backend._load_assistant(_Model(), {"dtype": torch.float32})
+
+    from_pretrained.assert_called_once_with(_ASSISTANT, dtype=torch.float32)
+    if reason is None:
+        assert backend.assistant is assistant
+        assert backend.assistant_unavailable is None
+    else:
+        assert backend.assistant is None
+        assert reason in str(backend.assistant_unavailable)
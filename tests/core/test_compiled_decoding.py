@@ -0,0 +1,87 @@
+"""Tests for static-shape compiled decoding."""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+from typing import Any
+
+import pytest
+import torch
+from transformers import GenerationConfig
+
+from insanely_fast_whisper_rocm.core import compiled_decoding
+from insanely_fast_whisper_rocm.core.compiled_decoding import (
+    BucketedGenerate,
+    bucket_batch_size,
+    enable_compiled_decoding,
+)
+from insanely_fast_whisper_rocm.utils import constants
+
+
+@pytest.fixture(autouse=True)
+def real_torch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Undo session-wide ``sys.modules["torch"]`` mocks from other test modules."""
+    monkeypatch.setitem(sys.modules, "torch", torch)
+
+
+def test_bucket_batch_size() -> None:
+    """Batches round up to a power of two without exceeding the limit."""
+    assert [bucket_batch_size(n, 8) for n in range(1, 9)] == [1, 2, 4, 4, 8, 8, 8, 8]
+    assert bucket_batch_size(5, 6) == 6
+    assert bucket_batch_size(3, 2) == 3
+
+
+def test_bucketed_generate_pads_and_trims_rows() -> None:
+    """Padded rows repeat the last row and are dropped from every output."""
+    seen: list[torch.Tensor] = []
+
+    def generate(
+        input_features: torch.Tensor, attention_mask: torch.Tensor, **_: object
+    ) -> dict[str, Any]:
+        seen.append(input_features)
+        rows = input_features.shape[0]
+        return {
+            "sequences": torch.arange(rows).unsqueeze(1),
+            "segments": [[{"row": i}] for i in range(rows)],
+            "scalar": torch.tensor(1.0),
+        }
+
+    features = torch.rand(3, 80, 3000)
+    out = BucketedGenerate(generate, limit=8)(
+        input_features=features, attention_mask=torch.ones(3, 3000)
+    )
+
+    assert seen[0].shape == (4, 80, 3000)
+    assert torch.equal(seen[0][:3], features)
+    assert torch.equal(seen[0][3], features[2])
+    assert out["sequences"].tolist() == [[0], [1], [2]]
+    assert out["segments"] == [[{"row": 0}], [{"row": 1}], [{"row": 2}]]
+    assert out["scalar"].item() == 1.0
+
+
+def test_enable_compiled_decoding_configures_static_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The model gets a fixed-size static cache and a compile config."""
+    monkeypatch.setattr(constants, "TORCH_COMPILE_CACHE_DIR", str(tmp_path))
+    # Recorded first so the variable set by the code is removed afterwards
+    monkeypatch.setenv("TORCHINDUCTOR_CACHE_DIR", "")
+    monkeypatch.delenv("TORCHINDUCTOR_CACHE_DIR")
+    model = types.SimpleNamespace(
+        generation_config=GenerationConfig(),
+        config=types.SimpleNamespace(max_target_positions=448),
+        generate=lambda **_: None,
+    )
+
+    enable_compiled_decoding(model, "cpu", batch_size=8)
+
+    assert model.generation_config.cache_implementation == "static"
+    assert model.generation_config.max_cache_len == 448
+    compile_config = model.generation_config.compile_config
+    assert compile_config.dynamic is False
+    assert compile_config._compile_all_devices is True
+    assert isinstance(model.generate, BucketedGenerate)
+    assert model.generate.limit == 8
+    assert compiled_decoding.os.environ["TORCHINDUCTOR_CACHE_DIR"] == str(tmp_path)
@@ -0,0 +1,134 @@
+"""Tests for the converted-weights cache."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import torch
+from transformers import (
+    AutoModelForSpeechSeq2Seq,
+    GenerationConfig,
+    WhisperConfig,
+    WhisperForConditionalGeneration,
+)
+
+from insanely_fast_whisper_rocm.core import converted_weights
+from insanely_fast_whisper_rocm.core.asr_backend import (
+    HuggingFaceBackend,
+    HuggingFaceBackendConfig,
+)
+from insanely_fast_whisper_rocm.utils import constants
+
+_REVISION = "0123abcd"
+
+
+@pytest.fixture(autouse=True)
+def real_torch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Undo session-wide ``sys.modules["torch"]`` mocks from other test modules."""
+    monkeypatch.setitem(sys.modules, "torch", torch)
+
+
+@pytest.fixture
+def snapshot(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Publish a tiny float32 Whisper checkpoint in a fake Hugging Face cache.
+
+    Returns:
+        Path: The checkpoint's snapshot directory.
+    """
+    config = WhisperConfig(
+        d_model=32,
+        encoder_layers=1,
+        decoder_layers=1,
+        encoder_attention_heads=2,
+        decoder_attention_heads=2,
+        encoder_ffn_dim=64,
+        decoder_ffn_dim=64,
+        dtype="float32",
+    )
+    snapshot_dir = tmp_path / "hub" / "models--org--tiny" / "snapshots" / _REVISION
+    WhisperForConditionalGeneration(config).save_pretrained(snapshot_dir)
+    monkeypatch.setattr(
+        converted_weights,
+        "try_to_load_from_cache",
+        lambda repo_id, filename: (
+            str(snapshot_dir / filename) if repo_id == "org/tiny" else None
+        ),
+    )
+    monkeypatch.setattr(
+        constants, "CONVERTED_MODEL_CACHE_DIR", str(tmp_path / "converted")
+    )
+    return snapshot_dir
+
+
+def test_source_checkpoint_reads_revision_and_dtype(snapshot: Path) -> None:
+    """Revision and stored dtype come from the cached snapshot."""
+    source = converted_weights.source_checkpoint("org/tiny")
+    assert source == converted_weights.SourceCheckpoint(_REVISION, "float32")
+    assert converted_weights.source_checkpoint("org/missing") is None
+
+
+def test_store_and_load_round_trip(snapshot: Path) -> None:
+    """A stored model loads back in its dtype with its generation config."""
+    model = AutoModelForSpeechSeq2Seq.from_pretrained(snapshot, dtype=torch.float16)
+    model.generation_config = GenerationConfig(no_timestamps_token_id=50363)
+    path = converted_weights.converted_model_dir("org/tiny", _REVISION, "float16")
+
+    assert converted_weights.load_converted_model(path, {}) is None
+    converted_weights.store_converted_model(path, model)
+    loaded = converted_weights.load_converted_model(path, {"dtype": torch.float16})
+
+    assert loaded is not None
+    assert loaded.dtype == torch.float16
+    assert loaded.generation_config.no_timestamps_token_id == 50363
+    assert not list(path.parent.glob("*.tmp"))
+
+
+def _config(dtype: str) -> HuggingFaceBackendConfig:
+    return HuggingFaceBackendConfig(
+        model_name="org/tiny",
+        device="cpu",
+        dtype=dtype,
+        batch_size=1,
+        chunk_length=30,
+        progress_group_size=1,
+    )
+
+
+def test_backend_converts_once_per_revision(snapshot: Path) -> None:
+    """Only the first load converts the source; later ones read the cache."""
+    path = converted_weights.converted_model_dir("org/tiny", _REVISION, "float16")
+    load_kwargs = {"dtype": torch.float16, "use_safetensors": True}
+    # Only the backend's source loads are redirected; cache reads stay real
+    with patch(
+        "insanely_fast_whisper_rocm.core.asr_backend.AutoModelForSpeechSeq2Seq"
+    ) as auto_model:
+        from_source = auto_model.from_pretrained
+        from_source.side_effect = lambda _name, **kw: (
+            AutoModelForSpeechSeq2Seq.from_pretrained(snapshot, **kw)
+        )
+        first = HuggingFaceBackend(_config("float16"))
+        model = first._load_model(load_kwargs)
+        assert first._converted_model_dir == path
+        converted_weights.store_converted_model(path, model)
+
+        second = HuggingFaceBackend(_config("float16"))
+        cached = second._load_model(load_kwargs)
+
+    from_source.assert_called_once()
+    assert second._converted_model_dir is None
+    assert cached.dtype == torch.float16
+    assert cached.config._commit_hash == _REVISION
+
+
+def test_backend_skips_cache_for_native_dtype(snapshot: Path) -> None:
+    """Loading in the published dtype converts nothing, so nothing is cached."""
+    backend = HuggingFaceBackend(_config("float32"))
+    with patch(
+        "insanely_fast_whisper_rocm.core.asr_backend.AutoModelForSpeechSeq2Seq"
+        ".from_pretrained"
+    ):
+        backend._load_model({"dtype": torch.float32})
+    assert backend._converted_model_dir is None
@@ -0,0 +1,146 @@
+"""Tests for multi-process CPU inference."""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import torch
+
+from insanely_fast_whisper_rocm.core import backend_cache, cpu_pool
+from insanely_fast_whisper_rocm.core.asr_backend import (
+    ASRBackend,
+    HuggingFaceBackendConfig,
+)
+from insanely_fast_whisper_rocm.core.cancellation import CancellationToken
+from insanely_fast_whisper_rocm.core.cpu_pool import CpuWorkerPoolBackend
+from insanely_fast_whisper_rocm.core.errors import (
+    TranscriptionCancelledError,
+    TranscriptionError,
+)
+from insanely_fast_whisper_rocm.utils import constants
+
+
+class _WorkerBackend(ASRBackend):
+    """Model-free backend reporting which process and thread count served it."""
+
+    def __init__(self, config: HuggingFaceBackendConfig) -> None:
+        self.config = config
+
+    def process_audio(  # type: ignore[override]
+        self, audio_file_path: str, **_: object
+    ) -> dict[str, Any]:
+        if audio_file_path == "crash.wav":
+            os._exit(1)  # Simulate a worker killed mid-call
+        time.sleep(0.3)
+        return {
+            "text": audio_file_path,
+            "pid": os.getpid(),
+            "threads": torch.get_num_threads(),
+        }
+
+    def detect_language(self, audio_file_paths: list[str]) -> str | None:
+        return "de"
+
+
+def _config() -> HuggingFaceBackendConfig:
+    return HuggingFaceBackendConfig(
+        model_name="openai/whisper-tiny",
+        device="cpu",
+        dtype="float32",
+        batch_size=2,
+        chunk_length=15,
+        progress_group_size=4,
+    )
+
+
+def test_worker_threads_split_cores(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Cores are split between workers unless a thread count is configured."""
+    monkeypatch.setattr(constants, "CPU_WORKER_THREADS", 0)
+    monkeypatch.setattr(cpu_pool.os, "cpu_count", lambda: 64)
+    assert cpu_pool.worker_threads(8) == 8
+    assert cpu_pool.worker_threads(128) == 1
+
+    monkeypatch.setattr(constants, "CPU_WORKER_THREADS", 3)
+    assert cpu_pool.worker_threads(8) == 3
+
+
+@pytest.mark.integration
+def test_calls_fan_out_across_worker_processes() -> None:
+    """Concurrent calls run in separate, thread-pinned worker processes."""
+    pool = CpuWorkerPoolBackend(
+        _config(), workers=2, threads=1, backend_factory=_WorkerBackend
+    )
+    try:
+        assert pool.parallelism == 2
+        with ThreadPoolExecutor(max_workers=4) as callers:
+            results = list(
+                callers.map(
+                    lambda n: pool.process_audio(f"{n}.wav", None, "transcribe", False),
+                    range(4),
+                )
+            )
+        assert [r["text"] for r in results] == ["0.wav", "1.wav", "2.wav", "3.wav"]
+        pids = {r["pid"] for r in results}
+        assert len(pids) == 2
+        assert os.getpid() not in pids
+        assert {r["threads"] for r in results} == {1}
+        assert pool.detect_language(["a.wav"]) == "de"
+    finally:
+        pool.close()
+
+
+@pytest.mark.integration
+def test_pool_recovers_after_a_worker_dies() -> None:
+    """A dead worker fails its call; the next call runs on a new pool."""
+    pool = CpuWorkerPoolBackend(
+        _config(), workers=1, threads=1, backend_factory=_WorkerBackend
+    )
+    try:
+        with pytest.raises(TranscriptionError, match="worker process failed"):
+            pool.process_audio("crash.wav", None, "transcribe", False)
+        result = pool.process_audio("ok.wav", None, "transcribe", False)
+        assert result["text"] == "ok.wav"
+    finally:
+        pool.close()
+
+
+def test_cancelled_caller_stops_waiting() -> None:
+    """A cancelled token aborts the wait and cancels the queued call."""
+    pool = CpuWorkerPoolBackend(
+        _config(), workers=1, threads=1, backend_factory=_WorkerBackend
+    )
+    token = CancellationToken()
+    token.cancel()
+    pending: Future[dict[str, Any]] = Future()
+    try:
+        with pytest.raises(TranscriptionCancelledError):
+            pool._wait(pending, token)
+        assert pending.cancelled()
+    finally:
+        pool.close()
+
+
+def test_backend_cache_uses_worker_pool_for_cpu(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``CPU_WORKERS`` > 1 routes CPU configs to the worker pool."""
+    backend_cache.clear_cache()
+    with patch.object(backend_cache, "CpuWorkerPoolBackend") as pool_cls:
+        monkeypatch.setattr(constants, "CPU_WORKERS", 1)
+        with patch.object(backend_cache, "HuggingFaceBackend"):
+            backend_cache.acquire_pipeline(_config(), save_transcriptions=False)
+        pool_cls.assert_not_called()
+
+        backend_cache.clear_cache()
+        monkeypatch.setattr(constants, "CPU_WORKERS", 4)
+        pipeline, _ = backend_cache.acquire_pipeline(
+            _config(), save_transcriptions=False
+        )
+        pool_cls.assert_called_once()
+        assert pipeline.asr_backend is pool_cls.return_value
+    backend_cache.clear_cache()
@@ -0,0 +1,197 @@
+"""Tests for the multi-device replica pool."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from insanely_fast_whisper_rocm.core import backend_cache
+from insanely_fast_whisper_rocm.core.asr_backend import HuggingFaceBackendConfig
+from insanely_fast_whisper_rocm.core.device_pool import (
+    DevicePoolBackend,
+    is_cpu_only,
+    is_device_pool,
+    pool_devices,
+)
+from insanely_fast_whisper_rocm.core.pipeline import WhisperPipeline
+
+
+def _config(device: str = "cpu,cpu") -> HuggingFaceBackendConfig:
+    return HuggingFaceBackendConfig(
+        model_name="openai/whisper-tiny",
+        device=device,
+        dtype="float32",
+        batch_size=2,
+        chunk_length=10,
+        progress_group_size=4,
+    )
+
+
+def _install(pool: DevicePoolBackend, fake: Any) -> None:  # noqa: ANN401
+    """Route every replica's ``process_audio`` to ``fake(replica_index, path)``."""
+    for index, replica in enumerate(pool.replicas):
+        replica.process_audio = (  # type: ignore[method-assign]
+            lambda audio_file_path, i=index, **_: fake(i, audio_file_path)
+        )
+
+
+def test_device_string_parsing() -> None:
+    """Comma-separated device strings select pool mode."""
+    assert pool_devices(" 0, 1 ,") == ["0", "1"]
+    assert pool_devices("cuda:0") == ["cuda:0"]
+    assert is_device_pool("cpu,cpu")
+    assert not is_device_pool("0")
+    assert is_cpu_only("cpu, cpu")
+    assert not is_cpu_only("cpu,0")
+
+
+def test_pool_creates_one_replica_per_device() -> None:
+    """Each replica shares the config except for its own device."""
+    pool = DevicePoolBackend(_config("cpu,cpu"))
+
+    assert pool.parallelism == 2
+    assert [r.config.device for r in pool.replicas] == ["cpu", "cpu"]
+    assert pool.replicas[0] is not pool.replicas[1]
+    assert pool.replicas[1].config.batch_size == 2
+
+
+def test_sequential_calls_rotate_through_replicas() -> None:
+    """With no call in flight, the replica with the fewest completed calls wins."""
+    pool = DevicePoolBackend(_config())
+    _install(pool, lambda i, path: {"text": path, "replica": i})
+
+    used = [
+        pool.process_audio(f"{n}.wav", None, "transcribe", False)["replica"]
+        for n in range(4)
+    ]
+
+    assert used == [0, 1, 0, 1]
+    assert [s["completed"] for s in pool.stats()] == [2, 2]
+
+
+def test_busy_replica_is_skipped() -> None:
+    """A call goes to the replica with the fewest calls in flight."""
+    pool = DevicePoolBackend(_config())
+    started, release = threading.Event(), threading.Event()
+
+    def fake(index: int, path: str) -> dict[str, Any]:
+        if path == "slow.wav":
+            started.set()
+            assert release.wait(5)
+        return {"text": path, "replica": index}
+
+    _install(pool, fake)
+    slow: dict[str, Any] = {}
+    worker = threading.Thread(
+        target=lambda: slow.update(
+            pool.process_audio("slow.wav", None, "transcribe", False)
+        )
+    )
+    worker.start()
+    assert started.wait(5)
+    assert pool.stats()[0]["in_flight"] == 1
+
+    quick = [
+        pool.process_audio("quick.wav", None, "transcribe", False)["replica"]
+        for _ in range(2)
+    ]
+    release.set()
+    worker.join(5)
+
+    assert slow["replica"] == 0
+    assert quick == [1, 1]
+
+
+def test_replica_runs_one_call_at_a_time() -> None:
+    """Calls beyond the pool size queue on a replica instead of sharing it."""
+    pool = DevicePoolBackend(_config())
+    active = [0, 0]
+    peak = [0, 0]
+    guard = threading.Lock()
+
+    def fake(index: int, path: str) -> dict[str, Any]:
+        with guard:
+            active[index] += 1
+            peak[index] = max(peak[index], active[index])
+        time.sleep(0.02)
+        with guard:
+            active[index] -= 1
+        return {"text": path, "replica": index}
+
+    _install(pool, fake)
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(
+            executor.map(
+                lambda n: pool.process_audio(f"{n}.wav", None, "transcribe", False),
+                range(6),
+            )
+        )
+
+    assert len(results) == 6
+    assert peak == [1, 1]
+
+
+def test_pipeline_decodes_chunks_on_all_replicas_in_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Chunks run concurrently across replicas but merge in chunk order."""
+    pool = DevicePoolBackend(_config())
+    # Both replicas must be busy at once; the first chunk finishes last.
+    both_running = threading.Barrier(2, timeout=5)
+    second_done = threading.Event()
+    replicas_used: dict[str, int] = {}
+
+    def fake(index: int, path: str) -> dict[str, Any]:
+        replicas_used[path] = index
+        both_running.wait()
+        if path == "c1.wav":
+            assert second_done.wait(5)
+        else:
+            second_done.set()
+        return {"text": path, "chunks": [{"text": path, "timestamp": (0.0, 1.0)}]}
+
+    _install(pool, fake)
+    monkeypatch.setattr(
+        "insanely_fast_whisper_rocm.audio.conversion.ensure_wav", lambda path: path
+    )
+    monkeypatch.setattr(
+        "insanely_fast_whisper_rocm.audio.processing.split_audio",
+        lambda *_a, **_k: [("c1.wav", 0.0), ("c2.wav", 10.0)],
+    )
+    monkeypatch.setattr(
+        "insanely_fast_whisper_rocm.utils.file_utils.cleanup_temp_files",
+        lambda paths: None,
+    )
+    pipeline = WhisperPipeline(asr_backend=pool, save_transcriptions=False)
+
+    result = pipeline.process(
+        audio_file_path="input.wav",
+        language="en",
+        task="transcribe",
+        timestamp_type="chunk",
+    )
+
+    assert sorted(replicas_used.values()) == [0, 1]
+    assert result["text"] == "c1.wav\n\nc2.wav"
+    assert [c["timestamp"] for c in result["chunks"]] == [[0.0, 1.0], [10.0, 11.0]]
+
+
+def test_backend_cache_builds_pool_for_device_list() -> None:
+    """A device list is cached as one pool and kept on CPU-only invalidation."""
+    backend_cache.clear_cache()
+    try:
+        with patch.object(DevicePoolBackend, "close") as close:
+            with backend_cache.borrow_pipeline(
+                _config(), save_transcriptions=False
+            ) as pipeline:
+                assert isinstance(pipeline.asr_backend, DevicePoolBackend)
+            backend_cache.invalidate_gpu_cache()
+            close.assert_not_called()
+            assert len(backend_cache._CACHE) == 1
+    finally:
+        backend_cache.clear_cache()
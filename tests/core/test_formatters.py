@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import pytest
+
 from insanely_fast_whisper_rocm.core.formatters import (
+    RenderPlan,
     SrtFormatter,
     TxtFormatter,
     VttFormatter,
@@ -407,3 +410,58 @@ class TestResultToWords:
             "Sentence-level chunks were incorrectly detected as word-level. "
             "Average chunk duration was 24.4s, which should fail the heuristic."
         )
+
+
+class TestRenderPlan:
+    """Test suite for the shared RenderPlan cache."""
+
+    _RESULT = {
+        "text": "Hello world. This is a test.",
+        "chunks": [
+            {"text": "Hello", "timestamp": [0.0, 0.4]},
+            {"text": " world.", "timestamp": [0.4, 0.9]},
+            {"text": " This", "timestamp": [1.2, 1.5]},
+            {"text": " is", "timestamp": [1.5, 1.7]},
+            {"text": " a", "timestamp": [1.7, 1.8]},
+            {"text": " test.", "timestamp": [1.8, 2.3]},
+        ],
+    }
+
+    def test_render_plan__segments_once_across_formats(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """SRT, VTT and quality scoring should share a single segmentation."""
+        from insanely_fast_whisper_rocm.core import formatters
+
+        calls = {"words": 0, "segments": 0}
+        real_words = formatters._result_to_words
+        real_segment = formatters.segment_words
+
+        def counting_words(result: dict) -> list | None:
+            calls["words"] += 1
+            return real_words(result)
+
+        def counting_segment(words: list) -> list:
+            calls["segments"] += 1
+            return real_segment(words)
+
+        monkeypatch.setattr(formatters, "_result_to_words", counting_words)
+        monkeypatch.setattr(formatters, "segment_words", counting_segment)
+
+        plan = RenderPlan(self._RESULT)
+        srt = SrtFormatter.format(self._RESULT, plan=plan)
+        vtt = VttFormatter.format(self._RESULT, plan=plan)
+        quality = build_quality_segments(self._RESULT, plan)
+
+        assert calls == {"words": 1, "segments": 1}
+        assert srt == SrtFormatter.format(self._RESULT)
+        assert vtt == VttFormatter.format(self._RESULT)
+        assert len(quality) == len(plan.segments)
+
+    def test_render_plan__resolve_ignores_foreign_plan(self) -> None:
+        """A plan built for another result must not be reused."""
+        plan = RenderPlan({"text": "other"})
+        resolved = RenderPlan.resolve(self._RESULT, plan)
+        assert resolved is not plan
+        assert resolved.result is self._RESULT
+        assert RenderPlan.resolve(self._RESULT, resolved) is resolved
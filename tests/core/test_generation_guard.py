@@ -0,0 +1,257 @@
+"""Tests for the generation budget and runaway-decoding guard."""
+
+from __future__ import annotations
+
+import types
+import wave
+from pathlib import Path
+from typing import Any
+
+import pytest
+import torch
+
+from insanely_fast_whisper_rocm.audio.results import merge_chunk_results
+from insanely_fast_whisper_rocm.core.asr_backend import (
+    HuggingFaceBackend,
+    HuggingFaceBackendConfig,
+)
+from insanely_fast_whisper_rocm.core.generation_guard import (
+    BudgetMonitor,
+    RepetitionGuard,
+    compression_ratio,
+    max_new_tokens_for,
+)
+from insanely_fast_whisper_rocm.utils import constants
+
+_LOOP = "thank you " * 60
+
+
+def _wav(path: Path, seconds: float) -> Path:
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(16000)
+        handle.writeframes(b"\0\0" * int(16000 * seconds))
+    return path
+
+
+def test_max_new_tokens_for__scales_with_duration(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The budget grows with duration and stays within the decoder limit."""
+    monkeypatch.setattr(constants, "GENERATION_TOKENS_PER_SECOND", 8.0)
+    monkeypatch.setattr(constants, "GENERATION_TOKEN_MARGIN", 16)
+    assert max_new_tokens_for(10.0) == 96
+    assert max_new_tokens_for(30.0) == 256
+    assert max_new_tokens_for(600.0) == 444
+    assert max_new_tokens_for(None) is None
+
+    monkeypatch.setattr(constants, "GENERATION_TOKENS_PER_SECOND", 0.0)
+    assert max_new_tokens_for(10.0) is None
+
+
+def test_compression_ratio__flags_loops() -> None:
+    """Repeated text compresses far better than ordinary speech."""
+    speech = (
+        "The committee met on Tuesday to review the budget, and after a long "
+        "debate about road repairs they postponed the vote until next month."
+    )
+    assert compression_ratio("") == 0.0
+    assert compression_ratio(speech) < 2.4
+    assert compression_ratio(_LOOP) > 2.4
+
+
+def test_repetition_guard__stops_only_looping_rows() -> None:
+    """A looping sequence is finished while a varied one keeps going."""
+    guard = RepetitionGuard(threshold=2.4, window=32, stride=4)
+    prompt = [50258, 50259, 50360]
+    varied = prompt[:]
+    looping = prompt[:]
+    flags = torch.zeros(2, dtype=torch.bool)
+    for step in range(64):
+        varied.append(1000 + step * 37)
+        looping.append(500 + step % 3)
+        flags |= guard(torch.tensor([varied, looping]), None)
+
+    assert flags.tolist() == [False, True]
+    assert guard.triggered is True
+
+
+def test_repetition_guard__restarts_for_each_generate_call() -> None:
+    """A new, shorter sequence starts a fresh budget of generated tokens."""
+    guard = RepetitionGuard(threshold=2.4, window=8, stride=1)
+    assert not guard(torch.tensor([[1, 2, 3] * 6]), None).any()
+    # The next generate() call begins with a short prompt again
+    assert not guard(torch.tensor([[7, 7]]), None).any()
+    assert guard._prompt_length == 2
+
+
+class _Pipe:
+    """ASR pipeline stub returning queued texts and recording kwargs."""
+
+    def __init__(self, texts: list[str]) -> None:
+        self.texts = texts
+        self.calls: list[dict[str, Any]] = []
+        self.model = types.SimpleNamespace(
+            generation_config=types.SimpleNamespace(
+                no_timestamps_token_id=1, lang_to_id={"en": 2}, task_to_id={}
+            ),
+            config=types.SimpleNamespace(
+                lang_to_id={"en": 2, "de": 3}, task_to_id={}, max_target_positions=448
+            ),
+        )
+
+    def __call__(self, _path: str, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        """Record the call.
+
+        Returns:
+            dict[str, Any]: The next queued text.
+        """
+        self.calls.append(kwargs)
+        return {"text": self.texts.pop(0)}
+
+
+class _CappingPipe(_Pipe):
+    """Pipeline stub whose decodes always run until ``max_new_tokens``."""
+
+    def __call__(self, path: str, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        """Step the stopping criteria through the whole token budget.
+
+        Returns:
+            dict[str, Any]: The next queued text.
+        """
+        generate_kwargs = kwargs["generate_kwargs"]
+        for length in range(4, 4 + generate_kwargs["max_new_tokens"]):
+            generate_kwargs["stopping_criteria"](
+                torch.zeros(1, length, dtype=torch.long), None
+            )
+        return super().__call__(path, **kwargs)
+
+
+def _backend(pipe: _Pipe) -> HuggingFaceBackend:
+    backend = HuggingFaceBackend(
+        HuggingFaceBackendConfig(
+            model_name="openai/whisper-tiny",
+            device="cpu",
+            dtype="float32",
+            batch_size=1,
+            chunk_length=30,
+            progress_group_size=1,
+        )
+    )
+    backend.asr_pipe = pipe
+    return backend
+
+
+def test_process_audio__caps_tokens_by_duration(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The chunk's duration sets max_new_tokens and no guard fires."""
+    monkeypatch.setattr(constants, "GENERATION_TOKENS_PER_SECOND", 8.0)
+    pipe = _Pipe(["hello there"])
+    result = _backend(pipe).process_audio(
+        str(_wav(tmp_path / "a.wav", 5.0)),
+        language="en",
+        task="transcribe",
+        return_timestamps_value=False,
+    )
+
+    expected = max_new_tokens_for(5.0)
+    assert pipe.calls[0]["generate_kwargs"]["max_new_tokens"] == expected
+    assert result["config_used"]["max_new_tokens"] == expected
+    assert "generation_guard" not in result
+
+
+def test_process_audio__budget_is_opt_in(tmp_path: Path) -> None:
+    """By default decodes keep the model's own token limit."""
+    pipe = _Pipe(["hello there"])
+    result = _backend(pipe).process_audio(
+        str(_wav(tmp_path / "a.wav", 5.0)),
+        language="en",
+        task="transcribe",
+        return_timestamps_value=False,
+    )
+
+    assert "max_new_tokens" not in pipe.calls[0]["generate_kwargs"]
+    assert result["config_used"]["max_new_tokens"] is None
+
+
+def test_budget_monitor__reports_capped_decodes() -> None:
+    """The monitor notes a decode that reached its cap without stopping it."""
+    monitor = BudgetMonitor(max_new_tokens=3)
+    prompt = [50258, 50259, 50360]
+    for step in range(2):
+        ids = torch.tensor([prompt + list(range(step + 1))])
+        assert not monitor(ids, None).any()
+    assert monitor.reached is False
+    monitor(torch.tensor([prompt + [0, 1, 2]]), None)
+    assert monitor.reached is True
+
+
+def test_process_audio__records_reached_budget(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A decode that runs into max_new_tokens is recorded in the guard events."""
+    monkeypatch.setattr(constants, "GENERATION_TOKENS_PER_SECOND", 8.0)
+    result = _backend(_CappingPipe(["hello there"])).process_audio(
+        str(_wav(tmp_path / "a.wav", 5.0)),
+        language="en",
+        task="transcribe",
+        return_timestamps_value=False,
+    )
+
+    (event,) = result["generation_guard"]
+    assert event == {
+        "chunk": "a.wav",
+        "reason": "max_new_tokens_reached",
+        "max_new_tokens": max_new_tokens_for(5.0),
+    }
+
+
+def test_process_audio__retries_looping_chunk(tmp_path: Path) -> None:
+    """A looping decode is retried with a repetition penalty and recorded."""
+    pipe = _Pipe([_LOOP, "thank you for listening"])
+    result = _backend(pipe).process_audio(
+        str(_wav(tmp_path / "a.wav", 5.0)),
+        language="en",
+        task="transcribe",
+        return_timestamps_value=False,
+    )
+
+    assert result["text"] == "thank you for listening"
+    assert "repetition_penalty" not in pipe.calls[0]["generate_kwargs"]
+    assert pipe.calls[1]["generate_kwargs"]["repetition_penalty"] == (
+        constants.GENERATION_RETRY_REPETITION_PENALTY
+    )
+    (event,) = result["generation_guard"]
+    assert event["chunk"] == "a.wav"
+    assert event["reason"] == "compression_ratio"
+    assert event["resolved"] is True
+    assert event["kept"] == "retry"
+
+
+def test_process_audio__guard_disabled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With the guard off, looping output is returned as is."""
+    monkeypatch.setattr(constants, "GENERATION_REPETITION_GUARD", False)
+    pipe = _Pipe([_LOOP])
+    result = _backend(pipe).process_audio(
+        str(_wav(tmp_path / "a.wav", 5.0)),
+        language="en",
+        task="transcribe",
+        return_timestamps_value=False,
+    )
+
+    assert len(pipe.calls) == 1
+    assert "stopping_criteria" not in pipe.calls[0]["generate_kwargs"]
+    assert "generation_guard" not in result
+
+
+def test_merge_chunk_results__keeps_guard_events() -> None:
+    """Guard events survive merging and carry their chunk offset."""
+    merged = merge_chunk_results([
+        ({"text": "a", "chunks": []}, 0.0),
+        ({"text": "b", "chunks": [], "generation_guard": [{"chunk": "c2"}]}, 30.0),
+    ])
+    assert merged["generation_guard"] == [{"chunk": "c2", "chunk_start": 30.0}]
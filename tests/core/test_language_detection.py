@@ -0,0 +1,263 @@
+"""Tests for once-per-file language detection in `WhisperPipeline`."""
+
+from __future__ import annotations
+
+import threading
+import types
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import pytest
+import torch
+
+from insanely_fast_whisper_rocm.core import asr_backend as asr_backend_module
+from insanely_fast_whisper_rocm.core import pipeline as pipeline_module
+from insanely_fast_whisper_rocm.core.asr_backend import (
+    ASRBackend,
+    HuggingFaceBackend,
+    HuggingFaceBackendConfig,
+)
+from insanely_fast_whisper_rocm.core.pipeline import WhisperPipeline
+from insanely_fast_whisper_rocm.utils import constants
+
+
+class _DetectingBackend(ASRBackend):
+    """Backend stub that detects a fixed language and records decodes."""
+
+    def __init__(self, language: str | None = "de") -> None:
+        """Initialize the stub.
+
+        Args:
+            language: Language returned by `detect_language`.
+        """
+        self.config = types.SimpleNamespace(chunk_length=30)
+        self.language = language
+        self.detect_calls: list[list[str]] = []
+        self.decode_languages: list[str | None] = []
+
+    def detect_language(self, audio_file_paths: list[str]) -> str | None:
+        """Record the sampled chunks.
+
+        Returns:
+            str | None: The configured language.
+        """
+        self.detect_calls.append(list(audio_file_paths))
+        return self.language
+
+    def process_audio(  # type: ignore[override]
+        self, audio_file_path: str, language: str | None, **_: object
+    ) -> dict[str, Any]:
+        """Record the language each chunk is decoded with.
+
+        Returns:
+            dict[str, Any]: A minimal chunk result.
+        """
+        self.decode_languages.append(language)
+        return {"text": audio_file_path, "chunks": [], "runtime_seconds": 0.1}
+
+
+@pytest.fixture
+def audio_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A real input file split into five fake chunks.
+
+    Returns:
+        Path: The input file.
+    """
+    monkeypatch.setattr(pipeline_module, "_LANGUAGE_CACHE", OrderedDict())
+    monkeypatch.setattr(
+        "insanely_fast_whisper_rocm.audio.conversion.ensure_wav", lambda path: path
+    )
+    monkeypatch.setattr(
+        "insanely_fast_whisper_rocm.audio.processing.split_audio",
+        lambda *_a, **_k: [(f"chunk_{i}.wav", i * 30.0) for i in range(5)],
+    )
+    monkeypatch.setattr(
+        "insanely_fast_whisper_rocm.utils.file_utils.cleanup_temp_files",
+        lambda _paths: None,
+    )
+    path = tmp_path / "talk.wav"
+    path.write_bytes(b"RIFF-audio")
+    return path
+
+
+def _run(backend: ASRBackend, audio_file: Path, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+    pipeline = WhisperPipeline(asr_backend=backend, save_transcriptions=False)
+    params: dict[str, Any] = {
+        "language": None,
+        "task": "transcribe",
+        "timestamp_type": "chunk",
+    }
+    params.update(kwargs)
+    return pipeline.process(str(audio_file), **params)
+
+
+def test_language_detected_once_and_reused(audio_file: Path) -> None:
+    """Detection samples spread-out chunks and pins every chunk decode."""
+    backend = _DetectingBackend("de")
+    result = _run(backend, audio_file)
+
+    assert backend.detect_calls == [["chunk_0.wav", "chunk_1.wav", "chunk_3.wav"]]
+    assert backend.decode_languages == ["de"] * 5
+    assert result["detected_language"] == "de"
+
+
+def test_detected_language_is_cached_per_content(audio_file: Path) -> None:
+    """Re-running the same audio reuses the cached language."""
+    backend = _DetectingBackend("fr")
+    _run(backend, audio_file)
+    result = _run(backend, audio_file)
+
+    assert len(backend.detect_calls) == 1
+    assert result["detected_language"] == "fr"
+
+
+def test_explicit_language_skips_detection(audio_file: Path) -> None:
+    """Detection only runs when no language was given."""
+    backend = _DetectingBackend("de")
+    _run(backend, audio_file, language="en")
+
+    assert backend.detect_calls == []
+    assert backend.decode_languages == ["en"] * 5
+
+
+def test_translate_detects_source_language(audio_file: Path) -> None:
+    """Translations pin the detected source language like transcriptions."""
+    backend = _DetectingBackend("de")
+    result = _run(backend, audio_file, task="translate")
+
+    assert len(backend.detect_calls) == 1
+    assert backend.decode_languages == ["de"] * 5
+    assert result["detected_language"] == "de"
+
+
+def test_only_detection_holds_the_inference_lock(audio_file: Path) -> None:
+    """Hashing and the cache lookup run without the inference lock."""
+    lock = threading.Lock()
+    backend = _DetectingBackend(None)
+
+    def detect_language(_paths: list[str]) -> str | None:
+        return "de" if lock.locked() else None
+
+    backend.detect_language = detect_language  # type: ignore[method-assign]
+    pipeline = WhisperPipeline(asr_backend=backend, save_transcriptions=False)
+    chunks = [(f"chunk_{i}.wav", i * 30.0) for i in range(5)]
+
+    assert pipeline._identify_language(str(audio_file), chunks, lock) == "de"
+    assert not lock.locked()
+    with lock:
+        # Another job is decoding; the cached language must not wait for it.
+        assert pipeline._identify_language(str(audio_file), chunks, lock) == "de"
+
+
+def test_detection_disabled_or_unsupported(
+    audio_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Without a detected language each chunk detects on its own."""
+    backend = _DetectingBackend(None)
+    result = _run(backend, audio_file)
+    assert "detected_language" not in result
+    assert backend.decode_languages == [None] * 5
+
+    monkeypatch.setattr(constants, "LANGUAGE_DETECTION_SAMPLE_CHUNKS", 0)
+    backend = _DetectingBackend("de")
+    _run(backend, audio_file)
+    assert backend.detect_calls == []
+
+
+class _FeatureExtractor:
+    """Feature extractor stub producing one feature row per sample."""
+
+    sampling_rate = 16000
+    n_samples = 16000
+
+    def __call__(self, samples: list[Any], **_: object) -> types.SimpleNamespace:
+        """Check that samples are cut to the window and batch them.
+
+        Returns:
+            types.SimpleNamespace: Object exposing ``input_features``.
+        """
+        assert all(len(sample) == self.n_samples for sample in samples)
+        return types.SimpleNamespace(input_features=torch.zeros(len(samples), 2, 2))
+
+
+class _Model:
+    """Model stub returning fixed language token ids."""
+
+    device = torch.device("cpu")
+    dtype = torch.float32
+    generation_config = types.SimpleNamespace(lang_to_id={"<|en|>": 2})
+
+    def __init__(self, token_ids: list[int]) -> None:
+        """Initialize the stub.
+
+        Args:
+            token_ids: Language token ids returned per sample.
+        """
+        self.token_ids = token_ids
+
+    def detect_language(self, input_features: torch.Tensor) -> torch.Tensor:
+        """Return the configured token ids, one per sample.
+
+        Returns:
+            torch.Tensor: Language token ids of shape ``(batch, 1)``.
+        """
+        assert input_features.shape[0] == len(self.token_ids)
+        return torch.tensor(self.token_ids).view(-1, 1)
+
+
+def test_hf_backend_detect_language_votes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The most frequent language token wins, ties going to the first sample."""
+    backend = HuggingFaceBackend(
+        HuggingFaceBackendConfig(
+            model_name="openai/whisper-tiny",
+            device="cpu",
+            dtype="float32",
+            batch_size=1,
+            chunk_length=30,
+            progress_group_size=1,
+        )
+    )
+    vocabulary = {1: "<|de|>", 2: "<|en|>"}
+    model = _Model([2, 1, 1])
+    backend.asr_pipe = types.SimpleNamespace(
+        model=model,
+        feature_extractor=_FeatureExtractor(),
+        tokenizer=types.SimpleNamespace(
+            convert_ids_to_tokens=lambda ids: [vocabulary[i] for i in ids]
+        ),
+    )
+    monkeypatch.setattr(
+        asr_backend_module, "ffmpeg_read", lambda _data, _rate: [0.0] * 32000
+    )
+    paths = []
+    for name in ("a.wav", "b.wav", "c.wav"):
+        (tmp_path / name).write_bytes(b"x")
+        paths.append(str(tmp_path / name))
+
+    assert backend.detect_language(paths) == "de"
+    model.token_ids = [2, 1]
+    assert backend.detect_language(paths[:2]) == "en"
+    assert backend.detect_language([]) is None
+
+
+def test_hf_backend_detect_language_without_language_tokens(
+    tmp_path: Path,
+) -> None:
+    """English-only checkpoints report no language."""
+    backend = HuggingFaceBackend(
+        HuggingFaceBackendConfig(
+            model_name="openai/whisper-tiny.en",
+            device="cpu",
+            dtype="float32",
+            batch_size=1,
+            chunk_length=30,
+            progress_group_size=1,
+        )
+    )
+    model = _Model([2])
+    model.generation_config = types.SimpleNamespace(lang_to_id=None)
+    backend.asr_pipe = types.SimpleNamespace(model=model)
+    assert backend.detect_language([str(tmp_path / "a.wav")]) is None
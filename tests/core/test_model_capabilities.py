@@ -0,0 +1,190 @@
+"""Tests for model capability profiles and their reuse by the backend."""
+
+from __future__ import annotations
+
+import json
+import types
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from insanely_fast_whisper_rocm.core import model_capabilities
+from insanely_fast_whisper_rocm.core.asr_backend import (
+    HuggingFaceBackend,
+    HuggingFaceBackendConfig,
+)
+from insanely_fast_whisper_rocm.core.model_capabilities import (
+    ModelCapabilities,
+    load_profile,
+    probe_capabilities,
+    store_profile,
+)
+from insanely_fast_whisper_rocm.utils import constants
+
+_MULTILINGUAL = {"lang_to_id": {"en": 1, "de": 2}, "task_to_id": {"transcribe": 3}}
+
+
+def _model(revision: str | None = None, **generation: Any) -> types.SimpleNamespace:  # noqa: ANN401
+    return types.SimpleNamespace(
+        generation_config=types.SimpleNamespace(**generation),
+        config=types.SimpleNamespace(_commit_hash=revision, **_MULTILINGUAL),
+    )
+
+
+def _backend(model_name: str = "openai/whisper-tiny") -> HuggingFaceBackend:
+    return HuggingFaceBackend(
+        HuggingFaceBackendConfig(
+            model_name=model_name,
+            device="cpu",
+            dtype="float32",
+            batch_size=2,
+            chunk_length=30,
+            progress_group_size=1,
+        )
+    )
+
+
+def test_probe_capabilities__multilingual_with_timestamps() -> None:
+    """A complete Whisper checkpoint supports everything."""
+    caps = probe_capabilities(
+        "openai/whisper-tiny",
+        _model("abc", no_timestamps_token_id=5, **_MULTILINGUAL),
+    )
+    assert caps.supports_timestamps is True
+    assert caps.multilingual is True
+    assert caps.task_mappings is True
+    assert caps.revision == "abc"
+
+
+@pytest.mark.parametrize(
+    ("model_name", "expected"),
+    [
+        ("distil-whisper/distil-large-v2", True),
+        ("distil-whisper/distil-large-v3.5", True),
+        ("distil-whisper/distil-medium.en", False),
+    ],
+)
+def test_probe_capabilities__distil_timestamp_support(
+    model_name: str, expected: bool
+) -> None:
+    """distil-whisper timestamps depend on the checkpoint version."""
+    caps = probe_capabilities(model_name, _model(no_timestamps_token_id=5))
+    assert caps.supports_timestamps is expected
+    assert caps.task_mappings is False
+
+
+def test_store_and_load_profile__persists_per_revision() -> None:
+    """Profiles with a revision survive a fresh registry."""
+    caps = probe_capabilities(
+        "org/whisper-ft", _model("rev1", no_timestamps_token_id=5)
+    )
+    store_profile(caps)
+    model_capabilities._PROFILES.clear()
+
+    assert load_profile("org/whisper-ft", "rev1") == caps
+    assert load_profile("org/whisper-ft", "rev2") is None
+    assert load_profile("org/whisper-ft", None) is None
+    assert list(Path(constants.MODEL_PROFILE_CACHE_DIR).glob("*.json")) == [
+        Path(constants.MODEL_PROFILE_CACHE_DIR) / "org--whisper-ft@rev1.json"
+    ]
+
+
+def test_load_profile__ignores_other_transformers_versions() -> None:
+    """Profiles written by another Transformers version are re-probed."""
+    store_profile(ModelCapabilities("org/whisper-ft", "rev1", True, True, True))
+    path = Path(constants.MODEL_PROFILE_CACHE_DIR) / "org--whisper-ft@rev1.json"
+    data = json.loads(path.read_text())
+    data["transformers_version"] = "0.0.1"
+    path.write_text(json.dumps(data))
+    model_capabilities._PROFILES.clear()
+
+    assert load_profile("org/whisper-ft", "rev1") is None
+
+
+def test_process_audio__probes_once_and_reuses_kwargs(tmp_path: Path) -> None:
+    """Capabilities are probed once and kwargs templates are not shared."""
+    backend = _backend()
+    calls: list[dict[str, Any]] = []
+    pipe = MagicMock(
+        side_effect=lambda _path, **kwargs: calls.append(kwargs) or {"text": "hi"}
+    )
+    pipe.model = _model(no_timestamps_token_id=5, **_MULTILINGUAL)
+    backend.asr_pipe = pipe
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"0")
+
+    with patch(
+        "insanely_fast_whisper_rocm.core.asr_backend.probe_capabilities",
+        wraps=probe_capabilities,
+    ) as probe:
+        for _ in range(3):
+            backend.process_audio(
+                str(audio),
+                language="de",
+                task="transcribe",
+                return_timestamps_value=True,
+            )
+        calls[0]["generate_kwargs"]["language"] = "mutated"
+        backend.process_audio(
+            str(audio), language="de", task="transcribe", return_timestamps_value=True
+        )
+
+    assert probe.call_count == 1
+    assert len(backend._kwargs_templates) == 1
+    generate_kwargs = dict(calls[-1]["generate_kwargs"])
+    generate_kwargs.pop("stopping_criteria", None)
+    assert generate_kwargs == {
+        "no_repeat_ngram_size": 3,
+        "temperature": 0,
+        "task": "transcribe",
+        "language": "de",
+    }
+
+
+def test_initialize_pipeline__reuses_persisted_backfill() -> None:
+    """A stored profile restores the backfilled config without fetching it."""
+    backfilled = {"no_timestamps_token_id": 5, **_MULTILINGUAL}
+
+    def load(backend: HuggingFaceBackend, generation_config: object) -> MagicMock:
+        model = MagicMock()
+        model.generation_config = generation_config
+        model.config = types.SimpleNamespace(_commit_hash="rev1", **_MULTILINGUAL)
+        with (
+            patch(
+                "insanely_fast_whisper_rocm.core.asr_backend.AutoModelForSpeechSeq2Seq.from_pretrained",
+                return_value=model,
+            ),
+            patch(
+                "insanely_fast_whisper_rocm.core.asr_backend.AutoTokenizer.from_pretrained"
+            ),
+            patch(
+                "insanely_fast_whisper_rocm.core.asr_backend.AutoFeatureExtractor.from_pretrained"
+            ),
+            patch(
+                "insanely_fast_whisper_rocm.core.asr_backend.GenerationConfig"
+            ) as gen_config_cls,
+            patch(
+                "insanely_fast_whisper_rocm.core.asr_backend.pipeline",
+                return_value=MagicMock(model=model),
+            ),
+        ):
+            gen_config_cls.from_pretrained.return_value = MagicMock(
+                no_timestamps_token_id=5, to_dict=lambda: backfilled, **_MULTILINGUAL
+            )
+            backend._initialize_pipeline()
+        return gen_config_cls
+
+    first = load(_backend("org/whisper-small-ft"), None)
+    first.from_pretrained.assert_called_once_with("openai/whisper-small")
+
+    model_capabilities._PROFILES.clear()
+    second_backend = _backend("org/whisper-small-ft")
+    second = load(second_backend, None)
+    second.from_pretrained.assert_not_called()
+    second.from_dict.assert_called_once_with(backfilled)
+    assert second_backend.capabilities is not None
+    assert second_backend.capabilities.generation_config_source == (
+        "openai/whisper-small"
+    )
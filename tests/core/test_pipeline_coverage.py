@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import pathlib
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -373,3 +374,57 @@ def test_execute_asr_no_chunks_error(tmp_path: pathlib.Path) -> None:
                 progress_callback=NoOpProgress(),
                 cancellation_token=None,
             )
+
+
+def test_execute_asr_holds_inference_lock_only_while_decoding(
+    tmp_path: pathlib.Path,
+) -> None:
+    """Conversion and splitting run before the inference lock is taken."""
+    audio_file = tmp_path / "test.wav"
+    audio_file.write_text("fake audio")
+    lock = threading.Lock()
+    held: dict[str, bool] = {}
+
+    def convert(path: str) -> str:
+        held["convert"] = lock.locked()
+        return path
+
+    def split(path: str, **_: object) -> list[tuple[str, float]]:
+        held["split"] = lock.locked()
+        return [(path, 0.0)]
+
+    def decode(**_: object) -> dict[str, object]:
+        held["decode"] = lock.locked()
+        return {"text": "test", "chunks": []}
+
+    mock_backend = MagicMock(spec=ASRBackend)
+    mock_backend.config = MagicMock(chunk_length=30)
+    mock_backend.process_audio.side_effect = decode
+    pipeline = WhisperPipeline(
+        asr_backend=mock_backend,
+        storage_backend=None,
+        save_transcriptions=False,
+    )
+
+    with (
+        patch(
+            "insanely_fast_whisper_rocm.core.pipeline.audio_conversion.ensure_wav",
+            side_effect=convert,
+        ),
+        patch(
+            "insanely_fast_whisper_rocm.core.pipeline.audio_processing.split_audio",
+            side_effect=split,
+        ),
+    ):
+        pipeline._execute_asr(
+            prepared_data=str(audio_file),
+            language="en",
+            task="transcribe",
+            timestamp_type="chunk",
+            progress_callback=NoOpProgress(),
+            cancellation_token=None,
+            inference_lock=lock,
+        )
+
+    assert held == {"convert": False, "split": False, "decode": True}
+    assert not lock.locked()
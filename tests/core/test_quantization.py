@@ -0,0 +1,159 @@
+"""Tests for dynamic int8 quantization on the CPU."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import torch
+import transformers
+from torch import nn
+from torch.ao.nn.quantized.dynamic import Linear as DynamicLinear
+
+from insanely_fast_whisper_rocm.core import quantization
+from insanely_fast_whisper_rocm.core.asr_backend import (
+    HuggingFaceBackend,
+    HuggingFaceBackendConfig,
+)
+from insanely_fast_whisper_rocm.core.errors import TranscriptionError
+from insanely_fast_whisper_rocm.utils import constants
+
+
+@pytest.fixture(autouse=True)
+def real_torch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Undo session-wide ``sys.modules["torch"]`` mocks from other test modules.
+
+    Quantized kernels look ``torch`` up in ``sys.modules`` at call time.
+    """
+    monkeypatch.setitem(sys.modules, "torch", torch)
+
+
+@pytest.fixture
+def cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point the quantized-model cache at a temp directory.
+
+    Returns:
+        Path: The cache directory.
+    """
+    monkeypatch.setattr(constants, "QUANTIZED_MODEL_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _float_model() -> nn.Module:
+    torch.manual_seed(0)
+    return _skeleton()
+
+
+def _skeleton() -> nn.Module:
+    return nn.Sequential(nn.Linear(16, 32), nn.ReLU(), nn.Linear(32, 4))
+
+
+def test_linear_layers_are_quantized() -> None:
+    """Linear layers become dynamic int8 modules with close outputs."""
+    model = _float_model()
+    inputs = torch.randn(3, 16)
+    expected = model(inputs)
+
+    quantized = quantization.quantize_linear_int8(model)
+
+    assert isinstance(quantized[0], DynamicLinear)
+    assert torch.allclose(quantized(inputs), expected, atol=0.05)
+
+
+def test_quantized_model_is_cached_per_revision(cache_dir: Path) -> None:
+    """The second load rebuilds the cached weights instead of quantizing again."""
+    loader = MagicMock(side_effect=_float_model)
+    skeleton = MagicMock(side_effect=_skeleton)
+    inputs = torch.randn(2, 16)
+
+    first = quantization.load_int8_model("org/model", "abc123", loader, skeleton)
+    second = quantization.load_int8_model("org/model", "abc123", loader, skeleton)
+
+    loader.assert_called_once()
+    skeleton.assert_called_once()
+    assert [p.name for p in cache_dir.iterdir()] == [
+        f"org--model@abc123-torch{torch.__version__.replace('+', '-')}"
+        f"-transformers{transformers.__version__}-int8.pt"
+    ]
+    assert isinstance(second[0], DynamicLinear)
+    assert torch.equal(first(inputs), second(inputs))
+    # Plain tensors only: readable without unpickling arbitrary objects
+    torch.load(next(cache_dir.iterdir()), weights_only=True)
+
+
+def test_unknown_revision_is_not_cached(cache_dir: Path) -> None:
+    """Without a revision the model is quantized on every load."""
+    loader = MagicMock(side_effect=_float_model)
+
+    quantization.load_int8_model("local/model", None, loader, _skeleton)
+    quantization.load_int8_model("local/model", None, loader, _skeleton)
+
+    assert loader.call_count == 2
+    assert not any(cache_dir.iterdir())
+
+
+def test_corrupt_cache_entry_is_requantized(cache_dir: Path) -> None:
+    """An unreadable cache file is treated as a miss and replaced."""
+    path = quantization._cache_path("org/model", "abc123")
+    path.write_bytes(b"not a model")
+    loader = MagicMock(side_effect=_float_model)
+
+    model = quantization.load_int8_model("org/model", "abc123", loader, _skeleton)
+
+    loader.assert_called_once()
+    assert isinstance(model, nn.Module)
+    assert isinstance(quantization._load_cached(path, _skeleton), nn.Module)
+
+
+def _config(device: str) -> HuggingFaceBackendConfig:
+    return HuggingFaceBackendConfig(
+        model_name="openai/whisper-tiny",
+        device=device,
+        dtype="int8",
+        batch_size=2,
+        chunk_length=15,
+        progress_group_size=4,
+    )
+
+
+def test_int8_requires_cpu() -> None:
+    """int8 inference is rejected on accelerators."""
+    with pytest.raises(TranscriptionError, match="only supported on the CPU"):
+        HuggingFaceBackend(_config("0"))
+
+
+def test_backend_loads_int8_model_by_revision(cache_dir: Path) -> None:
+    """The backend keys the quantized cache by the checkpoint's hub revision."""
+    backend = HuggingFaceBackend(_config("cpu"))
+    hub_config = MagicMock(_commit_hash="rev42")
+    with (
+        patch(
+            "insanely_fast_whisper_rocm.core.asr_backend.AutoConfig.from_pretrained",
+            return_value=hub_config,
+        ),
+        patch(
+            "insanely_fast_whisper_rocm.core.asr_backend.AutoModelForSpeechSeq2Seq"
+            ".from_pretrained",
+            side_effect=lambda *_a, **_k: _float_model(),
+        ) as from_pretrained,
+        patch(
+            "insanely_fast_whisper_rocm.core.asr_backend.AutoModelForSpeechSeq2Seq"
+            ".from_config",
+            side_effect=lambda _config: _skeleton(),
+        ) as from_config,
+        patch(
+            "insanely_fast_whisper_rocm.core.asr_backend.GenerationConfig"
+            ".from_pretrained",
+            side_effect=OSError("offline"),
+        ),
+    ):
+        model = backend._load_model({"dtype": torch.float32})
+        cached = backend._load_model({"dtype": torch.float32})
+
+    from_pretrained.assert_called_once_with("openai/whisper-tiny", dtype=torch.float32)
+    from_config.assert_called_once_with(hub_config)
+    assert isinstance(model[0], DynamicLinear)
+    assert isinstance(cached[0], DynamicLinear)
+    assert quantization._cache_path("openai/whisper-tiny", "rev42").is_file()
@@ -0,0 +1,140 @@
+"""Tests for `insanely_fast_whisper_rocm.core.result_writer`."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+from insanely_fast_whisper_rocm.core.asr_backend import ASRBackend
+from insanely_fast_whisper_rocm.core.pipeline import ProgressEvent, WhisperPipeline
+from insanely_fast_whisper_rocm.core.result_writer import BackgroundResultWriter
+from insanely_fast_whisper_rocm.core.storage import BaseStorage, JsonStorage
+
+
+class _BlockingStorage(JsonStorage):
+    """JsonStorage whose writes wait until ``release`` is set."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def save(
+        self, data: dict[str, Any], destination_path: Path, task: str
+    ) -> str | None:
+        self.release.wait(timeout=5)
+        return super().save(data, destination_path, task)
+
+
+def test_submit__returns_final_path_before_write(tmp_path: Path) -> None:
+    """The output path is known immediately; the file appears after flush."""
+    storage = _BlockingStorage()
+    writer = BackgroundResultWriter(max_workers=1)
+    data: dict[str, Any] = {"text": "hello", "chunks": [{"text": "hello"}]}
+
+    path = writer.submit(storage, data, tmp_path / "out.json", "transcribe")
+    # Later changes, nested ones included, must not leak in
+    data["pipeline_runtime_seconds"] = 1.0
+    data["chunks"][0]["text"] = "changed"
+
+    assert path == str(tmp_path / "out.json")
+    assert writer.pending_count == 1
+    storage.release.set()
+    assert writer.flush(timeout=5)
+    assert json.loads(Path(path).read_text(encoding="utf-8")) == {
+        "text": "hello",
+        "chunks": [{"text": "hello"}],
+    }
+    writer.shutdown()
+
+
+def test_wait_for__covers_every_write_to_a_shared_path(tmp_path: Path) -> None:
+    """Writes sharing one output path (e.g. SQLite) are all tracked."""
+    storage = _BlockingStorage()
+    storage.output_path = lambda _destination: tmp_path / "archive"  # type: ignore[method-assign]
+    writer = BackgroundResultWriter(max_workers=2)
+
+    first = writer.submit(storage, {"text": "a"}, tmp_path / "a.json", "t")
+    second = writer.submit(storage, {"text": "b"}, tmp_path / "b.json", "t")
+
+    assert first == second
+    assert writer.pending_count == 2
+    assert writer.wait_for(first, timeout=0.05) is False
+    storage.release.set()
+    assert writer.wait_for(first, timeout=5)
+    writer.shutdown()
+
+
+def test_failed_write__reported_to_callback_and_wait_for(tmp_path: Path) -> None:
+    """A storage failure reaches the callback and `wait_for` returns False."""
+    storage = MagicMock(spec=BaseStorage)
+    storage.output_path.return_value = tmp_path / "out.json"
+    storage.save.return_value = None
+    outcomes: list[tuple[str, BaseException | None]] = []
+    writer = BackgroundResultWriter()
+
+    path = writer.submit(
+        storage,
+        {"text": "x"},
+        tmp_path / "out.json",
+        "transcribe",
+        on_done=lambda p, e: outcomes.append((p, e)),
+    )
+
+    assert writer.wait_for(path, timeout=5) is False
+    writer.shutdown()
+    assert outcomes[0][0] == path
+    assert isinstance(outcomes[0][1], OSError)
+
+
+def test_shutdown__writer_restarts_on_next_submit(tmp_path: Path) -> None:
+    """Cached pipelines keep working after a CLI/API shutdown flush."""
+    writer = BackgroundResultWriter()
+    writer.shutdown()
+
+    path = writer.submit(JsonStorage(), {"text": "x"}, tmp_path / "a.json", "t")
+
+    assert writer.wait_for(path, timeout=5)
+    assert Path(path).exists()
+    writer.shutdown()
+
+
+def test_pipeline_save_result__uses_writer_and_notifies(tmp_path: Path) -> None:
+    """`_save_result` hands off to the writer and emits a save event."""
+    writer = BackgroundResultWriter()
+    pipeline = WhisperPipeline(
+        asr_backend=MagicMock(spec=ASRBackend),
+        output_dir=str(tmp_path),
+        result_writer=writer,
+    )
+    events: list[ProgressEvent] = []
+    pipeline.add_listener(events.append)
+
+    path = pipeline._save_result({"text": "x"}, tmp_path / "a.wav", "transcribe")
+    writer.shutdown()
+
+    assert path is not None and Path(path).exists()
+    assert [(e.event_type, e.message) for e in events] == [("save_complete", path)]
+
+
+def test_pipeline_save_result__reports_the_submitting_run(tmp_path: Path) -> None:
+    """A write finishing after the next run started keeps its own run id."""
+    storage = _BlockingStorage()
+    writer = BackgroundResultWriter()
+    pipeline = WhisperPipeline(
+        asr_backend=MagicMock(spec=ASRBackend),
+        storage_backend=storage,
+        output_dir=str(tmp_path),
+        result_writer=writer,
+    )
+    events: list[ProgressEvent] = []
+    pipeline.add_listener(events.append)
+
+    run_id = pipeline.pipeline_id
+    pipeline._save_result({"text": "x"}, tmp_path / "a.wav", "transcribe")
+    pipeline.pipeline_id = "next-run"
+    storage.release.set()
+    writer.shutdown()
+
+    assert [e.pipeline_id for e in events] == [run_id]
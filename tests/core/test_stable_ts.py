@@ -582,3 +582,168 @@ def test_stabilize_postprocess_typeerror_fallback(
     assert stabilized.get("stabilized") is True
     assert call_count["count"] == 2  # Called twice due to TypeError fallback
     assert stabilized.get("stabilization_path") == "postprocess_word_timestamps"
+
+
+def test_stabilize_passes_caller_pcm_to_stable_ts(
+    monkeypatch: pytest.MonkeyPatch, sample_result: dict[str, Any]
+) -> None:
+    """PCM supplied by the caller is used instead of decoding the file again."""
+    import numpy as np
+
+    seen: dict[str, Any] = {}
+
+    def fake_transcribe_any(
+        inference_func: Callable[[], dict[str, Any]], audio: object, **kwargs: object
+    ) -> dict[str, Any]:
+        seen["audio"] = audio
+        seen.update(kwargs)
+        return inference_func()
+
+    def fail_load_audio(*_a: object, **_k: object) -> None:
+        raise AssertionError("audio must not be decoded again")
+
+    mock_sw = SimpleNamespace(
+        transcribe_any=fake_transcribe_any,
+        audio=SimpleNamespace(load_audio=fail_load_audio),
+    )
+    monkeypatch.setattr(st, "stable_whisper", mock_sw, raising=False)
+    monkeypatch.setattr(st, "_postprocess", None, raising=False)
+    monkeypatch.setattr(st, "_postprocess_alt", None, raising=False)
+    monkeypatch.setattr(st, "audio_hash", lambda _path: "abc")
+    pcm = np.zeros(st.SAMPLE_RATE, dtype=np.float32)
+
+    stabilized = st.stabilize_timestamps(sample_result, audio=pcm)
+
+    assert stabilized.get("stabilized") is True
+    assert seen["audio"] is pcm
+    assert seen["input_sr"] == st.SAMPLE_RATE
+    assert seen["denoiser"] is None
+
+
+def _write_wav(path: Path, samples: list[int], rate: int = 16000) -> Path:
+    import wave
+
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(rate)
+        handle.writeframes(
+            b"".join(v.to_bytes(2, "little", signed=True) for v in samples)
+        )
+    return path
+
+
+def test_mapped_samples_reads_16k_mono_pcm_in_place(tmp_path: Path) -> None:
+    """16 kHz mono 16-bit WAVs are memory-mapped; other formats are not."""
+    import numpy as np
+
+    samples = st._mapped_samples(_write_wav(tmp_path / "a.wav", [0, 16384, -32768]))
+    assert isinstance(samples, np.memmap)
+    assert samples.tolist() == [0, 16384, -32768]
+    assert st._as_float_pcm(samples).tolist() == [0.0, 0.5, -1.0]
+
+    assert st._mapped_samples(_write_wav(tmp_path / "b.wav", [0], rate=8000)) is None
+    (tmp_path / "c.wav").write_bytes(b"RIFF-not-really-audio")
+    assert st._mapped_samples(tmp_path / "c.wav") is None
+
+
+def test_stabilize_maps_wav_and_caches_demucs_per_audio_hash(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The WAV is read without decoding and Demucs runs once per audio hash."""
+    import numpy as np
+    import torch
+
+    audio_file = _write_wav(tmp_path / "clip.wav", [16384] * st.SAMPLE_RATE)
+    calls = {"demucs": 0}
+    received: list[object] = []
+
+    def fail_load_audio(*_a: object, **_k: object) -> None:
+        raise AssertionError("a 16 kHz WAV must not be decoded")
+
+    def fake_demucs(audio: torch.Tensor, **_kwargs: object) -> torch.Tensor:
+        calls["demucs"] += 1
+        return audio * 0.5
+
+    def get_denoiser_func(_name: str, key: str) -> Callable[..., Any]:
+        return (lambda *_a: object()) if key == "load" else fake_demucs
+
+    def fake_transcribe_any(
+        inference_func: Callable[[], dict[str, Any]], audio: object, **kwargs: object
+    ) -> dict[str, Any]:
+        assert kwargs["denoiser"] is None  # Demucs already applied
+        received.append(audio)
+        return inference_func()
+
+    mock_sw = SimpleNamespace(
+        transcribe_any=fake_transcribe_any,
+        audio=SimpleNamespace(
+            load_audio=fail_load_audio, get_denoiser_func=get_denoiser_func
+        ),
+    )
+    monkeypatch.setattr(st, "stable_whisper", mock_sw, raising=False)
+    monkeypatch.setattr(st, "_postprocess", None, raising=False)
+    monkeypatch.setattr(st, "_postprocess_alt", None, raising=False)
+    monkeypatch.setattr(st.constants, "STABILIZATION_CACHE_DIR", str(tmp_path / "c"))
+
+    for _ in range(2):
+        result = {
+            "text": "hello",
+            "chunks": [{"text": "hello", "timestamp": [0.0, 1.0]}],
+            "original_file": str(audio_file),
+        }
+        assert st.stabilize_timestamps(result, demucs=True).get("stabilized")
+
+    assert calls == {"demucs": 1}
+    assert all(np.allclose(np.asarray(a), 0.25) for a in received)
+    assert len(list((tmp_path / "c").glob("*.demucs.npy"))) == 1
+
+
+def test_chunk_windows_groups_offsets_to_minimum_length() -> None:
+    """Pipeline chunks are joined into windows that start on chunk boundaries."""
+    windows = st._chunk_windows([0.0, 30.0, 60.0, 90.0, 120.0], 60.0)
+    assert windows == [(0.0, 60.0), (60.0, 120.0), (120.0, None)]
+    assert st._chunk_windows([0.0], 60.0) == [(0.0, None)]
+
+
+def test_stabilize_chunked_offsets_segments_back(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Each window is refined on its own audio slice and shifted back."""
+    import numpy as np
+
+    slice_lengths: list[int] = []
+
+    def fake_transcribe_any(
+        inference_func: Callable[[], dict[str, Any]], audio: object, **_k: object
+    ) -> dict[str, Any]:
+        slice_lengths.append(len(audio))  # type: ignore[arg-type]
+        base = inference_func()
+        for seg in base["segments"]:
+            seg["start"] += 0.25  # refined timing, window-relative
+        return base
+
+    mock_sw = SimpleNamespace(transcribe_any=fake_transcribe_any)
+    monkeypatch.setattr(st, "stable_whisper", mock_sw, raising=False)
+    monkeypatch.setattr(st, "_postprocess", None, raising=False)
+    monkeypatch.setattr(st, "_postprocess_alt", None, raising=False)
+    monkeypatch.setattr(st.constants, "STABILIZE_CHUNK_MIN_SECONDS", 10.0)
+    result = {
+        "text": "one two three",
+        "chunks": [
+            {"text": " one", "timestamp": [1.0, 2.0]},
+            {"text": " two", "timestamp": [11.0, 12.0]},
+            {"text": " three", "timestamp": [21.0, 22.0]},
+        ],
+        "chunk_offsets": [0.0, 10.0, 20.0],
+    }
+    pcm = np.zeros(25 * st.SAMPLE_RATE, dtype=np.float32)
+
+    stabilized = st.stabilize_timestamps(result, audio=pcm, chunked=True)
+
+    assert stabilized["stabilization_path"] == "chunked"
+    assert [s["start"] for s in stabilized["segments"]] == [1.25, 11.25, 21.25]
+    assert [s["end"] for s in stabilized["segments"]] == [2.0, 12.0, 22.0]
+    assert stabilized["text"] == "one two three"
+    assert "chunks" not in stabilized
+    assert sorted(slice_lengths) == [5 * st.SAMPLE_RATE] + [10 * st.SAMPLE_RATE] * 2
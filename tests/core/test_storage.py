@@ -5,6 +5,7 @@ This module contains tests for storage backend abstractions and implementations.
 
 from __future__ import annotations
 
+import gzip
 import json
 import tempfile
 from pathlib import Path
@@ -13,9 +14,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from insanely_fast_whisper_rocm.core import storage as storage_module
 from insanely_fast_whisper_rocm.core.storage import (
     BaseStorage,
+    FastJsonStorage,
     JsonStorage,
+    SQLiteStorage,
     StorageFactory,
 )
 
@@ -151,6 +155,173 @@ class TestJsonStorage:
             assert call_kwargs.get("exc_info") is True
 
 
+class TestFastJsonStorage:
+    """Test suite for FastJsonStorage class."""
+
+    @staticmethod
+    def _result() -> dict[str, Any]:
+        chunks = [{"text": "Héllo", "timestamp": [0.0, 1.0]}]
+        return {"text": "Héllo", "chunks": chunks, "segments": chunks}
+
+    def test_fast_json_storage__compact_and_deduplicated(self, tmp_path: Path) -> None:
+        """Output is compact JSON with duplicate segments stored once."""
+        saved = FastJsonStorage().save(self._result(), tmp_path / "r.json", "t")
+
+        raw = Path(saved).read_text(encoding="utf-8")
+        assert "\n" not in raw
+        assert '"segments"' not in raw
+        assert JsonStorage.load(saved) == self._result()
+
+    def test_fast_json_storage__gzip_roundtrip(self, tmp_path: Path) -> None:
+        """Gzip output gets a .json.gz suffix and loads transparently."""
+        saved = FastJsonStorage(compression="gzip").save(
+            self._result(), tmp_path / "r.json", "t"
+        )
+
+        assert saved.endswith("r.json.gz")
+        json.loads(gzip.decompress(Path(saved).read_bytes()))
+        assert JsonStorage.load(saved) == self._result()
+
+    def test_fast_json_storage__zstd_requires_package(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Zstd compression fails fast when zstandard is missing."""
+        monkeypatch.setattr(storage_module, "zstandard", None)
+        with pytest.raises(RuntimeError, match="zstandard"):
+            FastJsonStorage(compression="zstd")
+
+    def test_fast_json_storage__rejects_unknown_compression(self) -> None:
+        """Unknown compression names are rejected."""
+        with pytest.raises(ValueError, match="compression"):
+            FastJsonStorage(compression="lz4")
+
+    def test_fast_json_storage__failed_write_leaves_no_temp_file(
+        self, tmp_path: Path
+    ) -> None:
+        """A failed atomic replace returns None and cleans up the temp file."""
+        with patch(
+            "insanely_fast_whisper_rocm.core.storage.os.replace",
+            side_effect=OSError("disk full"),
+        ):
+            result = FastJsonStorage().save(self._result(), tmp_path / "r.json", "t")
+
+        assert result is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_json_storage__load_reads_pretty_json(self, tmp_path: Path) -> None:
+        """Files written by the default backend load unchanged."""
+        data = {"text": "x", "chunks": [], "segments": [{"text": "y"}]}
+        saved = JsonStorage().save(data, tmp_path / "r.json", "t")
+        assert JsonStorage.load(saved) == data
+
+
+def _archived_result(**overrides: Any) -> dict[str, Any]:  # noqa: ANN401
+    result = {
+        "text": "Hello world. Goodbye moon.",
+        "chunks": [
+            {
+                "text": " Hello world.",
+                "timestamp": [0.0, 1.5],
+                "words": [
+                    {"word": "Hello", "start": 0.0, "end": 0.6},
+                    {"word": "world.", "start": 0.7, "end": 1.5},
+                ],
+            },
+            {"text": " Goodbye moon.", "timestamp": [2.0, 3.0]},
+        ],
+        "original_file": "talk.mp3",
+        "task_type": "transcribe",
+        "config_used": {"model": "openai/whisper-tiny", "language": "en"},
+    }
+    result.update(overrides)
+    return result
+
+
+class TestSQLiteStorage:
+    """Test suite for SQLiteStorage class."""
+
+    def test_sqlite_storage__save_normalizes_rows(self, tmp_path: Path) -> None:
+        """Results, segments and words land in their own tables."""
+        storage = SQLiteStorage(tmp_path / "a.sqlite3")
+        saved = storage.save(_archived_result(), tmp_path / "talk.json", "transcribe")
+
+        assert saved == str(tmp_path / "a.sqlite3")
+        conn = storage._connect()
+        row = conn.execute("SELECT file, model, task, language FROM results").fetchone()
+        counts = [
+            conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("segments", "words")
+        ]
+        conn.close()
+        assert tuple(row) == ("talk.mp3", "openai/whisper-tiny", "transcribe", "en")
+        assert counts == [2, 2]
+
+    @pytest.mark.parametrize("fts_enabled", [True, False])
+    def test_sqlite_storage__search_returns_timestamped_hits(
+        self, tmp_path: Path, fts_enabled: bool
+    ) -> None:
+        """Search finds segments with timings, with or without FTS5."""
+        storage = SQLiteStorage(tmp_path / "a.sqlite3")
+        storage.fts_enabled = storage.fts_enabled and fts_enabled
+        storage.save(_archived_result(), tmp_path / "talk.json", "transcribe")
+        storage.save(
+            _archived_result(original_file="other.mp3", task_type="translate"),
+            tmp_path / "other.json",
+            "translate",
+        )
+
+        hits = storage.search("moon", task="transcribe")
+
+        assert [(h["file"], h["start"], h["end"]) for h in hits] == [
+            ("talk.mp3", 2.0, 3.0)
+        ]
+        assert hits[0]["text"] == "Goodbye moon."
+        assert storage.search("moon", model="other-model") == []
+
+    def test_sqlite_storage__groups_word_level_chunks(self, tmp_path: Path) -> None:
+        """Word chunks become segments whose words fill the words table."""
+        words = ["Hello", "world.", "It's", "late."]
+        result = _archived_result(
+            text="Hello world. It's late.",
+            chunks=[
+                {"text": f" {word}", "timestamp": [i * 0.5, i * 0.5 + 0.4]}
+                for i, word in enumerate(words)
+            ],
+            config_used={"model": "openai/whisper-tiny", "return_timestamps": "word"},
+        )
+        storage = SQLiteStorage(tmp_path / "a.sqlite3")
+        storage.save(result, tmp_path / "talk.json", "transcribe")
+
+        conn = storage._connect()
+        stored = [row[0] for row in conn.execute("SELECT word FROM words")]
+        segments = conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+        conn.close()
+        assert stored == words
+        assert segments < len(words)
+        assert storage.search("hello world")
+        assert storage.search("it's")
+        if storage.fts_enabled:
+            assert storage.search('"hello world"')
+
+    def test_sqlite_storage__invalid_query_raises_value_error(
+        self, tmp_path: Path
+    ) -> None:
+        """Malformed FTS5 queries surface as ValueError."""
+        storage = SQLiteStorage(tmp_path / "a.sqlite3")
+        if not storage.fts_enabled:
+            pytest.skip("SQLite build lacks FTS5")
+        with pytest.raises(ValueError, match="Invalid search query"):
+            storage.search('"unterminated')
+
+    def test_sqlite_storage__save_handles_database_error(self, tmp_path: Path) -> None:
+        """Database errors are logged and reported as None."""
+        storage = SQLiteStorage(tmp_path / "a.sqlite3")
+        with patch.object(
+            storage, "_connect", side_effect=storage_module.sqlite3.Error("locked")
+        ):
+            assert storage.save(_archived_result(), tmp_path / "t.json", "t") is None
+
+
 class TestStorageFactory:
     """Test suite for StorageFactory class."""
 
@@ -172,7 +343,30 @@ class TestStorageFactory:
     def test_storage_factory__raises_for_future_types(self) -> None:
         """Test that factory raises ValueError for not-yet-implemented types."""
         with pytest.raises(ValueError, match="Unsupported storage kind"):
-            StorageFactory.create("sqlite")
+            StorageFactory.create("postgres")
+
+    def test_storage_factory__create_sqlite_storage(self, tmp_path: Path) -> None:
+        """Sqlite creates an archive at the requested path."""
+        storage = StorageFactory.create("sqlite", db_path=tmp_path / "a.sqlite3")
+        assert isinstance(storage, SQLiteStorage)
+        assert (tmp_path / "a.sqlite3").exists()
+
+    def test_storage_factory__create_fast_json_storage(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """json-fast uses the configured compression unless overridden."""
+        monkeypatch.setattr(storage_module.constants, "STORAGE_COMPRESSION", "gzip")
+        assert StorageFactory.create("json-fast").compression == "gzip"
+        assert StorageFactory.create("json-fast", compression="none").compression == (
+            "none"
+        )
+
+    def test_storage_factory__default_kind_from_constants(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The default kind follows STORAGE_BACKEND."""
+        monkeypatch.setattr(storage_module.constants, "STORAGE_BACKEND", "json-fast")
+        assert isinstance(StorageFactory.create(), FastJsonStorage)
 
 
 class TestBaseStorage:
@@ -0,0 +1,145 @@
+"""Tests for streaming export helpers in `insanely_fast_whisper_rocm.core.streaming`."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from insanely_fast_whisper_rocm.core import streaming
+from insanely_fast_whisper_rocm.core.formatters import (
+    JsonFormatter,
+    SrtFormatter,
+    TxtFormatter,
+    VttFormatter,
+)
+from insanely_fast_whisper_rocm.core.pipeline import ProgressEvent
+
+
+def _word_result() -> dict:
+    return {
+        "text": "Hello world. This is a test.",
+        "chunks": [
+            {"text": "Hello", "timestamp": [0.0, 0.4]},
+            {"text": " world.", "timestamp": [0.4, 0.9]},
+            {"text": " This", "timestamp": [1.2, 1.5]},
+            {"text": " is", "timestamp": [1.5, 1.7]},
+            {"text": " a", "timestamp": [1.7, 1.8]},
+            {"text": " test.", "timestamp": [1.8, 2.3]},
+        ],
+    }
+
+
+def _chunk_result() -> dict:
+    return {
+        "text": "First sentence here. Second sentence follows.",
+        "chunks": [
+            {"text": "First sentence here.", "timestamp": [0.0, 2.0]},
+            {"text": "Second sentence follows.", "timestamp": [2.5, 4.0]},
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "formatter", [SrtFormatter, VttFormatter, JsonFormatter, TxtFormatter]
+)
+@pytest.mark.parametrize("factory", [_word_result, _chunk_result, dict])
+def test_iter_format__joins_to_format(formatter: type, factory: object) -> None:
+    """Joined fragments must match the in-memory formatter output exactly."""
+    result = factory()
+    assert "".join(formatter.iter_format(result)) == formatter.format(result)
+
+
+def test_write__streams_to_handle() -> None:
+    """BaseFormatter.write should write every fragment and count characters."""
+    result = _word_result()
+    buffer = io.StringIO()
+    written = SrtFormatter.write(result, buffer)
+    assert buffer.getvalue() == SrtFormatter.format(result)
+    assert written == len(buffer.getvalue())
+
+
+def test_should_stream__respects_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Results are streamed only once they reach the configured size."""
+    monkeypatch.setattr(streaming.constants, "STREAMING_EXPORT_MIN_SEGMENTS", 3)
+    assert streaming.should_stream(_word_result())
+    assert not streaming.should_stream(_chunk_result())
+
+
+def test_iter_encoded__yields_bytes() -> None:
+    """Encoded fragments decode back to the JSON document."""
+    result = _chunk_result()
+    body = b"".join(streaming.iter_encoded(JsonFormatter, result))
+    assert json.loads(body.decode("utf-8")) == result
+
+
+def _chunk_event(chunk_num: int, text: str, offset: float) -> ProgressEvent:
+    return ProgressEvent(
+        "chunk_complete",
+        "p",
+        "f.wav",
+        chunk_num=chunk_num,
+        result={"text": text, "chunks": [{"text": text, "timestamp": [0.0, 1.0]}]},
+        chunk_start_time=offset,
+    )
+
+
+def test_chunk_stream_writer__srt_offsets_and_numbering() -> None:
+    """Cues from later chunks are shifted and numbered continuously."""
+    buffer = io.StringIO()
+    writer = streaming.ChunkStreamWriter(buffer, "srt")
+    second = _chunk_event(2, "Two.", 30.0)
+
+    writer(ProgressEvent("chunk_start", "p", "f.wav", chunk_num=1))
+    writer(_chunk_event(1, "One.", 0.0))
+    writer(second)
+
+    assert buffer.getvalue() == (
+        "1\n00:00:00,000 --> 00:00:01,000\nOne.\n"
+        "\n2\n00:00:30,000 --> 00:00:31,000\nTwo.\n"
+    )
+    assert writer.cues_written == 2
+    # The pipeline merges the original chunk dicts later; they must be untouched.
+    assert second.result["chunks"][0]["timestamp"] == [0.0, 1.0]
+
+
+def test_chunk_stream_writer__orders_out_of_order_chunks() -> None:
+    """Chunks finished early by a pool wait until earlier ones are written."""
+    buffer = io.StringIO()
+    writer = streaming.ChunkStreamWriter(buffer, "txt")
+
+    writer(_chunk_event(3, "Three.", 60.0))
+    writer(_chunk_event(2, "Two.", 30.0))
+    assert buffer.getvalue() == ""
+
+    writer(_chunk_event(1, "One.", 0.0))
+    assert buffer.getvalue() == "One.\n\nTwo.\n\nThree."
+
+
+def test_chunk_stream_writer__vtt_and_txt() -> None:
+    """VTT output starts with a header; TXT joins chunks by a blank line."""
+    vtt = io.StringIO()
+    txt = io.StringIO()
+    vtt_writer = streaming.ChunkStreamWriter(vtt, "vtt")
+    txt_writer = streaming.ChunkStreamWriter(txt, "txt")
+    for offset, text in ((0.0, "One."), (30.0, "Two.")):
+        chunk = {"text": text, "chunks": [{"text": text, "timestamp": [0.0, 1.0]}]}
+        vtt_writer.write_chunk(chunk, offset)
+        txt_writer.write_chunk(chunk, offset)
+
+    assert vtt.getvalue().startswith("WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nOne.")
+    assert "00:00:30.000 --> 00:00:31.000\nTwo." in vtt.getvalue()
+    assert txt.getvalue() == "One.\n\nTwo."
+
+
+def test_chunk_stream_writer__rejects_json() -> None:
+    """JSON cannot be appended chunk by chunk."""
+    with pytest.raises(ValueError, match="incremental"):
+        streaming.ChunkStreamWriter(io.StringIO(), "json")
+
+
+def test_txt_iter_format__yields_lines() -> None:
+    """Plain text is emitted line by line rather than as one string."""
+    result = {"text": "One.\n\nTwo."}
+    assert list(TxtFormatter.iter_format(result)) == ["One.\n", "\n", "Two."]
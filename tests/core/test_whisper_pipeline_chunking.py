@@ -282,6 +282,7 @@ def test_whisper_pipeline_merges_chunks_and_reports_progress(
     assert result["runtime_seconds"] == 3.5
     assert result["config_used"]["chunking_used"] is True
     assert result["config_used"]["num_chunks"] == 2
+    assert result["chunk_offsets"] == [0.0, 3.5]
 
     assert backend.calls == [
         {
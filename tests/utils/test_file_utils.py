@@ -42,7 +42,7 @@ def test_save_upload_file__saves_file_successfully(tmp_path: Path) -> None:
 
     file = MagicMock(spec=UploadFile)
     file.filename = "test.wav"
-    file.file = BytesIO(b"fake audio data")
+    file.file = BytesIO(b"RIFF\0\0\0\0WAVEfake audio data")
 
     with patch(
         "insanely_fast_whisper_rocm.utils.file_utils.UPLOAD_DIR", str(upload_dir)
@@ -55,7 +55,7 @@ def test_save_upload_file__saves_file_successfully(tmp_path: Path) -> None:
 
     # Verify content
     with open(saved_path, "rb") as f:
-        assert f.read() == b"fake audio data"
+        assert f.read() == b"RIFF\0\0\0\0WAVEfake audio data"
 
 
 def test_save_upload_file__os_error__raises_http_exception(tmp_path: Path) -> None:
@@ -64,7 +64,7 @@ def test_save_upload_file__os_error__raises_http_exception(tmp_path: Path) -> No
 
     file = MagicMock(spec=UploadFile)
     file.filename = "test.wav"
-    file.file = BytesIO(b"fake audio data")
+    file.file = BytesIO(b"RIFF\0\0\0\0WAVEfake audio data")
 
     with patch(
         "insanely_fast_whisper_rocm.utils.file_utils.UPLOAD_DIR", str(upload_dir)
@@ -164,14 +164,14 @@ def test_file_handler__save_upload__saves_file_successfully(tmp_path: Path) -> N
 
     file = MagicMock(spec=UploadFile)
     file.filename = "test.wav"
-    file.file = BytesIO(b"test data")
+    file.file = BytesIO(b"RIFF\0\0\0\0WAVEtest data")
 
     saved_path = handler.save_upload(file)
 
     assert os.path.exists(saved_path)
     assert saved_path.startswith(str(upload_dir))
     with open(saved_path, "rb") as f:
-        assert f.read() == b"test data"
+        assert f.read() == b"RIFF\0\0\0\0WAVEtest data"
 
 
 def test_file_handler__save_upload__logs_error_on_os_error(tmp_path: Path) -> None:
@@ -181,7 +181,7 @@ def test_file_handler__save_upload__logs_error_on_os_error(tmp_path: Path) -> No
 
     file = MagicMock(spec=UploadFile)
     file.filename = "test.wav"
-    file.file = BytesIO(b"test data")
+    file.file = BytesIO(b"RIFF\0\0\0\0WAVEtest data")
 
     with patch("builtins.open", side_effect=OSError("Disk error")):
         with pytest.raises(HTTPException, match="Error saving uploaded file"):
@@ -0,0 +1,172 @@
+"""Tests for `insanely_fast_whisper_rocm.utils.temp_space`."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from insanely_fast_whisper_rocm.utils import temp_space
+from insanely_fast_whisper_rocm.utils.file_utils import cleanup_temp_files
+from insanely_fast_whisper_rocm.utils.temp_space import TempSpaceManager
+
+
+def _manager(tmp_path: Path, **kwargs: float) -> TempSpaceManager:
+    return TempSpaceManager(
+        upload_dir=str(tmp_path / "uploads"), temp_dir=str(tmp_path / "tmp"), **kwargs
+    )
+
+
+def _write(path: Path, size: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    return path
+
+
+def test_sweep__removes_expired_artifacts(tmp_path: Path) -> None:
+    """Unleased artifacts older than the TTL are deleted, younger ones kept."""
+    manager = _manager(tmp_path, ttl_seconds=60, quota_bytes=0)
+    old_dir = tmp_path / "converted_audio_old"
+    _write(old_dir / "a.wav", 10)
+    download = _write(tmp_path / "download.srt", 10)
+    manager.track(old_dir)
+    manager.track(download, lease=False)
+    manager.release(old_dir)
+
+    freed = manager.sweep(now=time.time() + 30)
+    assert freed == 0 and old_dir.exists()
+
+    freed = manager.sweep(now=time.time() + 61)
+
+    assert freed == 20
+    assert not old_dir.exists() and not download.exists()
+    stats = manager.stats()
+    assert stats["expired"] == 2 and stats["tracked"] == 0
+
+
+def test_sweep__evicts_oldest_beyond_quota(tmp_path: Path) -> None:
+    """Once the quota is exceeded the oldest released artifacts go first."""
+    manager = _manager(tmp_path, ttl_seconds=0, quota_bytes=250)
+    paths = [_write(tmp_path / f"{i}.wav", 100) for i in range(3)]
+    for path in paths:
+        manager.track(path)
+        manager.release(path)
+        time.sleep(0.01)
+
+    freed = manager.sweep()
+
+    assert freed == 100
+    assert [p.exists() for p in paths] == [False, True, True]
+    stats = manager.stats()
+    assert stats["evicted"] == 1 and stats["tracked_bytes"] == 200
+
+
+def test_sweep__keeps_leased_artifacts(tmp_path: Path) -> None:
+    """Artifacts still held by a job survive both the TTL and the quota."""
+    manager = _manager(tmp_path, ttl_seconds=60, quota_bytes=150)
+    leased = _write(tmp_path / "uploads" / "in_use.mp3", 100)
+    released = _write(tmp_path / "done.wav", 100)
+    manager.track(leased)
+    manager.track(released)
+    manager.release(released)
+
+    freed = manager.sweep(now=time.time() + 30)
+
+    assert freed == 100
+    assert leased.exists() and not released.exists()
+    assert manager.sweep(now=time.time() + 61) == 0
+    assert leased.exists()
+
+    manager.release(leased)
+    assert manager.sweep(now=time.time() + 61) == 100
+    assert not leased.exists()
+
+
+def test_sweep__reclaims_leaked_leases(tmp_path: Path) -> None:
+    """A lease never released by its owner stops protecting the artifact."""
+    manager = _manager(tmp_path, ttl_seconds=60, orphan_age_seconds=3600)
+    leaked = _write(tmp_path / "tmp" / "converted_audio_1_x" / "a.wav", 100)
+    manager.track(leaked.parent)
+
+    assert manager.sweep(now=time.time() + 120) == 0
+    assert leaked.exists()
+
+    assert manager.sweep(now=time.time() + 3601) == 100
+    assert not leaked.parent.exists()
+
+
+def test_sweep_orphans__only_stale_untracked_leftovers(tmp_path: Path) -> None:
+    """Orphans need a known name and to be older than their minimum age."""
+    manager = _manager(tmp_path, ttl_seconds=60, orphan_age_seconds=3600)
+    tmp = tmp_path / "tmp"
+    stale = _write(tmp / f"{temp_space.temp_prefix('audio_chunks_')}x" / "c.wav", 5)
+    foreign = _write(tmp / "someone_else" / "f.wav", 5).parent
+    legacy = _write(tmp / "audio_chunks_legacy" / "c.wav", 5).parent
+    upload = _write(tmp_path / "uploads" / f"{uuid.uuid4()}_file.mp3", 5)
+    user_file = _write(tmp_path / "uploads" / "notes.mp3", 5)
+    tracked = _write(tmp_path / "uploads" / f"{uuid.uuid4()}_in_use.mp3", 5)
+    manager.track(tracked)
+    past = time.time() - 120
+    for path in (stale.parent, foreign, legacy, upload, user_file, tracked):
+        os.utime(path, (past, past))
+
+    # Only this process's expired chunk directory is old enough so far
+    assert manager.sweep_orphans() == 5
+    assert not stale.parent.exists()
+    assert legacy.exists() and upload.exists()
+
+    assert manager.sweep_orphans(now=time.time() + 3600) == 10
+    assert not legacy.exists() and not upload.exists()
+    assert foreign.exists() and user_file.exists() and tracked.exists()
+    assert manager.stats()["orphans_removed"] == 3
+
+
+def test_sweep_orphans__skips_artifacts_of_running_processes(
+    tmp_path: Path,
+) -> None:
+    """Temp directories owned by another live process are left alone."""
+    manager = _manager(tmp_path, ttl_seconds=60)
+    with subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"]) as p:
+        try:
+            owned = _write(tmp_path / "tmp" / f"audio_chunks_{p.pid}_x" / "c.wav", 5)
+            past = time.time() - 120
+            os.utime(owned.parent, (past, past))
+
+            assert manager.sweep_orphans() == 0
+        finally:
+            p.kill()
+    p.wait()
+
+    assert manager.sweep_orphans() == 5
+    assert not owned.parent.exists()
+
+
+def test_start__sweeps_immediately_and_stops(tmp_path: Path) -> None:
+    """The janitor thread sweeps on start and can be stopped."""
+    manager = _manager(tmp_path, ttl_seconds=60, orphan_age_seconds=60)
+    orphan = _write(tmp_path / "uploads" / f"{uuid.uuid4()}_left.mp3", 1)
+    past = time.time() - 120
+    os.utime(orphan, (past, past))
+
+    manager.start(interval=60)
+    deadline = time.time() + 5
+    while orphan.exists() and time.time() < deadline:
+        time.sleep(0.01)
+    manager.stop()
+
+    assert not orphan.exists()
+    assert manager.stats()["last_sweep"] is not None
+
+
+def test_cleanup_temp_files__releases_tracked_paths(tmp_path: Path) -> None:
+    """Files removed by their owner are no longer tracked."""
+    path = _write(tmp_path / "chunk.wav", 1)
+    temp_space.track_temp_path(path)
+    assert temp_space.get_temp_manager().stats()["tracked"] == 1
+
+    cleanup_temp_files([str(path)])
+
+    assert temp_space.get_temp_manager().stats()["tracked"] == 0
@@ -0,0 +1,149 @@
+"""Tests for upload admission in `insanely_fast_whisper_rocm.utils`."""
+
+from __future__ import annotations
+
+import struct
+import wave
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from fastapi.testclient import TestClient
+
+from insanely_fast_whisper_rocm.api.app import create_app
+from insanely_fast_whisper_rocm.utils import constants, file_utils
+from insanely_fast_whisper_rocm.utils.file_utils import FileHandler
+from insanely_fast_whisper_rocm.utils.upload_admission import (
+    probe_duration,
+    sniff_audio_format,
+)
+
+
+def _wav_bytes(seconds: float, rate: int = 8000) -> bytes:
+    buffer = BytesIO()
+    with wave.open(buffer, "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(rate)
+        handle.writeframes(b"\0\0" * int(seconds * rate))
+    return buffer.getvalue()
+
+
+def _upload(data: bytes, name: str = "clip.wav") -> UploadFile:
+    file = MagicMock(spec=UploadFile)
+    file.filename = name
+    file.file = BytesIO(data)
+    file.size = None
+    return file
+
+
+@pytest.mark.parametrize(
+    ("head", "expected"),
+    [
+        (b"RIFF\0\0\0\0WAVEfmt ", "wav"),
+        (b"fLaC\0\0\0\x22", "flac"),
+        (b"ID3\x04\0\0\0\0\0\0", "mp3"),
+        (b"\xff\xfb\x90\x64\0\0", "mp3"),
+        (b"\0\0\0\x20ftypM4A ", "mp4"),
+        (b"OggS\0\x02", "ogg"),
+        (b"\x1a\x45\xdf\xa3\x01", "matroska"),
+        (b"<html><body>", None),
+        (b"", None),
+    ],
+)
+def test_sniff_audio_format(head: bytes, expected: str | None) -> None:
+    """Containers are recognized by their signature, not the extension."""
+    assert sniff_audio_format(head) == expected
+
+
+def test_probe_duration__wav_and_flac_headers(tmp_path: Path) -> None:
+    """WAV and FLAC durations are read from the headers alone."""
+    wav = tmp_path / "a.wav"
+    wav.write_bytes(_wav_bytes(1.5))
+    # STREAMINFO: 16 kHz, mono, 16 bit, 48000 samples
+    info = (16000 << 44) | (0 << 41) | (15 << 36) | 48000
+    flac = tmp_path / "a.flac"
+    flac.write_bytes(b"fLaC\x80\0\0\x22" + b"\0" * 10 + struct.pack(">Q", info))
+
+    assert probe_duration(str(wav), "wav") == pytest.approx(1.5)
+    assert probe_duration(str(flac), "flac") == pytest.approx(3.0)
+    assert probe_duration(str(tmp_path / "missing.wav"), "wav") is None
+
+
+def test_save_upload__rejects_unknown_content(tmp_path: Path) -> None:
+    """Garbage with an audio extension is rejected with 415 and not kept."""
+    handler = FileHandler(upload_dir=str(tmp_path))
+
+    with pytest.raises(HTTPException) as exc_info:
+        handler.save_upload(_upload(b"not audio at all", "clip.mp3"))
+
+    assert exc_info.value.status_code == 415
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_save_upload__enforces_size_limit_while_streaming(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The copy stops with 413 once the byte limit is crossed."""
+    monkeypatch.setattr(constants, "MAX_AUDIO_SIZE_MB", 1)
+    monkeypatch.setattr(file_utils, "UPLOAD_CHUNK_BYTES", 64 * 1024)
+    upload = _upload(b"RIFF\0\0\0\0WAVE" + b"\0" * (2 * 1024 * 1024))
+    handler = FileHandler(upload_dir=str(tmp_path))
+
+    with pytest.raises(HTTPException) as exc_info:
+        handler.save_upload(upload)
+
+    assert exc_info.value.status_code == 413
+    assert list(tmp_path.iterdir()) == []
+    # Reading stopped shortly after the limit instead of consuming everything
+    assert upload.file.tell() < 1024 * 1024 + 2 * 64 * 1024
+
+
+def test_save_upload__rejects_declared_size_without_reading(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A declared size over the limit is rejected before any copying."""
+    monkeypatch.setattr(constants, "MAX_AUDIO_SIZE_MB", 1)
+    upload = _upload(_wav_bytes(0.1))
+    upload.size = 5 * 1024 * 1024
+
+    with pytest.raises(HTTPException) as exc_info:
+        FileHandler(upload_dir=str(tmp_path)).save_upload(upload)
+
+    assert exc_info.value.status_code == 413
+    assert upload.file.tell() == 0
+
+
+def test_save_upload__enforces_duration_limit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Uploads longer than MAX_AUDIO_DURATION_SECONDS are rejected."""
+    monkeypatch.setattr(constants, "MAX_AUDIO_DURATION_SECONDS", 1)
+    handler = FileHandler(upload_dir=str(tmp_path))
+
+    saved = handler.save_upload(_upload(_wav_bytes(0.5)))
+    with pytest.raises(HTTPException) as exc_info:
+        handler.save_upload(_upload(_wav_bytes(2.0)))
+
+    assert exc_info.value.status_code == 413
+    assert list(tmp_path.iterdir()) == [Path(saved)]
+
+
+def test_middleware__rejects_oversized_content_length(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A declared body far over the limit gets 413 before the route runs."""
+    monkeypatch.setattr(constants, "MAX_AUDIO_SIZE_MB", 1)
+    client = TestClient(create_app())
+    body = b"\0" * (3 * 1024 * 1024)
+
+    response = client.post(
+        "/v1/audio/transcriptions",
+        content=body,
+        headers={"content-type": "multipart/form-data; boundary=x"},
+    )
+
+    assert response.status_code == 413
+    assert "upload limit" in response.json()["detail"]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import json
 import tempfile
+import threading
 import unittest.mock
 import zipfile
 from pathlib import Path
@@ -469,3 +471,133 @@ def test_process_transcription_request_with_cancellation() -> None:
                     config,
                     file_config,
                 )
+
+
+def test_process_transcription_request_concurrent_batch_keeps_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Concurrent batches keep upload order and isolate per-file errors."""
+    monkeypatch.setattr(handlers.constants, "WEBUI_BATCH_CONCURRENCY", 3)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.wav"
+        path.write_text("fake audio")
+        paths.append(str(path))
+    release_first = threading.Event()
+    started: list[str] = []
+
+    def fake_transcribe(audio_path: str, *args: object, **kwargs: object) -> dict:
+        started.append(Path(audio_path).stem)
+        if audio_path.endswith("a.wav"):
+            # The first file finishes last; later files must not wait for it.
+            assert release_first.wait(timeout=5)
+        elif audio_path.endswith("b.wav"):
+            raise TranscriptionError("boom")
+        else:
+            release_first.set()
+        return {"text": f"text {Path(audio_path).stem}"}
+
+    monkeypatch.setattr(handlers, "transcribe", fake_transcribe)
+
+    result = handlers.process_transcription_request(
+        paths,
+        TranscriptionConfig(),
+        FileHandlingConfig(save_transcriptions=False, temp_uploads_dir=str(tmp_path)),
+    )
+
+    assert sorted(started) == ["a", "b", "c"]
+    summary = result[0]
+    assert summary.index("a.wav") < summary.index("b.wav") < summary.index("c.wav")
+    assert "b.wav: Error - boom" in summary
+
+
+def test_batch_progress__is_monotonic() -> None:
+    """Late updates from earlier files never move progress backwards."""
+    tracker = unittest.mock.MagicMock()
+    tracker.cancelled = False
+    progress = handlers._BatchProgress(tracker)
+
+    progress(0.5, desc="file 2")
+    progress(0.25, desc="file 1")
+    progress(None, desc="indeterminate")
+
+    assert [c.args[0] for c in tracker.call_args_list] == [0.5, 0.5, None]
+    assert progress.cancelled is False
+
+
+def test_process_transcription_request_progress_never_moves_backwards(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Per-file updates from the main loop go through the monotonic view."""
+    monkeypatch.setattr(handlers.constants, "WEBUI_BATCH_CONCURRENCY", 2)
+    paths = []
+    for name in ("a", "b"):
+        path = tmp_path / f"{name}.wav"
+        path.write_text("fake audio")
+        paths.append(str(path))
+    second_done = threading.Event()
+
+    def fake_transcribe(audio_path: str, *args: object, **kwargs: object) -> dict:
+        tracker = kwargs["progress_tracker_instance"]
+        if audio_path.endswith("a.wav"):
+            # The main loop reports the first file after the second finished
+            assert second_done.wait(timeout=5)
+        else:
+            tracker(1.0, desc="second file done")
+            second_done.set()
+        return {"text": f"text {Path(audio_path).stem}"}
+
+    monkeypatch.setattr(handlers, "transcribe", fake_transcribe)
+    tracker = unittest.mock.MagicMock()
+    tracker.cancelled = False
+
+    handlers.process_transcription_request(
+        paths,
+        TranscriptionConfig(),
+        FileHandlingConfig(save_transcriptions=False, temp_uploads_dir=str(tmp_path)),
+        progress_tracker=tracker,
+    )
+
+    fractions = [c.args[0] for c in tracker.call_args_list if c.args[0] is not None]
+    assert fractions == sorted(fractions)
+    assert fractions[-1] == 1.0
+
+
+def test_tracker_cancellation_token__observes_tracker() -> None:
+    """Cancelling in the UI cancels the token the pipeline checks."""
+    tracker = unittest.mock.MagicMock()
+    tracker.cancelled = False
+    token = handlers._TrackerCancellationToken(tracker)
+    token.raise_if_cancelled()
+
+    tracker.cancelled = True
+    with pytest.raises(TranscriptionCancelledError):
+        token.raise_if_cancelled()
+    assert handlers._TrackerCancellationToken(None).cancelled is False
+
+
+def test_process_transcription_request_renders_json_for_sqlite_archive(
+    tmp_path: Path,
+) -> None:
+    """A SQLite archive is never offered as the transcript's JSON download."""
+    audio_path = tmp_path / "test.wav"
+    audio_path.write_text("fake audio")
+    archive = tmp_path / "transcripts.sqlite3"
+    archive.write_bytes(b"SQLite format 3\0")
+    result_dict = {"text": "Test transcription", "output_file_path": str(archive)}
+
+    with unittest.mock.patch(
+        "insanely_fast_whisper_rocm.webui.handlers.transcribe",
+        return_value=result_dict,
+    ):
+        result = handlers.process_transcription_request(
+            [str(audio_path)],
+            TranscriptionConfig(),
+            FileHandlingConfig(temp_uploads_dir=str(tmp_path)),
+        )
+
+    json_download = Path(result[6]["value"])
+    assert json_download.suffix == ".json"
+    assert json.loads(json_download.read_text(encoding="utf-8"))["text"] == (
+        "Test transcription"
+    )
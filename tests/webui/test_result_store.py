@@ -0,0 +1,136 @@
+"""Tests for the memoized WebUI result store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from insanely_fast_whisper_rocm.core.formatters import FORMATTERS
+from insanely_fast_whisper_rocm.utils.filename_generator import TaskType
+from insanely_fast_whisper_rocm.webui import result_store as result_store_module
+from insanely_fast_whisper_rocm.webui.handlers import _prepare_temp_downloadable_file
+from insanely_fast_whisper_rocm.webui.merge_handler import merge_files
+from insanely_fast_whisper_rocm.webui.result_store import (
+    ResultStore,
+    get_session_store,
+)
+from insanely_fast_whisper_rocm.webui.zip_creator import (
+    BatchZipBuilder,
+    ZipConfiguration,
+)
+
+
+def _result(text: str = "Hello world.") -> dict:
+    return {"text": text, "chunks": [{"text": text, "timestamp": [0.0, 1.5]}]}
+
+
+def test_render__formats_once_per_result_and_format() -> None:
+    """Repeated renders reuse the memoized output."""
+    store = ResultStore()
+    result = _result()
+
+    with patch.object(
+        FORMATTERS["srt"], "format", wraps=FORMATTERS["srt"].format
+    ) as spy:
+        first = store.render(result, "srt")
+        second = store.render(result, "srt")
+
+    assert first == second == FORMATTERS["srt"].format(result)
+    assert spy.call_count == 1
+    assert (store.stats.hits, store.stats.misses) == (1, 1)
+
+
+def test_render__unknown_format_raises() -> None:
+    """Unknown formats are rejected like the formatter registry does."""
+    with pytest.raises(ValueError, match="No formatter"):
+        ResultStore().render(_result(), "docx")
+
+
+def test_lru__evicts_least_recently_used_when_over_budget() -> None:
+    """The store stays within its character budget."""
+    first, second = _result("a" * 40), _result("b" * 40)
+    probe = ResultStore()
+    probe.render(first, "txt")
+    budget = probe.size * 3 // 2
+    store = ResultStore(max_chars=budget)
+
+    store.render(first, "txt")
+    store.render(second, "txt")
+
+    assert len(store) == 1
+    assert store.size <= budget
+    assert store.stats.evictions == 1
+    assert store.render(second, "txt") == "b" * 40
+
+
+def test_budget__counts_raw_results_before_rendering() -> None:
+    """Raw results and their plans count against the budget on their own."""
+    store = ResultStore(max_chars=1000)
+    result = _result("a" * 2000)
+
+    store.plan_for(result)
+    assert store.size == 0
+    assert len(store) == 0
+
+    small = _result()
+    store.plan_for(small)
+    assert 0 < store.size <= 1000
+
+
+def test_zip_builders_and_merges__share_renderings(tmp_path: Path) -> None:
+    """Archives and merges built from one store render each format once."""
+    store = ResultStore()
+    results = {"/tmp/a.mp3": _result(), "/tmp/b.mp3": _result("Second one.")}
+
+    for name in ("one.zip", "two.zip"):
+        builder = BatchZipBuilder(
+            ZipConfiguration(temp_dir=str(tmp_path)), result_store=store
+        )
+        with builder.create(filename=name) as b:
+            b.add_batch_files(results, formats=["srt"])
+            b.build()
+    merged = merge_files(results, "srt", result_store=store)
+
+    assert merged.success
+    assert store.stats.misses == 2
+    assert store.stats.hits == 4
+
+
+def test_prepare_temp_downloadable_file__reuses_written_file(
+    tmp_path: Path,
+) -> None:
+    """A second download of the same result returns the existing file."""
+    store = ResultStore()
+    result = _result()
+
+    first = _prepare_temp_downloadable_file(
+        result, "txt", "audio", tmp_path, TaskType.TRANSCRIBE, result_store=store
+    )
+    second = _prepare_temp_downloadable_file(
+        result, "txt", "audio", tmp_path, TaskType.TRANSCRIBE, result_store=store
+    )
+
+    assert first == second
+    assert Path(first).read_text(encoding="utf-8") == store.render(result, "txt")
+
+
+def test_get_session_store__bounded_per_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Stores are kept per session, dropping the least recently used one."""
+    monkeypatch.setattr(
+        result_store_module,
+        "_SESSION_STORES",
+        type(result_store_module._SESSION_STORES)(),
+    )
+    monkeypatch.setattr(result_store_module.constants, "WEBUI_RESULT_CACHE_SESSIONS", 2)
+
+    store_a = get_session_store("a")
+    get_session_store("b")
+    assert get_session_store("a") is store_a
+    get_session_store("c")
+
+    assert list(result_store_module._SESSION_STORES) == ["a", "c"]
+    assert get_session_store(None) is not get_session_store(None)
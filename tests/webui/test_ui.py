@@ -294,6 +294,43 @@ class TestProcessTranscriptionRequestWrapper:
         call_args = mock_process.call_args
         assert call_args.kwargs["progress_tracker"] is progress_tracker
 
+    @patch("insanely_fast_whisper_rocm.webui.ui.process_transcription_request")
+    def test_wrapper__uses_session_result_store(self, mock_process: MagicMock) -> None:
+        """The Gradio session hash selects a result store reused across runs."""
+        mock_process.return_value = ("text", {}, {}, Mock(), Mock(), Mock(), Mock())
+        kwargs = {
+            "audio_paths": ["test.wav"],
+            "model_name": "openai/whisper-tiny",
+            "device": "cpu",
+            "batch_size": 8,
+            "timestamp_type": "word",
+            "language": "en",
+            "task": "transcribe",
+            "dtype": "float16",
+            "whisper_chunk_length": 30,
+            "stabilize": False,
+            "demucs": False,
+            "vad": False,
+            "vad_threshold": 0.35,
+            "save_transcriptions": True,
+            "temp_uploads_dir": "/tmp/test",
+            "progress": Mock(spec=gr.Progress),
+        }
+
+        _process_transcription_request_wrapper(
+            request=Mock(session_hash="session-a"), **kwargs
+        )
+        _process_transcription_request_wrapper(
+            request=Mock(session_hash="session-a"), **kwargs
+        )
+        _process_transcription_request_wrapper(
+            request=Mock(session_hash="session-b"), **kwargs
+        )
+
+        stores = [c.kwargs["result_store"] for c in mock_process.call_args_list]
+        assert stores[0] is stores[1]
+        assert stores[0] is not stores[2]
+
 
 class TestCreateUIComponents:
     """Test suite for create_ui_components function."""
@@ -104,3 +104,53 @@ def test_create_batch_zip_convenience_can_include_merged(tmp_path: Path) -> None
         merged_json = json.loads(zf.read("merged/batch_merged_b1.json").decode("utf-8"))
 
     assert merged_json["batch_info"]["total_files"] == 2
+
+
+def test_add_file_async_writes_entries_before_build(tmp_path: Path) -> None:
+    """Files queued in the background land in the archive; build adds the summary."""
+    cfg = ZipConfiguration(temp_dir=str(tmp_path), organize_by_format=True)
+    raw = {"text": "hello", "chunks": [{"text": "hello", "timestamp": [0.0, 1.0]}]}
+
+    builder = BatchZipBuilder(cfg).create(batch_id="b1", filename="out.zip")
+    futures = [
+        builder.add_file_async(f"/tmp/{name}.mp3", raw, ["txt", "srt"])
+        for name in ("a", "b")
+    ]
+    for future in futures:
+        future.result(timeout=5)
+    assert builder.stats.files_added == 4
+    zip_path, stats = builder.build()
+
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        names = set(zf.namelist())
+        summary = json.loads(zf.read("batch_summary.json"))
+    assert {"txt/a.txt", "txt/b.txt", "srt/a.srt", "srt/b.srt"} <= names
+    assert summary["batch_info"]["total_individual_files"] == 2
+    assert stats.files_added == 5
+
+
+def test_store_only_mode_uses_zip_stored(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """WEBUI_ZIP_STORE_ONLY switches the default method to ZIP_STORED."""
+    from insanely_fast_whisper_rocm.webui import zip_creator
+
+    monkeypatch.setattr(zip_creator.constants, "WEBUI_ZIP_STORE_ONLY", True)
+    builder = BatchZipBuilder(ZipConfiguration(temp_dir=str(tmp_path)))
+    with builder.create(filename="out.zip") as b:
+        b.add_custom_file("a.txt", "x" * 1000)
+        zip_path, _ = b.build()
+
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        assert zf.getinfo("a.txt").compress_type == zipfile.ZIP_STORED
+
+
+def test_discard_removes_partial_archive(tmp_path: Path) -> None:
+    """A discarded archive is closed and deleted."""
+    builder = BatchZipBuilder(ZipConfiguration(temp_dir=str(tmp_path)))
+    builder.create(filename="out.zip")
+    builder.add_file_async("/tmp/a.mp3", {"text": "hello"}, ["txt"])
+
+    builder.discard()
+
+    assert not (tmp_path / "out.zip").exists()